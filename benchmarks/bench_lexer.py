@@ -0,0 +1,180 @@
+"""
+Benchmark: vazão e memória de pico do AnalisadorLexico por perfil de corpus.
+
+Para cada perfil de gerador_corpus.py e cada tamanho pedido (em KB), gera o
+corpus, tokeniza com o AnalisadorLexico e mede:
+
+- tokens/s (melhor de --repeticoes execuções);
+- memória de pico da análise (tracemalloc, em uma execução separada).
+
+Os resultados são gravados em JSON (chaves ordenadas, uma entrada por
+perfil/tamanho) para serem comparados entre commits. Com --comparar, a
+execução falha se a vazão de alguma entrada cair mais que --tolerancia em
+relação ao arquivo de referência. Também falha se o custo por token de um
+perfil crescer com o tamanho do corpus (ex.: fatiamento quadrático).
+
+Uso:
+    python benchmarks/bench_lexer.py --saida base.json
+    python benchmarks/bench_lexer.py --saida novo.json --comparar base.json
+    python benchmarks/bench_lexer.py --perfis strings comentarios --tamanhos 64 1024
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, RAIZ)
+
+from src.lexer.lexer import AnalisadorLexico
+from src.lexer.AFD import get_afd
+from gerador_corpus import PERFIS, gerar_corpus
+
+VERSAO_FORMATO = 1
+
+# Razão máxima aceitável entre o custo por token do maior e do menor corpus
+TOLERANCIA_LINEAR = 3.0
+
+
+def tokenizar(codigo, motor):
+    """Tokeniza o código inteiro e retorna o número de tokens (incluindo EOF)."""
+    total = 0
+    for _ in AnalisadorLexico(codigo, motor):
+        total += 1
+    return total
+
+
+def medir(codigo, motor, repeticoes):
+    """Retorna (tokens, melhor tempo em segundos, pico de memória em bytes)."""
+    tokenizar(codigo, motor)  # Aquecimento
+    melhor = None
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        tokens = tokenizar(codigo, motor)
+        decorrido = time.perf_counter() - inicio
+        if melhor is None or decorrido < melhor:
+            melhor = decorrido
+    
+    tracemalloc.start()
+    tokenizar(codigo, motor)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return tokens, melhor, pico
+
+
+def ambiente(motor):
+    """Descreve onde a medição foi feita, para contextualizar comparações."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=RAIZ,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "motor": motor or "padrão",
+        "data": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def verificar_linearidade(resultados, perfis, tamanhos):
+    """Retorna os perfis cujo custo por token cresce com o tamanho do corpus."""
+    suspeitos = []
+    if len(tamanhos) < 2:
+        return suspeitos
+    menor, maior = min(tamanhos), max(tamanhos)
+    for perfil in perfis:
+        razao = (resultados[f"{perfil}/{maior}KB"]["us_por_token"]
+                 / resultados[f"{perfil}/{menor}KB"]["us_por_token"])
+        if razao > TOLERANCIA_LINEAR:
+            suspeitos.append((perfil, razao))
+    return suspeitos
+
+
+def comparar(resultados, caminho, tolerancia):
+    """Compara a vazão com um JSON de referência; retorna as entradas que regrediram."""
+    with open(caminho, 'r', encoding='utf-8') as f:
+        referencia = json.load(f)["resultados"]
+    
+    print(f"\nComparação com {caminho}:")
+    print(f"{'ENTRADA':>24} | {'ANTES':>10} | {'DEPOIS':>10} | {'VARIAÇÃO':>9}")
+    print("-" * 62)
+    regressoes = []
+    for chave in sorted(resultados):
+        if chave not in referencia:
+            continue
+        antes = referencia[chave]["tokens_por_segundo"]
+        depois = resultados[chave]["tokens_por_segundo"]
+        variacao = depois / antes - 1
+        print(f"{chave:>24} | {antes:>10.0f} | {depois:>10.0f} | {variacao:>+8.1%}")
+        if variacao < -tolerancia:
+            regressoes.append(chave)
+    return regressoes
+
+
+def main():
+    argumentos = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argumentos.add_argument('--perfis', nargs='+', default=list(PERFIS), choices=PERFIS)
+    argumentos.add_argument('--tamanhos', nargs='+', type=int, default=[64, 512], help="Tamanhos do corpus em KB")
+    argumentos.add_argument('--repeticoes', type=int, default=3, help="Repetições por medição de tempo")
+    argumentos.add_argument('--semente', type=int, default=0, help="Semente do gerador de corpus")
+    argumentos.add_argument('--motor', default=None, help="Motor léxico (ver lexer.AFD.MOTORES)")
+    argumentos.add_argument('--saida', help="Arquivo JSON onde gravar os resultados")
+    argumentos.add_argument('--comparar', help="JSON de referência para detectar regressões")
+    argumentos.add_argument('--tolerancia', type=float, default=0.25,
+                            help="Queda máxima de vazão aceita na comparação (fração)")
+    opcoes = argumentos.parse_args()
+    
+    get_afd(opcoes.motor)  # Construção do motor fora da medição
+    
+    print(f"{'PERFIL':>16} | {'KB':>6} | {'TOKENS':>8} | {'TOKENS/s':>10} | {'µs/TOKEN':>8} | {'PICO (KB)':>9}")
+    print("-" * 72)
+    
+    resultados = {}
+    for perfil in opcoes.perfis:
+        for tamanho in opcoes.tamanhos:
+            codigo = gerar_corpus(perfil, tamanho * 1024, opcoes.semente)
+            tokens, segundos, pico = medir(codigo, opcoes.motor, opcoes.repeticoes)
+            resultados[f"{perfil}/{tamanho}KB"] = {
+                "perfil": perfil,
+                "caracteres": len(codigo),
+                "tokens": tokens,
+                "segundos": round(segundos, 6),
+                "tokens_por_segundo": round(tokens / segundos, 1),
+                "us_por_token": round(segundos / tokens * 1e6, 4),
+                "pico_bytes": pico,
+            }
+            print(f"{perfil:>16} | {tamanho:>6} | {tokens:>8} | {tokens / segundos:>10.0f} | "
+                  f"{segundos / tokens * 1e6:>8.2f} | {pico / 1024:>9.1f}")
+    
+    if opcoes.saida:
+        with open(opcoes.saida, 'w', encoding='utf-8') as f:
+            json.dump({"versao": VERSAO_FORMATO, "ambiente": ambiente(opcoes.motor), "resultados": resultados},
+                      f, indent=2, sort_keys=True, ensure_ascii=False)
+            f.write("\n")
+        print(f"\nResultados gravados em {opcoes.saida}")
+    
+    falhou = False
+    for perfil, razao in verificar_linearidade(resultados, opcoes.perfis, opcoes.tamanhos):
+        print(f"FALHA: custo por token de '{perfil}' cresce {razao:.2f}x com o tamanho (limite {TOLERANCIA_LINEAR})")
+        falhou = True
+    
+    if opcoes.comparar:
+        regressoes = comparar(resultados, opcoes.comparar, opcoes.tolerancia)
+        for chave in regressoes:
+            print(f"FALHA: vazão de {chave} caiu mais de {opcoes.tolerancia:.0%}")
+        falhou = falhou or bool(regressoes)
+    
+    return 1 if falhou else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+"""
+Benchmark: análise sintática de código com muitas expressões.
+
+Gera programas Coral sintéticos dominados por expressões e mede apenas o
+parser (os tokens são produzidos uma vez, fora da medição), reportando o
+melhor tempo de --repeticoes. Perfis:
+
+    aritmetica  atribuições com cadeias longas de operadores de todos os níveis
+    chamadas    chamadas de função e de método, indexações e listas literais
+    aninhada    parênteses e operadores unários aninhados
+
+Também mede a profundidade máxima da pilha de chamadas Python durante a
+análise (sys.setprofile) e verifica que parênteses aninhados a
+--profundidade níveis são analisados sem RecursionError.
+
+Uso:
+    python benchmarks/bench_parser.py
+    python benchmarks/bench_parser.py --linhas 20000 --perfis aritmetica
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.lexer.lexer import LexerCoral
+from src.parser.parser import ParserCoral
+
+PERFIS = ("aritmetica", "chamadas", "aninhada")
+
+OPERADORES = ("+", "-", "*", "/", "%", "**", "<", ">=", "==", "!=", "E", "OU")
+
+
+def _operando(rnd):
+    return rnd.choice(("a", "b", "total", "indice", "1", "2.5", "VERDADE", '"txt"'))
+
+
+def _linha_aritmetica(rnd):
+    partes = [_operando(rnd)]
+    for _ in range(rnd.randint(6, 14)):
+        partes.append(rnd.choice(OPERADORES))
+        partes.append(_operando(rnd))
+    return f"x = {' '.join(partes)}\n"
+
+
+def _linha_chamadas(rnd):
+    argumentos = ", ".join(_operando(rnd) for _ in range(rnd.randint(1, 4)))
+    return (f"r = calcula({argumentos}) + obj.metodo({_operando(rnd)}).campo"
+            f" * lista[indice + 1][0] - [{argumentos}]\n")
+
+
+def _linha_aninhada(rnd):
+    profundidade = rnd.randint(4, 12)
+    expressao = _operando(rnd)
+    for _ in range(profundidade):
+        expressao = f"{rnd.choice(('-', 'NAO '))}({expressao} {rnd.choice(OPERADORES)} {_operando(rnd)})"
+    return f"y = {expressao}\n"
+
+
+_LINHAS = {
+    "aritmetica": _linha_aritmetica,
+    "chamadas": _linha_chamadas,
+    "aninhada": _linha_aninhada,
+}
+
+
+def gerar_programa(perfil, linhas, semente=0):
+    """Gera um programa com o número de linhas pedido (determinístico pela semente)."""
+    rnd = random.Random(semente)
+    return "".join(_LINHAS[perfil](rnd) for _ in range(linhas))
+
+
+def medir(tokens, repeticoes):
+    """Retorna o melhor tempo (s) de análise sintática da lista de tokens."""
+    melhor = None
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        ParserCoral(tokens).parse()
+        decorrido = time.perf_counter() - inicio
+        if melhor is None or decorrido < melhor:
+            melhor = decorrido
+    return melhor
+
+
+def profundidade_pilha(tokens):
+    """Retorna a profundidade máxima de frames Python durante a análise."""
+    profundidade = maxima = 0
+
+    def perfilador(frame, evento, argumento):
+        nonlocal profundidade, maxima
+        if evento == 'call':
+            profundidade += 1
+            maxima = max(maxima, profundidade)
+        elif evento == 'return':
+            profundidade -= 1
+
+    sys.setprofile(perfilador)
+    try:
+        ParserCoral(tokens).parse()
+    finally:
+        sys.setprofile(None)
+    return maxima
+
+
+def main():
+    argumentos = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argumentos.add_argument('--perfis', nargs='+', choices=PERFIS, default=list(PERFIS))
+    argumentos.add_argument('--linhas', type=int, default=5000, help="Linhas por programa")
+    argumentos.add_argument('--repeticoes', type=int, default=5)
+    argumentos.add_argument('--profundidade', type=int, default=10000,
+                            help="Níveis de parênteses do teste de aninhamento")
+    opcoes = argumentos.parse_args()
+
+    print(f"{'PERFIL':>12} | {'TOKENS':>8} | {'TEMPO (ms)':>10} | {'TOKENS/s':>10} | {'PILHA':>5}")
+    print("-" * 58)
+    for perfil in opcoes.perfis:
+        tokens = LexerCoral.analisar_string(gerar_programa(perfil, opcoes.linhas)).tokenizar_tudo()
+        segundos = medir(tokens, opcoes.repeticoes)
+        pilha = profundidade_pilha(LexerCoral.analisar_string(gerar_programa(perfil, 50)).tokenizar_tudo())
+        print(f"{perfil:>12} | {len(tokens):>8} | {segundos * 1000:>10.1f} | "
+              f"{len(tokens) / segundos:>10.0f} | {pilha:>5}")
+
+    n = opcoes.profundidade
+    codigo = f"x = {'(' * n}1 + 2{')' * n}\n"
+    try:
+        ParserCoral(LexerCoral.analisar_string(codigo)).parse()
+    except RecursionError:
+        print(f"\nFALHA: RecursionError com {n} níveis de parênteses")
+        sys.exit(1)
+    print(f"\n{n} níveis de parênteses analisados sem RecursionError")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark de regressão: escalabilidade do analisador léxico.
+
+Gera programas Coral sintéticos de 1k, 10k e 100k linhas e mede o tempo
+de análise léxica de cada um. O tempo deve crescer linearamente com o
+tamanho do arquivo; um crescimento quadrático (como o causado por copiar
+o restante do código a cada token) faz o benchmark falhar.
+
+Uso:
+    python benchmarks/escala_lexer.py
+    python benchmarks/escala_lexer.py 1000 10000 100000
+"""
+
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.lexer.lexer import LexerCoral
+
+# Razão máxima aceitável entre o tempo por linha do maior e do menor arquivo
+TOLERANCIA_LINEAR = 3.0
+
+BLOCO = '''# bloco {n}
+FUNCAO calcula_{n}(a, b):
+    total = a * {n} + b / 2.5
+    SE total >= 100 E NAO a == b:
+        ESCREVA(f"total: {{total}}")
+    SENAO:
+        lista = [a, b, "texto {n}", VERDADE]
+    RETORNAR total
+
+'''
+
+
+def gerar_programa(linhas):
+    """Gera um programa Coral com aproximadamente o número de linhas pedido."""
+    linhas_por_bloco = BLOCO.count('\n')
+    blocos = max(1, linhas // linhas_por_bloco)
+    return ''.join(BLOCO.format(n=n) for n in range(blocos))
+
+
+def medir(codigo):
+    """Retorna (tokens, segundos) da análise léxica completa do código."""
+    inicio = time.perf_counter()
+    lexer = LexerCoral.analisar_string(codigo)
+    total = 0
+    while lexer.getNextToken().tipo != "EOF":
+        total += 1
+    return total, time.perf_counter() - inicio
+
+
+def main():
+    tamanhos = [int(arg) for arg in sys.argv[1:]] or [1000, 10000, 100000]
+    
+    print(f"{'LINHAS':>10} | {'TOKENS':>10} | {'TEMPO (s)':>10} | {'µs/LINHA':>10}")
+    print("-" * 50)
+    
+    custos = []
+    for linhas in tamanhos:
+        codigo = gerar_programa(linhas)
+        total_linhas = codigo.count('\n')
+        tokens, segundos = medir(codigo)
+        custo = segundos / total_linhas * 1e6
+        custos.append(custo)
+        print(f"{total_linhas:>10} | {tokens:>10} | {segundos:>10.3f} | {custo:>10.2f}")
+    
+    razao = custos[-1] / custos[0]
+    print(f"\nRazão custo/linha (maior/menor): {razao:.2f} (limite {TOLERANCIA_LINEAR})")
+    
+    if razao > TOLERANCIA_LINEAR:
+        print("FALHA: o tempo de análise léxica não cresce linearmente.")
+        return 1
+    
+    print("OK: crescimento linear.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""
+Gerador de corpus Coral sintético para benchmarks do lexer.
+
+Gera programas lexicamente válidos, de tamanho configurável, com diferentes
+perfis de tokens:
+
+    identificadores  muitos identificadores longos e chamadas de função
+    strings          strings simples, f-strings e strings multilinha longas
+    indentacao       blocos aninhados profundamente (muitos INDENTA/DEDENTA)
+    comentarios      linhas e finais de linha com comentários
+    misto            mistura dos perfis acima
+
+A geração é determinística para uma mesma semente, então o mesmo corpus pode
+ser medido em commits diferentes.
+
+Uso:
+    python benchmarks/gerador_corpus.py strings 1024 > corpus.crl
+"""
+
+import random
+import sys
+
+PERFIS = ("identificadores", "strings", "indentacao", "comentarios", "misto")
+
+PALAVRAS = ("valor", "total", "contador", "resultado", "lista", "indice", "nome", "dados")
+
+
+def _identificador(rnd):
+    return f"{rnd.choice(PALAVRAS)}_{rnd.choice(PALAVRAS)}_{rnd.randrange(1000)}"
+
+
+def _bloco_identificadores(rnd):
+    a, b, c = (_identificador(rnd) for _ in range(3))
+    return (
+        f"{a} = {b} + {c} * {rnd.randrange(100)}\n"
+        f"{b} = calcula_{a}({a}, {c}, {b}.{c})\n"
+        f"SE {a} >= {b} E NAO {c} == {a}:\n"
+        f"    {c} = [{a}, {b}, {c}]\n"
+    )
+
+
+def _bloco_strings(rnd):
+    nome = _identificador(rnd)
+    texto = " ".join(rnd.choice(PALAVRAS) for _ in range(rnd.randint(5, 40)))
+    return (
+        f'{nome} = "{texto}"\n'
+        f"mensagem = f'{texto} {{{nome}}}'\n"
+        f'documento = """{texto}\n{texto}\n{texto}"""\n'
+        f"ESCREVA('escape \\\\ \\'{texto}\\'')\n"
+    )
+
+
+def _bloco_indentacao(rnd, profundidade=12):
+    linhas = []
+    for nivel in range(profundidade):
+        recuo = "    " * nivel
+        linhas.append(f"{recuo}SE {_identificador(rnd)} > {nivel}:\n")
+    recuo = "    " * profundidade
+    linhas.append(f"{recuo}{_identificador(rnd)} = {rnd.randrange(100)}\n")
+    # Volta a um nível intermediário antes de fechar todos os blocos
+    meio = "    " * (profundidade // 2)
+    linhas.append(f"{meio}{_identificador(rnd)} = 0\n")
+    return "".join(linhas)
+
+
+def _bloco_comentarios(rnd):
+    texto = " ".join(rnd.choice(PALAVRAS) for _ in range(rnd.randint(3, 15)))
+    return (
+        f"# {texto}\n"
+        f"#\n"
+        f"{_identificador(rnd)} = {rnd.randrange(100)}  # {texto}\n"
+        f"\n"
+        f"    # comentário indentado: {texto}\n"
+    )
+
+
+_BLOCOS = {
+    "identificadores": _bloco_identificadores,
+    "strings": _bloco_strings,
+    "indentacao": _bloco_indentacao,
+    "comentarios": _bloco_comentarios,
+}
+
+
+def gerar_corpus(perfil, caracteres, semente=0):
+    """
+    Gera um programa Coral com o perfil pedido e ao menos o número de caracteres pedido.
+    
+    Args:
+        perfil: Um dos PERFIS
+        caracteres: Tamanho mínimo do programa gerado
+        semente: Semente do gerador pseudoaleatório
+    
+    Returns:
+        str: Código fonte gerado
+    """
+    if perfil not in PERFIS:
+        raise ValueError(f"Perfil desconhecido: {perfil!r} (disponíveis: {', '.join(PERFIS)})")
+    
+    rnd = random.Random(semente)
+    geradores = list(_BLOCOS.values()) if perfil == "misto" else [_BLOCOS[perfil]]
+    partes = []
+    total = 0
+    while total < caracteres:
+        bloco = rnd.choice(geradores)(rnd)
+        partes.append(bloco)
+        total += len(bloco)
+    return "".join(partes)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (3, 4):
+        print(__doc__.strip().splitlines()[-1].strip())
+        sys.exit(1)
+    sys.stdout.write(gerar_corpus(sys.argv[1], int(sys.argv[2]) * 1024, int(sys.argv[3]) if len(sys.argv) == 4 else 0))
@@ -0,0 +1,67 @@
+"""
+Benchmark: aceleração da análise léxica paralela (LexerCoral.analisar_paralelo).
+
+Gera um programa sintético grande e o tokeniza sequencialmente e com pools
+de 1, 2, 4, 8 e 16 processos (limitado aos núcleos disponíveis), verificando
+que o TokenStream é idêntico ao sequencial e reportando a aceleração.
+
+Uso:
+    python benchmarks/lexer_paralelo.py
+    python benchmarks/lexer_paralelo.py --linhas 1000000 --processos 4 8 16
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.lexer.lexer import LexerCoral
+from src.lexer.LexerParalelo import analisar_paralelo
+from escala_lexer import gerar_programa
+
+
+def colunas(fluxo):
+    return (fluxo.tipos, fluxo.inicios, fluxo.fins, fluxo.linhas_colunas)
+
+
+def main():
+    nucleos = os.cpu_count() or 1
+    argumentos = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argumentos.add_argument('--linhas', type=int, default=400000, help="Linhas do programa gerado")
+    argumentos.add_argument('--processos', type=int, nargs='*',
+                            default=[n for n in (1, 2, 4, 8, 16) if n <= nucleos],
+                            help="Tamanhos de pool a medir")
+    opcoes = argumentos.parse_args()
+    
+    codigo = gerar_programa(opcoes.linhas)
+    print(f"{codigo.count(chr(10))} linhas, {len(codigo)} caracteres, {nucleos} núcleos\n")
+    
+    inicio = time.perf_counter()
+    referencia = LexerCoral.analisar_string(codigo).tokenizar_em_colunas()
+    sequencial = time.perf_counter() - inicio
+    
+    print(f"{'PROCESSOS':>10} | {'TOKENS':>10} | {'TEMPO (s)':>10} | {'ACELERAÇÃO':>10}")
+    print("-" * 50)
+    print(f"{'sequencial':>10} | {len(referencia):>10} | {sequencial:>10.3f} | {1:>9.2f}x")
+    
+    for processos in opcoes.processos:
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            # Inicializa os processos fora da medição
+            list(executor.map(int, range(processos)))
+            inicio = time.perf_counter()
+            fluxo = analisar_paralelo(codigo, processos=processos, executor=executor)
+            decorrido = time.perf_counter() - inicio
+        
+        if colunas(fluxo) != colunas(referencia):
+            print(f"FALHA: tokens com {processos} processos diferem da análise sequencial.")
+            return 1
+        print(f"{processos:>10} | {len(fluxo):>10} | {decorrido:>10.3f} | {sequencial / decorrido:>9.2f}x")
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
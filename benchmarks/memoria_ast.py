@@ -0,0 +1,126 @@
+"""
+Benchmark: memória da AST por tipo de nó.
+
+Analisa os arquivos .crl informados (ou, sem argumentos, um programa
+sintético de --linhas linhas gerado com escala_lexer.gerar_programa) e
+reporta, para cada tipo de nó, a quantidade de nós e os bytes ocupados pelo
+próprio objeto, pelo seu __dict__ (se houver) e pelas listas que ele
+contém. Os tokens são produzidos antes da medição; o total retido pela AST
+(tracemalloc) é comparado ao tamanho do código fonte e ao da mesma árvore
+em arena (parser.arena.ArenaAST).
+
+Uso:
+    python benchmarks/memoria_ast.py
+    python benchmarks/memoria_ast.py --linhas 100000
+    python benchmarks/memoria_ast.py exemplos/parser/programa_completo.crl
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+from collections import Counter
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.lexer.lexer import LexerCoral
+from src.parser.parser import ParserCoral
+from src.parser.ast_nodes import ASTNode
+from src.parser.arena import ArenaAST
+from escala_lexer import gerar_programa
+
+
+def bytes_do_no(no):
+    """Bytes do objeto do nó, do seu __dict__ e das listas que ele contém."""
+    total = sys.getsizeof(no)
+    if hasattr(no, '__dict__'):
+        total += sys.getsizeof(no.__dict__)
+    for campo in type(no).CAMPOS:
+        valor = getattr(no, campo)
+        if isinstance(valor, list):
+            total += sys.getsizeof(valor)
+    return total
+
+
+def memoria_por_tipo(raiz):
+    """Retorna (nós, bytes) por nome de classe, percorrendo a AST com pilha explícita."""
+    nos = Counter()
+    ocupado = Counter()
+    pilha = [raiz]
+    while pilha:
+        valor = pilha.pop()
+        if isinstance(valor, ASTNode):
+            nome = type(valor).__name__
+            nos[nome] += 1
+            ocupado[nome] += bytes_do_no(valor)
+            pilha.extend(getattr(valor, campo) for campo in type(valor).CAMPOS)
+        elif isinstance(valor, (list, tuple)):
+            pilha.extend(valor)
+    return nos, ocupado
+
+
+def medir(codigo):
+    """Retorna (AST, bytes retidos pela análise sintática)."""
+    tokens = LexerCoral.analisar_string(codigo).tokenizar_tudo()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        ast = ParserCoral(tokens).parse()
+        gc.collect()
+        retido, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return ast, retido
+
+
+def medir_arena(ast):
+    """Retorna (arena, bytes retidos pela arena construída a partir da AST)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        arena = ArenaAST.de_ast(ast)
+        gc.collect()
+        retido, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return arena, retido
+
+
+def main():
+    argumentos = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argumentos.add_argument('arquivos', nargs='*', help="Arquivos .crl (padrão: programa sintético)")
+    argumentos.add_argument('--linhas', type=int, default=20000, help="Linhas do programa sintético")
+    opcoes = argumentos.parse_args()
+
+    if opcoes.arquivos:
+        codigo = ""
+        for caminho in opcoes.arquivos:
+            with open(caminho, encoding='utf-8') as arquivo:
+                codigo += arquivo.read().rstrip('\n') + "\n"
+    else:
+        codigo = gerar_programa(opcoes.linhas)
+
+    ast, retido = medir(codigo)
+    nos, ocupado = memoria_por_tipo(ast)
+
+    print(f"{'TIPO':>22} | {'NÓS':>8} | {'BYTES':>10} | {'BYTES/NÓ':>8}")
+    print("-" * 58)
+    for nome, total in ocupado.most_common():
+        print(f"{nome:>22} | {nos[nome]:>8} | {total:>10} | {total / nos[nome]:>8.1f}")
+    print("-" * 58)
+    total_nos = sum(nos.values())
+    total_bytes = sum(ocupado.values())
+    print(f"{'TOTAL':>22} | {total_nos:>8} | {total_bytes:>10} | {total_bytes / total_nos:>8.1f}")
+
+    fonte = len(codigo.encode('utf-8'))
+    print(f"\nCódigo fonte: {fonte} bytes")
+    print(f"Retido pela AST (tracemalloc): {retido} bytes ({retido / fonte:.1f}x o código fonte)")
+
+    arena, retido_arena = medir_arena(ast)
+    print(f"Retido pela arena (tracemalloc): {retido_arena} bytes ({retido_arena / fonte:.1f}x o código fonte)")
+    print(f"Arena serializada: {len(arena.para_bytes())} bytes")
+
+
+if __name__ == "__main__":
+    main()
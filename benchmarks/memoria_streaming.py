@@ -0,0 +1,81 @@
+"""
+Benchmark: memória de pico do lexer com leitura em blocos.
+
+Gera um arquivo .crl sintético do tamanho pedido (em MB) em um diretório
+temporário e o tokeniza com LexerCoral.analisar_arquivo(streaming=True),
+medindo a memória de pico com tracemalloc. O pico deve ficar limitado
+(ordem do tamanho do bloco), independente do tamanho do arquivo; o
+benchmark falha (código de saída 1) se passar de LIMITE_PICO_MB.
+
+Uso:
+    python benchmarks/memoria_streaming.py
+    python benchmarks/memoria_streaming.py 50 200
+"""
+
+import sys
+import os
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.lexer.lexer import LexerCoral
+from escala_lexer import BLOCO
+
+# Memória de pico máxima aceitável durante a análise léxica
+LIMITE_PICO_MB = 8
+
+
+def gerar_arquivo(caminho, megabytes):
+    """Grava um programa Coral com aproximadamente o tamanho pedido."""
+    alvo = megabytes * 1024 * 1024
+    escritos = 0
+    n = 0
+    with open(caminho, 'w', encoding='utf-8') as f:
+        while escritos < alvo:
+            bloco = BLOCO.format(n=n)
+            f.write(bloco)
+            escritos += len(bloco)
+            n += 1
+
+
+def medir(caminho):
+    """Retorna (tokens, segundos, pico em bytes) da análise léxica em blocos."""
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    lexer = LexerCoral.analisar_arquivo(caminho, streaming=True)
+    total = 0
+    while lexer.getNextToken().tipo != "EOF":
+        total += 1
+    decorrido = time.perf_counter() - inicio
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return total, decorrido, pico
+
+
+def main():
+    tamanhos = [int(arg) for arg in sys.argv[1:]] or [1, 10]
+    
+    print(f"{'ARQUIVO (MB)':>12} | {'TOKENS':>10} | {'TEMPO (s)':>10} | {'PICO (MB)':>10}")
+    print("-" * 52)
+    
+    falhou = False
+    with tempfile.TemporaryDirectory() as diretorio:
+        for megabytes in tamanhos:
+            caminho = os.path.join(diretorio, f"gerado_{megabytes}mb.crl")
+            gerar_arquivo(caminho, megabytes)
+            tokens, segundos, pico = medir(caminho)
+            pico_mb = pico / (1024 * 1024)
+            falhou = falhou or pico_mb > LIMITE_PICO_MB
+            print(f"{megabytes:>12} | {tokens:>10} | {segundos:>10.2f} | {pico_mb:>10.2f}")
+            os.remove(caminho)
+    
+    if falhou:
+        print(f"\nFALHOU: memória de pico acima de {LIMITE_PICO_MB} MB")
+        sys.exit(1)
+    print("\nOK: memória de pico limitada")
+
+
+if __name__ == "__main__":
+    main()
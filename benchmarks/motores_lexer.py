@@ -0,0 +1,84 @@
+"""
+Benchmark: vazão dos motores léxicos sobre os programas de exemplos/.
+
+Tokeniza todos os arquivos .crl de exemplos/ com cada motor disponível
+(ver lexer.AFD.MOTORES), repetindo a medição e reportando o melhor tempo.
+Os arquivos são concatenados em memória e lidos uma única vez, então o
+benchmark mede apenas a análise léxica.
+
+Uso:
+    python benchmarks/motores_lexer.py
+    python benchmarks/motores_lexer.py --repeticoes 10 dicionario regex
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, RAIZ)
+
+from src.lexer.lexer import LexerCoral
+from src.lexer.AFD import MOTORES, get_afd
+
+
+def carregar_exemplos():
+    """Retorna a lista de códigos-fonte válidos de exemplos/."""
+    codigos = []
+    for arquivo in sorted(glob.glob(os.path.join(RAIZ, "exemplos", "**", "*.crl"), recursive=True)):
+        with open(arquivo, 'r', encoding='utf-8') as f:
+            codigo = f.read()
+        try:
+            tokenizar(codigo, None)
+        except ValueError:
+            continue  # Exemplos de erro léxico (ex.: tokens_invalidos.crl)
+        codigos.append(codigo)
+    return codigos
+
+
+def tokenizar(codigo, motor):
+    """Tokeniza o código inteiro e retorna o número de tokens."""
+    lexer = LexerCoral.analisar_string(codigo, motor=motor)
+    total = 0
+    while lexer.getNextToken().tipo != "EOF":
+        total += 1
+    return total
+
+
+def medir(codigos, motor, repeticoes):
+    """Retorna (tokens, melhor tempo em segundos) para o motor."""
+    get_afd(motor)  # Construção do motor fora da medição
+    melhor = None
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        tokens = sum(tokenizar(codigo, motor) for codigo in codigos)
+        decorrido = time.perf_counter() - inicio
+        if melhor is None or decorrido < melhor:
+            melhor = decorrido
+    return tokens, melhor
+
+
+def main():
+    argumentos = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argumentos.add_argument('motores', nargs='*', default=list(MOTORES), help="Motores a comparar")
+    argumentos.add_argument('--repeticoes', type=int, default=5, help="Repetições por motor")
+    opcoes = argumentos.parse_args()
+    
+    codigos = carregar_exemplos()
+    print(f"{len(codigos)} arquivos de exemplos/, {sum(len(c) for c in codigos)} caracteres\n")
+    
+    print(f"{'MOTOR':>12} | {'TOKENS':>8} | {'TEMPO (ms)':>10} | {'TOKENS/s':>10} | {'RELATIVO':>8}")
+    print("-" * 62)
+    
+    referencia = None
+    for motor in opcoes.motores:
+        tokens, segundos = medir(codigos, motor, opcoes.repeticoes)
+        referencia = referencia or segundos
+        print(f"{motor:>12} | {tokens:>8} | {segundos * 1000:>10.2f} | "
+              f"{tokens / segundos:>10.0f} | {referencia / segundos:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
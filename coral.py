@@ -9,6 +9,7 @@ Uso:
     coral.py <arquivo.crl>                    # Executa análise completa
     coral.py --lex <arquivo.crl>              # Apenas análise léxica
     coral.py --parse <arquivo.crl>            # Apenas análise sintática
+    coral.py --cache <arquivo.crl>            # Usa os caches de tokens e da AST em disco
     coral.py --help                           # Exibe esta ajuda
     coral.py --version                        # Exibe a versão
 """
@@ -16,12 +17,15 @@ Uso:
 import sys
 import os
 import argparse
+from functools import partial
 
 # Adiciona o diretório src ao path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from lexer.lexer import LexerCoral
+from lexer.lexer import LexerCoral, AnalisadorLexico, ErroLexico
 from parser.parser import ParserCoral, exibir_ast, ErroSintatico
+from parser.cache_ast import chave_ast_arquivo, carregar_ast, salvar_ast
+from parser.percurso import Visitante
 from interpreter.interpreter import executar_programa
 from llvm.llvm_compiler import LLVMCompiler
 
@@ -29,54 +33,224 @@ __version__ = "0.1.0"
 __author__ = "Coral Language Team"
 
 
+class ImpressorAST(Visitante):
+    """Imprime a árvore AST de forma hierárquica e simples (usado por --ast)."""
+    
+    def _linha(self, texto, recuo=1):
+        """Retorna a ação que imprime texto recuado em relação ao nó atual."""
+        return partial(print, "  " * (self.profundidade + recuo) + texto)
+    
+    def visitar_padrao(self, no):
+        indentacao = "  " * self.profundidade
+        nome_classe = type(no).__name__
+        
+        # Imprime o nó atual
+        print(f"{indentacao}{nome_classe}", end="")
+        
+        # Adiciona informações específicas do nó
+        if hasattr(no, 'nome'):
+            print(f"(nome={no.nome})", end="")
+        elif hasattr(no, 'valor') and nome_classe == 'LiteralNode':
+            valor_repr = repr(no.valor) if isinstance(no.valor, str) else no.valor
+            print(f"(valor={valor_repr})", end="")
+        elif hasattr(no, 'operador') and nome_classe in ['ExpressaoBinariaNode', 'ExpressaoUnariaNode']:
+            op = no.operador.lexema if hasattr(no.operador, 'lexema') else no.operador
+            print(f"(op={op})", end="")
+        
+        print()  # Nova linha
+    
+    # Os métodos abaixo imprimem o nó e retornam os filhos (ver Visitante)
+    
+    def visitar_ProgramaNode(self, no):
+        self.visitar_padrao(no)
+        return no.declaracoes
+    
+    visitar_BlocoNode = visitar_ProgramaNode
+    
+    def visitar_AtribuicaoNode(self, no):
+        self.visitar_padrao(no)
+        return [self._linha("identificador:"), (no.identificador, 2),
+                self._linha("expressao:"), (no.expressao, 2)]
+    
+    def visitar_ExpressaoBinariaNode(self, no):
+        self.visitar_padrao(no)
+        return [self._linha("esquerda:"), (no.esquerda, 2), self._linha("direita:"), (no.direita, 2)]
+    
+    def visitar_ExpressaoUnariaNode(self, no):
+        self.visitar_padrao(no)
+        return [self._linha("expressao:"), (no.expressao, 2)]
+    
+    def visitar_SeNode(self, no):
+        self.visitar_padrao(no)
+        itens = [self._linha("condicao:"), (no.condicao, 2), self._linha("bloco_se:"), (no.bloco_se, 2)]
+        if no.blocos_senaose:
+            itens.append(self._linha("blocos_senaose:"))
+            for cond, bloco in no.blocos_senaose:
+                itens += [self._linha("condicao:", 2), (cond, 3), self._linha("bloco:", 2), (bloco, 3)]
+        if no.bloco_senao:
+            itens += [self._linha("bloco_senao:"), (no.bloco_senao, 2)]
+        return itens
+    
+    def visitar_EnquantoNode(self, no):
+        self.visitar_padrao(no)
+        return [self._linha("condicao:"), (no.condicao, 2), self._linha("bloco:"), (no.bloco, 2)]
+    
+    def visitar_ParaNode(self, no):
+        self.visitar_padrao(no)
+        return [self._linha(f"variavel: {no.variavel}"), self._linha("iteravel:"), (no.iteravel, 2),
+                self._linha("bloco:"), (no.bloco, 2)]
+    
+    def visitar_FuncaoNode(self, no):
+        self.visitar_padrao(no)
+        return [self._linha(f"parametros: {no.parametros}"), self._linha("bloco:"), (no.bloco, 2)]
+    
+    def visitar_ChamadaFuncaoNode(self, no):
+        self.visitar_padrao(no)
+        if isinstance(no.nome, str):
+            itens = [self._linha(f"funcao: {no.nome}")]
+        else:
+            itens = [self._linha("funcao:"), (no.nome, 2)]
+        if no.argumentos:
+            itens.append(self._linha("argumentos:"))
+            itens += [(arg, 2) for arg in no.argumentos]
+        return itens
+    
+    def visitar_RetornarNode(self, no):
+        self.visitar_padrao(no)
+        if no.expressao:
+            return [self._linha("expressao:"), (no.expressao, 2)]
+    
+    def visitar_ListaNode(self, no):
+        self.visitar_padrao(no)
+        if no.elementos:
+            return [self._linha("elementos:")] + [(elem, 2) for elem in no.elementos]
+    
+    def visitar_IndexacaoNode(self, no):
+        self.visitar_padrao(no)
+        return [self._linha("objeto:"), (no.objeto, 2), self._linha("indice:"), (no.indice, 2)]
+    
+    def visitar_ClasseNode(self, no):
+        self.visitar_padrao(no)
+        return [self._linha("bloco:"), (no.bloco, 2)]
+    
+    def visitar_AcessoAtributoNode(self, no):
+        self.visitar_padrao(no)
+        return [self._linha("objeto:"), (no.objeto, 2), self._linha(f"atributo: {no.atributo}")]
+    
+    def visitar_DicionarioNode(self, no):
+        self.visitar_padrao(no)
+        if no.pares:
+            itens = [self._linha("pares:")]
+            for chave, valor in no.pares:
+                itens += [self._linha("chave:", 2), (chave, 3), self._linha("valor:", 2), (valor, 3)]
+            return itens
+
+
 class CoralInterpreter:
     """Interpretador principal da linguagem Coral."""
     
-    def __init__(self, arquivo):
+    def __init__(self, arquivo, usar_cache=False):
         self.arquivo = arquivo
-        self.codigo = None
+        self.usar_cache = usar_cache
         self.tokens = []
         self.ast = None
+        self.chave_ast = None
     
     def carregar_arquivo(self):
-        """Carrega o código fonte do arquivo."""
+        """
+        Verifica se o arquivo fonte pode ser lido.
+        
+        O conteúdo não é carregado aqui: o lexer lê o arquivo em blocos
+        sob demanda (ver LexerCoral.analisar_arquivo com streaming=True).
+        """
         if not os.path.exists(self.arquivo):
             print(f"Erro: Arquivo '{self.arquivo}' não encontrado.")
             sys.exit(1)
         
         try:
             with open(self.arquivo, 'r', encoding='utf-8') as f:
-                self.codigo = f.read()
+                f.read(1)
             return True
         except Exception as e:
             print(f"Erro ao ler arquivo: {e}")
             sys.exit(1)
     
+    def exibir_arquivo(self, tamanho_bloco=64 * 1024):
+        """Exibe o conteúdo do arquivo, lendo-o em blocos."""
+        with open(self.arquivo, 'r', encoding='utf-8') as f:
+            while True:
+                bloco = f.read(tamanho_bloco)
+                if not bloco:
+                    break
+                sys.stdout.write(bloco)
+        print()
+    
+    def carregar_ast_do_cache(self):
+        """
+        Carrega a AST salva no cache .crlc para o conteúdo atual do arquivo.
+        
+        A chave (hash do conteúdo do arquivo, lido em blocos, versão do Coral
+        e do front-end) fica em self.chave_ast para que analise_sintatica
+        salve a AST em caso de falta.
+        
+        Returns:
+            bool: True se a AST foi carregada (as análises léxica e sintática
+            não são necessárias)
+        """
+        if not self.usar_cache:
+            return False
+        
+        self.chave_ast = chave_ast_arquivo(self.arquivo, __version__)
+        self.ast = carregar_ast(self.chave_ast)
+        return self.ast is not None
+    
     def analise_lexica(self, exibir=True):
         """Realiza análise léxica do código."""
         try:
-            lexer = LexerCoral.analisar_arquivo(self.arquivo)
+            if not exibir:
+                if self.usar_cache:
+                    # Tokens em colunas (TokenStream): bem mais compacto que uma lista de Token
+                    self.tokens = LexerCoral.tokenizar_arquivo(self.arquivo, cache=True)
+                else:
+                    # Sem cache, o parser puxa os tokens direto do lexer (erros léxicos
+                    # surgem durante a análise sintática, que fecha o arquivo)
+                    self.tokens = LexerCoral.analisar_arquivo(self.arquivo, streaming=True)
+                return True
+            
+            # Modo de recuperação: todos os erros léxicos são exibidos de uma vez.
+            # Com cache, os tokens salvos são usados; numa falta, o arquivo é
+            # analisado uma única vez, já no modo de recuperação
+            erros = []
+            if self.usar_cache:
+                lexer = LexerCoral.tokenizar_arquivo(self.arquivo, cache=True, erros=erros)
+            else:
+                lexer = LexerCoral.analisar_arquivo(self.arquivo, streaming=True, recuperar_erros=True)
+                erros = lexer.erros
             self.tokens = []
             
-            if exibir:
-                print(f"{'='*70}")
-                print(f"Análise Léxica - Arquivo: {self.arquivo}")
-                print(f"{'='*70}")
-                print(f"{'TOKEN':<20} | TIPO")
-                print("-" * 42)
+            print(f"{'='*70}")
+            print(f"Análise Léxica - Arquivo: {self.arquivo}")
+            print(f"{'='*70}")
+            print(f"{'TOKEN':<20} | TIPO")
+            print("-" * 42)
             
-            while True:
-                token = lexer.getNextToken()
-                self.tokens.append(token)
-                
-                if exibir and token.tipo != "EOF":
-                    print(f"{token.lexema:<20} | {token.tipo}")
-                
-                if token.tipo == "EOF":
-                    break
+            try:
+                for token in lexer:
+                    self.tokens.append(token)
+                    if token.tipo != "EOF":
+                        print(f"{token.lexema:<20} | {token.tipo}")
+            finally:
+                if not self.usar_cache:
+                    lexer.fechar()
             
-            if exibir:
-                print(f"Análise léxica concluída: {len(self.tokens)-1} tokens encontrados.\n")
+            if erros:
+                print()
+                for erro in erros:
+                    print(f"Erro léxico: {erro}")
+                print(f"\n{len(erros)} erro(s) léxico(s) encontrado(s).\n")
+                return False
+            
+            print(f"Análise léxica concluída: {len(self.tokens)-1} tokens encontrados.\n")
             
             return True
             
@@ -85,13 +259,23 @@ class CoralInterpreter:
             return False
     
     def analise_sintatica(self, exibir=True):
-        """Realiza análise sintática do código."""
-        if not self.tokens:
+        """Realiza análise sintática do código (ou usa a AST carregada do cache)."""
+        if self.ast is None and not self.tokens:
             self.analise_lexica(exibir=False)
         
         try:
-            parser = ParserCoral(self.tokens)
-            self.ast = parser.parse()
+            if self.ast is None:
+                try:
+                    parser = ParserCoral(self.tokens)
+                    self.ast = parser.parse()
+                finally:
+                    if isinstance(self.tokens, AnalisadorLexico):
+                        self.tokens.fechar()  # Lexer em streaming (sem cache): fecha o arquivo mesmo com erro
+                self.tokens = []  # Os tokens não são mais necessários após a análise
+                # O arquivo é lido de novo pelo lexer: se mudou desde o cálculo da
+                # chave, a AST é de outro conteúdo e não é salva sob essa chave
+                if self.chave_ast is not None and chave_ast_arquivo(self.arquivo, __version__) == self.chave_ast:
+                    salvar_ast(self.chave_ast, self.ast)
             
             if exibir:
                 print(f"{'='*70}")
@@ -105,137 +289,16 @@ class CoralInterpreter:
         except ErroSintatico as e:
             print(f"\n{e.formatar_mensagem()}\n")
             return False
+        except ErroLexico as e:
+            print(f"\nErro léxico: {e}\n")
+            return False
         except Exception as e:
             print(f"\nErro inesperado: {type(e).__name__}: {e}\n")
             return False
     
     def _imprimir_ast(self, no, nivel=0):
         """Imprime a árvore AST de forma hierárquica e simples."""
-        if no is None:
-            return
-        
-        indentacao = "  " * nivel
-        nome_classe = type(no).__name__
-        
-        # Imprime o nó atual
-        print(f"{indentacao}{nome_classe}", end="")
-        
-        # Adiciona informações específicas do nó
-        if hasattr(no, 'nome'):
-            print(f"(nome={no.nome})", end="")
-        elif hasattr(no, 'valor') and nome_classe == 'LiteralNode':
-            valor_repr = repr(no.valor) if isinstance(no.valor, str) else no.valor
-            print(f"(valor={valor_repr})", end="")
-        elif hasattr(no, 'operador') and nome_classe in ['ExpressaoBinariaNode', 'ExpressaoUnariaNode']:
-            op = no.operador.lexema if hasattr(no.operador, 'lexema') else no.operador
-            print(f"(op={op})", end="")
-        
-        print()  # Nova linha
-        
-        # Processa nós filhos baseado no tipo
-        if hasattr(no, 'declaracoes'):  # ProgramaNode
-            for decl in no.declaracoes:
-                self._imprimir_ast(decl, nivel + 1)
-        
-        elif hasattr(no, 'instrucoes'):  # BlocoNode
-            for instr in no.instrucoes:
-                self._imprimir_ast(instr, nivel + 1)
-        
-        elif nome_classe == 'AtribuicaoNode':
-            print(f"{indentacao}  identificador:")
-            self._imprimir_ast(no.identificador, nivel + 2)
-            print(f"{indentacao}  expressao:")
-            self._imprimir_ast(no.expressao, nivel + 2)
-        
-        elif nome_classe == 'ExpressaoBinariaNode':
-            print(f"{indentacao}  esquerda:")
-            self._imprimir_ast(no.esquerda, nivel + 2)
-            print(f"{indentacao}  direita:")
-            self._imprimir_ast(no.direita, nivel + 2)
-        
-        elif nome_classe == 'ExpressaoUnariaNode':
-            print(f"{indentacao}  expressao:")
-            self._imprimir_ast(no.expressao, nivel + 2)
-        
-        elif nome_classe == 'SeNode':
-            print(f"{indentacao}  condicao:")
-            self._imprimir_ast(no.condicao, nivel + 2)
-            print(f"{indentacao}  bloco_se:")
-            self._imprimir_ast(no.bloco_se, nivel + 2)
-            if no.blocos_senaose:
-                print(f"{indentacao}  blocos_senaose:")
-                for cond, bloco in no.blocos_senaose:
-                    print(f"{indentacao}    condicao:")
-                    self._imprimir_ast(cond, nivel + 3)
-                    print(f"{indentacao}    bloco:")
-                    self._imprimir_ast(bloco, nivel + 3)
-            if no.bloco_senao:
-                print(f"{indentacao}  bloco_senao:")
-                self._imprimir_ast(no.bloco_senao, nivel + 2)
-        
-        elif nome_classe == 'EnquantoNode':
-            print(f"{indentacao}  condicao:")
-            self._imprimir_ast(no.condicao, nivel + 2)
-            print(f"{indentacao}  bloco:")
-            self._imprimir_ast(no.bloco, nivel + 2)
-        
-        elif nome_classe == 'ParaNode':
-            print(f"{indentacao}  variavel: {no.variavel}")
-            print(f"{indentacao}  iteravel:")
-            self._imprimir_ast(no.iteravel, nivel + 2)
-            print(f"{indentacao}  bloco:")
-            self._imprimir_ast(no.bloco, nivel + 2)
-        
-        elif nome_classe == 'FuncaoNode':
-            print(f"{indentacao}  parametros: {no.parametros}")
-            print(f"{indentacao}  bloco:")
-            self._imprimir_ast(no.bloco, nivel + 2)
-        
-        elif nome_classe == 'ChamadaFuncaoNode':
-            if isinstance(no.nome, str):
-                print(f"{indentacao}  funcao: {no.nome}")
-            else:
-                print(f"{indentacao}  funcao:")
-                self._imprimir_ast(no.nome, nivel + 2)
-            if no.argumentos:
-                print(f"{indentacao}  argumentos:")
-                for arg in no.argumentos:
-                    self._imprimir_ast(arg, nivel + 2)
-        
-        elif nome_classe == 'RetornarNode':
-            if no.expressao:
-                print(f"{indentacao}  expressao:")
-                self._imprimir_ast(no.expressao, nivel + 2)
-        
-        elif nome_classe == 'ListaNode':
-            if no.elementos:
-                print(f"{indentacao}  elementos:")
-                for elem in no.elementos:
-                    self._imprimir_ast(elem, nivel + 2)
-        
-        elif nome_classe == 'IndexacaoNode':
-            print(f"{indentacao}  objeto:")
-            self._imprimir_ast(no.objeto, nivel + 2)
-            print(f"{indentacao}  indice:")
-            self._imprimir_ast(no.indice, nivel + 2)
-        
-        elif nome_classe == 'ClasseNode':
-            print(f"{indentacao}  bloco:")
-            self._imprimir_ast(no.bloco, nivel + 2)
-        
-        elif nome_classe == 'AcessoAtributoNode':
-            print(f"{indentacao}  objeto:")
-            self._imprimir_ast(no.objeto, nivel + 2)
-            print(f"{indentacao}  atributo: {no.atributo}")
-        
-        elif nome_classe == 'DicionarioNode':
-            if no.pares:
-                print(f"{indentacao}  pares:")
-                for chave, valor in no.pares:
-                    print(f"{indentacao}    chave:")
-                    self._imprimir_ast(chave, nivel + 3)
-                    print(f"{indentacao}    valor:")
-                    self._imprimir_ast(valor, nivel + 3)
+        ImpressorAST().visitar(no, nivel)
     
     def executar(self, modo='completo'):
         """
@@ -250,7 +313,7 @@ class CoralInterpreter:
         
         if modo == 'cat':
             # Exibe o conteúdo do arquivo
-            print(self.codigo)
+            self.exibir_arquivo()
             return True
         
         if modo == 'lex':
@@ -258,7 +321,7 @@ class CoralInterpreter:
         
         elif modo == 'parse':
             # Análise sintática: apenas valida a sintaxe
-            if not self.analise_lexica(exibir=False):
+            if not self.carregar_ast_do_cache() and not self.analise_lexica(exibir=False):
                 return False
             
             if not self.analise_sintatica(exibir=False):
@@ -273,7 +336,7 @@ class CoralInterpreter:
             return True
         
         elif modo == 'ast':
-            if not self.analise_lexica(exibir=False):
+            if not self.carregar_ast_do_cache() and not self.analise_lexica(exibir=False):
                 return False
             
             if not self.analise_sintatica(exibir=True):
@@ -291,7 +354,7 @@ class CoralInterpreter:
         
         elif modo == 'llvmir':
             # Modo LLVM IR: compila para LLVM
-            if not self.analise_lexica(exibir=False):
+            if not self.carregar_ast_do_cache() and not self.analise_lexica(exibir=False):
                 return False
             
             if not self.analise_sintatica(exibir=False):
@@ -323,7 +386,7 @@ class CoralInterpreter:
         
         elif modo == 'completo':
             # Modo completo: executa o programa e mostra apenas o output
-            if not self.analise_lexica(exibir=False):
+            if not self.carregar_ast_do_cache() and not self.analise_lexica(exibir=False):
                 return False
             
             if not self.analise_sintatica(exibir=False):
@@ -407,6 +470,15 @@ Para mais informações, visite: https://github.com/GabrielVerri/Coral_project
         help='Compilar para LLVM IR'
     )
     
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='Usar os caches de tokens e da AST em disco (~/.cache/coral)'
+    )
+    
+    # Mantida por compatibilidade: sem --cache, os caches já não são usados
+    parser.add_argument('--sem-cache', action='store_true', help=argparse.SUPPRESS)
+    
     parser.add_argument(
         '--logo',
         action='store_true',
@@ -452,7 +524,7 @@ Para mais informações, visite: https://github.com/GabrielVerri/Coral_project
         modo = 'completo'
     
     # Executa o interpretador
-    interpretador = CoralInterpreter(args.arquivo)
+    interpretador = CoralInterpreter(args.arquivo, usar_cache=args.cache and not args.sem_cache)
     sucesso = interpretador.executar(modo)
     
     sys.exit(0 if sucesso else 1)
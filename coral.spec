@@ -15,8 +15,9 @@ for root, dirs, files in os.walk(src_path):
 
 # Coleta todos os submódulos
 hiddenimports = [
-    'lexer', 'lexer.lexer', 'lexer.Token', 'lexer.Buffer', 'lexer.afn_to_afd',
-    'lexer.AFD', 'lexer.AFD.AFDUnificado', 'lexer.AFD.AFDStringLiteral', 
+    'lexer', 'lexer.lexer', 'lexer.Token', 'lexer.TokenStream', 'lexer.Buffer', 'lexer.afn_to_afd', 'lexer.cache_afd',
+    'lexer.AFD', 'lexer.AFD.AFDUnificado', 'lexer.AFD.AFDTabela', 'lexer.AFD.AFDGerado', 'lexer.AFD.AFDRegex',
+    'lexer.AFD.scanner_gerado', 'lexer.AFD.AFDStringLiteral', 
     'lexer.AFD.AFDOperadoresLogicos', 'lexer.AFD.AFDOperadoresBooleanos',
     'lexer.AFD.AFDOperadoresAritmeticosRelacionais', 'lexer.AFD.AFDIdentificadores',
     'lexer.AFD.AFDDelimitadores', 'lexer.AFD.AFDDecimal', 'lexer.AFD.AFDComentariosLinha',
@@ -4,6 +4,9 @@ echo   Coral Language - Build Executable
 echo ========================================
 echo.
 
+echo Gerando scanner do lexer...
+python src\lexer\gerador_scanner.py
+
 echo Gerando executavel...
 pyinstaller --clean coral.spec
 
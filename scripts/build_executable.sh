@@ -5,6 +5,9 @@ echo "  Coral Language - Build Executable"
 echo "========================================"
 echo ""
 
+echo "Gerando scanner do lexer..."
+python src/lexer/gerador_scanner.py
+
 echo "Gerando executável..."
 pyinstaller --clean coral.spec
 
@@ -13,8 +13,10 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 
 try:
     from src.parser.ast_nodes import *
+    from src.parser.percurso import TabelaDespacho
 except ModuleNotFoundError:
     from parser.ast_nodes import *
+    from parser.percurso import TabelaDespacho
 
 
 class ErroExecucao(Exception):
@@ -93,6 +95,11 @@ class InterpretadorCoral:
         self.ambiente_global = Ambiente()
         self.ambiente_atual = self.ambiente_global
         self._registrar_funcoes_nativas()
+        
+        # Tabela de despacho de visitar, criada uma vez por classe (inclusive subclasses)
+        classe = type(self)
+        if '_despacho' not in classe.__dict__:
+            classe._despacho = TabelaDespacho(classe, 'visitar_', 'visitar_generico')
     
     def _mapa_tipos_python(self):
         """Mapeia tipos Coral para tipos Python."""
@@ -196,10 +203,8 @@ class InterpretadorCoral:
             sys.exit(1)
     
     def visitar(self, no):
-        """Visita um nó da AST e executa a ação apropriada."""
-        nome_metodo = f'visitar_{type(no).__name__}'
-        metodo = getattr(self, nome_metodo, self.visitar_generico)
-        return metodo(no)
+        """Visita um nó da AST e executa a ação apropriada (visitar_<Classe>, em cache por classe)."""
+        return self._despacho[type(no)](self, no)
     
     def visitar_generico(self, no):
         """Método chamado quando não há implementação específica."""
@@ -232,17 +237,8 @@ class InterpretadorCoral:
                 from src.lexer.lexer import LexerCoral
                 from src.parser.parser import ParserCoral
                 
-                # Analisa a expressão
-                lexer = LexerCoral.analisar_string(expressao_str)
-                tokens = []
-                while True:
-                    token = lexer.getNextToken()
-                    tokens.append(token)
-                    if token.tipo == "EOF":
-                        break
-                
-                # Parse como expressão
-                parser = ParserCoral(tokens)
+                # Parse como expressão (tokens puxados do lexer sob demanda)
+                parser = ParserCoral(LexerCoral.analisar_string(expressao_str))
                 # Usa o método interno para parsear apenas uma expressão
                 expressao_node = parser.expressao()
                 
@@ -0,0 +1,92 @@
+import re
+
+from .AFDUnificado import AFDUnificado
+from .AFDRegex import AFDRegex
+
+class AFDBytes:
+    """
+    Reconhecimento de tokens diretamente sobre os bytes UTF-8 do código fonte.
+    
+    Usa o padrão mestre do AFDRegex compilado para bytes: nele, \\w e \\d
+    casam apenas ASCII. Em UTF-8, todo byte de um caractere não ASCII é
+    >= 0x80, então aspas, barras, quebras de linha, dígitos e operadores
+    ASCII são reconhecidos sem decodificar o texto, e strings e comentários
+    podem conter qualquer caractere.
+    
+    Quando o resultado pode depender de um caractere não ASCII (um token que
+    começa com ele, ou identificador/número/ponto seguido dele), apenas o
+    trecho da linha a partir do token é decodificado e reconhecido pelo AFD
+    de texto, garantindo os mesmos tokens da análise do texto decodificado.
+    
+    match retorna (lexema, tamanho, tipo) com o lexema já decodificado e o
+    tamanho em bytes.
+    """
+    
+    # Grupos cujo fim depende da classe do caractere seguinte (isalnum, isdigit)
+    GRUPOS_DEPENDENTES = frozenset(('IDENTIFICADOR', 'DECIMAL', 'INTEIRO', 'PONTO'))
+    
+    # Bytes decodificados por vez no reconhecimento pelo AFD de texto
+    JANELA_TEXTO = 1024
+    
+    padrao = re.compile(AFDRegex.construir_padrao().encode('ascii'))
+    
+    def __init__(self, afd_texto):
+        """
+        Args:
+            afd_texto: AFD de texto (ex.: get_afd()) usado perto de caracteres
+                não ASCII
+        """
+        self.afd_texto = afd_texto
+    
+    def match(self, entrada, inicio=0):
+        """
+        Reconhece um token em entrada (bytes, bytearray ou mmap) a partir de inicio.
+        
+        Returns:
+            Tupla (lexema, tamanho em bytes, tipo) ou None.
+        """
+        m = self.padrao.match(entrada, inicio)
+        if m is None:
+            return self._reconhecer_texto(entrada, inicio)
+        
+        grupo = m.lastgroup
+        fim = m.end()
+        if grupo in self.GRUPOS_DEPENDENTES and fim < len(entrada) and entrada[fim] >= 0x80:
+            return self._reconhecer_texto(entrada, inicio)
+        
+        lexema = m.group().decode('utf-8')
+        if grupo == 'IDENTIFICADOR':
+            return (lexema, fim - inicio, AFDUnificado.PALAVRAS_ESPECIAIS.get(lexema, 'IDENTIFICADOR'))
+        if grupo == 'OPERADOR_DUPLO':
+            return (lexema, 2, AFDUnificado.OPERADORES_DUPLOS[lexema])
+        if grupo == 'OPERADOR_SIMPLES':
+            return (lexema, 1, AFDUnificado.OPERADORES_SIMPLES[lexema])
+        return (lexema, fim - inicio, AFDRegex.TIPOS_GRUPO[grupo])
+    
+    def _reconhecer_texto(self, entrada, inicio):
+        """Decodifica o trecho da linha a partir de inicio e o reconhece com o AFD de texto."""
+        fim_linha = entrada.find(b'\n', inicio)
+        if fim_linha < 0:
+            fim_linha = len(entrada)
+        
+        janela = self.JANELA_TEXTO
+        while True:
+            fim = min(fim_linha, inicio + janela)
+            trecho = entrada[inicio:fim]
+            try:
+                texto = trecho.decode('utf-8')
+            except UnicodeDecodeError as erro:
+                # Só um caractere cortado no fim da janela é tolerado
+                if fim == fim_linha or erro.reason != 'unexpected end of data':
+                    raise
+                texto = trecho[:erro.start].decode('utf-8')
+            resultado = self.afd_texto.match(texto, 0)
+            if fim == fim_linha or (resultado is not None and resultado[1] < len(texto)):
+                break
+            # O token pode continuar (ou só ser reconhecido) depois da janela
+            janela *= 2
+        
+        if resultado is None:
+            return None
+        lexema, _, tipo = resultado
+        return (lexema, len(lexema.encode('utf-8')), tipo)
@@ -0,0 +1,11 @@
+class AFDGerado:
+    """
+    Adapta o scanner gerado (ver lexer/gerador_scanner.py) à interface dos AFDs.
+    
+    match é a própria função scan do módulo gerado, sem camada intermediária.
+    """
+    
+    def __init__(self, modulo):
+        self.modulo = modulo
+        self.chave = modulo.CHAVE
+        self.match = modulo.scan
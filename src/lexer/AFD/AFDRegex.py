@@ -0,0 +1,100 @@
+import re
+
+from .AFDUnificado import AFDUnificado
+
+class AFDRegex:
+    """
+    Motor léxico baseado em uma única expressão regular (padrão mestre).
+    
+    As classes de token da linguagem Coral são compiladas em uma alternância
+    de grupos nomeados, na mesma ordem de prioridade dos caminhos rápidos do
+    AFDUnificado. O reconhecimento em uma posição é um único re.match.
+    
+    As classes de caractere Unicode do módulo re (\\w, \\d) não coincidem
+    exatamente com str.isalpha()/str.isdigit() para alguns caracteres não
+    ASCII (ex.: '²', '½'). Nesses casos, e quando nenhum grupo casa, o
+    reconhecimento é delegado ao AFD de reserva, garantindo tokens idênticos.
+    """
+    
+    # Alternativas em ordem de prioridade: (grupo, padrão)
+    ALTERNATIVAS = [
+        ('FSTRING_MULTILINE', r'f"""[\s\S]*?"""'),
+        ('FSTRING', r'''f(?!""")"(?:\\[\s\S]|[^"\\\n])*"|f'(?:\\[\s\S]|[^'\\\n])*\''''),
+        ('IDENTIFICADOR', r'[^\W\d]\w*'),
+        ('COMENTARIO_LINHA', r'#[^\n]*\n?'),
+        ('STRING_MULTILINE', r'"""[\s\S]*?"""'),
+        ('STRING', r'''(?!""")"(?:\\[\s\S]|[^"\\\n])*"|'(?:\\[\s\S]|[^'\\\n])*\''''),
+        ('DECIMAL', r'\d+\.\d+(?!\w)'),
+        ('INTEIRO', r'\d+(?![\w.])'),
+        ('OPERADOR_DUPLO', None),
+        ('OPERADOR_SIMPLES', None),
+        ('PONTO', r'\.(?!\d)'),
+    ]
+    
+    # Grupos cujo tipo de token é fixo
+    TIPOS_GRUPO = {
+        'FSTRING_MULTILINE': 'STRING_MULTILINE',
+        'FSTRING': 'STRING',
+        'COMENTARIO_LINHA': 'COMENTARIO_LINHA',
+        'STRING_MULTILINE': 'STRING_MULTILINE',
+        'STRING': 'STRING',
+        'DECIMAL': 'DECIMAL',
+        'INTEIRO': 'INTEIRO',
+        'PONTO': 'DELIMITADOR',
+    }
+    
+    def __init__(self, afd_reserva):
+        """
+        Args:
+            afd_reserva: AFD usado quando o padrão mestre não decide o token
+                (ex.: AFDUnificado).
+        """
+        self.afd_reserva = afd_reserva
+        self.padrao = re.compile(self.construir_padrao())
+    
+    @classmethod
+    def construir_padrao(cls):
+        """Monta o padrão mestre a partir das alternativas e das tabelas de operadores."""
+        operadores = {
+            'OPERADOR_DUPLO': AFDUnificado.OPERADORES_DUPLOS,
+            'OPERADOR_SIMPLES': AFDUnificado.OPERADORES_SIMPLES
+        }
+        partes = []
+        for grupo, padrao in cls.ALTERNATIVAS:
+            if padrao is None:
+                padrao = '|'.join(re.escape(op) for op in operadores[grupo])
+            partes.append(f"(?P<{grupo}>{padrao})")
+        return '|'.join(partes)
+    
+    def match(self, entrada, inicio=0):
+        """
+        Reconhece um token em entrada a partir da posição inicio.
+        
+        Returns:
+            Tupla (lexema, tamanho, tipo) ou None se nenhum token for reconhecido.
+        """
+        m = self.padrao.match(entrada, inicio)
+        if m is None:
+            return self.afd_reserva.match(entrada, inicio)
+        
+        grupo = m.lastgroup
+        fim = m.end()
+        lexema = m.group()
+        
+        if grupo == 'IDENTIFICADOR':
+            # [^\W\d] também aceita numerais não decimais ('²', '½')
+            primeiro_char = lexema[0]
+            if primeiro_char != '_' and not primeiro_char.isalpha():
+                return self.afd_reserva.match(entrada, inicio)
+            return (lexema, fim - inicio, AFDUnificado.PALAVRAS_ESPECIAIS.get(lexema, 'IDENTIFICADOR'))
+        
+        if grupo == 'DECIMAL' or grupo == 'INTEIRO' or grupo == 'PONTO':
+            # \d difere de str.isdigit() fora do ASCII
+            if not entrada[inicio:fim + 1].isascii():
+                return self.afd_reserva.match(entrada, inicio)
+        elif grupo == 'OPERADOR_DUPLO':
+            return (lexema, 2, AFDUnificado.OPERADORES_DUPLOS[lexema])
+        elif grupo == 'OPERADOR_SIMPLES':
+            return (lexema, 1, AFDUnificado.OPERADORES_SIMPLES[lexema])
+        
+        return (lexema, fim - inicio, self.TIPOS_GRUPO[grupo])
@@ -0,0 +1,88 @@
+from array import array
+
+from .AFDUnificado import AFDUnificado
+
+class AFDTabela(AFDUnificado):
+    """
+    AFD unificado com motor de tabela de inteiros.
+    
+    Mantém os caminhos rápidos do AFDUnificado, mas o percurso genérico da
+    tabela usa:
+    - uma tabela de classes de caractere indexada por ord() (ASCII);
+    - uma matriz de transições plana em array, com estados inteiros;
+    - rastreamento do maior casamento apenas por índice.
+    """
+    
+    # Caracteres com ord() abaixo deste limite são classificados pela tabela
+    LIMITE_ASCII = 128
+    
+    # Transição inexistente
+    SEM_TRANSICAO = -1
+    
+    def _inicializar(self, tabela_transicoes, estados_aceitacao):
+        super()._inicializar(tabela_transicoes, estados_aceitacao)
+        
+        simbolos = sorted({s for trans in tabela_transicoes.values() for s in trans})
+        estados = sorted(set(tabela_transicoes) | set(estados_aceitacao) | {0} |
+                         {d for trans in tabela_transicoes.values() for d in trans.values()})
+        
+        # Coluna extra (a última) para caracteres sem transição em nenhum estado
+        self.colunas = {simbolo: indice for indice, simbolo in enumerate(simbolos)}
+        self.total_colunas = len(simbolos) + 1
+        self.coluna_invalida = len(simbolos)
+        
+        self.classes_ascii = array('B', [
+            self.colunas.get(self._get_tipo_caractere(chr(codigo)), self.coluna_invalida)
+            for codigo in range(self.LIMITE_ASCII)
+        ])
+        self._classes_unicode = {}
+        
+        self.transicoes = array('i', [self.SEM_TRANSICAO]) * (len(estados) * self.total_colunas)
+        for estado, trans in tabela_transicoes.items():
+            base = estado * self.total_colunas
+            for simbolo, destino in trans.items():
+                self.transicoes[base + self.colunas[simbolo]] = destino
+        
+        # Tipo de token de cada estado como índice em tipos_token (-1 = não aceita)
+        self.tipos_token = sorted(set(estados_aceitacao.values()))
+        indice_tipo = {tipo: indice for indice, tipo in enumerate(self.tipos_token)}
+        self.aceitacao = array('b', [-1]) * len(estados)
+        for estado, tipo in estados_aceitacao.items():
+            self.aceitacao[estado] = indice_tipo[tipo]
+    
+    def _classe_unicode(self, char):
+        """Classe de um caractere fora da faixa ASCII (memoizada)."""
+        coluna = self._classes_unicode.get(char)
+        if coluna is None:
+            coluna = self.colunas.get(self._get_tipo_caractere(char), self.coluna_invalida)
+            self._classes_unicode[char] = coluna
+        return coluna
+    
+    def _casar_tabela(self, entrada, inicio):
+        """Percorre a matriz de transições a partir de inicio (maior casamento)."""
+        classes = self.classes_ascii
+        limite = self.LIMITE_ASCII
+        transicoes = self.transicoes
+        aceitacao = self.aceitacao
+        total_colunas = self.total_colunas
+        
+        fim = len(entrada)
+        estado = 0
+        i = inicio
+        ultima_posicao = -1
+        ultimo_tipo = -1
+        
+        while i < fim:
+            codigo = ord(entrada[i])
+            coluna = classes[codigo] if codigo < limite else self._classe_unicode(entrada[i])
+            estado = transicoes[estado * total_colunas + coluna]
+            if estado < 0:
+                break
+            i += 1
+            if aceitacao[estado] >= 0:
+                ultima_posicao = i
+                ultimo_tipo = aceitacao[estado]
+        
+        if ultima_posicao < 0:
+            return None
+        return (entrada[inicio:ultima_posicao], ultima_posicao - inicio, self.tipos_token[ultimo_tipo])
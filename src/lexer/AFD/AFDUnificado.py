@@ -1,12 +1,78 @@
 class AFDUnificado:
     """AFD unificado que reconhece todos os tokens da linguagem Coral."""
     
+    # Identificadores com tipo próprio (palavras inteiras)
+    PALAVRAS_ESPECIAIS = {
+        "VERDADE": "BOOLEANO", "FALSO": "BOOLEANO",
+        "E": "OPERADOR_LOGICO", "OU": "OPERADOR_LOGICO", "NAO": "OPERADOR_LOGICO"
+    }
+    
+    # Operadores de dois caracteres (têm prioridade sobre os simples)
+    OPERADORES_DUPLOS = {
+        "==": "OPERADOR_RELACIONAL", "!=": "OPERADOR_RELACIONAL",
+        "<=": "OPERADOR_RELACIONAL", ">=": "OPERADOR_RELACIONAL",
+        "++": "OPERADOR_ATRIBUICAO", "--": "OPERADOR_ATRIBUICAO",
+        "+=": "OPERADOR_ATRIBUICAO", "-=": "OPERADOR_ATRIBUICAO",
+        "*=": "OPERADOR_ATRIBUICAO", "/=": "OPERADOR_ATRIBUICAO",
+        "%=": "OPERADOR_ATRIBUICAO",
+        "**": "OPERADOR_ARITMETICO"
+    }
+    
+    # Operadores e delimitadores de um caractere
+    OPERADORES_SIMPLES = {
+        '+': 'OPERADOR_ARITMETICO', '-': 'OPERADOR_ARITMETICO', 
+        '*': 'OPERADOR_ARITMETICO', '/': 'OPERADOR_ARITMETICO',
+        '%': 'OPERADOR_ARITMETICO', '=': 'OPERADOR_ATRIBUICAO',
+        '!': 'OPERADOR_RELACIONAL', '<': 'OPERADOR_RELACIONAL',
+        '>': 'OPERADOR_RELACIONAL', '(': 'DELIMITADOR',
+        ')': 'DELIMITADOR', '{': 'DELIMITADOR', '}': 'DELIMITADOR',
+        '[': 'DELIMITADOR', ']': 'DELIMITADOR', ',': 'DELIMITADOR',
+        ';': 'DELIMITADOR', ':': 'DELIMITADOR'
+    }
+    
     def __init__(self, conversor):
-        self.tabela_transicoes = conversor.get_tabela_transicoes_afd()
-        self.estados_aceitacao = conversor.get_estados_aceitacao_afd()
-        self.estado_atual = 'Sq0'
+        self._inicializar(
+            conversor.get_tabela_transicoes_afd(),
+            conversor.get_estados_aceitacao_afd()
+        )
+    
+    @classmethod
+    def de_tabelas(cls, tabela_transicoes, estados_aceitacao):
+        """Cria o AFD diretamente a partir de tabelas já construídas (ex.: cache em disco)."""
+        afd = cls.__new__(cls)
+        afd._inicializar(tabela_transicoes, estados_aceitacao)
+        return afd
+    
+    def _inicializar(self, tabela_transicoes, estados_aceitacao):
+        self.tabela_transicoes = tabela_transicoes
+        self.estados_aceitacao = estados_aceitacao
         
-    def _get_tipo_caractere(self, char):
+    # Exemplos das categorias de caracteres fora da faixa ASCII, na ordem em
+    # que _get_tipo_caractere as testa (os demais caracteres são 'outro')
+    _EXEMPLOS_NAO_ASCII = (('isalpha', 'é'), ('isdigit', '٣'), ('isspace', '\u2003'))
+    
+    @classmethod
+    def classes_caracteres(cls, alfabeto):
+        """
+        Retorna a classe de cada caractere segundo _get_tipo_caractere,
+        restrita ao alfabeto do AFN (None se nenhuma transição usa a classe).
+        
+        Returns:
+            Tupla (classes_ascii, classes_nao_ascii): classes_ascii tem a classe
+            de cada caractere com ord() < 128; classes_nao_ascii tem pares
+            (método de str, classe), testados em ordem, terminando com
+            (None, classe dos demais caracteres).
+        """
+        def classe(char):
+            tipo = cls._get_tipo_caractere(char)
+            return tipo if tipo in alfabeto else None
+        
+        classes_ascii = tuple(classe(chr(codigo)) for codigo in range(128))
+        classes_nao_ascii = tuple((metodo, classe(exemplo)) for metodo, exemplo in cls._EXEMPLOS_NAO_ASCII)
+        return classes_ascii, classes_nao_ascii + ((None, classe('€')),)
+    
+    @staticmethod
+    def _get_tipo_caractere(char):
         if char == '\n':
             return '\\n'
         if char.isalpha():
@@ -42,153 +108,143 @@ class AFDUnificado:
             pos += 1
         return pos
             
-    def match(self, entrada):
-        """Reconhece um token no início da entrada."""
-        if not entrada:
+    def match(self, entrada, inicio=0):
+        """
+        Reconhece um token em entrada a partir da posição inicio.
+        
+        Todas as verificações operam sobre (entrada, inicio) sem copiar o
+        restante do código; apenas o lexema reconhecido é fatiado.
+        
+        Returns:
+            Tupla (lexema, tamanho, tipo) ou None se nenhum token for reconhecido.
+        """
+        fim = len(entrada)
+        if inicio >= fim:
             return None
 
         # F-strings multilinhas (somente aspas duplas triplas)
-        if entrada.startswith('f"""'):
-            if len(entrada) >= 7:
-                pos = entrada.find('"""', 4)
+        if entrada.startswith('f"""', inicio):
+            if fim - inicio >= 7:
+                pos = entrada.find('"""', inicio + 4)
                 if pos >= 0:
-                    return (entrada[:pos+3], pos+3, "STRING_MULTILINE")
-        elif entrada.startswith('f"') or entrada.startswith("f'"):
-            delim = entrada[1]
-            pos = 2
-            while pos < len(entrada):
+                    return (entrada[inicio:pos+3], pos+3 - inicio, "STRING_MULTILINE")
+        elif entrada.startswith('f"', inicio) or entrada.startswith("f'", inicio):
+            delim = entrada[inicio + 1]
+            pos = inicio + 2
+            while pos < fim:
                 if entrada[pos] == '\\':
                     pos += 2
                 elif entrada[pos] == delim:
-                    return (entrada[:pos+1], pos+1, "STRING")
+                    return (entrada[inicio:pos+1], pos+1 - inicio, "STRING")
                 elif entrada[pos] == '\n':
                     break  # String não fechada
                 else:
                     pos += 1
 
+        primeiro_char = entrada[inicio]
+
         # Identificadores e palavras reservadas
-        if entrada[0] == '_' or entrada[0].isalpha():
-            pos = self._consume_identifier(entrada, 0)
-            lexema = entrada[:pos]
-            
-            if lexema == "VERDADE" and self._check_word_boundary(entrada, 7):
-                return ("VERDADE", 7, "BOOLEANO")
-            elif lexema == "FALSO" and self._check_word_boundary(entrada, 5):
-                return ("FALSO", 5, "BOOLEANO")
-            elif lexema == "E" and self._check_word_boundary(entrada, 1):
-                return ("E", 1, "OPERADOR_LOGICO")
-            elif lexema == "OU" and self._check_word_boundary(entrada, 2):
-                return ("OU", 2, "OPERADOR_LOGICO")
-            elif lexema == "NAO" and self._check_word_boundary(entrada, 3):
-                return ("NAO", 3, "OPERADOR_LOGICO")
-            
-            return (entrada[:pos], pos, "IDENTIFICADOR")
+        if primeiro_char == '_' or primeiro_char.isalpha():
+            pos = self._consume_identifier(entrada, inicio)
+            lexema = entrada[inicio:pos]
+            return (lexema, pos - inicio, self.PALAVRAS_ESPECIAIS.get(lexema, "IDENTIFICADOR"))
             
         # Comentários
-        if entrada.startswith('#'):
-            pos = entrada.find('\n')
+        if primeiro_char == '#':
+            pos = entrada.find('\n', inicio)
             if pos >= 0:
-                return (entrada[:pos+1], pos+1, "COMENTARIO_LINHA")
-            return (entrada, len(entrada), "COMENTARIO_LINHA")
+                return (entrada[inicio:pos+1], pos+1 - inicio, "COMENTARIO_LINHA")
+            return (entrada[inicio:], fim - inicio, "COMENTARIO_LINHA")
             
         # Strings multilinhas (apenas """ sem quebra entre as aspas)
         # Multistring permite conteúdo multilinhas, mas as aspas de abertura/fechamento 
         # devem estar completas (""" na mesma linha)
-        if entrada.startswith('"""'):
+        if entrada.startswith('"""', inicio):
             # Procura o fechamento """
-            pos = 3
-            while pos < len(entrada):
-                if entrada[pos:pos+3] == '"""':
-                    return (entrada[:pos+3], pos+3, "STRING_MULTILINE")
-                pos += 1
+            pos = entrada.find('"""', inicio + 3)
+            if pos >= 0:
+                return (entrada[inicio:pos+3], pos+3 - inicio, "STRING_MULTILINE")
             # String não fechada
             return None
         
         # Strings normais
-        if entrada[0] in ('"', "'"):
-            aspas = entrada[0]
-            pos = 1
-            while pos < len(entrada):
+        if primeiro_char in ('"', "'"):
+            aspas = primeiro_char
+            pos = inicio + 1
+            while pos < fim:
                 if entrada[pos] == '\\':
                     pos += 2  # Pula caractere escapado
                     continue
                 if entrada[pos] == aspas:
-                    return (entrada[:pos+1], pos+1, "STRING")
+                    return (entrada[inicio:pos+1], pos+1 - inicio, "STRING")
                 if entrada[pos] == '\n':
                     return None  # String não pode ter quebra de linha
                 pos += 1
             return None  # String não fechada
         
         # Números inteiros e decimais
-        if entrada[0].isdigit():
-            pos = 0
-            while pos < len(entrada) and entrada[pos].isdigit():
+        if primeiro_char.isdigit():
+            pos = inicio
+            while pos < fim and entrada[pos].isdigit():
                 pos += 1
                 
-            if pos < len(entrada) and entrada[pos] == '.':
+            if pos < fim and entrada[pos] == '.':
                 decimal_pos = pos + 1
-                if decimal_pos < len(entrada) and entrada[decimal_pos].isdigit():
+                if decimal_pos < fim and entrada[decimal_pos].isdigit():
                     pos = decimal_pos
-                    while pos < len(entrada) and entrada[pos].isdigit():
+                    while pos < fim and entrada[pos].isdigit():
                         pos += 1
-                    if pos < len(entrada) and self._is_valid_identifier_char(entrada[pos]):
+                    if pos < fim and self._is_valid_identifier_char(entrada[pos]):
                         return None
-                    return (entrada[:pos], pos, "DECIMAL")
+                    return (entrada[inicio:pos], pos - inicio, "DECIMAL")
                 return None
                 
-            if pos < len(entrada) and self._is_valid_identifier_char(entrada[pos]):
+            if pos < fim and self._is_valid_identifier_char(entrada[pos]):
                 return None
-            return (entrada[:pos], pos, "INTEIRO")
+            return (entrada[inicio:pos], pos - inicio, "INTEIRO")
         
         # Operadores compostos
-        if len(entrada) >= 2:
-            dois_chars = entrada[:2]
-            if dois_chars in ["==", "!=", "<=", ">="]:
-                return (dois_chars, 2, "OPERADOR_RELACIONAL")
-            elif dois_chars in ["++", "--", "+=", "-=", "*=", "/=", "%="]:
-                return (dois_chars, 2, "OPERADOR_ATRIBUICAO")
-            elif dois_chars == "**":
-                return ("**", 2, "OPERADOR_ARITMETICO")
+        if fim - inicio >= 2:
+            dois_chars = entrada[inicio:inicio+2]
+            tipo = self.OPERADORES_DUPLOS.get(dois_chars)
+            if tipo:
+                return (dois_chars, 2, tipo)
         
         # Operadores e delimitadores simples
-        primeiro_char = entrada[0]
-        if primeiro_char in "+-*/%=!<>(){}[],;:":
-            tipo_map = {
-                '+': 'OPERADOR_ARITMETICO', '-': 'OPERADOR_ARITMETICO', 
-                '*': 'OPERADOR_ARITMETICO', '/': 'OPERADOR_ARITMETICO',
-                '%': 'OPERADOR_ARITMETICO', '=': 'OPERADOR_ATRIBUICAO',
-                '!': 'OPERADOR_RELACIONAL', '<': 'OPERADOR_RELACIONAL',
-                '>': 'OPERADOR_RELACIONAL', '(': 'DELIMITADOR',
-                ')': 'DELIMITADOR', '{': 'DELIMITADOR', '}': 'DELIMITADOR',
-                '[': 'DELIMITADOR', ']': 'DELIMITADOR', ',': 'DELIMITADOR',
-                ';': 'DELIMITADOR', ':': 'DELIMITADOR'
-            }
-            return (primeiro_char, 1, tipo_map.get(primeiro_char, 'OPERADOR'))
+        tipo = self.OPERADORES_SIMPLES.get(primeiro_char)
+        if tipo:
+            return (primeiro_char, 1, tipo)
         
         # Ponto como delimitador (rejeita casos como ".5")
         if primeiro_char == '.':
-            if len(entrada) > 1 and entrada[1].isdigit():
+            if fim - inicio > 1 and entrada[inicio + 1].isdigit():
                 return None
             return ('.', 1, 'DELIMITADOR')
         
         # Fallback: usa tabela de transições do AFD
-        self.estado_atual = 'Sq0'
-        lexema = ""
-        i = 0
+        return self._casar_tabela(entrada, inicio)
+    
+    def _casar_tabela(self, entrada, inicio):
+        """
+        Percorre a tabela de transições a partir de inicio (maior casamento).
+        
+        O estado é local: a mesma instância é compartilhada entre analisadores e threads.
+        """
+        fim = len(entrada)
+        estado_atual = 0
+        i = inicio
         ultimo_estado_aceitacao = None
         ultima_posicao_aceitacao = -1
         
-        while i < len(entrada):
-            char = entrada[i]
-            tipo_char = self._get_tipo_caractere(char)
+        while i < fim:
+            tipo_char = self._get_tipo_caractere(entrada[i])
             
-            if (self.estado_atual in self.tabela_transicoes and 
-                tipo_char in self.tabela_transicoes[self.estado_atual]):
-                self.estado_atual = self.tabela_transicoes[self.estado_atual][tipo_char]
-                lexema += char
+            if (estado_atual in self.tabela_transicoes and 
+                tipo_char in self.tabela_transicoes[estado_atual]):
+                estado_atual = self.tabela_transicoes[estado_atual][tipo_char]
                 
-                if self.estado_atual in self.estados_aceitacao:
-                    ultimo_estado_aceitacao = self.estado_atual
+                if estado_atual in self.estados_aceitacao:
+                    ultimo_estado_aceitacao = estado_atual
                     ultima_posicao_aceitacao = i + 1
                 
                 i += 1
@@ -196,8 +252,8 @@ class AFDUnificado:
                 break
         
         if ultimo_estado_aceitacao is not None:
-            return (entrada[:ultima_posicao_aceitacao], 
-                   ultima_posicao_aceitacao, 
+            return (entrada[inicio:ultima_posicao_aceitacao], 
+                   ultima_posicao_aceitacao - inicio, 
                    self.estados_aceitacao[ultimo_estado_aceitacao])
         
         return None
\ No newline at end of file
@@ -1,20 +1,113 @@
 """
 Pacote de AFDs do lexer. Usa o AFD unificado criado a partir da conversão AFN->AFD.
+
+O AFD é construído uma única vez por processo (de forma thread-safe) e sua
+tabela é persistida em disco, de modo que execuções seguintes não precisam
+refazer a construção de subconjuntos.
+
+Motores disponíveis em get_afd():
+- 'gerado': scanner especializado gerado por lexer/gerador_scanner.py (padrão);
+  usado somente quando está atualizado em relação ao AFN, caso contrário
+  get_afd() recorre ao motor 'dicionario'
+- 'dicionario': AFDUnificado, tabela de transições em dicionários
+- 'tabela': AFDTabela, matriz de transições plana em array com estados inteiros
+- 'regex': AFDRegex, padrão mestre do módulo re com grupos nomeados
 """
 
+import threading
+
 from ..AFN import AFNCoralUnificado
 from ..afn_to_afd import ConversorAFNparaAFD
+from ..cache_afd import chave_cache, chave_scanner, carregar_tabelas, salvar_tabelas
 from .AFDUnificado import AFDUnificado
+from .AFDTabela import AFDTabela
+from .AFDGerado import AFDGerado
+from .AFDRegex import AFDRegex
+from .AFDBytes import AFDBytes
 
 __all__ = [
     "AFDUnificado",
+    "AFDTabela",
+    "AFDGerado",
+    "AFDRegex",
+    "AFDBytes",
+    "MOTORES",
     "get_afd"
 ]
 
-def get_afd():
-    """Retorna o AFD unificado."""
+MOTORES = {
+    'gerado': AFDGerado,
+    'dicionario': AFDUnificado,
+    'tabela': AFDTabela,
+    'regex': AFDRegex
+}
+
+MOTOR_PADRAO = 'gerado'
+
+_afds = {}
+_tabelas = None
+_trava_afd = threading.Lock()
+
+def _carregar_tabelas_afd():
+    """Carrega as tabelas do AFD do cache em disco ou as constrói a partir do AFN."""
+    global _tabelas
+    
+    if _tabelas is not None:
+        return _tabelas
+    
     afn = AFNCoralUnificado()
-    conversor = ConversorAFNparaAFD(afn)
-    afd_unificado = AFDUnificado(conversor)
+    chave = chave_cache(afn)
+    
+    tabelas = carregar_tabelas(chave)
+    if tabelas is None:
+        conversor = ConversorAFNparaAFD(afn)
+        conversor.construir_subconjuntos()
+        tabelas = (conversor.get_tabela_transicoes_afd(), conversor.get_estados_aceitacao_afd())
+        salvar_tabelas(chave, *tabelas)
+    
+    _tabelas = tabelas
+    return tabelas
+
+def _carregar_scanner_gerado():
+    """Retorna o scanner gerado se ele estiver atualizado em relação ao AFN, ou None."""
+    try:
+        from . import scanner_gerado
+    except ImportError:
+        return None
+    
+    if getattr(scanner_gerado, 'CHAVE', None) != chave_scanner(AFNCoralUnificado(), AFDUnificado):
+        return None
+    return AFDGerado(scanner_gerado)
+
+def _construir_afd(motor):
+    if motor == 'gerado':
+        afd = _carregar_scanner_gerado()
+        if afd is not None:
+            return afd
+        # Scanner ausente ou desatualizado: recorre ao AFD por tabela
+        return _afds.get('dicionario') or _construir_afd('dicionario')
+    
+    if motor == 'regex':
+        return AFDRegex(_afds.get('dicionario') or _construir_afd('dicionario'))
+    
+    return MOTORES[motor].de_tabelas(*_carregar_tabelas_afd())
+
+def get_afd(motor=None):
+    """
+    Retorna o AFD unificado do motor pedido, compartilhado por todo o processo.
+    
+    Args:
+        motor: Nome do motor (ver MOTORES); None usa o motor padrão.
+    """
+    motor = motor or MOTOR_PADRAO
+    if motor not in MOTORES:
+        raise ValueError(f"Motor léxico desconhecido: '{motor}'. Opções: {', '.join(MOTORES)}")
+    
+    afd = _afds.get(motor)
+    if afd is None:
+        with _trava_afd:
+            afd = _afds.get(motor)
+            if afd is None:
+                afd = _afds[motor] = _construir_afd(motor)
     
-    return afd_unificado
+    return afd
@@ -0,0 +1,409 @@
+"""
+Scanner da linguagem Coral gerado automaticamente por lexer/gerador_scanner.py.
+
+NÃO EDITE: regenere com `python src/lexer/gerador_scanner.py`.
+"""
+
+CHAVE = 'v2-3d8f438e246c766d5b0d29721914cc8694fa6c94640b1c43b7dd26f630852319-s0f3597769d83bf82'
+
+_PALAVRAS_ESPECIAIS = {'VERDADE': 'BOOLEANO', 'FALSO': 'BOOLEANO', 'E': 'OPERADOR_LOGICO', 'OU': 'OPERADOR_LOGICO', 'NAO': 'OPERADOR_LOGICO'}
+
+_OPERADORES_DUPLOS = {'==': 'OPERADOR_RELACIONAL', '!=': 'OPERADOR_RELACIONAL', '<=': 'OPERADOR_RELACIONAL', '>=': 'OPERADOR_RELACIONAL', '++': 'OPERADOR_ATRIBUICAO', '--': 'OPERADOR_ATRIBUICAO', '+=': 'OPERADOR_ATRIBUICAO', '-=': 'OPERADOR_ATRIBUICAO', '*=': 'OPERADOR_ATRIBUICAO', '/=': 'OPERADOR_ATRIBUICAO', '%=': 'OPERADOR_ATRIBUICAO', '**': 'OPERADOR_ARITMETICO'}
+
+_OPERADORES_SIMPLES = {'+': 'OPERADOR_ARITMETICO', '-': 'OPERADOR_ARITMETICO', '*': 'OPERADOR_ARITMETICO', '/': 'OPERADOR_ARITMETICO', '%': 'OPERADOR_ARITMETICO', '=': 'OPERADOR_ATRIBUICAO', '!': 'OPERADOR_RELACIONAL', '<': 'OPERADOR_RELACIONAL', '>': 'OPERADOR_RELACIONAL', '(': 'DELIMITADOR', ')': 'DELIMITADOR', '{': 'DELIMITADOR', '}': 'DELIMITADOR', '[': 'DELIMITADOR', ']': 'DELIMITADOR', ',': 'DELIMITADOR', ';': 'DELIMITADOR', ':': 'DELIMITADOR'}
+
+
+_CLASSES_ASCII = ('outro', 'outro', 'outro', 'outro', 'outro', 'outro', 'outro', 'outro', 'outro', None, None, None, None, None, 'outro', 'outro', 'outro', 'outro', 'outro', 'outro', 'outro', 'outro', 'outro', 'outro', 'outro', 'outro', 'outro', 'outro', None, None, None, None, None, '!', '"', '#', 'outro', '%', 'outro', "'", '(', ')', '*', '+', ',', '-', '.', '/', 'digito', 'digito', 'digito', 'digito', 'digito', 'digito', 'digito', 'digito', 'digito', 'digito', None, None, '<', '=', '>', 'outro', 'outro', 'A', 'letra', 'letra', 'D', 'E', 'F', 'letra', 'letra', 'letra', 'letra', 'letra', 'L', 'letra', 'N', 'O', 'letra', 'letra', 'R', 'S', 'letra', 'U', 'V', 'letra', 'letra', 'letra', 'letra', None, 'outro', None, 'outro', None, 'outro', 'letra', 'letra', 'letra', 'letra', 'letra', 'letra', 'letra', 'letra', 'letra', 'letra', 'letra', 'letra', 'letra', 'letra', 'letra', 'letra', 'letra', 'letra', 'letra', 'letra', 'letra', 'letra', 'letra', 'letra', 'letra', 'letra', '{', 'outro', '}', 'outro', 'outro')
+
+
+def _classe(c):
+    codigo = ord(c)
+    if codigo < 128:
+        return _CLASSES_ASCII[codigo]
+    if c.isalpha():
+        return 'letra'
+    if c.isdigit():
+        return 'digito'
+    if c.isspace():
+        return None
+    return 'outro'
+
+
+def scan(fonte, pos=0):
+    """Reconhece um token em fonte a partir de pos: (lexema, tamanho, tipo) ou None."""
+    fim = len(fonte)
+    if pos >= fim:
+        return None
+    c = fonte[pos]
+
+    if c == 'f' and pos + 1 < fim:
+        aspas = fonte[pos + 1]
+        if aspas == '"' and fonte.startswith('f"""', pos):
+            if fim - pos >= 7:
+                p = fonte.find('"""', pos + 4)
+                if p >= 0:
+                    return (fonte[pos:p + 3], p + 3 - pos, "STRING_MULTILINE")
+        elif aspas == '"' or aspas == "'":
+            p = pos + 2
+            while p < fim:
+                d = fonte[p]
+                if d == '\\':
+                    p += 2
+                elif d == aspas:
+                    return (fonte[pos:p + 1], p + 1 - pos, "STRING")
+                elif d == '\n':
+                    break
+                else:
+                    p += 1
+
+    if c == '_' or c.isalpha():
+        p = pos + 1
+        while p < fim:
+            d = fonte[p]
+            if d == '_' or d.isalnum():
+                p += 1
+            else:
+                break
+        lexema = fonte[pos:p]
+        return (lexema, p - pos, _PALAVRAS_ESPECIAIS.get(lexema, "IDENTIFICADOR"))
+
+    if c == '#':
+        p = fonte.find('\n', pos)
+        if p >= 0:
+            return (fonte[pos:p + 1], p + 1 - pos, "COMENTARIO_LINHA")
+        return (fonte[pos:], fim - pos, "COMENTARIO_LINHA")
+
+    if c == '"' or c == "'":
+        if c == '"' and fonte.startswith('"""', pos):
+            p = fonte.find('"""', pos + 3)
+            if p >= 0:
+                return (fonte[pos:p + 3], p + 3 - pos, "STRING_MULTILINE")
+            return None
+        p = pos + 1
+        while p < fim:
+            d = fonte[p]
+            if d == '\\':
+                p += 2
+                continue
+            if d == c:
+                return (fonte[pos:p + 1], p + 1 - pos, "STRING")
+            if d == '\n':
+                return None
+            p += 1
+        return None
+
+    if c.isdigit():
+        p = pos + 1
+        while p < fim and fonte[p].isdigit():
+            p += 1
+        if p < fim and fonte[p] == '.':
+            p += 1
+            if p < fim and fonte[p].isdigit():
+                p += 1
+                while p < fim and fonte[p].isdigit():
+                    p += 1
+                if p < fim and (fonte[p] == '_' or fonte[p].isalnum()):
+                    return None
+                return (fonte[pos:p], p - pos, "DECIMAL")
+            return None
+        if p < fim and (fonte[p] == '_' or fonte[p].isalnum()):
+            return None
+        return (fonte[pos:p], p - pos, "INTEIRO")
+
+    if pos + 1 < fim:
+        dois = fonte[pos:pos + 2]
+        tipo = _OPERADORES_DUPLOS.get(dois)
+        if tipo:
+            return (dois, 2, tipo)
+
+    tipo = _OPERADORES_SIMPLES.get(c)
+    if tipo:
+        return (c, 1, tipo)
+
+    if c == '.':
+        if pos + 1 < fim and fonte[pos + 1].isdigit():
+            return None
+        return ('.', 1, 'DELIMITADOR')
+
+    return _casar_afd(fonte, pos)
+
+
+def _casar_afd(fonte, pos):
+    """Maior casamento pelo AFD unificado, compilado em código."""
+    fim = len(fonte)
+    estado = 0
+    i = pos
+    ultima = -1
+    tipo = None
+    while i < fim:
+        t = _classe(fonte[i])
+        if estado == 0:
+            if t == '!':
+                estado = 1
+            elif t == '"':
+                estado = 2
+            elif t == '"""':
+                estado = 3
+            elif t == '#':
+                estado = 4
+                ultima = i + 1
+                tipo = 'COMENTARIO_LINHA'
+            elif t in ('%', '/'):
+                estado = 5
+                ultima = i + 1
+                tipo = 'OPERADOR_ARITMETICO'
+            elif t == "'":
+                estado = 6
+            elif t == "'''":
+                estado = 7
+            elif t in ('(', ')', ',', '{', '}'):
+                estado = 8
+                ultima = i + 1
+                tipo = 'DELIMITADOR'
+            elif t == '*':
+                estado = 9
+                ultima = i + 1
+                tipo = 'OPERADOR_ARITMETICO'
+            elif t == '+':
+                estado = 10
+                ultima = i + 1
+                tipo = 'OPERADOR_ARITMETICO'
+            elif t == '-':
+                estado = 11
+                ultima = i + 1
+                tipo = 'OPERADOR_ARITMETICO'
+            elif t in ('<', '>'):
+                estado = 12
+                ultima = i + 1
+                tipo = 'OPERADOR_RELACIONAL'
+            elif t == '=':
+                estado = 13
+                ultima = i + 1
+                tipo = 'OPERADOR_ATRIBUICAO'
+            elif t == 'E':
+                estado = 14
+                ultima = i + 1
+                tipo = 'OPERADOR_LOGICO'
+            elif t == 'F':
+                estado = 15
+            elif t == 'N':
+                estado = 16
+            elif t == 'O':
+                estado = 17
+            elif t == 'V':
+                estado = 18
+            elif t == 'digito':
+                estado = 19
+                ultima = i + 1
+                tipo = 'INTEIRO'
+            elif t == 'letra':
+                estado = 20
+                ultima = i + 1
+                tipo = 'IDENTIFICADOR'
+            else:
+                break
+        elif estado == 1:
+            if t == '=':
+                estado = 21
+                ultima = i + 1
+                tipo = 'OPERADOR_RELACIONAL'
+            else:
+                break
+        elif estado == 2:
+            if t == 'outro':
+                estado = 2
+            elif t == '"':
+                estado = 22
+                ultima = i + 1
+                tipo = 'STRING'
+            else:
+                break
+        elif estado == 3:
+            if t == 'qualquer':
+                estado = 3
+            elif t == '"""':
+                estado = 23
+                ultima = i + 1
+                tipo = 'STRING_MULTILINE'
+            else:
+                break
+        elif estado == 4:
+            if t == 'outro':
+                estado = 4
+                ultima = i + 1
+                tipo = 'COMENTARIO_LINHA'
+            else:
+                break
+        elif estado == 5:
+            if t == '=':
+                estado = 24
+                ultima = i + 1
+                tipo = 'OPERADOR_ATRIBUICAO'
+            else:
+                break
+        elif estado == 6:
+            if t == 'outro':
+                estado = 6
+            elif t == "'":
+                estado = 22
+                ultima = i + 1
+                tipo = 'STRING'
+            else:
+                break
+        elif estado == 7:
+            if t == 'qualquer':
+                estado = 7
+            elif t == "'''":
+                estado = 23
+                ultima = i + 1
+                tipo = 'STRING_MULTILINE'
+            else:
+                break
+        elif estado == 9:
+            if t == '=':
+                estado = 24
+                ultima = i + 1
+                tipo = 'OPERADOR_ATRIBUICAO'
+            elif t == '*':
+                estado = 25
+                ultima = i + 1
+                tipo = 'OPERADOR_ARITMETICO'
+            else:
+                break
+        elif estado == 10:
+            if t in ('+', '='):
+                estado = 24
+                ultima = i + 1
+                tipo = 'OPERADOR_ATRIBUICAO'
+            else:
+                break
+        elif estado == 11:
+            if t in ('-', '='):
+                estado = 24
+                ultima = i + 1
+                tipo = 'OPERADOR_ATRIBUICAO'
+            else:
+                break
+        elif estado == 12:
+            if t == '=':
+                estado = 21
+                ultima = i + 1
+                tipo = 'OPERADOR_RELACIONAL'
+            else:
+                break
+        elif estado == 13:
+            if t == '=':
+                estado = 21
+                ultima = i + 1
+                tipo = 'OPERADOR_RELACIONAL'
+            else:
+                break
+        elif estado == 15:
+            if t == 'A':
+                estado = 26
+            else:
+                break
+        elif estado == 16:
+            if t == 'A':
+                estado = 27
+            else:
+                break
+        elif estado == 17:
+            if t == 'U':
+                estado = 14
+                ultima = i + 1
+                tipo = 'OPERADOR_LOGICO'
+            else:
+                break
+        elif estado == 18:
+            if t == 'E':
+                estado = 28
+            else:
+                break
+        elif estado == 19:
+            if t == 'digito':
+                estado = 19
+                ultima = i + 1
+                tipo = 'INTEIRO'
+            elif t == '.':
+                estado = 29
+            else:
+                break
+        elif estado == 20:
+            if t == 'letra_digito':
+                estado = 20
+                ultima = i + 1
+                tipo = 'IDENTIFICADOR'
+            else:
+                break
+        elif estado == 26:
+            if t == 'L':
+                estado = 30
+            else:
+                break
+        elif estado == 27:
+            if t == 'O':
+                estado = 14
+                ultima = i + 1
+                tipo = 'OPERADOR_LOGICO'
+            else:
+                break
+        elif estado == 28:
+            if t == 'R':
+                estado = 31
+            else:
+                break
+        elif estado == 29:
+            if t == 'digito':
+                estado = 32
+                ultima = i + 1
+                tipo = 'DECIMAL'
+            else:
+                break
+        elif estado == 30:
+            if t == 'S':
+                estado = 33
+            else:
+                break
+        elif estado == 31:
+            if t == 'D':
+                estado = 34
+            else:
+                break
+        elif estado == 32:
+            if t == 'digito':
+                estado = 32
+                ultima = i + 1
+                tipo = 'DECIMAL'
+            else:
+                break
+        elif estado == 33:
+            if t == 'O':
+                estado = 35
+                ultima = i + 1
+                tipo = 'BOOLEANO'
+            else:
+                break
+        elif estado == 34:
+            if t == 'A':
+                estado = 36
+            else:
+                break
+        elif estado == 36:
+            if t == 'D':
+                estado = 37
+            else:
+                break
+        elif estado == 37:
+            if t == 'E':
+                estado = 35
+                ultima = i + 1
+                tipo = 'BOOLEANO'
+            else:
+                break
+        else:
+            break
+        i += 1
+    if ultima < 0:
+        return None
+    return (fonte[pos:ultima], ultima - pos, tipo)
@@ -1,3 +1,5 @@
+import hashlib
+
 class Estado:
     """Representa um estado do AFN."""
     
@@ -47,6 +49,26 @@ class AFNCoralUnificado:
                     
         return fecho
     
+    def assinatura(self):
+        """Retorna um hash SHA-256 da definição do AFN (estados e transições)."""
+        partes = []
+        for estado_id, estado in self.estados.items():
+            transicoes = sorted(
+                (simbolo, sorted(destinos)) for simbolo, destinos in estado.transicoes.items()
+            )
+            partes.append(repr((
+                estado_id,
+                estado.aceitacao,
+                estado.tipo_token,
+                transicoes,
+                sorted(estado.epsilon_transicoes)
+            )))
+        return hashlib.sha256('\n'.join(partes).encode('utf-8')).hexdigest()
+    
+    def simbolos(self):
+        """Retorna o conjunto dos símbolos com transição em algum estado (o alfabeto)."""
+        return {simbolo for estado in self.estados.values() for simbolo in estado.transicoes}
+    
     def mover(self, estados_atuais, simbolo):
         estados_destino = set()
         
@@ -1,12 +1,36 @@
+import mmap
+import re
+
+from .IndiceLinhas import IndiceLinhas, IndiceLinhasBytes
+from .Token import Token
+from .AFD.AFDBytes import AFDBytes
+
 class BufferLeitura:
-    """Gerencia leitura do código fonte com controle de posição."""
+    """
+    Gerencia leitura do código fonte com controle de posição.
     
-    def __init__(self, codigo_fonte):
+    Durante a análise só a posição (deslocamento no código fonte) é mantida;
+    linha e coluna são derivadas dela sob demanda pelo IndiceLinhas.
+    """
+    
+    # Espaços/tabulações e quebra de linha, no tipo do código fonte (str)
+    _ESPACOS = re.compile(r'[ \t]+')
+    _TABULACAO = '\t'
+    _QUEBRA_LINHA = '\n'
+    
+    def __init__(self, codigo_fonte, indice_linhas=None):
         self.codigo_fonte = codigo_fonte
         self.posicao = 0
-        self.linha = 1
-        self.coluna = 1
         self.tamanho = len(codigo_fonte)
+        self.indice_linhas = indice_linhas or IndiceLinhas(codigo_fonte)
+    
+    @property
+    def linha(self):
+        return self.indice_linhas.linha(self.posicao)
+    
+    @property
+    def coluna(self):
+        return self.indice_linhas.coluna(self.posicao)
     
     def caractere_atual(self):
         """Retorna o caractere na posição atual."""
@@ -24,19 +48,352 @@ class BufferLeitura:
     
     def get_posicao_info(self):
         """Retorna informações da posição atual."""
+        linha, coluna = self.indice_linhas.linha_coluna(self.posicao)
         return {
             'posicao': self.posicao,
-            'linha': self.linha,
-            'coluna': self.coluna
+            'linha': linha,
+            'coluna': coluna
         }
     
+    def marca(self):
+        """Retorna um marcador da posição atual para criar_token/linha_coluna."""
+        return self.posicao
+    
+    def criar_token(self, lexema, tipo, marca, coluna=None):
+        """
+        Cria um token que começa na posição marcada, na linha atual.
+        
+        Linha e coluna são calculadas pelo token só quando acessadas; coluna
+        pode ser fixada (ex.: nível de indentação em INDENTA/DEDENTA).
+        """
+        return Token(lexema, tipo, None, coluna, marca, self.indice_linhas)
+    
+    def linha_coluna(self, marca):
+        """Retorna (linha, coluna) da posição marcada."""
+        return self.indice_linhas.linha_coluna(marca)
+    
+    def reconhecer(self, afd):
+        """Reconhece o token na posição atual com o AFD: (lexema, tamanho, tipo) ou None."""
+        return afd.match(self.codigo_fonte, self.posicao)
+    
+    def fechar(self):
+        """Libera os recursos do buffer (nada a fazer para código fonte em memória)."""
+    
     def avancar(self, quantidade=1):
-        """Avança o buffer atualizando linha e coluna."""
-        for _ in range(quantidade):
-            if self.posicao < self.tamanho:
-                if self.codigo_fonte[self.posicao] == '\n':
-                    self.linha += 1
-                    self.coluna = 1
-                else:
-                    self.coluna += 1
-                self.posicao += 1
+        """Avança o buffer em quantidade caracteres."""
+        self.posicao = min(self.posicao + quantidade, self.tamanho)
+    
+    def avancar_caractere(self):
+        """Avança o buffer um caractere."""
+        self.avancar(1)
+    
+    def pular_espacos(self):
+        """
+        Avança sobre a sequência de espaços e tabulações na posição atual.
+        
+        Returns:
+            tuple: (caracteres pulados, tabulações entre eles)
+        """
+        inicio = self.posicao
+        espacos = self._ESPACOS.match(self.codigo_fonte, inicio)
+        if espacos is None:
+            return 0, 0
+        self.avancar(espacos.end() - inicio)
+        return espacos.end() - inicio, espacos.group().count(self._TABULACAO)
+    
+    def pular_comentario(self):
+        """Avança sobre o comentário de linha na posição atual, até a quebra de linha inclusive."""
+        fim = self.codigo_fonte.find(self._QUEBRA_LINHA, self.posicao)
+        self.avancar((self.tamanho if fim < 0 else fim + 1) - self.posicao)
+
+class BufferLeituraMmap(BufferLeitura):
+    """
+    Buffer de leitura sobre os bytes UTF-8 de um arquivo mapeado em memória.
+    
+    O arquivo não é decodificado nem copiado: posicao e tamanho são em bytes,
+    os tokens são reconhecidos por AFDBytes e só os lexemas dos tokens (e as
+    colunas consultadas) são decodificados. Posições dos tokens são
+    deslocamentos em bytes; linha e coluna (em caracteres) são as mesmas da
+    análise do texto decodificado. Não há tradução de quebras de linha, como
+    em open(..., newline='').
+    
+    Linha e coluna são gravadas nos tokens ao criá-los, decodificando só o
+    trecho desde a última posição resolvida, para que continuem disponíveis
+    depois que o mmap é fechado.
+    """
+    
+    _CARACTERES_ASCII = tuple(chr(byte) for byte in range(128))
+    
+    _ESPACOS = re.compile(rb'[ \t]+')
+    _TABULACAO = b'\t'
+    _QUEBRA_LINHA = b'\n'
+    
+    def __init__(self, dados):
+        """
+        Args:
+            dados: Objeto de bytes (mmap, bytes ou bytearray) em UTF-8
+        """
+        super().__init__(dados, IndiceLinhasBytes(dados))
+        self._afd_bytes = None
+        # Última posição resolvida por linha_coluna, com sua linha e coluna
+        self._resolvida = (0, 1, 1)
+    
+    @classmethod
+    def abrir(cls, nome_arquivo):
+        """Mapeia o arquivo em memória (somente leitura) e cria o buffer."""
+        with open(nome_arquivo, 'rb') as arquivo:
+            try:
+                dados = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                dados = b''  # Arquivo vazio não pode ser mapeado
+        return cls(dados)
+    
+    def fechar(self):
+        """Fecha o mmap (os tokens já criados guardam linha e coluna)."""
+        if isinstance(self.codigo_fonte, mmap.mmap) and not self.codigo_fonte.closed:
+            self.codigo_fonte.close()
+    
+    def criar_token(self, lexema, tipo, marca, coluna=None):
+        """Cria um token que começa na posição marcada, com linha e coluna já resolvidas."""
+        linha, coluna_marca = self.linha_coluna(marca)
+        return Token(lexema, tipo, linha, coluna_marca if coluna is None else coluna, marca)
+    
+    def linha_coluna(self, marca):
+        """
+        Retorna (linha, coluna) da posição marcada.
+        
+        As marcas chegam em ordem durante a análise, então só o trecho desde
+        a última posição resolvida é lido; marcas anteriores a ela são
+        resolvidas pelo índice de linhas.
+        """
+        posicao, linha, coluna = self._resolvida
+        if marca < posicao:
+            return self.indice_linhas.linha_coluna(marca)
+        trecho = self.codigo_fonte[posicao:marca]
+        quebra = trecho.rfind(self._QUEBRA_LINHA)
+        if quebra >= 0:
+            linha += trecho.count(self._QUEBRA_LINHA)
+            trecho = trecho[quebra + 1:]
+            coluna = 1
+        if trecho.isascii():
+            coluna += len(trecho)
+        else:
+            coluna += len(trecho.decode('utf-8', errors='replace'))
+        self._resolvida = (marca, linha, coluna)
+        return linha, coluna
+    
+    def caractere_atual(self):
+        """Retorna o caractere (decodificado) na posição atual."""
+        if self.posicao >= self.tamanho:
+            return None
+        byte = self.codigo_fonte[self.posicao]
+        if byte < 0x80:
+            return self._CARACTERES_ASCII[byte]
+        return self.codigo_fonte[self.posicao:self.posicao + 4].decode('utf-8', errors='replace')[0]
+    
+    def avancar_caractere(self):
+        """Avança o buffer um caractere (1 a 4 bytes em UTF-8)."""
+        if self.posicao >= self.tamanho:
+            return
+        byte = self.codigo_fonte[self.posicao]
+        self.avancar(1 if byte < 0xC0 else 2 if byte < 0xE0 else 3 if byte < 0xF0 else 4)
+    
+    def resto_codigo(self):
+        """Retorna o restante do código a partir da posição atual, decodificado."""
+        return self.codigo_fonte[self.posicao:].decode('utf-8')
+    
+    def reconhecer(self, afd):
+        """Reconhece o token na posição atual sobre os bytes; afd é usado perto de caracteres não ASCII."""
+        if self._afd_bytes is None or self._afd_bytes.afd_texto is not afd:
+            self._afd_bytes = AFDBytes(afd)
+        return self._afd_bytes.match(self.codigo_fonte, self.posicao)
+
+class BufferLeituraArquivo(BufferLeitura):
+    """
+    Buffer de leitura que lê o código fonte de um arquivo em blocos.
+    
+    codigo_fonte guarda apenas uma janela do arquivo, sempre com linhas
+    completas (termina em '\\n', exceto no fim do arquivo). posicao é relativa
+    à janela; deslocamento é a posição absoluta do início da janela, e
+    get_posicao_info trabalha com posições absolutas.
+    
+    A janela é completada sob demanda; o trecho já consumido é descartado,
+    então a memória fica limitada ao tamanho do bloco mais o maior token
+    (ex.: uma STRING_MULTILINE longa).
+    """
+    
+    TAMANHO_BLOCO = 64 * 1024
+    
+    def __init__(self, arquivo, tamanho_bloco=TAMANHO_BLOCO, fechar_ao_fim=False):
+        """
+        Args:
+            arquivo: Objeto de arquivo em modo texto (com método read)
+            tamanho_bloco: Quantidade de caracteres lida por vez
+            fechar_ao_fim: Se True, fecha o arquivo ao terminar a leitura
+        """
+        super().__init__('')
+        self._linha = 1
+        self._coluna = 1
+        self.arquivo = arquivo
+        self.tamanho_bloco = tamanho_bloco
+        self.fechar_ao_fim = fechar_ao_fim
+        self.deslocamento = 0
+        self.arquivo_esgotado = False
+        self._linha_incompleta = ''
+        self._completar()
+    
+    def _ler_bloco(self):
+        """Lê o próximo bloco do arquivo; retorna '' no fim."""
+        if self.arquivo_esgotado:
+            return ''
+        bloco = self.arquivo.read(self.tamanho_bloco)
+        if not bloco:
+            self.arquivo_esgotado = True
+            if self.fechar_ao_fim:
+                self.arquivo.close()
+        return bloco
+    
+    def fechar(self):
+        """Fecha o arquivo se ele pertence ao buffer (fechar_ao_fim), mesmo antes do fim."""
+        if self.fechar_ao_fim:
+            self.arquivo.close()
+    
+    def _completar(self):
+        """
+        Descarta o trecho consumido e acrescenta ao menos uma linha completa à janela.
+        
+        Returns:
+            bool: True se a janela recebeu novos caracteres
+        """
+        corte = self.posicao
+        if corte > 0:
+            self.codigo_fonte = self.codigo_fonte[corte:]
+            self.deslocamento += corte
+            self.posicao -= corte
+        
+        novo = ''
+        while not novo:
+            bloco = self._ler_bloco()
+            if not bloco:
+                novo, self._linha_incompleta = self._linha_incompleta, ''
+                break
+            texto = self._linha_incompleta + bloco
+            fim_linha = texto.rfind('\n') + 1
+            novo, self._linha_incompleta = texto[:fim_linha], texto[fim_linha:]
+        
+        self.codigo_fonte += novo
+        self.tamanho = len(self.codigo_fonte)
+        return bool(novo)
+    
+    @property
+    def linha(self):
+        return self._linha
+    
+    @property
+    def coluna(self):
+        return self._coluna
+    
+    def caractere_atual(self):
+        """Retorna o caractere na posição atual."""
+        if self.posicao >= self.tamanho and self.fim_arquivo():
+            return None
+        return self.codigo_fonte[self.posicao]
+    
+    def resto_codigo(self):
+        """Retorna o restante da janela atual a partir da posição atual."""
+        return self.codigo_fonte[self.posicao:]
+    
+    def fim_arquivo(self):
+        """Verifica se chegou ao fim do arquivo, completando a janela se preciso."""
+        while self.posicao >= self.tamanho:
+            if not self._completar():
+                return True
+        return False
+    
+    def get_posicao_info(self):
+        """Retorna informações da posição atual (posição absoluta no arquivo)."""
+        return {
+            'posicao': self.deslocamento + self.posicao,
+            'linha': self._linha,
+            'coluna': self._coluna
+        }
+    
+    def marca(self):
+        """Retorna a posição absoluta atual para criar_token/linha_coluna."""
+        return self.deslocamento + self.posicao
+    
+    def criar_token(self, lexema, tipo, marca, coluna=None):
+        """
+        Cria um token que começa na posição marcada, na linha atual.
+        
+        A janela é descartada conforme a leitura avança, então linha e coluna
+        são mantidas incrementalmente e gravadas no token.
+        """
+        linha, coluna_marca = self.linha_coluna(marca)
+        return Token(lexema, tipo, linha, coluna_marca if coluna is None else coluna, marca)
+    
+    def linha_coluna(self, marca):
+        """Retorna (linha, coluna) de uma posição marcada na linha atual."""
+        return self._linha, self._coluna - (self.deslocamento + self.posicao - marca)
+    
+    def avancar(self, quantidade=1):
+        """Avança o buffer atualizando linha e coluna pelas quebras de linha saltadas."""
+        inicio = self.posicao
+        fim = min(inicio + quantidade, self.tamanho)
+        quebras = self.codigo_fonte.count('\n', inicio, fim)
+        if quebras:
+            self._linha += quebras
+            self._coluna = fim - self.codigo_fonte.rfind('\n', inicio, fim)
+        else:
+            self._coluna += fim - inicio
+        self.posicao = fim
+    
+    def reconhecer(self, afd):
+        """
+        Reconhece o token na posição atual, completando a janela enquanto o
+        resultado puder depender de linhas ainda não lidas.
+        """
+        while True:
+            resultado = afd.match(self.codigo_fonte, self.posicao)
+            if self.arquivo_esgotado and not self._linha_incompleta:
+                return resultado
+            if not self._depende_do_restante(resultado):
+                return resultado
+            self._completar()
+    
+    def _depende_do_restante(self, resultado):
+        """
+        Indica se o token na posição atual pode atravessar o fim da janela.
+        
+        Como a janela termina em fim de linha, só strings podem fazê-lo:
+        strings triplas (com ou sem f) até encontrarem o fechamento, e strings
+        simples cuja quebra de linha final foi escapada com '\\'.
+        """
+        fonte = self.codigo_fonte
+        inicio = self.posicao
+        
+        if fonte.startswith('f', inicio) and fonte[inicio + 1:inicio + 2] in ('"', "'"):
+            # F-string não reconhecida cai no identificador 'f'
+            if resultado is not None and resultado[0] != 'f':
+                return False
+            inicio += 1
+        elif resultado is not None:
+            return False
+        elif fonte[inicio:inicio + 1] not in ('"', "'"):
+            return False
+        
+        if fonte.startswith('"""', inicio):
+            return fonte.find('"""', inicio + 3) < 0
+        
+        # String simples: percorre até a aspa de fechamento ou a quebra de linha
+        aspas = fonte[inicio]
+        pos = inicio + 1
+        while pos < self.tamanho:
+            char = fonte[pos]
+            if char == '\\':
+                pos += 2
+            elif char == aspas or char == '\n':
+                return False
+            else:
+                pos += 1
+        return True
@@ -0,0 +1,96 @@
+import re
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+
+class IndiceLinhas:
+    """
+    Índice das posições de início de linha de um código fonte.
+    
+    Converte uma posição (deslocamento no código fonte) em linha e coluna com
+    uma busca binária, em vez de contar caracteres durante a análise. O índice
+    só é construído na primeira consulta, então códigos sem erros e cujas
+    posições não são consultadas não pagam por ele.
+    
+    Linhas e colunas começam em 1; apenas '\\n' inicia uma nova linha ('\\r'
+    sozinho conta como coluna, como em BufferLeituraArquivo.avancar).
+    """
+    
+    # Quebra de linha, no tipo do código fonte (str)
+    _QUEBRA_LINHA = '\n'
+    
+    def __init__(self, codigo_fonte):
+        self.codigo_fonte = codigo_fonte
+        self.inicios = None
+    
+    def _construir(self):
+        """Constrói o array com a posição de início de cada linha."""
+        self.inicios = array('q', [0])
+        self.inicios.extend(accumulate(len(linha) + 1 for linha in self.codigo_fonte.split('\n')[:-1]))
+    
+    def linha(self, posicao):
+        """Retorna a linha (a partir de 1) da posição."""
+        if self.inicios is None:
+            self._construir()
+        return bisect_right(self.inicios, posicao)
+    
+    def coluna(self, posicao):
+        """Retorna a coluna (a partir de 1) da posição."""
+        return posicao - self.inicios[self.linha(posicao) - 1] + 1
+    
+    def linha_coluna(self, posicao):
+        """Retorna (linha, coluna) da posição."""
+        linha = self.linha(posicao)
+        return linha, posicao - self.inicios[linha - 1] + 1
+    
+    def editar(self, inicio, fim, texto, codigo_fonte):
+        """
+        Atualiza o índice após codigo_fonte[inicio:fim] ser substituído por texto.
+        
+        Args:
+            codigo_fonte: Código fonte já editado
+        """
+        self.codigo_fonte = codigo_fonte
+        if self.inicios is None:
+            return
+        
+        # Linhas que começam dentro do trecho substituído são refeitas
+        primeira = bisect_right(self.inicios, inicio)
+        ultima = bisect_right(self.inicios, fim)
+        deslocamento = len(texto) - (fim - inicio)
+        
+        novas = array('q')
+        pos = texto.find(self._QUEBRA_LINHA)
+        while pos >= 0:
+            novas.append(inicio + pos + 1)
+            pos = texto.find(self._QUEBRA_LINHA, pos + 1)
+        novas.extend(map(deslocamento.__add__, self.inicios[ultima:]))
+        self.inicios[primeira:] = novas
+
+class IndiceLinhasBytes(IndiceLinhas):
+    """
+    Índice de linhas sobre os bytes UTF-8 de um código fonte (ex.: mmap).
+    
+    Posições são deslocamentos em bytes; colunas continuam contando
+    caracteres, decodificando apenas o início da linha consultada. Em editar,
+    inicio e fim são posições em bytes e texto são os bytes inseridos.
+    """
+    
+    _QUEBRA_LINHA = b'\n'
+    
+    def _construir(self):
+        """Constrói o array com a posição (em bytes) de início de cada linha."""
+        self.inicios = array('q', [0])
+        self.inicios.extend(m.end() for m in re.finditer(b'\n', self.codigo_fonte))
+    
+    def coluna(self, posicao):
+        """Retorna a coluna (a partir de 1, em caracteres) da posição."""
+        return self.linha_coluna(posicao)[1]
+    
+    def linha_coluna(self, posicao):
+        """Retorna (linha, coluna) da posição."""
+        linha = self.linha(posicao)
+        trecho = self.codigo_fonte[self.inicios[linha - 1]:posicao]
+        if trecho.isascii():
+            return linha, len(trecho) + 1
+        return linha, len(trecho.decode('utf-8')) + 1
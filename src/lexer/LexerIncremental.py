@@ -0,0 +1,176 @@
+from bisect import bisect_right
+
+from .lexer import AnalisadorLexico
+from .Buffer import BufferLeitura
+from .IndiceLinhas import IndiceLinhas
+
+class LexerIncremental:
+    """
+    Análise léxica incremental para edições de um código fonte em memória.
+    
+    Além dos tokens, guarda um ponto de retomada no início de cada linha:
+    posição, índice do próximo token e o estado do analisador
+    (pilha_indentacao, nivel_parenteses, inicio_linha). Como a saída do
+    analisador a partir de um início de linha depende apenas desse estado e
+    do texto restante, uma edição é re-analisada a partir do último ponto
+    antes dela e a análise para assim que, depois do trecho editado, um
+    início de linha chega com o mesmo estado de um ponto antigo: dali em
+    diante os tokens antigos são reaproveitados, apenas deslocados.
+    
+    Todos os tokens compartilham um único IndiceLinhas, atualizado a cada
+    edição, então deslocar um token é só ajustar sua posição.
+    
+    Exemplo:
+        incremental = LexerIncremental(codigo)
+        tokens = incremental.editar(inicio, fim, "novo texto")
+    """
+    
+    def __init__(self, codigo_fonte, motor=None):
+        """
+        Args:
+            codigo_fonte: Código Coral a ser analisado
+            motor: Motor de reconhecimento de tokens (ver lexer.AFD.MOTORES)
+        """
+        self.motor = motor
+        self.codigo_fonte = codigo_fonte
+        self.indice_linhas = IndiceLinhas(codigo_fonte)
+        self.tokens = []
+        
+        # Pontos de retomada, em colunas paralelas ordenadas por posição
+        self._posicoes = []
+        self._indices = []
+        self._estados = []
+        
+        # Quantidade de tokens reconhecidos na última análise
+        self.tokens_relexados = 0
+        
+        self._analisar(self._analisador(codigo_fonte), self.tokens, (self._posicoes, self._indices, self._estados))
+    
+    def _analisador(self, codigo_fonte):
+        """Cria um AnalisadorLexico cujos tokens usam o índice de linhas compartilhado."""
+        buffer_leitura = BufferLeitura(codigo_fonte, self.indice_linhas)
+        return AnalisadorLexico(codigo_fonte, self.motor, buffer_leitura=buffer_leitura)
+    
+    def _analisar(self, analisador, tokens, pontos, convergencia=None):
+        """
+        Reconhece tokens até o fim ou até convergir com os pontos antigos.
+        
+        Args:
+            analisador: AnalisadorLexico posicionado em um início de linha
+            tokens: Lista onde os tokens reconhecidos são acrescentados
+            pontos: Colunas (posições, índices, estados) onde os pontos
+                de retomada são acrescentados
+            convergencia: (limite, deslocamento) para parar no primeiro início
+                de linha com posição >= limite cujo estado coincide com o ponto
+                antigo na posição - deslocamento; None analisa até o fim
+        
+        Returns:
+            int: Índice do ponto antigo de convergência, ou None se a análise
+            foi até o fim
+        """
+        posicoes, indices, estados = pontos
+        buffer_leitura = analisador.buffer_leitura
+        codigo_fonte = buffer_leitura.codigo_fonte
+        proximo = analisador._reconhecer_proximo_token
+        reconhecidos = 0
+        
+        try:
+            while True:
+                # Início de linha sem tokens pendentes e com a indentação ainda não
+                # processada: o estado depende só do texto anterior. No fim do
+                # arquivo os DEDENTA finais já podem ter sido emitidos.
+                posicao = buffer_leitura.posicao
+                if ((posicao == 0 or codigo_fonte[posicao - 1] == '\n') and not analisador.tokens_pendentes
+                        and analisador.inicio_linha
+                        and (posicao < buffer_leitura.tamanho or posicao == 0)
+                        and (not posicoes or posicoes[-1] < posicao)):
+                    estado = (tuple(analisador.pilha_indentacao), analisador.nivel_parenteses,
+                              analisador.inicio_linha)
+                    
+                    if convergencia and posicao >= convergencia[0]:
+                        antigo = self._ponto_em(posicao - convergencia[1])
+                        if antigo is not None and self._estados[antigo] == estado:
+                            return antigo
+                    
+                    posicoes.append(posicao)
+                    indices.append(len(tokens))
+                    estados.append(estado)
+                
+                token = proximo()
+                if token is None:
+                    break
+                reconhecidos += 1
+                tokens.append(token)
+            
+            tokens.append(analisador._token_eof())
+            return None
+        finally:
+            self.tokens_relexados = reconhecidos
+    
+    def _ponto_em(self, posicao):
+        """Retorna o índice do ponto de retomada antigo exatamente em posicao, ou None."""
+        i = bisect_right(self._posicoes, posicao) - 1
+        if i >= 0 and self._posicoes[i] == posicao:
+            return i
+        return None
+    
+    def editar(self, inicio, fim, texto):
+        """
+        Substitui codigo_fonte[inicio:fim] por texto e atualiza os tokens.
+        
+        Os tokens posteriores ao trecho re-analisado são os mesmos objetos
+        da lista anterior, com a posição atualizada no lugar. Em caso
+        de erro léxico (ValueError), o estado anterior é mantido.
+        
+        Args:
+            inicio: Posição inicial do trecho substituído
+            fim: Posição final (exclusiva) do trecho substituído
+            texto: Texto inserido no lugar do trecho
+        
+        Returns:
+            list: Todos os tokens do novo código fonte, terminando com EOF
+        """
+        if not 0 <= inicio <= fim <= len(self.codigo_fonte):
+            raise ValueError(f"Intervalo de edição inválido: [{inicio}, {fim})")
+        
+        codigo_fonte = self.codigo_fonte[:inicio] + texto + self.codigo_fonte[fim:]
+        deslocamento = len(texto) - (fim - inicio)
+        
+        # Último ponto de retomada antes do trecho editado (o texto anterior não mudou)
+        k = bisect_right(self._posicoes, inicio) - 1
+        pilha, nivel_parenteses, inicio_linha = self._estados[k]
+        
+        self.indice_linhas.editar(inicio, fim, texto, codigo_fonte)
+        analisador = self._analisador(codigo_fonte)
+        analisador.buffer_leitura.posicao = self._posicoes[k]
+        analisador.pilha_indentacao = list(pilha)
+        analisador.nivel_parenteses = nivel_parenteses
+        analisador.inicio_linha = inicio_linha
+        
+        tokens = self.tokens[:self._indices[k]]
+        pontos = (self._posicoes[:k], self._indices[:k], self._estados[:k])
+        try:
+            antigo = self._analisar(analisador, tokens, pontos, (inicio + len(texto), deslocamento))
+        except ValueError:
+            self.indice_linhas.editar(inicio, inicio + len(texto), self.codigo_fonte[inicio:fim], self.codigo_fonte)
+            raise
+        posicoes, indices, estados = pontos
+        
+        if antigo is not None:
+            # Reaproveita os tokens e pontos antigos a partir da convergência
+            delta_indices = len(tokens) - self._indices[antigo]
+            
+            restantes = self.tokens[self._indices[antigo]:]
+            if deslocamento:
+                for token in restantes:
+                    token.posicao += deslocamento
+            tokens += restantes
+            
+            posicoes += [p + deslocamento for p in self._posicoes[antigo:]]
+            indices += [i + delta_indices for i in self._indices[antigo:]]
+            estados += self._estados[antigo:]
+        
+        self.codigo_fonte = codigo_fonte
+        self.tokens = tokens
+        self._posicoes, self._indices, self._estados = posicoes, indices, estados
+        return tokens
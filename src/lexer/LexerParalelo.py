@@ -0,0 +1,146 @@
+"""
+Análise léxica paralela de arquivos grandes.
+
+O código fonte é dividido em trechos que começam em linhas de indentação 0
+(primeiro caractere é código, não espaço, comentário ou linha vazia). Cada
+trecho é analisado isoladamente em um processo, com o AnalisadorLexico
+sequencial, e os TokenStreams são concatenados com posições e linhas
+deslocadas.
+
+Uma fronteira só é válida se o trecho anterior termina fora de parênteses,
+com inicio_linha verdadeiro e sem erro (um token que atravessa a fronteira,
+como uma STRING_MULTILINE, termina o trecho em erro). Nesse caso, os DEDENTA
+que o trecho isolado emite no seu fim são exatamente os que a análise
+sequencial emitiria ao processar a indentação 0 da linha seguinte. Trechos
+com fronteira inválida são unidos ao seguinte e analisados de novo.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .lexer import AnalisadorLexico
+from .TokenStream import TokenStream, _BITS_COLUNA
+
+# Trechos menores que isso não compensam o custo de enviar a outro processo
+TAMANHO_MINIMO_TRECHO = 256 * 1024
+
+# Trechos por processo, para equilibrar a carga entre os processos
+TRECHOS_POR_PROCESSO = 4
+
+def dividir_em_trechos(codigo_fonte, quantidade):
+    """
+    Escolhe até quantidade - 1 fronteiras em inícios de linha de indentação 0.
+    
+    Returns:
+        list: Posições iniciais dos trechos (a primeira é sempre 0)
+    """
+    inicios = [0]
+    tamanho = len(codigo_fonte)
+    for k in range(1, quantidade):
+        pos = max(inicios[-1] + 1, tamanho * k // quantidade)
+        while True:
+            pos = codigo_fonte.find('\n', pos - 1) + 1
+            if pos <= 0 or pos >= tamanho:
+                return inicios
+            if codigo_fonte[pos] not in ' \t\r\n#':
+                break
+            pos += 1
+        inicios.append(pos)
+    return inicios
+
+def _analisar_trecho(codigo_fonte, motor):
+    """
+    Analisa um trecho isolado (executado nos processos do pool).
+    
+    Returns:
+        tuple: (colunas, fronteira_valida, posicao_erro); colunas são os
+        arrays do TokenStream, ou None se o trecho terminou em erro léxico
+    """
+    analisador = AnalisadorLexico(codigo_fonte, motor)
+    try:
+        fluxo = analisador.tokenizar_em_colunas()
+    except ValueError:
+        return None, False, analisador.buffer_leitura.posicao
+    
+    fronteira_valida = analisador.nivel_parenteses == 0 and analisador.inicio_linha
+    colunas = (fluxo.tipos, fluxo.inicios, fluxo.fins, fluxo.linhas_colunas)
+    return colunas, fronteira_valida, None
+
+def analisar_paralelo(codigo_fonte, motor=None, processos=None, executor=None,
+                      tamanho_minimo_trecho=TAMANHO_MINIMO_TRECHO):
+    """
+    Tokeniza o código fonte em paralelo, com resultado idêntico a
+    AnalisadorLexico(codigo_fonte).tokenizar_em_colunas().
+    
+    Args:
+        codigo_fonte: Código Coral a ser analisado
+        motor: Motor de reconhecimento de tokens (ver lexer.AFD.MOTORES)
+        processos: Número de processos (padrão: os.cpu_count())
+        executor: Executor já criado (ex.: ProcessPoolExecutor) a reutilizar
+        tamanho_minimo_trecho: Tamanho mínimo de cada trecho, em caracteres
+    
+    Returns:
+        TokenStream: Tokens de todo o código fonte, terminando com EOF
+    
+    Raises:
+        ValueError: Em erro léxico, com a mesma mensagem da análise sequencial
+    """
+    processos = processos or os.cpu_count() or 1
+    quantidade = min(processos * TRECHOS_POR_PROCESSO, len(codigo_fonte) // max(1, tamanho_minimo_trecho))
+    inicios = dividir_em_trechos(codigo_fonte, quantidade) if quantidade > 1 else [0]
+    if len(inicios) == 1:
+        return AnalisadorLexico(codigo_fonte, motor).tokenizar_em_colunas()
+    
+    fins = inicios[1:] + [len(codigo_fonte)]
+    trechos = [codigo_fonte[inicio:fim] for inicio, fim in zip(inicios, fins)]
+    
+    if executor is None:
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            resultados = list(executor.map(_analisar_trecho, trechos, [motor] * len(trechos)))
+    else:
+        resultados = list(executor.map(_analisar_trecho, trechos, [motor] * len(trechos)))
+    
+    # Une trechos cuja fronteira final é inválida ao trecho seguinte
+    i = 0
+    while i < len(trechos):
+        colunas, fronteira_valida, posicao_erro = resultados[i]
+        ultimo = i == len(trechos) - 1
+        if colunas is not None and (fronteira_valida or ultimo):
+            i += 1
+            continue
+        if ultimo:
+            break
+        trechos[i:i + 2] = [trechos[i] + trechos[i + 1]]
+        inicios.pop(i + 1)
+        resultados[i:i + 2] = [_analisar_trecho(trechos[i], motor)]
+        if colunas is None and resultados[i][2] == posicao_erro:
+            # O erro não dependia do texto seguinte: é um erro léxico real
+            break
+    else:
+        return _costurar(codigo_fonte, inicios, resultados)
+    
+    # Erro léxico: a análise sequencial produz a mensagem com a posição correta
+    return AnalisadorLexico(codigo_fonte, motor).tokenizar_em_colunas()
+
+def _costurar(codigo_fonte, inicios, resultados):
+    """Concatena os TokenStreams dos trechos, descartando o EOF dos intermediários."""
+    fluxo = TokenStream(codigo_fonte)
+    linha = 0
+    anterior = 0
+    ultimo = len(resultados) - 1
+    for n, (inicio, (colunas, _, _)) in enumerate(zip(inicios, resultados)):
+        tipos, posicoes_inicio, posicoes_fim, linhas_colunas = colunas
+        if n < ultimo:
+            tipos, posicoes_inicio, posicoes_fim, linhas_colunas = (
+                tipos[:-1], posicoes_inicio[:-1], posicoes_fim[:-1], linhas_colunas[:-1]
+            )
+        
+        linha += codigo_fonte.count('\n', anterior, inicio)
+        anterior = inicio
+        deslocamento_linha = linha << _BITS_COLUNA
+        
+        fluxo.tipos.extend(tipos)
+        fluxo.inicios.extend(map(inicio.__add__, posicoes_inicio))
+        fluxo.fins.extend(map(inicio.__add__, posicoes_fim))
+        fluxo.linhas_colunas.extend(map(deslocamento_linha.__add__, linhas_colunas))
+    return fluxo
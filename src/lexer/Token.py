@@ -1,12 +1,65 @@
+# Tipos de token produzidos pelo analisador léxico; o índice é o id numérico do tipo
+TIPOS_TOKEN = (
+    "IDENTIFICADOR",
+    "PALAVRA_RESERVADA",
+    "INTEIRO",
+    "DECIMAL",
+    "STRING",
+    "STRING_MULTILINE",
+    "BOOLEANO",
+    "OPERADOR_LOGICO",
+    "OPERADOR_ARITMETICO",
+    "OPERADOR_RELACIONAL",
+    "OPERADOR_ATRIBUICAO",
+    "DELIMITADOR",
+    "COMENTARIO_LINHA",
+    "COMENTARIO_BLOCO",
+    "NEWLINE",
+    "INDENTA",
+    "DEDENTA",
+    "EOF",
+)
+
+ID_TIPO = {tipo: indice for indice, tipo in enumerate(TIPOS_TOKEN)}
+
 class Token:
-    """Representa um token reconhecido pelo analisador léxico."""
+    """
+    Representa um token reconhecido pelo analisador léxico.
     
-    def __init__(self, lexema, tipo, linha, coluna, posicao):
+    linha e coluna podem ser omitidas (None) quando indice_linhas é
+    informado: são então calculadas a partir de posicao só quando acessadas
+    (ex.: mensagens de erro, nós da AST).
+    """
+    
+    __slots__ = ('lexema', 'tipo', 'posicao', 'indice_linhas', '_linha', '_coluna')
+    
+    def __init__(self, lexema, tipo, linha, coluna, posicao, indice_linhas=None):
         self.lexema = lexema
         self.tipo = tipo
-        self.linha = linha
-        self.coluna = coluna
         self.posicao = posicao
+        self.indice_linhas = indice_linhas
+        self._linha = linha
+        self._coluna = coluna
+    
+    @property
+    def linha(self):
+        if self._linha is None:
+            return self.indice_linhas.linha(self.posicao)
+        return self._linha
+    
+    @linha.setter
+    def linha(self, linha):
+        self._linha = linha
+    
+    @property
+    def coluna(self):
+        if self._coluna is None:
+            return self.indice_linhas.coluna(self.posicao)
+        return self._coluna
+    
+    @coluna.setter
+    def coluna(self, coluna):
+        self._coluna = coluna
     
     def __repr__(self):
         return f"Token({self.lexema!r}, {self.tipo}, L{self.linha}:C{self.coluna})"
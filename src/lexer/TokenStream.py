@@ -0,0 +1,152 @@
+from array import array
+
+from .Token import TIPOS_TOKEN, ID_TIPO
+
+# Lexemas que não são fatias do código fonte
+_LEXEMAS_FIXOS = {
+    ID_TIPO["NEWLINE"]: "\\n",
+    ID_TIPO["INDENTA"]: "",
+    ID_TIPO["DEDENTA"]: "",
+    ID_TIPO["EOF"]: "",
+}
+
+# Tipos cuja coluna não é derivada da posição (guardam o nível de indentação)
+_COLUNA_FIXA = frozenset((ID_TIPO["INDENTA"], ID_TIPO["DEDENTA"]))
+
+# Linha e coluna são empacotadas em um único inteiro de 64 bits
+_BITS_COLUNA = 32
+_MASCARA_COLUNA = (1 << _BITS_COLUNA) - 1
+
+class TokenStream:
+    """
+    Sequência de tokens armazenada em colunas (arrays) em vez de objetos Token.
+    
+    Para cada token guarda apenas o id do tipo (ver Token.TIPOS_TOKEN), os
+    deslocamentos de início e fim no código fonte e linha/coluna empacotadas.
+    O lexema é fatiado do código fonte somente quando acessado.
+    
+    Indexar a sequência retorna um TokenView, compatível com Token (lexema,
+    tipo, linha, coluna, posicao), então o TokenStream pode ser passado
+    diretamente ao ParserCoral.
+    """
+    
+    def __init__(self, codigo_fonte):
+        self.codigo_fonte = codigo_fonte
+        self.tipos = array('B')
+        self.inicios = array('q')
+        self.fins = array('q')
+        self.linhas_colunas = array('Q')
+    
+    @classmethod
+    def de_tokens(cls, codigo_fonte, tokens):
+        """
+        Cria o TokenStream a partir de um iterável de tokens do código fonte.
+        
+        Os tokens são consumidos um a um, sem manter a lista em memória. Os
+        tokens devem estar em ordem de posição: linha e coluna são derivadas
+        das posições percorrendo o código fonte uma única vez, sem consultar
+        o token.
+        """
+        fluxo = cls(codigo_fonte)
+        tipos, inicios, fins, linhas_colunas = fluxo.tipos, fluxo.inicios, fluxo.fins, fluxo.linhas_colunas
+        linha = 1
+        inicio_linha = 0
+        anterior = 0
+        for token in tokens:
+            inicio = token.posicao
+            quebras = codigo_fonte.count('\n', anterior, inicio)
+            if quebras:
+                linha += quebras
+                inicio_linha = codigo_fonte.rfind('\n', anterior, inicio) + 1
+            anterior = inicio
+            
+            tipo = ID_TIPO[token.tipo]
+            if tipo in _LEXEMAS_FIXOS:
+                fim = inicio
+                coluna = token.coluna if tipo in _COLUNA_FIXA else inicio - inicio_linha + 1
+            else:
+                fim = inicio + len(token.lexema)
+                coluna = inicio - inicio_linha + 1
+            
+            tipos.append(tipo)
+            inicios.append(inicio)
+            fins.append(fim)
+            linhas_colunas.append((linha << _BITS_COLUNA) | coluna)
+        return fluxo
+    
+    def adicionar(self, tipo, inicio, fim, linha, coluna):
+        """Acrescenta um token dado pelo nome do tipo e pelos deslocamentos do lexema."""
+        self.tipos.append(ID_TIPO[tipo])
+        self.inicios.append(inicio)
+        self.fins.append(fim)
+        self.linhas_colunas.append((linha << _BITS_COLUNA) | coluna)
+    
+    def __len__(self):
+        return len(self.tipos)
+    
+    def __getitem__(self, indice):
+        if indice < 0:
+            indice += len(self.tipos)
+        if not 0 <= indice < len(self.tipos):
+            raise IndexError("índice de token fora do intervalo")
+        return TokenView(self, indice)
+    
+    def __iter__(self):
+        for indice in range(len(self.tipos)):
+            yield TokenView(self, indice)
+    
+    def lexema(self, indice):
+        """Retorna o lexema do token (fatiado do código fonte)."""
+        fixo = _LEXEMAS_FIXOS.get(self.tipos[indice])
+        if fixo is not None:
+            return fixo
+        return self.codigo_fonte[self.inicios[indice]:self.fins[indice]]
+    
+    def tipo(self, indice):
+        return TIPOS_TOKEN[self.tipos[indice]]
+    
+    def linha(self, indice):
+        return self.linhas_colunas[indice] >> _BITS_COLUNA
+    
+    def coluna(self, indice):
+        return self.linhas_colunas[indice] & _MASCARA_COLUNA
+    
+    def posicao(self, indice):
+        return self.inicios[indice]
+    
+    def memoria(self):
+        """Retorna o número de bytes ocupados pelas colunas."""
+        return sum(coluna.itemsize * len(coluna)
+                   for coluna in (self.tipos, self.inicios, self.fins, self.linhas_colunas))
+
+class TokenView:
+    """Visão leve de um token de um TokenStream, com a mesma interface de Token."""
+    
+    __slots__ = ('fluxo', 'indice')
+    
+    def __init__(self, fluxo, indice):
+        self.fluxo = fluxo
+        self.indice = indice
+    
+    @property
+    def lexema(self):
+        return self.fluxo.lexema(self.indice)
+    
+    @property
+    def tipo(self):
+        return self.fluxo.tipo(self.indice)
+    
+    @property
+    def linha(self):
+        return self.fluxo.linha(self.indice)
+    
+    @property
+    def coluna(self):
+        return self.fluxo.coluna(self.indice)
+    
+    @property
+    def posicao(self):
+        return self.fluxo.posicao(self.indice)
+    
+    def __repr__(self):
+        return f"Token({self.lexema!r}, {self.tipo}, L{self.linha}:C{self.coluna})"
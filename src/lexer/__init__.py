@@ -1,3 +1,3 @@
-from .lexer import AnalisadorLexico, LexerCoral
+from .lexer import AnalisadorLexico, ErroLexico, LexerCoral
 
-__all__ = ["AnalisadorLexico", "LexerCoral"]
+__all__ = ["AnalisadorLexico", "ErroLexico", "LexerCoral"]
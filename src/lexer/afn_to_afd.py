@@ -8,7 +8,14 @@ sys.path.insert(0, src_dir)
 from lexer.AFN import AFNTransicoes, AFNCoralUnificado
 
 class ConversorAFNparaAFD:
-    """Converte AFN em AFD usando algoritmo de construção de subconjuntos."""
+    """
+    Converte AFN em AFD usando algoritmo de construção de subconjuntos,
+    seguido de minimização pelo algoritmo de Hopcroft.
+    
+    Os estados do AFD são identificados por inteiros; o estado inicial é 0.
+    """
+    
+    ESTADO_INICIAL = 0
     
     def __init__(self, afn):
         self.afn = afn
@@ -16,61 +23,195 @@ class ConversorAFNparaAFD:
         self.afd_estados = {}
         self.afd_transicoes = {}
         self.afd_estados_aceitacao = {}
+        self._fechos = {}
+        self._aceitacao_afn = self._prioridades_aceitacao()
+    
+    def _prioridades_aceitacao(self):
+        """
+        Mapeia cada estado de aceitação do AFN para (prioridade, tipo_token).
+        
+        Quando um estado do AFD contém mais de um estado de aceitação, prevalece
+        o definido por último no AFN: as classes específicas (operadores lógicos,
+        booleanos) são definidas depois das genéricas (identificadores).
+        """
+        prioridades = {}
+        for indice, (estado_id, estado) in enumerate(self.afn.estados.items()):
+            if estado.aceitacao:
+                prioridades[estado_id] = (indice, estado.tipo_token)
+        return prioridades
     
-    def _novo_nome_estado(self, conjunto_estados):
-        return 'S' + '_'.join(sorted(conjunto_estados))
+    def _epsilon_fecho(self, estado_id):
+        """ε-fecho de um único estado do AFN, memoizado."""
+        fecho = self._fechos.get(estado_id)
+        if fecho is None:
+            fecho = frozenset(self.afn.epsilon_fecho(estado_id))
+            self._fechos[estado_id] = fecho
+        return fecho
     
-    def _eh_estado_aceitacao(self, conjunto_estados):
-        estados_aceitacao = self.afn_transicoes.get_estados_aceitacao()
+    def _tipo_aceitacao(self, conjunto_estados):
+        melhor = None
         for estado in conjunto_estados:
-            if estado in estados_aceitacao:
-                return estados_aceitacao[estado]
-        return None
+            candidato = self._aceitacao_afn.get(estado)
+            if candidato is not None and (melhor is None or candidato[0] > melhor[0]):
+                melhor = candidato
+        return melhor[1] if melhor else None
     
-    def construir_subconjuntos(self):
-        """Algoritmo de construção de subconjuntos para converter AFN em AFD."""
-        estado_inicial = 'Sq0'
-        estados_nao_processados = [estado_inicial]
+    def construir_subconjuntos(self, minimizar=True):
+        """
+        Algoritmo de construção de subconjuntos para converter AFN em AFD.
+        
+        Args:
+            minimizar: Se True, aplica a minimização de Hopcroft ao AFD resultante.
+        """
+        simbolos = sorted(self.afn_transicoes.get_simbolos())
+        
+        # Para cada estado do AFN e símbolo, o ε-fecho dos destinos (calculado uma única vez)
+        destinos_afn = {}
+        for estado_id, estado in self.afn.estados.items():
+            por_simbolo = {}
+            for simbolo, destinos in estado.transicoes.items():
+                fecho = set()
+                for destino in destinos:
+                    fecho |= self._epsilon_fecho(destino)
+                por_simbolo[simbolo] = frozenset(fecho)
+            destinos_afn[estado_id] = por_simbolo
         
         # Estado inicial do AFD = ε-fecho do estado inicial do AFN
-        self.afd_estados[estado_inicial] = frozenset(self.afn.epsilon_fecho(self.afn.estado_inicial.id))
+        inicial = self._epsilon_fecho(self.afn.estado_inicial.id)
+        ids = {inicial: self.ESTADO_INICIAL}
+        self.afd_estados = {self.ESTADO_INICIAL: inicial}
+        self.afd_transicoes = {}
+        self.afd_estados_aceitacao = {}
         
-        tipo_token = self._eh_estado_aceitacao(self.afd_estados[estado_inicial])
+        tipo_token = self._tipo_aceitacao(inicial)
         if tipo_token:
-            self.afd_estados_aceitacao[estado_inicial] = tipo_token
-            
+            self.afd_estados_aceitacao[self.ESTADO_INICIAL] = tipo_token
+        
+        estados_nao_processados = [self.ESTADO_INICIAL]
         while estados_nao_processados:
             estado_atual = estados_nao_processados.pop()
             estados_afn = self.afd_estados[estado_atual]
             
-            # Para cada símbolo possível
-            for simbolo in self.afn_transicoes.get_simbolos():
+            for simbolo in simbolos:
                 estados_destino = set()
-                
-                # Para cada estado AFN no estado atual do AFD
                 for estado in estados_afn:
-                    novos_estados = self.afn.mover({estado}, simbolo)
-                    for novo_estado in novos_estados:
-                        # Adiciona o ε-fecho de cada novo estado
-                        estados_destino.update(self.afn.epsilon_fecho(novo_estado))
+                    fecho = destinos_afn[estado].get(simbolo)
+                    if fecho:
+                        estados_destino |= fecho
                 
-                if estados_destino:
-                    estado_destino = self._novo_nome_estado(estados_destino)
-                    
-                    # Adiciona transição
-                    if estado_atual not in self.afd_transicoes:
-                        self.afd_transicoes[estado_atual] = {}
-                    self.afd_transicoes[estado_atual][simbolo] = estado_destino
+                if not estados_destino:
+                    continue
+                
+                estados_destino = frozenset(estados_destino)
+                estado_destino = ids.get(estados_destino)
+                
+                # Se é um novo estado, adiciona à lista de não processados
+                if estado_destino is None:
+                    estado_destino = len(ids)
+                    ids[estados_destino] = estado_destino
+                    self.afd_estados[estado_destino] = estados_destino
+                    estados_nao_processados.append(estado_destino)
                     
-                    # Se é um novo estado, adiciona à lista de não processados
-                    if estado_destino not in self.afd_estados:
-                        self.afd_estados[estado_destino] = frozenset(estados_destino)
-                        estados_nao_processados.append(estado_destino)
-                        
-                        # Verifica se é estado de aceitação
-                        tipo_token = self._eh_estado_aceitacao(estados_destino)
-                        if tipo_token:
-                            self.afd_estados_aceitacao[estado_destino] = tipo_token
+                    tipo_token = self._tipo_aceitacao(estados_destino)
+                    if tipo_token:
+                        self.afd_estados_aceitacao[estado_destino] = tipo_token
+                
+                self.afd_transicoes.setdefault(estado_atual, {})[simbolo] = estado_destino
+        
+        if minimizar:
+            self.minimizar()
+    
+    def minimizar(self):
+        """
+        Minimiza o AFD pelo algoritmo de Hopcroft.
+        
+        Estados equivalentes são fundidos e estados mortos (que nunca levam a
+        aceitação) são removidos junto com as transições que chegam a eles.
+        Os estados resultantes são renumerados em ordem de busca em largura
+        a partir do estado inicial.
+        """
+        simbolos = sorted({s for trans in self.afd_transicoes.values() for s in trans})
+        estados = list(self.afd_estados)
+        morto = len(estados)  # Estado morto explícito para completar o AFD
+        todos = estados + [morto]
+        
+        def destino(estado, simbolo):
+            if estado == morto:
+                return morto
+            return self.afd_transicoes.get(estado, {}).get(simbolo, morto)
+        
+        # Transições inversas: inversas[simbolo][destino] = origens
+        inversas = {simbolo: {} for simbolo in simbolos}
+        for estado in todos:
+            for simbolo in simbolos:
+                inversas[simbolo].setdefault(destino(estado, simbolo), set()).add(estado)
+        
+        # Partição inicial: um bloco por tipo de token (None = não aceitação)
+        por_tipo = {}
+        for estado in todos:
+            por_tipo.setdefault(self.afd_estados_aceitacao.get(estado), set()).add(estado)
+        blocos = dict(enumerate(por_tipo.values()))
+        bloco_de = {estado: bloco for bloco, membros in blocos.items() for estado in membros}
+        
+        maior = max(blocos, key=lambda bloco: len(blocos[bloco]))
+        pendentes = set(blocos) - {maior}
+        
+        while pendentes:
+            divisor = blocos[pendentes.pop()].copy()
+            for simbolo in simbolos:
+                origens = set()
+                for estado in divisor:
+                    origens |= inversas[simbolo].get(estado, set())
+                if not origens:
+                    continue
+                
+                # Agrupa as origens pelo bloco a que pertencem
+                atingidos = {}
+                for estado in origens:
+                    atingidos.setdefault(bloco_de[estado], set()).add(estado)
+                
+                for bloco, parte in atingidos.items():
+                    if len(parte) == len(blocos[bloco]):
+                        continue
+                    novo = len(blocos)
+                    blocos[bloco] -= parte
+                    blocos[novo] = parte
+                    for estado in parte:
+                        bloco_de[estado] = novo
+                    if bloco in pendentes:
+                        pendentes.add(novo)
+                    elif len(parte) <= len(blocos[bloco]):
+                        pendentes.add(novo)
+                    else:
+                        pendentes.add(bloco)
+        
+        # Renumera os blocos em ordem de busca em largura, descartando o bloco morto
+        bloco_morto = bloco_de[morto]
+        novos_ids = {bloco_de[self.ESTADO_INICIAL]: self.ESTADO_INICIAL}
+        fila = [bloco_de[self.ESTADO_INICIAL]]
+        transicoes = {}
+        for bloco in fila:
+            representante = next(iter(blocos[bloco]))
+            for simbolo in simbolos:
+                bloco_destino = bloco_de[destino(representante, simbolo)]
+                if bloco_destino == bloco_morto:
+                    continue
+                if bloco_destino not in novos_ids:
+                    novos_ids[bloco_destino] = len(novos_ids)
+                    fila.append(bloco_destino)
+                transicoes.setdefault(novos_ids[bloco], {})[simbolo] = novos_ids[bloco_destino]
+        
+        self.afd_transicoes = transicoes
+        self.afd_estados = {
+            novo: frozenset().union(*(self.afd_estados[e] for e in blocos[bloco] if e != morto))
+            for bloco, novo in novos_ids.items()
+        }
+        aceitacao = {}
+        for bloco, novo in novos_ids.items():
+            tipo_token = self.afd_estados_aceitacao.get(next(iter(blocos[bloco])))
+            if tipo_token:
+                aceitacao[novo] = tipo_token
+        self.afd_estados_aceitacao = aceitacao
     
     def get_tabela_transicoes_afd(self):
         """Retorna a tabela de transições do AFD resultante."""
@@ -84,4 +225,4 @@ if __name__ == "__main__":
     afn = AFNCoralUnificado()
     
     conversor = ConversorAFNparaAFD(afn)
-    conversor.construir_subconjuntos()
\ No newline at end of file
+    conversor.construir_subconjuntos()
@@ -0,0 +1,109 @@
+"""
+Persistência em disco da tabela do AFD unificado.
+
+A tabela resultante da construção de subconjuntos é salva em JSON no
+diretório de cache da linguagem, identificada pela assinatura do AFN que
+a originou. Qualquer alteração na definição do AFN (ou no formato da
+tabela) gera uma nova chave, invalidando automaticamente o cache antigo.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+
+from utils.utils import diretorio_cache
+
+# Incrementar sempre que o formato da tabela salva mudar
+VERSAO_FORMATO = 2
+
+# Fonte do gerador de scanner (lido do disco: o gerador importa este módulo)
+_GERADOR_SCANNER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "gerador_scanner.py")
+
+
+def chave_cache(afn):
+    """Retorna a chave do cache para o AFN informado."""
+    return f"v{VERSAO_FORMATO}-{afn.assinatura()}"
+
+
+def chave_scanner(afn, afd_classe):
+    """
+    Retorna a chave do scanner gerado para o AFN informado.
+    
+    Além do AFN, a chave cobre as tabelas dos caminhos rápidos de afd_classe
+    (palavras especiais e operadores) e as classes de caracteres
+    (afd_classe.classes_caracteres), que são embutidas no código gerado, e
+    o código fonte do gerador (modelo SCAN) e do módulo de afd_classe, onde
+    ficam os caminhos rápidos que o modelo reproduz.
+    """
+    with open(_GERADOR_SCANNER, 'r', encoding='utf-8') as f:
+        fonte_gerador = f.read()
+    entradas = repr((
+        sorted(afd_classe.PALAVRAS_ESPECIAIS.items()),
+        sorted(afd_classe.OPERADORES_DUPLOS.items()),
+        sorted(afd_classe.OPERADORES_SIMPLES.items()),
+        afd_classe.classes_caracteres(afn.simbolos()),
+        fonte_gerador,
+        inspect.getsource(inspect.getmodule(afd_classe))
+    ))
+    resumo = hashlib.sha256(entradas.encode('utf-8')).hexdigest()[:16]
+    return f"{chave_cache(afn)}-s{resumo}"
+
+
+def _caminho(chave):
+    return os.path.join(diretorio_cache('afd'), f"afd-{chave}.json")
+
+
+def carregar_tabelas(chave):
+    """
+    Carrega as tabelas do AFD salvas para a chave informada.
+    
+    Returns:
+        Tupla (tabela_transicoes, estados_aceitacao) ou None se não houver
+        cache válido.
+    """
+    try:
+        with open(_caminho(chave), 'r', encoding='utf-8') as f:
+            dados = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if dados.get('chave') != chave:
+        return None
+    
+    # JSON só tem chaves string: restaura os identificadores inteiros dos estados
+    transicoes = {
+        int(estado): simbolos for estado, simbolos in dados['transicoes'].items()
+    }
+    aceitacao = {int(estado): tipo for estado, tipo in dados['aceitacao'].items()}
+    return transicoes, aceitacao
+
+
+def salvar_tabelas(chave, tabela_transicoes, estados_aceitacao):
+    """
+    Salva as tabelas do AFD no cache em disco.
+    
+    A escrita é atômica (arquivo temporário + rename). Falhas de escrita
+    são ignoradas: o cache é apenas uma otimização.
+    """
+    caminho = _caminho(chave)
+    dados = {
+        'chave': chave,
+        'transicoes': tabela_transicoes,
+        'aceitacao': estados_aceitacao
+    }
+    try:
+        os.makedirs(os.path.dirname(caminho), exist_ok=True)
+        descritor, temporario = tempfile.mkstemp(dir=os.path.dirname(caminho), suffix='.tmp')
+    except OSError:
+        return
+    try:
+        with os.fdopen(descritor, 'w', encoding='utf-8') as f:
+            json.dump(dados, f)
+        os.replace(temporario, caminho)
+    except OSError:
+        try:
+            os.remove(temporario)
+        except OSError:
+            pass
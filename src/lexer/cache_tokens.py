@@ -0,0 +1,166 @@
+"""
+Cache em disco dos tokens de arquivos fonte.
+
+O TokenStream de um arquivo é salvo no diretório de cache da linguagem,
+identificado pelo hash do conteúdo do arquivo e pela versão do lexer (hash
+do código fonte do próprio lexer). Uma alteração no arquivo ou no lexer gera
+uma nova chave, invalidando automaticamente as entradas antigas.
+
+O tamanho total do cache é limitado: ao salvar uma entrada, as menos usadas
+recentemente (data de modificação mais antiga; cada leitura atualiza a data
+da entrada lida) são removidas até o cache caber no limite.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+
+from utils.utils import diretorio_cache
+from .TokenStream import TokenStream
+
+# Incrementar sempre que o formato do arquivo salvo mudar
+VERSAO_FORMATO = 1
+
+# Tamanho máximo padrão do cache, em bytes
+TAMANHO_MAXIMO = 64 * 1024 * 1024
+
+EXTENSAO = '.tokens'
+
+_versao_lexer = None
+
+
+def versao_lexer():
+    """
+    Retorna o hash do código fonte do lexer (pacote lexer e utils.utils).
+    
+    Calculado uma vez por processo. Inclui o formato do cache e a ordem dos
+    bytes da plataforma, já que os arrays são salvos em formato nativo.
+    """
+    global _versao_lexer
+    if _versao_lexer is None:
+        resumo = hashlib.sha256(f"v{VERSAO_FORMATO}-{sys.byteorder}".encode('ascii'))
+        diretorio_lexer = os.path.dirname(os.path.abspath(__file__))
+        arquivos = [os.path.join(diretorio_lexer, '..', 'utils', 'utils.py')]
+        for raiz, diretorios, nomes in os.walk(diretorio_lexer):
+            diretorios[:] = sorted(d for d in diretorios if d != '__pycache__')
+            arquivos.extend(os.path.join(raiz, nome) for nome in sorted(nomes) if nome.endswith('.py'))
+        for arquivo in arquivos:
+            resumo.update(os.path.relpath(arquivo, diretorio_lexer).encode('utf-8'))
+            with open(arquivo, 'rb') as f:
+                resumo.update(f.read())
+        _versao_lexer = resumo.hexdigest()[:16]
+    return _versao_lexer
+
+
+def chave_tokens(conteudo):
+    """Retorna a chave do cache para o conteúdo (bytes) de um arquivo fonte."""
+    return f"{versao_lexer()}-{hashlib.sha256(conteudo).hexdigest()}"
+
+
+def _caminho(chave, diretorio):
+    return os.path.join(diretorio or diretorio_cache('tokens'), f"{chave}{EXTENSAO}")
+
+
+def carregar_tokens(chave, codigo_fonte, diretorio=None):
+    """
+    Carrega o TokenStream salvo para a chave informada.
+    
+    Args:
+        codigo_fonte: Código fonte do arquivo (os lexemas são fatiados dele)
+        diretorio: Diretório do cache (padrão: diretorio_cache('tokens'))
+    
+    Returns:
+        TokenStream ou None se não houver cache válido.
+    """
+    caminho = _caminho(chave, diretorio)
+    try:
+        with open(caminho, 'rb') as f:
+            dados = f.read()
+    except OSError:
+        return None
+    
+    cabecalho, _, corpo = dados.partition(b'\n')
+    try:
+        cabecalho = json.loads(cabecalho)
+    except ValueError:
+        return None
+    
+    fluxo = TokenStream(codigo_fonte)
+    colunas = (fluxo.tipos, fluxo.inicios, fluxo.fins, fluxo.linhas_colunas)
+    quantidade = cabecalho.get('tokens', -1)
+    if (cabecalho.get('chave') != chave
+            or len(corpo) != quantidade * sum(coluna.itemsize for coluna in colunas)):
+        return None
+    
+    inicio = 0
+    for coluna in colunas:
+        fim = inicio + quantidade * coluna.itemsize
+        coluna.frombytes(corpo[inicio:fim])
+        inicio = fim
+    
+    # Marca a entrada como usada recentemente (ordem de remoção LRU)
+    try:
+        os.utime(caminho)
+    except OSError:
+        pass
+    return fluxo
+
+
+def salvar_tokens(chave, fluxo, diretorio=None, tamanho_maximo=TAMANHO_MAXIMO):
+    """
+    Salva o TokenStream no cache em disco e aplica o limite de tamanho.
+    
+    A escrita é atômica (arquivo temporário + rename). Falhas de escrita
+    são ignoradas: o cache é apenas uma otimização.
+    """
+    caminho = _caminho(chave, diretorio)
+    cabecalho = json.dumps({'chave': chave, 'tokens': len(fluxo)}).encode('utf-8')
+    try:
+        os.makedirs(os.path.dirname(caminho), exist_ok=True)
+        descritor, temporario = tempfile.mkstemp(dir=os.path.dirname(caminho), suffix='.tmp')
+    except OSError:
+        return
+    try:
+        with os.fdopen(descritor, 'wb') as f:
+            f.write(cabecalho + b'\n')
+            for coluna in (fluxo.tipos, fluxo.inicios, fluxo.fins, fluxo.linhas_colunas):
+                coluna.tofile(f)
+        os.replace(temporario, caminho)
+    except OSError:
+        try:
+            os.remove(temporario)
+        except OSError:
+            pass
+        return
+    
+    limitar_cache(os.path.dirname(caminho), tamanho_maximo)
+
+
+def limitar_cache(diretorio, tamanho_maximo=TAMANHO_MAXIMO, extensao=EXTENSAO):
+    """
+    Remove as entradas usadas há mais tempo até o cache caber em tamanho_maximo bytes.
+    
+    Só são consideradas as entradas com a extensão informada (o cache da AST,
+    parser.cache_ast, usa a mesma política com a extensão .crlc).
+    """
+    entradas = []
+    try:
+        with os.scandir(diretorio) as iterador:
+            for entrada in iterador:
+                if entrada.name.endswith(extensao):
+                    estado = entrada.stat()
+                    entradas.append((estado.st_mtime, estado.st_size, entrada.path))
+    except OSError:
+        return
+    
+    total = sum(tamanho for _, tamanho, _ in entradas)
+    for _, tamanho, caminho in sorted(entradas):
+        if total <= tamanho_maximo:
+            break
+        try:
+            os.remove(caminho)
+        except OSError:
+            continue
+        total -= tamanho
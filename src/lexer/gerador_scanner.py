@@ -0,0 +1,274 @@
+"""
+Gerador do scanner especializado da linguagem Coral.
+
+Constrói o AFD unificado a partir do AFN (AFNCoralUnificado + afn_to_afd) e
+emite um módulo Python independente (lexer/AFD/scanner_gerado.py) com uma
+função scan(fonte, pos) em código direto: os caminhos rápidos do
+AFDUnificado ficam embutidos e cada estado do AFD vira um ramo de código,
+sem interpretar tabela de transições em tempo de execução.
+
+O módulo gerado guarda a chave do AFN que o originou; get_afd() só o usa
+quando a chave coincide com a definição atual, caso contrário volta ao
+AFDUnificado.
+
+Uso:
+    python src/lexer/gerador_scanner.py [destino]
+"""
+
+import sys
+import os
+
+# Adiciona o diretório src ao path do Python para imports
+src_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, src_dir)
+
+from lexer.AFN import AFNCoralUnificado
+from lexer.afn_to_afd import ConversorAFNparaAFD
+from lexer.AFD.AFDUnificado import AFDUnificado
+from lexer.cache_afd import chave_scanner
+
+DESTINO_PADRAO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "AFD", "scanner_gerado.py")
+
+CABECALHO = '''"""
+Scanner da linguagem Coral gerado automaticamente por lexer/gerador_scanner.py.
+
+NÃO EDITE: regenere com `python src/lexer/gerador_scanner.py`.
+"""
+
+CHAVE = {chave!r}
+
+_PALAVRAS_ESPECIAIS = {palavras!r}
+
+_OPERADORES_DUPLOS = {duplos!r}
+
+_OPERADORES_SIMPLES = {simples!r}
+
+'''
+
+# Caminhos rápidos: equivalentes a AFDUnificado.match
+SCAN = '''
+
+def scan(fonte, pos=0):
+    """Reconhece um token em fonte a partir de pos: (lexema, tamanho, tipo) ou None."""
+    fim = len(fonte)
+    if pos >= fim:
+        return None
+    c = fonte[pos]
+
+    if c == 'f' and pos + 1 < fim:
+        aspas = fonte[pos + 1]
+        if aspas == '"' and fonte.startswith('f"""', pos):
+            if fim - pos >= 7:
+                p = fonte.find('"""', pos + 4)
+                if p >= 0:
+                    return (fonte[pos:p + 3], p + 3 - pos, "STRING_MULTILINE")
+        elif aspas == '"' or aspas == "'":
+            p = pos + 2
+            while p < fim:
+                d = fonte[p]
+                if d == '\\\\':
+                    p += 2
+                elif d == aspas:
+                    return (fonte[pos:p + 1], p + 1 - pos, "STRING")
+                elif d == '\\n':
+                    break
+                else:
+                    p += 1
+
+    if c == '_' or c.isalpha():
+        p = pos + 1
+        while p < fim:
+            d = fonte[p]
+            if d == '_' or d.isalnum():
+                p += 1
+            else:
+                break
+        lexema = fonte[pos:p]
+        return (lexema, p - pos, _PALAVRAS_ESPECIAIS.get(lexema, "IDENTIFICADOR"))
+
+    if c == '#':
+        p = fonte.find('\\n', pos)
+        if p >= 0:
+            return (fonte[pos:p + 1], p + 1 - pos, "COMENTARIO_LINHA")
+        return (fonte[pos:], fim - pos, "COMENTARIO_LINHA")
+
+    if c == '"' or c == "'":
+        if c == '"' and fonte.startswith('"""', pos):
+            p = fonte.find('"""', pos + 3)
+            if p >= 0:
+                return (fonte[pos:p + 3], p + 3 - pos, "STRING_MULTILINE")
+            return None
+        p = pos + 1
+        while p < fim:
+            d = fonte[p]
+            if d == '\\\\':
+                p += 2
+                continue
+            if d == c:
+                return (fonte[pos:p + 1], p + 1 - pos, "STRING")
+            if d == '\\n':
+                return None
+            p += 1
+        return None
+
+    if c.isdigit():
+        p = pos + 1
+        while p < fim and fonte[p].isdigit():
+            p += 1
+        if p < fim and fonte[p] == '.':
+            p += 1
+            if p < fim and fonte[p].isdigit():
+                p += 1
+                while p < fim and fonte[p].isdigit():
+                    p += 1
+                if p < fim and (fonte[p] == '_' or fonte[p].isalnum()):
+                    return None
+                return (fonte[pos:p], p - pos, "DECIMAL")
+            return None
+        if p < fim and (fonte[p] == '_' or fonte[p].isalnum()):
+            return None
+        return (fonte[pos:p], p - pos, "INTEIRO")
+
+    if pos + 1 < fim:
+        dois = fonte[pos:pos + 2]
+        tipo = _OPERADORES_DUPLOS.get(dois)
+        if tipo:
+            return (dois, 2, tipo)
+
+    tipo = _OPERADORES_SIMPLES.get(c)
+    if tipo:
+        return (c, 1, tipo)
+
+    if c == '.':
+        if pos + 1 < fim and fonte[pos + 1].isdigit():
+            return None
+        return ('.', 1, 'DELIMITADOR')
+
+    return _casar_afd(fonte, pos)
+'''
+
+
+def _gerar_classes(classes_ascii, classes_nao_ascii):
+    """
+    Emite _classe(c): a classe de c no alfabeto do AFN (None se nenhum estado
+    tem transição por ela), com as classes de AFDUnificado.classes_caracteres.
+    """
+    linhas = [
+        "",
+        f"_CLASSES_ASCII = {classes_ascii!r}",
+        "",
+        "",
+        "def _classe(c):",
+        "    codigo = ord(c)",
+        "    if codigo < 128:",
+        "        return _CLASSES_ASCII[codigo]",
+    ]
+    for metodo, classe in classes_nao_ascii:
+        if metodo is None:
+            linhas.append(f"    return {classe!r}")
+        else:
+            linhas.append(f"    if c.{metodo}():")
+            linhas.append(f"        return {classe!r}")
+    return "\n".join(linhas) + "\n"
+
+
+def _condicao(simbolos):
+    simbolos = sorted(simbolos)
+    if len(simbolos) == 1:
+        return f"t == {simbolos[0]!r}"
+    return f"t in {tuple(simbolos)!r}"
+
+
+def _gerar_afd(tabela_transicoes, estados_aceitacao):
+    """Emite o AFD como código: um ramo por estado, uma condição por destino."""
+    linhas = [
+        "",
+        "",
+        "def _casar_afd(fonte, pos):",
+        '    """Maior casamento pelo AFD unificado, compilado em código."""',
+        "    fim = len(fonte)",
+        "    estado = 0",
+        "    i = pos",
+        "    ultima = -1",
+        "    tipo = None",
+        "    while i < fim:",
+        "        t = _classe(fonte[i])",
+    ]
+
+    primeiro = True
+    for estado in sorted(tabela_transicoes):
+        linhas.append(f"        {'if' if primeiro else 'elif'} estado == {estado}:")
+        primeiro = False
+
+        # Agrupa os símbolos pelo estado de destino
+        por_destino = {}
+        for simbolo, destino in tabela_transicoes[estado].items():
+            por_destino.setdefault(destino, []).append(simbolo)
+
+        ramo = "if"
+        for destino in sorted(por_destino):
+            linhas.append(f"            {ramo} {_condicao(por_destino[destino])}:")
+            linhas.append(f"                estado = {destino}")
+            if destino in estados_aceitacao:
+                linhas.append("                ultima = i + 1")
+                linhas.append(f"                tipo = {estados_aceitacao[destino]!r}")
+            ramo = "elif"
+        linhas.append("            else:")
+        linhas.append("                break")
+
+    if primeiro:
+        linhas.append("        break")
+    else:
+        linhas.append("        else:")
+        linhas.append("            break")
+
+    linhas += [
+        "        i += 1",
+        "    if ultima < 0:",
+        "        return None",
+        "    return (fonte[pos:ultima], ultima - pos, tipo)",
+        "",
+    ]
+    return "\n".join(linhas)
+
+
+def gerar_codigo(afn=None):
+    """
+    Gera o código-fonte do scanner especializado.
+
+    Args:
+        afn: AFN de origem (por padrão, AFNCoralUnificado)
+
+    Returns:
+        str: Código-fonte do módulo
+    """
+    afn = afn or AFNCoralUnificado()
+    conversor = ConversorAFNparaAFD(afn)
+    conversor.construir_subconjuntos()
+
+    codigo = CABECALHO.format(
+        chave=chave_scanner(afn, AFDUnificado),
+        palavras=AFDUnificado.PALAVRAS_ESPECIAIS,
+        duplos=AFDUnificado.OPERADORES_DUPLOS,
+        simples=AFDUnificado.OPERADORES_SIMPLES
+    )
+    codigo += _gerar_classes(*AFDUnificado.classes_caracteres(afn.simbolos()))
+    codigo += SCAN
+    codigo += _gerar_afd(
+        conversor.get_tabela_transicoes_afd(),
+        conversor.get_estados_aceitacao_afd()
+    )
+    return codigo
+
+
+def gerar_scanner(destino=DESTINO_PADRAO):
+    """Gera o scanner e o grava em destino. Retorna o caminho gravado."""
+    codigo = gerar_codigo()
+    with open(destino, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(codigo)
+    return destino
+
+
+if __name__ == "__main__":
+    destino = gerar_scanner(sys.argv[1] if len(sys.argv) > 1 else DESTINO_PADRAO)
+    print(f"Scanner gerado em {destino}")
@@ -1,44 +1,117 @@
 import sys
 import os
+from collections import deque
 
 src_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, src_dir)
 
 from lexer.AFD import get_afd
-from lexer.Token import Token
-from lexer.Buffer import BufferLeitura
+from lexer.TokenStream import TokenStream
+from lexer.cache_tokens import chave_tokens, carregar_tokens, salvar_tokens
+from lexer.Buffer import BufferLeitura, BufferLeituraArquivo, BufferLeituraMmap
 from utils.utils import PALAVRAS_RESERVADAS
 
+class ErroLexico(ValueError):
+    """Erro léxico (token inválido ou indentação inconsistente) com sua localização."""
+    
+    def __init__(self, mensagem, linha=None, coluna=None, posicao=None, lexema=None):
+        self.mensagem = mensagem
+        self.linha = linha
+        self.coluna = coluna
+        self.posicao = posicao
+        self.lexema = lexema
+        super().__init__(self.formatar_mensagem())
+    
+    def formatar_mensagem(self):
+        texto = self.mensagem
+        if self.linha is not None and self.coluna is not None:
+            texto += f" na linha {self.linha}, coluna {self.coluna}"
+        if self.lexema is not None:
+            texto += f": '{self.lexema}'"
+        return texto
+
 class AnalisadorLexico:
     """Analisador léxico/Tokenizador para a linguagem Coral com suporte a INDENTA/DEDENTA."""
     
-    def __init__(self, codigo_fonte):
-        self.buffer_leitura = BufferLeitura(codigo_fonte)
+    def __init__(self, codigo_fonte, motor=None, buffer_leitura=None, recuperar_erros=False,
+                 emitir_comentarios=False):
+        """
+        Args:
+            codigo_fonte: Código Coral a ser analisado
+            motor: Motor de reconhecimento de tokens (ver lexer.AFD.MOTORES);
+                None usa o motor padrão.
+            buffer_leitura: Buffer já construído (ex.: BufferLeituraArquivo);
+                quando informado, codigo_fonte é ignorado.
+            recuperar_erros: Se True, erros léxicos não interrompem a análise:
+                são registrados em erros e o trecho inválido é descartado.
+            emitir_comentarios: Se True, comentários são emitidos como tokens
+                (COMENTARIO_LINHA), ex.: para formatadores; por padrão são
+                pulados sem criar tokens.
+        """
+        self.buffer_leitura = buffer_leitura or BufferLeitura(codigo_fonte)
         
         self.palavras_reservadas = PALAVRAS_RESERVADAS
-
-        self.afd = get_afd()
+        
+        self.afd = get_afd(motor)
         
         # Sistema de rastreamento de indentação
         self.pilha_indentacao = [0]
-        self.tokens_pendentes = []
+        self.tokens_pendentes = deque()
+        
+        # Tokens já reconhecidos por peekNextToken e ainda não consumidos
+        self.tokens_adiante = deque()
         self.inicio_linha = True
         self.nivel_parenteses = 0
+        
+        # Modo de recuperação: todos os erros léxicos encontrados, em ordem
+        self.recuperar_erros = recuperar_erros
+        self.erros = []
+        
+        self.emitir_comentarios = emitir_comentarios
+    
+    def fechar(self):
+        """Libera o arquivo lido pelo buffer (arquivo em streaming ou mmap)."""
+        self.buffer_leitura.fechar()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, tipo, valor, rastro):
+        self.fechar()
     
-    def _processar_indentacao(self, pos_info):
-        """Processa a indentação no início de uma linha."""
-        # Conta espaços/tabs no início da linha
+    def _erro(self, erro):
+        """Lança o erro léxico ou, no modo de recuperação, apenas o registra."""
+        if not self.recuperar_erros:
+            raise erro
+        self.erros.append(erro)
+    
+    def _ressincronizar(self):
+        """
+        Descarta o trecho inválido na posição atual (modo de recuperação).
+        
+        A análise recomeça no próximo espaço, quebra de linha ou caractere que
+        inicia um token válido. Uma aspa sem fechamento descarta o resto da
+        linha, para que o conteúdo da string não gere outros erros.
+        """
+        buffer_leitura = self.buffer_leitura
+        if buffer_leitura.caractere_atual() in '"\'':
+            while not buffer_leitura.fim_arquivo() and buffer_leitura.caractere_atual() not in '\r\n':
+                buffer_leitura.avancar_caractere()
+            return
+        
+        buffer_leitura.avancar_caractere()
+        while (not buffer_leitura.fim_arquivo()
+               and buffer_leitura.caractere_atual() not in ' \t\r\n'
+               and buffer_leitura.reconhecer(self.afd) is None):
+            buffer_leitura.avancar_caractere()
+    
+    def _processar_indentacao(self, inicio):
+        """Processa a indentação no início de uma linha (inicio: marca do buffer)."""
+        # Conta espaços/tabs no início da linha (tab conta como 4 espaços)
         nivel_indentacao = 0
-        while not self.buffer_leitura.fim_arquivo():
-            char = self.buffer_leitura.caractere_atual()
-            if char == ' ':
-                nivel_indentacao += 1
-                self.buffer_leitura.avancar(1)
-            elif char == '\t':
-                nivel_indentacao += 4  # Tab conta como 4 espaços
-                self.buffer_leitura.avancar(1)
-            else:
-                break
+        if not self.buffer_leitura.fim_arquivo() and self.buffer_leitura.caractere_atual() in ' \t':
+            caracteres, tabulacoes = self.buffer_leitura.pular_espacos()
+            nivel_indentacao = caracteres + 3 * tabulacoes
         
         # Se a linha está vazia ou é comentário, ignora indentação
         if self.buffer_leitura.fim_arquivo():
@@ -49,8 +122,7 @@ class AnalisadorLexico:
             return False  # Linha vazia
         
         # Verifica se é comentário
-        resto = self.buffer_leitura.resto_codigo()
-        if resto.startswith('#'):
+        if char_atual == '#':
             return False  # Linha de comentário
         
         # Compara com o nível de indentação atual
@@ -59,20 +131,19 @@ class AnalisadorLexico:
         if nivel_indentacao > nivel_atual:
             self.pilha_indentacao.append(nivel_indentacao)
             self.tokens_pendentes.append(
-                Token("", "INDENTA", pos_info['linha'], nivel_indentacao, pos_info['posicao'])
+                self.buffer_leitura.criar_token("", "INDENTA", inicio, nivel_indentacao)
             )
         
         elif nivel_indentacao < nivel_atual:
             while self.pilha_indentacao and self.pilha_indentacao[-1] > nivel_indentacao:
                 self.pilha_indentacao.pop()
                 self.tokens_pendentes.append(
-                    Token("", "DEDENTA", pos_info['linha'], nivel_indentacao, pos_info['posicao'])
+                    self.buffer_leitura.criar_token("", "DEDENTA", inicio, nivel_indentacao)
                 )
             
             if not self.pilha_indentacao or self.pilha_indentacao[-1] != nivel_indentacao:
-                raise ValueError(
-                    f"Indentação inconsistente na linha {pos_info['linha']}, coluna {pos_info['coluna']}"
-                )
+                linha, coluna = self.buffer_leitura.linha_coluna(inicio)
+                self._erro(ErroLexico("Indentação inconsistente", linha, coluna, inicio))
         
         return True  # Linha contém código real
     
@@ -80,147 +151,316 @@ class AnalisadorLexico:
         """Reconhece e retorna o próximo token do código fonte."""
         # Se há tokens pendentes (INDENT/DEDENT), retorna eles primeiro
         if self.tokens_pendentes:
-            return self.tokens_pendentes.pop(0)
+            return self.tokens_pendentes.popleft()
         
-        # Processa indentação no início de linha
-        if self.inicio_linha and self.nivel_parenteses == 0:
-            pos_info = self.buffer_leitura.get_posicao_info()
-            linha_tem_codigo = self._processar_indentacao(pos_info)
-            
-            # Só marca como não-início-de-linha se a linha tem código real
-            if linha_tem_codigo:
-                self.inicio_linha = False
-            
-            # Se gerou tokens de indentação, retorna o primeiro
-            if self.tokens_pendentes:
-                return self.tokens_pendentes.pop(0)
-        
-        # Pula espaços em branco (exceto newline)
-        while not self.buffer_leitura.fim_arquivo():
-            caractere = self.buffer_leitura.caractere_atual()
+        while True:
+            # Processa indentação no início de linha
+            if self.inicio_linha and self.nivel_parenteses == 0:
+                linha_tem_codigo = self._processar_indentacao(self.buffer_leitura.marca())
+                
+                # Só marca como não-início-de-linha se a linha tem código real
+                if linha_tem_codigo:
+                    self.inicio_linha = False
+                
+                # Se gerou tokens de indentação, retorna o primeiro
+                if self.tokens_pendentes:
+                    return self.tokens_pendentes.popleft()
             
-            # Newline marca início de nova linha
-            if caractere == '\n' or caractere == '\r':
-                pos_info = self.buffer_leitura.get_posicao_info()
+            # Pula espaços em branco (exceto newline)
+            while not self.buffer_leitura.fim_arquivo():
+                caractere = self.buffer_leitura.caractere_atual()
                 
-                # Pula o newline
-                if caractere == '\r' and not self.buffer_leitura.fim_arquivo():
-                    self.buffer_leitura.avancar(1)
-                    if self.buffer_leitura.caractere_atual() == '\n':
+                # Newline marca início de nova linha
+                if caractere == '\n' or caractere == '\r':
+                    # Só gera NEWLINE se não estiver dentro de parênteses
+                    token = None
+                    if self.nivel_parenteses == 0:
+                        token = self.buffer_leitura.criar_token("\\n", "NEWLINE", self.buffer_leitura.marca())
+                    
+                    # Pula o newline
+                    if caractere == '\r' and not self.buffer_leitura.fim_arquivo():
                         self.buffer_leitura.avancar(1)
-                else:
-                    self.buffer_leitura.avancar(1)
+                        if self.buffer_leitura.caractere_atual() == '\n':
+                            self.buffer_leitura.avancar(1)
+                    else:
+                        self.buffer_leitura.avancar(1)
+                    
+                    self.inicio_linha = True
+                    
+                    if token:
+                        return token
+                    continue  # Ignora newline dentro de parênteses
                 
-                self.inicio_linha = True
+                # Outros espaços em branco
+                if caractere in ' \t':
+                    self.buffer_leitura.pular_espacos()
+                    continue
                 
-                # Só retorna NEWLINE se não estiver dentro de parênteses
-                if self.nivel_parenteses == 0:
-                    return Token("\\n", "NEWLINE", pos_info['linha'], pos_info['coluna'], pos_info['posicao'])
-                else:
-                    continue  # Ignora newline dentro de parênteses
+                break
             
-            # Outros espaços em branco
-            if caractere in ' \t':
-                self.buffer_leitura.avancar(1)
+            # Comentário de linha (até a quebra de linha, inclusive): pulado sem criar token
+            if not self.emitir_comentarios and self.buffer_leitura.caractere_atual() == '#':
+                self.buffer_leitura.pular_comentario()
                 continue
             
-            break
-        
-        # Fim do arquivo: gera DEDENTAs pendentes
-        if self.buffer_leitura.fim_arquivo():
-            pos_info = self.buffer_leitura.get_posicao_info()
-            
-            while len(self.pilha_indentacao) > 1:
-                self.pilha_indentacao.pop()
-                self.tokens_pendentes.append(
-                    Token("", "DEDENTA", pos_info['linha'], 0, pos_info['posicao'])
-                )
-            
-            if self.tokens_pendentes:
-                return self.tokens_pendentes.pop(0)
-            
-            return None
-        
-        # Reconhece o próximo token normalmente
-        pos_info = self.buffer_leitura.get_posicao_info()
-        resultado = self.afd.match(self.buffer_leitura.resto_codigo())
-        
-        if resultado:
-            lexema, tamanho, tipo = resultado
+            # Fim do arquivo: gera DEDENTAs pendentes
+            if self.buffer_leitura.fim_arquivo():
+                inicio = self.buffer_leitura.marca()
+                
+                while len(self.pilha_indentacao) > 1:
+                    self.pilha_indentacao.pop()
+                    self.tokens_pendentes.append(
+                        self.buffer_leitura.criar_token("", "DEDENTA", inicio, 0)
+                    )
+                
+                if self.tokens_pendentes:
+                    return self.tokens_pendentes.popleft()
+                
+                return None
             
-            # Reclassifica palavras reservadas
-            if tipo == "IDENTIFICADOR" and lexema in self.palavras_reservadas:
-                tipo = "PALAVRA_RESERVADA"
+            # Reconhece o próximo token normalmente
+            inicio = self.buffer_leitura.marca()
+            resultado = self.buffer_leitura.reconhecer(self.afd)
             
-            # Rastreia parênteses/colchetes/chaves
-            if lexema in '([{':
-                self.nivel_parenteses += 1
-            elif lexema in ')]}':
-                self.nivel_parenteses -= 1
+            if resultado:
+                lexema, tamanho, tipo = resultado
+                
+                # Reclassifica palavras reservadas
+                if tipo == "IDENTIFICADOR" and lexema in self.palavras_reservadas:
+                    tipo = "PALAVRA_RESERVADA"
+                
+                # Rastreia parênteses/colchetes/chaves
+                if lexema in '([{':
+                    self.nivel_parenteses += 1
+                elif lexema in ')]}':
+                    self.nivel_parenteses -= 1
+                
+                token = self.buffer_leitura.criar_token(lexema, tipo, inicio)
+                self.buffer_leitura.avancar(tamanho)
+                return token
             
-            token = Token(lexema, tipo, pos_info['linha'], pos_info['coluna'], pos_info['posicao'])
-            self.buffer_leitura.avancar(tamanho)
-            return token
-        else:
             caractere = self.buffer_leitura.caractere_atual()
-            raise ValueError(
-                f"Token inválido na linha {pos_info['linha']}, coluna {pos_info['coluna']}: '{caractere}'"
-            )
+            linha, coluna = self.buffer_leitura.linha_coluna(inicio)
+            self._erro(ErroLexico("Token inválido", linha, coluna, inicio, caractere))
+            
+            # Modo de recuperação: descarta o trecho inválido e continua
+            self._ressincronizar()
     
-    def getNextToken(self):
-        """Retorna o próximo token para o analisador sintático."""
+    def _token_eof(self):
+        """Cria o token EOF na posição atual."""
+        return self.buffer_leitura.criar_token("", "EOF", self.buffer_leitura.marca())
+    
+    def _lexar_proximo(self):
+        """Reconhece o próximo token (EOF ao fim)."""
         token = self._reconhecer_proximo_token()
         
-        # Pula comentários
-        while token and token.tipo in ("COMENTARIO_LINHA", "COMENTARIO_BLOCO"):
-            token = self._reconhecer_proximo_token()
-        
         # Retorna EOF se acabou
         if token is None:
-            pos_info = self.buffer_leitura.get_posicao_info()
-            token = Token("", "EOF", pos_info['linha'], pos_info['coluna'], pos_info['posicao'])
+            token = self._token_eof()
         
         return token
     
-    def peekNextToken(self):
-        """Espia o próximo token sem consumi-lo (lookahead)."""
-        pos_salva = self.buffer_leitura.posicao
-        linha_salva = self.buffer_leitura.linha
-        coluna_salva = self.buffer_leitura.coluna
+    def getNextToken(self):
+        """Retorna o próximo token para o analisador sintático."""
+        if self.tokens_adiante:
+            return self.tokens_adiante.popleft()
+        return self._lexar_proximo()
+    
+    def peekNextToken(self, k=1):
+        """
+        Espia o k-ésimo próximo token sem consumi-lo (lookahead).
+        
+        Os tokens espiados ficam guardados e são devolvidos por getNextToken,
+        então cada token é reconhecido uma única vez e o estado de indentação
+        e parênteses não é alterado duas vezes.
+        """
+        while len(self.tokens_adiante) < k:
+            self.tokens_adiante.append(self._lexar_proximo())
+        return self.tokens_adiante[k - 1]
+    
+    def __iter__(self):
+        """
+        Itera sobre os tokens restantes, terminando com o token EOF.
         
-        token = self.getNextToken()
+        Exemplo:
+            for token in LexerCoral.analisar_string(codigo):
+                ...
+        """
+        while self.tokens_adiante:
+            token = self.tokens_adiante.popleft()
+            yield token
+            if token.tipo == "EOF":
+                return
         
-        self.buffer_leitura.posicao = pos_salva
-        self.buffer_leitura.linha = linha_salva
-        self.buffer_leitura.coluna = coluna_salva
+        proximo = self._reconhecer_proximo_token
+        while True:
+            token = proximo()
+            if token is None:
+                break
+            yield token
+        yield self._token_eof()
+    
+    def tokenizar_tudo(self):
+        """Retorna a lista de todos os tokens restantes, terminando com o token EOF."""
+        tokens = []
+        adicionar = tokens.append
+        while self.tokens_adiante:
+            token = self.tokens_adiante.popleft()
+            adicionar(token)
+            if token.tipo == "EOF":
+                return tokens
         
-        return token
+        proximo = self._reconhecer_proximo_token
+        while True:
+            token = proximo()
+            if token is None:
+                break
+            adicionar(token)
+        adicionar(self._token_eof())
+        return tokens
+    
+    def tokenizar_em_colunas(self):
+        """
+        Retorna todos os tokens restantes em um TokenStream (armazenamento colunar).
+        
+        Requer o código fonte completo em memória como texto: não disponível
+        na leitura em blocos (BufferLeituraArquivo) nem sobre bytes
+        (BufferLeituraMmap).
+        """
+        if isinstance(self.buffer_leitura, (BufferLeituraArquivo, BufferLeituraMmap)):
+            raise ValueError("tokenizar_em_colunas requer o código fonte completo em texto (sem streaming ou mmap)")
+        return TokenStream.de_tokens(self.buffer_leitura.codigo_fonte, self)
 
 class LexerCoral:
     """Interface principal do analisador léxico da linguagem Coral."""
     
     @staticmethod
-    def analisar_arquivo(nome_arquivo):
-        """Analisa um arquivo Coral retornando o analisador léxico."""
+    def analisar_arquivo(nome_arquivo, motor=None, streaming=False, mmap=False, recuperar_erros=False):
+        """
+        Analisa um arquivo Coral retornando o analisador léxico.
+        
+        Args:
+            nome_arquivo: Caminho do arquivo .crl
+            motor: Motor de reconhecimento de tokens (ver lexer.AFD.MOTORES)
+            streaming: Se True, lê o arquivo em blocos sob demanda em vez de
+                carregá-lo inteiro na memória (ver BufferLeituraArquivo)
+            mmap: Se True, mapeia o arquivo em memória e analisa os bytes
+                UTF-8 sem decodificá-lo inteiro; as posições dos tokens são
+                em bytes (ver BufferLeituraMmap)
+            recuperar_erros: Se True, registra todos os erros léxicos em
+                analisador.erros em vez de parar no primeiro
+        
+        Com streaming=True ou mmap=True, o analisador deve ser fechado ao
+        terminar (fechar() ou with LexerCoral.analisar_arquivo(...) as
+        analisador): em streaming o arquivo só é fechado sozinho ao chegar ao
+        fim, o que não acontece se a análise parar em um erro.
+        """
+        try:
+            if mmap:
+                buffer_leitura = BufferLeituraMmap.abrir(nome_arquivo)
+            elif streaming:
+                arquivo = open(nome_arquivo, "r", encoding="utf-8")
+            else:
+                with open(nome_arquivo, "r", encoding="utf-8") as f:
+                    codigo_fonte = f.read()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Arquivo {nome_arquivo} não encontrado.")
+        
+        if mmap:
+            try:
+                return AnalisadorLexico(None, motor, buffer_leitura, recuperar_erros)
+            except BaseException:
+                buffer_leitura.fechar()
+                raise
+        if streaming:
+            return LexerCoral.analisar_fluxo(arquivo, motor, fechar_ao_fim=True, recuperar_erros=recuperar_erros)
+        return AnalisadorLexico(codigo_fonte, motor, recuperar_erros=recuperar_erros)
+    
+    @staticmethod
+    def tokenizar_arquivo(nome_arquivo, motor=None, cache=False, diretorio_cache=None, erros=None):
+        """
+        Tokeniza um arquivo Coral inteiro, retornando um TokenStream.
+        
+        Args:
+            nome_arquivo: Caminho do arquivo .crl
+            motor: Motor de reconhecimento de tokens (ver lexer.AFD.MOTORES)
+            cache: Se True, reutiliza os tokens salvos em disco para o mesmo
+                conteúdo e versão do lexer, sem analisar o arquivo; em caso
+                de falta, salva os tokens (ver lexer.cache_tokens)
+            diretorio_cache: Diretório do cache (padrão: ~/.cache/coral/tokens)
+            erros: Lista que recebe os erros léxicos; se informada, a análise
+                usa o modo de recuperação em vez de parar no primeiro erro, e
+                os tokens só são salvos no cache se não houver erros
+        """
+        if not cache:
+            analisador = LexerCoral.analisar_arquivo(nome_arquivo, motor, recuperar_erros=erros is not None)
+            fluxo = analisador.tokenizar_em_colunas()
+            if analisador.erros:
+                erros.extend(analisador.erros)
+            return fluxo
+        
         try:
-            with open(nome_arquivo, "r", encoding="utf-8") as f:
-                codigo_fonte = f.read()
+            with open(nome_arquivo, "rb") as f:
+                conteudo = f.read()
         except FileNotFoundError:
             raise FileNotFoundError(f"Arquivo {nome_arquivo} não encontrado.")
         
-        return AnalisadorLexico(codigo_fonte)
+        # Mesma tradução de quebras de linha de open() em modo texto
+        codigo_fonte = conteudo.decode("utf-8")
+        if "\r" in codigo_fonte:
+            codigo_fonte = codigo_fonte.replace("\r\n", "\n").replace("\r", "\n")
+        
+        chave = chave_tokens(conteudo)
+        fluxo = carregar_tokens(chave, codigo_fonte, diretorio_cache)
+        if fluxo is None:
+            analisador = AnalisadorLexico(codigo_fonte, motor, recuperar_erros=erros is not None)
+            fluxo = analisador.tokenizar_em_colunas()
+            if analisador.erros:
+                erros.extend(analisador.erros)
+            else:
+                salvar_tokens(chave, fluxo, diretorio_cache)
+        return fluxo
+    
+    @staticmethod
+    def analisar_fluxo(arquivo, motor=None, tamanho_bloco=BufferLeituraArquivo.TAMANHO_BLOCO,
+                       fechar_ao_fim=False, recuperar_erros=False):
+        """
+        Analisa código Coral lido em blocos de um objeto de arquivo em modo texto.
+        
+        Args:
+            arquivo: Objeto com método read(n) (ex.: arquivo aberto, io.StringIO)
+            motor: Motor de reconhecimento de tokens (ver lexer.AFD.MOTORES)
+            tamanho_bloco: Caracteres lidos por vez
+            fechar_ao_fim: Se True, fecha o arquivo ao terminar a leitura
+            recuperar_erros: Se True, registra todos os erros léxicos em
+                analisador.erros em vez de parar no primeiro
+        """
+        buffer_leitura = BufferLeituraArquivo(arquivo, tamanho_bloco, fechar_ao_fim)
+        return AnalisadorLexico(None, motor, buffer_leitura, recuperar_erros)
     
     @staticmethod
-    def analisar_string(codigo_fonte):
+    def analisar_string(codigo_fonte, motor=None, recuperar_erros=False, emitir_comentarios=False):
         """Analisa uma string de código Coral retornando o analisador léxico."""
-        return AnalisadorLexico(codigo_fonte)
+        return AnalisadorLexico(codigo_fonte, motor, recuperar_erros=recuperar_erros,
+                                emitir_comentarios=emitir_comentarios)
+    
+    @staticmethod
+    def analisar_paralelo(codigo_fonte, motor=None, processos=None):
+        """
+        Tokeniza uma string de código Coral grande em vários processos.
+        
+        Retorna um TokenStream idêntico ao de tokenizar_em_colunas() da
+        análise sequencial (ver lexer.LexerParalelo).
+        """
+        from lexer.LexerParalelo import analisar_paralelo
+        return analisar_paralelo(codigo_fonte, motor, processos)
 
 def main():
     """Função principal para execução via linha de comando."""
     if len(sys.argv) != 2:
         print("Uso: python lexer.py <arquivo.coral>")
         sys.exit(1)
-
+    
     nome_arquivo = sys.argv[1]
     
     try:
@@ -229,8 +469,7 @@ def main():
         print(f"{'TOKEN':20} | {'TIPO'}")
         print("-" * 40)
         
-        while True:
-            token = lexer.getNextToken()
+        for token in lexer:
             if token.tipo == "EOF":
                 break
             print(f"{token.lexema:20} | {token.tipo}")
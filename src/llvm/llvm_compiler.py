@@ -22,6 +22,56 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from parser.ast_nodes import *
+from parser.percurso import Visitante
+
+
+class _StringCollector(Visitante):
+    """
+    Coleta as strings literais do programa em compiler.strings.
+    
+    Visita apenas o código que a primeira passada percorre: declarações,
+    blocos de SE/ENQUANTO/PARA, o lado direito das atribuições e os
+    argumentos de ESCREVA. Demais nós são ignorados (visitar_padrao).
+    """
+    
+    def __init__(self, compiler):
+        self.compiler = compiler
+    
+    def visitar_padrao(self, node):
+        return None
+    
+    def visitar_ProgramaNode(self, node):
+        return node.declaracoes
+    
+    visitar_BlocoNode = visitar_ProgramaNode
+    
+    def visitar_ChamadaFuncaoNode(self, node):
+        # Verifica se é ESCREVA
+        if hasattr(node, 'nome') and node.nome == 'ESCREVA':
+            return node.argumentos
+    
+    def visitar_LiteralNode(self, node):
+        compiler = self.compiler
+        if isinstance(node.valor, str):
+            if node.valor not in compiler.strings.values():
+                compiler.strings[compiler.string_counter] = node.valor
+                compiler.string_counter += 1
+    
+    def visitar_AtribuicaoNode(self, node):
+        return [node.expressao]
+    
+    def visitar_SeNode(self, node):
+        blocos = [node.bloco_se]
+        if node.blocos_senaose:
+            blocos += [bloco for _, bloco in node.blocos_senaose]
+        if node.bloco_senao:
+            blocos.append(node.bloco_senao)
+        return blocos
+    
+    def visitar_EnquantoNode(self, node):
+        return [node.bloco]
+    
+    visitar_ParaNode = visitar_EnquantoNode
 
 
 class LLVMCompiler:
@@ -140,47 +190,7 @@ class LLVMCompiler:
     
     def _collect_strings(self, node):
         """Coleta todas as strings do programa (primeira passada)."""
-        if node is None:
-            return
-        
-        node_type = type(node).__name__
-        
-        if node_type == 'ProgramaNode':
-            for decl in node.declaracoes:
-                self._collect_strings(decl)
-        
-        elif node_type == 'BlocoNode':
-            for instr in node.declaracoes:
-                self._collect_strings(instr)
-        
-        elif node_type == 'ChamadaFuncaoNode':
-            # Verifica se é ESCREVA
-            if hasattr(node, 'nome') and node.nome == 'ESCREVA':
-                for arg in node.argumentos:
-                    self._collect_strings(arg)
-        
-        elif node_type == 'LiteralNode':
-            if isinstance(node.valor, str):
-                if node.valor not in self.strings.values():
-                    self.strings[self.string_counter] = node.valor
-                    self.string_counter += 1
-        
-        elif node_type == 'AtribuicaoNode':
-            self._collect_strings(node.expressao)
-        
-        elif node_type == 'SeNode':
-            self._collect_strings(node.bloco_se)
-            if node.blocos_senaose:
-                for _, bloco in node.blocos_senaose:
-                    self._collect_strings(bloco)
-            if node.bloco_senao:
-                self._collect_strings(node.bloco_senao)
-        
-        elif node_type == 'EnquantoNode':
-            self._collect_strings(node.bloco)
-        
-        elif node_type == 'ParaNode':
-            self._collect_strings(node.bloco)
+        _StringCollector(self).visitar(node)
     
     def _emit_line(self, line):
         """Emite uma linha de código com indentação."""
@@ -0,0 +1,414 @@
+"""
+Representação da AST em arena: nós em arrays paralelos, sem objetos ligados.
+
+Os nós ficam em pré-ordem (a raiz é o nó 0 e os descendentes de um nó vêm
+depois dele), um por posição dos arrays:
+    
+    tipos           classe do nó (índice em CLASSES)
+    locs            posição empacotada (ver ast_nodes.empacotar_posicao)
+    inicio_campos   início dos campos do nó em campos; o nó tem
+                    len(CLASSES[tipo].CAMPOS) campos
+
+Cada campo é uma referência inteira: o índice do valor multiplicado por 8
+mais uma marca do tipo do valor (nó, constante, lista, tupla ou token).
+Constantes (nomes, literais, None, booleanos) são índices em constantes,
+listas e tuplas são trechos de itens (inicio_listas/tamanho_listas) e
+tokens guardam lexema e tipo (índices em constantes), loc e posição.
+
+Percorrer a arena inteira é um laço sobre inteiros (ex.: nos(LiteralNode)),
+sem recursão nem acesso a atributos de milhares de objetos, e a
+serialização (para_bytes/de_bytes) copia os arrays diretamente; é o formato
+dos arquivos .crlc do cache da AST (cache_ast).
+"""
+
+import json
+import marshal
+import os
+import sys
+from array import array
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+try:
+    from src.parser import ast_nodes
+    from src.parser.ast_nodes import ASTNode
+except ModuleNotFoundError:
+    from . import ast_nodes
+    from .ast_nodes import ASTNode
+from lexer.Token import Token
+
+# Classes de nós na ordem de definição em ast_nodes
+CLASSES = tuple(
+    classe for classe in vars(ast_nodes).values()
+    if isinstance(classe, type) and issubclass(classe, ASTNode)
+)
+ID_CLASSE = {classe: i for i, classe in enumerate(CLASSES)}
+
+# Marcas das referências (3 bits baixos)
+NO, CONSTANTE, LISTA, TUPLA, TOKEN = range(5)
+_BITS_MARCA = 3
+_MASCARA_MARCA = (1 << _BITS_MARCA) - 1
+
+_TIPOS_CONSTANTES = (type(None), bool, int, float, str)
+
+# Arrays da arena, na ordem de para_bytes
+_ARRAYS = (
+    ('tipos', 'B'), ('locs', 'Q'), ('inicio_campos', 'I'), ('campos', 'I'),
+    ('inicio_listas', 'I'), ('tamanho_listas', 'I'), ('itens', 'I'),
+    ('lexemas_tokens', 'I'), ('tipos_tokens', 'I'), ('locs_tokens', 'Q'), ('posicoes_tokens', 'Q'),
+)
+
+
+class ArenaAST:
+    """AST em arrays paralelos (ver o docstring do módulo)."""
+    
+    def __init__(self):
+        for nome, codigo in _ARRAYS:
+            setattr(self, nome, array(codigo))
+        self.constantes = []
+        self._indices_constantes = {}
+    
+    def __len__(self):
+        return len(self.tipos)
+    
+    # ------------------------------------------------------------------
+    # Conversão a partir da AST de objetos
+    # ------------------------------------------------------------------
+    
+    @classmethod
+    def de_ast(cls, raiz):
+        """
+        Constrói a arena a partir de uma AST de objetos (sem recursão).
+        
+        Raises:
+            TypeError: Se a árvore contiver um valor que não é nó, lista,
+                tupla, token ou constante (None, bool, int, float, str).
+        """
+        arena = cls()
+        tipos = arena.tipos
+        locs = arena.locs
+        inicio_campos = arena.inicio_campos
+        campos = arena.campos
+        
+        # Pilha de (nó, array e posição onde gravar a referência ao nó)
+        pendentes = [(raiz, None, 0)]
+        while pendentes:
+            no, destino, posicao = pendentes.pop()
+            indice = len(tipos)
+            if destino is not None:
+                destino[posicao] = indice << _BITS_MARCA | NO
+            
+            classe = type(no)
+            tipos.append(ID_CLASSE[classe])
+            locs.append(no.loc)
+            inicio = len(campos)
+            inicio_campos.append(inicio)
+            nomes = classe.CAMPOS
+            campos.extend([0] * len(nomes))
+            filhos = []
+            for deslocamento, nome in enumerate(nomes):
+                campos[inicio + deslocamento] = arena._referencia(getattr(no, nome), campos, inicio + deslocamento, filhos)
+            # Pré-ordem: o primeiro filho é o próximo a ser numerado
+            pendentes.extend(reversed(filhos))
+        # O índice de constantes só é necessário durante a construção
+        arena._indices_constantes = {}
+        return arena
+    
+    def _referencia(self, valor, destino, posicao, filhos):
+        """
+        Retorna a referência de um valor de campo ou item de lista.
+        
+        Nós são adicionados a filhos (com destino/posição) e numerados depois;
+        a referência provisória é 0.
+        """
+        classe = type(valor)
+        if classe in ID_CLASSE:
+            filhos.append((valor, destino, posicao))
+            return 0
+        if classe in _TIPOS_CONSTANTES:
+            return self._constante(valor) << _BITS_MARCA | CONSTANTE
+        if classe is list or classe is tuple:
+            itens = self.itens
+            indice = len(self.inicio_listas)
+            inicio = len(itens)
+            self.inicio_listas.append(inicio)
+            self.tamanho_listas.append(len(valor))
+            itens.extend([0] * len(valor))
+            for deslocamento, item in enumerate(valor):
+                itens[inicio + deslocamento] = self._referencia(item, itens, inicio + deslocamento, filhos)
+            return indice << _BITS_MARCA | (LISTA if classe is list else TUPLA)
+        if hasattr(valor, 'lexema') and hasattr(valor, 'tipo'):
+            # Token (ou TokenView): apenas os dados, sem o lexer/TokenStream de origem
+            indice = len(self.lexemas_tokens)
+            self.lexemas_tokens.append(self._constante(valor.lexema))
+            self.tipos_tokens.append(self._constante(valor.tipo))
+            self.locs_tokens.append(ast_nodes.empacotar_posicao(valor.linha, valor.coluna))
+            self.posicoes_tokens.append(valor.posicao)
+            return indice << _BITS_MARCA | TOKEN
+        raise TypeError(f"Valor não serializável na AST: {classe.__name__}")
+    
+    def _constante(self, valor):
+        """Retorna o índice da constante, adicionando-a se for nova."""
+        # repr distingue 0.0 de -0.0 (iguais como chave de dicionário)
+        chave = (type(valor), repr(valor) if type(valor) is float else valor)
+        indice = self._indices_constantes.get(chave)
+        if indice is None:
+            indice = self._indices_constantes[chave] = len(self.constantes)
+            self.constantes.append(valor)
+        return indice
+    
+    # ------------------------------------------------------------------
+    # Conversão para a AST de objetos
+    # ------------------------------------------------------------------
+    
+    def para_ast(self):
+        """
+        Reconstrói a AST de objetos (ProgramaNode) a partir da arena.
+        
+        Os nós são criados do último para o primeiro: em pré-ordem, os filhos
+        de um nó já existem quando ele é criado.
+        """
+        objetos = [None] * len(self.tipos)
+        valor = self._decodificador(objetos.__getitem__, self._token)
+        campos = self.campos
+        inicio_campos = self.inicio_campos
+        locs = self.locs
+        classes = [(classe, classe.CAMPOS, len(classe.CAMPOS)) for classe in CLASSES]
+        novo = object.__new__
+        
+        constantes = self.constantes
+        tipos = self.tipos
+        try:
+            for indice in range(len(objetos) - 1, -1, -1):
+                classe, nomes, quantidade = classes[tipos[indice]]
+                no = novo(classe)
+                no.loc = locs[indice]
+                inicio = inicio_campos[indice]
+                for nome, referencia in zip(nomes, campos[inicio:inicio + quantidade]):
+                    # Constantes e nós (os casos comuns) sem chamar valor()
+                    marca = referencia & _MASCARA_MARCA
+                    if marca == CONSTANTE:
+                        setattr(no, nome, constantes[referencia >> _BITS_MARCA])
+                    elif marca == NO:
+                        setattr(no, nome, objetos[referencia >> _BITS_MARCA])
+                    else:
+                        setattr(no, nome, valor(referencia))
+                objetos[indice] = no
+        except IndexError:
+            raise ValueError("Arena corrompida")
+        return objetos[0] if objetos else None
+    
+    def _token(self, indice):
+        linha, coluna = ast_nodes.desempacotar_posicao(self.locs_tokens[indice])
+        return Token(
+            self.constantes[self.lexemas_tokens[indice]],
+            self.constantes[self.tipos_tokens[indice]],
+            linha, coluna, self.posicoes_tokens[indice]
+        )
+    
+    def _decodificador(self, no, token):
+        """
+        Retorna a função que converte uma referência em valor.
+        
+        no(indice) e token(indice) produzem os valores de nós e tokens; o
+        restante (constantes, listas, tuplas) é resolvido aqui.
+        """
+        constantes = self.constantes
+        inicio_listas = self.inicio_listas
+        tamanho_listas = self.tamanho_listas
+        itens = self.itens
+        
+        def valor(referencia):
+            marca = referencia & _MASCARA_MARCA
+            indice = referencia >> _BITS_MARCA
+            if marca == CONSTANTE:
+                return constantes[indice]
+            if marca == NO:
+                return no(indice)
+            if marca == TOKEN:
+                return token(indice)
+            if marca != LISTA and marca != TUPLA:
+                raise ValueError("Arena corrompida")
+            inicio = inicio_listas[indice]
+            elementos = [valor(item) for item in itens[inicio:inicio + tamanho_listas[indice]]]
+            return elementos if marca == LISTA else tuple(elementos)
+        
+        return valor
+    
+    # ------------------------------------------------------------------
+    # Iteração
+    # ------------------------------------------------------------------
+    
+    def classe(self, indice):
+        """Retorna a classe (de ast_nodes) do nó."""
+        return CLASSES[self.tipos[indice]]
+    
+    def no(self, indice):
+        """Retorna uma visão (NoArena) do nó."""
+        return NoArena(self, indice)
+    
+    def nos(self, *classes):
+        """
+        Itera, em pré-ordem, sobre as visões dos nós das classes informadas
+        (todas, se nenhuma for informada).
+        """
+        if not classes:
+            return (NoArena(self, indice) for indice in range(len(self.tipos)))
+        ids = {ID_CLASSE[classe] for classe in classes}
+        return (NoArena(self, indice) for indice, tipo in enumerate(self.tipos) if tipo in ids)
+    
+    def contar(self):
+        """Retorna a quantidade de nós por nome de classe."""
+        quantidades = [0] * len(CLASSES)
+        for tipo in self.tipos:
+            quantidades[tipo] += 1
+        return {classe.__name__: n for classe, n in zip(CLASSES, quantidades) if n}
+    
+    def campo(self, indice, nome):
+        """
+        Retorna o valor de um campo do nó: nós como NoArena, listas e tuplas
+        com seus itens convertidos, tokens como Token e constantes como estão.
+        """
+        nomes = CLASSES[self.tipos[indice]].CAMPOS
+        try:
+            deslocamento = nomes.index(nome)
+        except ValueError:
+            raise AttributeError(f"{CLASSES[self.tipos[indice]].__name__} não tem o campo '{nome}'")
+        referencia = self.campos[self.inicio_campos[indice] + deslocamento]
+        return self._decodificador(self.no, self._token)(referencia)
+    
+    def filhos(self, indice):
+        """Retorna os índices dos nós filhos diretos, na ordem dos campos."""
+        resultado = []
+        inicio = self.inicio_campos[indice]
+        pendentes = list(self.campos[inicio:inicio + len(CLASSES[self.tipos[indice]].CAMPOS)])
+        pendentes.reverse()
+        while pendentes:
+            referencia = pendentes.pop()
+            marca = referencia & _MASCARA_MARCA
+            if marca == NO:
+                resultado.append(referencia >> _BITS_MARCA)
+            elif marca == LISTA or marca == TUPLA:
+                lista = referencia >> _BITS_MARCA
+                inicio_lista = self.inicio_listas[lista]
+                itens = self.itens[inicio_lista:inicio_lista + self.tamanho_listas[lista]]
+                pendentes.extend(reversed(itens))
+        return resultado
+    
+    # ------------------------------------------------------------------
+    # Serialização
+    # ------------------------------------------------------------------
+    
+    def para_bytes(self):
+        """Serializa a arena: cabeçalho JSON, arrays em formato nativo e constantes (marshal)."""
+        corpo_constantes = marshal.dumps(self.constantes)
+        tamanhos = {nome: len(getattr(self, nome)) for nome, _ in _ARRAYS}
+        tamanhos['constantes'] = len(corpo_constantes)
+        partes = [json.dumps(tamanhos, sort_keys=True).encode('utf-8'), b'\n']
+        partes.extend(getattr(self, nome).tobytes() for nome, _ in _ARRAYS)
+        partes.append(corpo_constantes)
+        return b''.join(partes)
+    
+    @classmethod
+    def de_bytes(cls, dados):
+        """
+        Reconstrói a arena a partir dos bytes gerados por para_bytes.
+        
+        Raises:
+            ValueError: Se os dados estiverem truncados ou corrompidos.
+        """
+        cabecalho, _, corpo = dados.partition(b'\n')
+        try:
+            tamanhos = json.loads(cabecalho)
+            fim_arrays = sum(tamanhos[nome] * array(codigo).itemsize for nome, codigo in _ARRAYS)
+            tamanho_constantes = tamanhos['constantes']
+        except (ValueError, KeyError, TypeError):
+            raise ValueError("Cabeçalho da arena inválido")
+        if len(corpo) != fim_arrays + tamanho_constantes:
+            raise ValueError("Tamanho da arena serializada inválido")
+        
+        arena = cls()
+        inicio = 0
+        for nome, _ in _ARRAYS:
+            coluna = getattr(arena, nome)
+            fim = inicio + tamanhos[nome] * coluna.itemsize
+            coluna.frombytes(corpo[inicio:fim])
+            inicio = fim
+        try:
+            arena.constantes = marshal.loads(corpo[fim_arrays:])
+        except (EOFError, ValueError, TypeError):
+            raise ValueError("Constantes da arena inválidas")
+        arena._validar()
+        return arena
+    
+    def _validar(self):
+        """
+        Verifica a consistência dos tamanhos dos arrays.
+        
+        Referências fora dos arrays são detectadas ao serem lidas (IndexError).
+        """
+        n = len(self.tipos)
+        if not isinstance(self.constantes, list) or (n and self.tipos[0] != ID_CLASSE[ast_nodes.ProgramaNode]):
+            raise ValueError("Arena corrompida")
+        if len(self.locs) != n or len(self.inicio_campos) != n or len(self.tamanho_listas) != len(self.inicio_listas):
+            raise ValueError("Arena corrompida")
+        if max(self.tipos, default=0) >= len(CLASSES):
+            raise ValueError("Arena corrompida")
+        esperado = 0
+        for tipo, inicio in zip(self.tipos, self.inicio_campos):
+            if inicio != esperado:
+                raise ValueError("Arena corrompida")
+            esperado += len(CLASSES[tipo].CAMPOS)
+        if esperado != len(self.campos):
+            raise ValueError("Arena corrompida")
+        for inicio, tamanho in zip(self.inicio_listas, self.tamanho_listas):
+            if inicio + tamanho > len(self.itens):
+                raise ValueError("Arena corrompida")
+        n_tokens = len(self.lexemas_tokens)
+        if not len(self.tipos_tokens) == len(self.locs_tokens) == len(self.posicoes_tokens) == n_tokens:
+            raise ValueError("Arena corrompida")
+        if n_tokens and max(max(self.lexemas_tokens), max(self.tipos_tokens)) >= len(self.constantes):
+            raise ValueError("Arena corrompida")
+
+
+class NoArena:
+    """Visão leve de um nó da ArenaAST, com os campos do nó como atributos."""
+    
+    __slots__ = ('arena', 'indice')
+    
+    def __init__(self, arena, indice):
+        self.arena = arena
+        self.indice = indice
+    
+    @property
+    def classe(self):
+        return CLASSES[self.arena.tipos[self.indice]]
+    
+    @property
+    def loc(self):
+        return self.arena.locs[self.indice]
+    
+    @property
+    def linha(self):
+        return ast_nodes.desempacotar_posicao(self.loc)[0]
+    
+    @property
+    def coluna(self):
+        return ast_nodes.desempacotar_posicao(self.loc)[1]
+    
+    def filhos(self):
+        """Retorna as visões dos nós filhos diretos."""
+        return [NoArena(self.arena, indice) for indice in self.arena.filhos(self.indice)]
+    
+    def __getattr__(self, nome):
+        return self.arena.campo(self.indice, nome)
+    
+    def __eq__(self, outro):
+        return isinstance(outro, NoArena) and outro.arena is self.arena and outro.indice == self.indice
+    
+    def __hash__(self):
+        return hash((id(self.arena), self.indice))
+    
+    def __repr__(self):
+        return f"NoArena({self.classe.__name__}, {self.indice})"
@@ -3,13 +3,62 @@ Nós da Árvore Sintática Abstrata (AST) para a linguagem Coral.
 
 Cada classe representa um nó da AST correspondente a uma construção
 sintática da linguagem.
+
+Os nós usam __slots__ (sem __dict__ por instância) e guardam a posição no
+código fonte em um único inteiro, loc, com a linha nos bits altos e a coluna
+nos BITS_COLUNA bits baixos; 0 em qualquer parte significa posição
+desconhecida. linha e coluna continuam disponíveis como propriedades.
 """
 
+BITS_COLUNA = 32
+MASCARA_COLUNA = (1 << BITS_COLUNA) - 1
+
+
+def empacotar_posicao(linha, coluna):
+    """Empacota linha e coluna (None = desconhecida) em um único inteiro."""
+    return ((linha or 0) << BITS_COLUNA) | (coluna or 0)
+
+
+def desempacotar_posicao(loc):
+    """Retorna (linha, coluna) de uma posição empacotada."""
+    return (loc >> BITS_COLUNA) or None, (loc & MASCARA_COLUNA) or None
+
+
 class ASTNode:
-    """Classe base para todos os nós da AST."""
+    """
+    Classe base para todos os nós da AST.
+    
+    CAMPOS lista, para cada classe, os atributos do nó além da posição, na
+    ordem dos parâmetros do construtor (sem linha e coluna). As subclasses
+    atribuem loc diretamente, sem chamar super().__init__ (a chamada pesa na
+    criação de milhares de nós).
+    """
+    
+    __slots__ = ('loc',)
+    CAMPOS = ()
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.CAMPOS = cls.__base__.CAMPOS + tuple(cls.__dict__.get('__slots__', ()))
+    
     def __init__(self, linha=None, coluna=None):
-        self.linha = linha
-        self.coluna = coluna
+        self.loc = empacotar_posicao(linha, coluna)
+    
+    @property
+    def linha(self):
+        return (self.loc >> BITS_COLUNA) or None
+    
+    @linha.setter
+    def linha(self, linha):
+        self.loc = empacotar_posicao(linha, self.coluna)
+    
+    @property
+    def coluna(self):
+        return (self.loc & MASCARA_COLUNA) or None
+    
+    @coluna.setter
+    def coluna(self, coluna):
+        self.loc = empacotar_posicao(self.linha, coluna)
     
     def __repr__(self):
         return f"{self.__class__.__name__}()"
@@ -17,8 +66,10 @@ class ASTNode:
 
 class ProgramaNode(ASTNode):
     """Nó raiz do programa - contém lista de declarações."""
+    __slots__ = ('declaracoes',)
+    
     def __init__(self, declaracoes):
-        super().__init__()
+        self.loc = 0
         self.declaracoes = declaracoes
     
     def __repr__(self):
@@ -27,18 +78,20 @@ class ProgramaNode(ASTNode):
 
 class DeclaracaoNode(ASTNode):
     """Classe base para declarações (expressões, estruturas, funções, classes)."""
-    pass
+    __slots__ = ()
 
 
 class ExpressaoNode(DeclaracaoNode):
     """Classe base para expressões."""
-    pass
+    __slots__ = ()
 
 
 class ExpressaoBinariaNode(ExpressaoNode):
     """Expressão binária (ex: a + b, x == y)."""
+    __slots__ = ('esquerda', 'operador', 'direita')
+    
     def __init__(self, esquerda, operador, direita, linha=None, coluna=None):
-        super().__init__(linha, coluna)
+        self.loc = empacotar_posicao(linha, coluna)
         self.esquerda = esquerda
         self.operador = operador
         self.direita = direita
@@ -49,8 +102,10 @@ class ExpressaoBinariaNode(ExpressaoNode):
 
 class ExpressaoUnariaNode(ExpressaoNode):
     """Expressão unária (ex: -x, NAO condicao)."""
+    __slots__ = ('operador', 'expressao')
+    
     def __init__(self, operador, expressao, linha=None, coluna=None):
-        super().__init__(linha, coluna)
+        self.loc = empacotar_posicao(linha, coluna)
         self.operador = operador
         self.expressao = expressao
     
@@ -60,8 +115,10 @@ class ExpressaoUnariaNode(ExpressaoNode):
 
 class LiteralNode(ExpressaoNode):
     """Literal (número, string, booleano)."""
+    __slots__ = ('valor', 'tipo', 'formatada')
+    
     def __init__(self, valor, tipo, linha=None, coluna=None, formatada=False):
-        super().__init__(linha, coluna)
+        self.loc = empacotar_posicao(linha, coluna)
         self.valor = valor
         self.tipo = tipo
         self.formatada = formatada  # True se for f"string"
@@ -73,8 +130,10 @@ class LiteralNode(ExpressaoNode):
 
 class IdentificadorNode(ExpressaoNode):
     """Identificador (variável)."""
+    __slots__ = ('nome',)
+    
     def __init__(self, nome, linha=None, coluna=None):
-        super().__init__(linha, coluna)
+        self.loc = empacotar_posicao(linha, coluna)
         self.nome = nome
     
     def __repr__(self):
@@ -83,8 +142,10 @@ class IdentificadorNode(ExpressaoNode):
 
 class AcessoAtributoNode(ExpressaoNode):
     """Acesso a atributo (ex: objeto.atributo)."""
+    __slots__ = ('objeto', 'atributo')
+    
     def __init__(self, objeto, atributo, linha=None, coluna=None):
-        super().__init__(linha, coluna)
+        self.loc = empacotar_posicao(linha, coluna)
         self.objeto = objeto  # ExpressaoNode (geralmente IdentificadorNode)
         self.atributo = atributo  # String (nome do atributo)
     
@@ -94,8 +155,10 @@ class AcessoAtributoNode(ExpressaoNode):
 
 class AtribuicaoNode(DeclaracaoNode):
     """Atribuição (ex: x = 10, y += 5)."""
+    __slots__ = ('identificador', 'operador', 'expressao')
+    
     def __init__(self, identificador, operador, expressao, linha=None, coluna=None):
-        super().__init__(linha, coluna)
+        self.loc = empacotar_posicao(linha, coluna)
         self.identificador = identificador
         self.operador = operador
         self.expressao = expressao
@@ -106,8 +169,10 @@ class AtribuicaoNode(DeclaracaoNode):
 
 class SeNode(DeclaracaoNode):
     """Estrutura condicional SE."""
+    __slots__ = ('condicao', 'bloco_se', 'blocos_senaose', 'bloco_senao')
+    
     def __init__(self, condicao, bloco_se, blocos_senaose, bloco_senao, linha=None, coluna=None):
-        super().__init__(linha, coluna)
+        self.loc = empacotar_posicao(linha, coluna)
         self.condicao = condicao
         self.bloco_se = bloco_se
         self.blocos_senaose = blocos_senaose or []
@@ -119,8 +184,10 @@ class SeNode(DeclaracaoNode):
 
 class EnquantoNode(DeclaracaoNode):
     """Laço ENQUANTO."""
+    __slots__ = ('condicao', 'bloco')
+    
     def __init__(self, condicao, bloco, linha=None, coluna=None):
-        super().__init__(linha, coluna)
+        self.loc = empacotar_posicao(linha, coluna)
         self.condicao = condicao
         self.bloco = bloco
     
@@ -130,8 +197,10 @@ class EnquantoNode(DeclaracaoNode):
 
 class ParaNode(DeclaracaoNode):
     """Laço PARA."""
+    __slots__ = ('variavel', 'iteravel', 'bloco')
+    
     def __init__(self, variavel, iteravel, bloco, linha=None, coluna=None):
-        super().__init__(linha, coluna)
+        self.loc = empacotar_posicao(linha, coluna)
         self.variavel = variavel
         self.iteravel = iteravel
         self.bloco = bloco
@@ -142,8 +211,10 @@ class ParaNode(DeclaracaoNode):
 
 class BlocoNode(ASTNode):
     """Bloco de código (conjunto de declarações indentadas)."""
+    __slots__ = ('declaracoes',)
+    
     def __init__(self, declaracoes, linha=None, coluna=None):
-        super().__init__(linha, coluna)
+        self.loc = empacotar_posicao(linha, coluna)
         self.declaracoes = declaracoes
     
     def __repr__(self):
@@ -152,8 +223,10 @@ class BlocoNode(ASTNode):
 
 class FuncaoNode(DeclaracaoNode):
     """Definição de função."""
+    __slots__ = ('nome', 'parametros', 'bloco', 'tipo_retorno')
+    
     def __init__(self, nome, parametros, bloco, tipo_retorno=None, linha=None, coluna=None):
-        super().__init__(linha, coluna)
+        self.loc = empacotar_posicao(linha, coluna)
         self.nome = nome
         self.parametros = parametros
         self.bloco = bloco
@@ -166,8 +239,10 @@ class FuncaoNode(DeclaracaoNode):
 
 class ParametroNode(ASTNode):
     """Parâmetro de função."""
+    __slots__ = ('nome', 'tipo_anotacao', 'valor_padrao')
+    
     def __init__(self, nome, tipo_anotacao=None, valor_padrao=None, linha=None, coluna=None):
-        super().__init__(linha, coluna)
+        self.loc = empacotar_posicao(linha, coluna)
         self.nome = nome
         self.tipo_anotacao = tipo_anotacao  # Anotação de tipo (opcional)
         self.valor_padrao = valor_padrao
@@ -179,8 +254,10 @@ class ParametroNode(ASTNode):
 
 class ChamadaFuncaoNode(ExpressaoNode):
     """Chamada de função."""
+    __slots__ = ('nome', 'argumentos')
+    
     def __init__(self, nome, argumentos, linha=None, coluna=None):
-        super().__init__(linha, coluna)
+        self.loc = empacotar_posicao(linha, coluna)
         self.nome = nome
         self.argumentos = argumentos
     
@@ -190,8 +267,10 @@ class ChamadaFuncaoNode(ExpressaoNode):
 
 class RetornarNode(DeclaracaoNode):
     """Comando RETORNAR."""
+    __slots__ = ('expressao',)
+    
     def __init__(self, expressao=None, linha=None, coluna=None):
-        super().__init__(linha, coluna)
+        self.loc = empacotar_posicao(linha, coluna)
         self.expressao = expressao
     
     def __repr__(self):
@@ -200,8 +279,10 @@ class RetornarNode(DeclaracaoNode):
 
 class ClasseNode(DeclaracaoNode):
     """Definição de classe."""
+    __slots__ = ('nome', 'bloco')
+    
     def __init__(self, nome, bloco, linha=None, coluna=None):
-        super().__init__(linha, coluna)
+        self.loc = empacotar_posicao(linha, coluna)
         self.nome = nome
         self.bloco = bloco
     
@@ -211,8 +292,10 @@ class ClasseNode(DeclaracaoNode):
 
 class ListaNode(ExpressaoNode):
     """Lista literal [1, 2, 3]."""
+    __slots__ = ('elementos',)
+    
     def __init__(self, elementos, linha=None, coluna=None):
-        super().__init__(linha, coluna)
+        self.loc = empacotar_posicao(linha, coluna)
         self.elementos = elementos
     
     def __repr__(self):
@@ -221,8 +304,10 @@ class ListaNode(ExpressaoNode):
 
 class DicionarioNode(ExpressaoNode):
     """Dicionário literal {"chave": valor}."""
+    __slots__ = ('pares',)
+    
     def __init__(self, pares, linha=None, coluna=None):
-        super().__init__(linha, coluna)
+        self.loc = empacotar_posicao(linha, coluna)
         self.pares = pares
     
     def __repr__(self):
@@ -231,8 +316,10 @@ class DicionarioNode(ExpressaoNode):
 
 class TuplaNode(ExpressaoNode):
     """Tupla literal (1, 2, 3)."""
+    __slots__ = ('elementos',)
+    
     def __init__(self, elementos, linha=None, coluna=None):
-        super().__init__(linha, coluna)
+        self.loc = empacotar_posicao(linha, coluna)
         self.elementos = elementos
     
     def __repr__(self):
@@ -241,8 +328,10 @@ class TuplaNode(ExpressaoNode):
 
 class QuebraNode(DeclaracaoNode):
     """Comando QUEBRA (break)."""
+    __slots__ = ()
+    
     def __init__(self, linha=None, coluna=None):
-        super().__init__(linha, coluna)
+        self.loc = empacotar_posicao(linha, coluna)
     
     def __repr__(self):
         return "Quebra()"
@@ -250,8 +339,10 @@ class QuebraNode(DeclaracaoNode):
 
 class ContinuaNode(DeclaracaoNode):
     """Comando CONTINUA (continue)."""
+    __slots__ = ()
+    
     def __init__(self, linha=None, coluna=None):
-        super().__init__(linha, coluna)
+        self.loc = empacotar_posicao(linha, coluna)
     
     def __repr__(self):
         return "Continua()"
@@ -259,28 +350,21 @@ class ContinuaNode(DeclaracaoNode):
 
 class PassarNode(DeclaracaoNode):
     """Comando PASSAR (pass)."""
+    __slots__ = ()
+    
     def __init__(self, linha=None, coluna=None):
-        super().__init__(linha, coluna)
+        self.loc = empacotar_posicao(linha, coluna)
     
     def __repr__(self):
         return "Passar()"
 
 
-class AcessoAtributoNode(ExpressaoNode):
-    """Acesso a atributo (obj.attr)."""
-    def __init__(self, objeto, atributo, linha=None, coluna=None):
-        super().__init__(linha, coluna)
-        self.objeto = objeto
-        self.atributo = atributo
-    
-    def __repr__(self):
-        return f"Acesso({self.objeto}.{self.atributo})"
-
-
 class IndexacaoNode(ExpressaoNode):
     """Indexação (lista[0], dict["chave"])."""
+    __slots__ = ('objeto', 'indice')
+    
     def __init__(self, objeto, indice, linha=None, coluna=None):
-        super().__init__(linha, coluna)
+        self.loc = empacotar_posicao(linha, coluna)
         self.objeto = objeto
         self.indice = indice
     
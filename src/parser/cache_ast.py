@@ -0,0 +1,179 @@
+"""
+Cache em disco da AST de arquivos fonte (arquivos .crlc).
+
+A AST (ProgramaNode) de um arquivo é serializada em um formato binário
+compacto e salva no diretório de cache da linguagem, identificada pelo hash
+do conteúdo do arquivo, pela versão do Coral e pela versão do front-end
+(hash do código fonte do parser e do lexer). Execuções seguintes do mesmo
+arquivo carregam a AST diretamente, sem análise léxica nem sintática.
+
+Formato: a ArenaAST da árvore (parser.arena), com os arrays em formato
+nativo e as constantes em marshal (ArenaAST.para_bytes/de_bytes). A
+conversão entre a árvore e a arena não usa recursão, então árvores
+profundas também são salvas e carregadas.
+
+O tamanho total do cache é limitado com a mesma política LRU do cache de
+tokens (lexer.cache_tokens.limitar_cache).
+"""
+
+import hashlib
+import os
+import sys
+import tempfile
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+try:
+    from src.parser.arena import ArenaAST
+except ModuleNotFoundError:
+    from .arena import ArenaAST
+from lexer.cache_tokens import versao_lexer, limitar_cache
+from utils.utils import diretorio_cache
+
+# Incrementar sempre que o formato do arquivo salvo mudar
+VERSAO_FORMATO = 2
+
+# Tamanho máximo padrão do cache, em bytes
+TAMANHO_MAXIMO = 64 * 1024 * 1024
+
+EXTENSAO = '.crlc'
+
+# Tamanho dos blocos lidos ao calcular o hash de um arquivo fonte
+TAMANHO_BLOCO = 1024 * 1024
+
+_versao_parser = None
+
+
+def versao_parser():
+    """
+    Retorna o hash do código fonte do parser, combinado à versão do lexer.
+    
+    Calculado uma vez por processo.
+    """
+    global _versao_parser
+    if _versao_parser is None:
+        resumo = hashlib.sha256(f"v{VERSAO_FORMATO}-{versao_lexer()}".encode('ascii'))
+        diretorio_parser = os.path.dirname(os.path.abspath(__file__))
+        for nome in sorted(os.listdir(diretorio_parser)):
+            if nome.endswith('.py'):
+                resumo.update(nome.encode('utf-8'))
+                with open(os.path.join(diretorio_parser, nome), 'rb') as f:
+                    resumo.update(f.read())
+        _versao_parser = resumo.hexdigest()[:16]
+    return _versao_parser
+
+
+def chave_ast(conteudo, versao_coral=''):
+    """Retorna a chave do cache para o conteúdo (bytes) de um arquivo fonte."""
+    return f"{versao_parser()}-{versao_coral}-{hashlib.sha256(conteudo).hexdigest()}"
+
+
+def chave_ast_arquivo(caminho, versao_coral='', tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Retorna a chave do cache para um arquivo fonte (igual a chave_ast do seu
+    conteúdo), lendo-o em blocos em vez de carregá-lo inteiro na memória.
+    """
+    resumo = hashlib.sha256()
+    with open(caminho, 'rb') as f:
+        while True:
+            bloco = f.read(tamanho_bloco)
+            if not bloco:
+                break
+            resumo.update(bloco)
+    return f"{versao_parser()}-{versao_coral}-{resumo.hexdigest()}"
+
+
+def _caminho(chave, diretorio):
+    return os.path.join(diretorio or diretorio_cache('ast'), f"{chave}{EXTENSAO}")
+
+
+def serializar_ast(raiz):
+    """
+    Serializa a AST em bytes (ArenaAST.para_bytes).
+    
+    Raises:
+        TypeError: Se a árvore contiver um valor que não é nó, lista, tupla,
+            token ou constante (None, bool, int, float, str).
+    """
+    return ArenaAST.de_ast(raiz).para_bytes()
+
+
+def desserializar_ast(dados):
+    """
+    Reconstrói a AST a partir dos bytes gerados por serializar_ast.
+    
+    Raises:
+        ValueError: Se os dados estiverem truncados ou corrompidos.
+    """
+    arena = ArenaAST.de_bytes(dados)
+    if not len(arena):
+        raise ValueError("AST serializada vazia")
+    return arena.para_ast()
+
+
+def carregar_ast(chave, diretorio=None):
+    """
+    Carrega a AST salva para a chave informada.
+    
+    Args:
+        diretorio: Diretório do cache (padrão: diretorio_cache('ast'))
+    
+    Returns:
+        ProgramaNode ou None se não houver cache válido.
+    """
+    caminho = _caminho(chave, diretorio)
+    try:
+        with open(caminho, 'rb') as f:
+            dados = f.read()
+    except OSError:
+        return None
+    
+    chave_salva, _, corpo = dados.partition(b'\n')
+    if chave_salva != chave.encode('utf-8'):
+        return None
+    try:
+        ast = desserializar_ast(corpo)
+    except ValueError:
+        return None
+    
+    # Marca a entrada como usada recentemente (ordem de remoção LRU)
+    try:
+        os.utime(caminho)
+    except OSError:
+        pass
+    return ast
+
+
+def salvar_ast(chave, ast, diretorio=None, tamanho_maximo=TAMANHO_MAXIMO):
+    """
+    Salva a AST no cache em disco e aplica o limite de tamanho.
+    
+    A escrita é atômica (arquivo temporário + rename). Falhas de escrita
+    (e ASTs com valores não serializáveis) são ignoradas: o cache é apenas
+    uma otimização.
+    """
+    try:
+        dados = serializar_ast(ast)
+    except TypeError:
+        return
+    
+    caminho = _caminho(chave, diretorio)
+    try:
+        os.makedirs(os.path.dirname(caminho), exist_ok=True)
+        descritor, temporario = tempfile.mkstemp(dir=os.path.dirname(caminho), suffix='.tmp')
+    except OSError:
+        return
+    try:
+        with os.fdopen(descritor, 'wb') as f:
+            f.write(chave.encode('utf-8') + b'\n')
+            f.write(dados)
+        os.replace(temporario, caminho)
+    except OSError:
+        try:
+            os.remove(temporario)
+        except OSError:
+            pass
+        return
+    
+    limitar_cache(os.path.dirname(caminho), tamanho_maximo, EXTENSAO)
@@ -4,260 +4,261 @@ Conjuntos FIRST e FOLLOW para a gramática da linguagem Coral.
 Estes conjuntos são utilizados pelo parser preditivo LL(1) para
 determinar qual produção aplicar durante a análise sintática.
 
-Os conjuntos foram calculados conforme os algoritmos descritos em
-docs/especificacao_linguagem/gramatica_formal.md (Seções 3.4 e 3.5).
+Os conjuntos são calculados a partir da gramática em GRAMATICA, conforme os
+algoritmos descritos em docs/especificacao_linguagem/gramatica_formal.md
+(Seções 3.4 e 3.5), e a partir deles é montada a tabela LL(1). O cálculo é
+feito uma única vez por processo (ver FirstFollowSets).
 """
 
+from types import MappingProxyType
+
+EPSILON = 'ε'
+
+# Terminal de fim de entrada: o token EOF faz o papel de '$'
+FIM = 'EOF'
+
+# Terminal usado para tokens que não aparecem na gramática (ex.: ';', '++')
+OUTRO = 'OUTRO'
+
+# ===== GRAMÁTICA =====
+# Não-terminal -> lista de produções (tuplas de símbolos; () é ε).
+# Símbolos que não são chaves do dicionário são terminais: tipos de token
+# ('ID', 'INTEIRO', 'NEWLINE', ...), palavras reservadas, operadores lógicos
+# e lexemas de operadores/delimitadores, os mesmos nomes aceitos por
+# ParserCoral.verificar.
+#
+# A gramática descreve a forma geral aceita pelo parser: atribuições são
+# analisadas como Expressao seguida de operador de atribuição (o parser
+# restringe o alvo a identificadores, atributos e indexações), e declarações
+# simples na mesma linha de outra terminam em NEWLINE, EOF ou DEDENTA.
+
+_RELACIONAIS = ('==', '!=', '<', '>', '<=', '>=')
+_ATRIBUICAO = ('=', '+=', '-=', '*=', '/=', '%=')
+
+GRAMATICA = {
+    'Programa': [('Declaracoes',)],
+    'Declaracoes': [
+        ('NEWLINE', 'Declaracoes'),
+        ('DeclaracaoComposta', 'Declaracoes'),
+        ('DeclaracaoSimples', 'FimDeclaracao'),
+        (),
+    ],
+    'FimDeclaracao': [('NEWLINE', 'Declaracoes'), ()],
+    
+    'DeclaracaoComposta': [('Se',), ('Enquanto',), ('Para',), ('Funcao',), ('Classe',)],
+    'DeclaracaoSimples': [
+        ('Retornar',), ('Quebra',), ('Continua',), ('Passar',), ('ExpressaoOuAtribuicao',),
+    ],
+    
+    'Se': [('SE', 'Expressao', ':', 'Bloco', 'BlocoSenaoSe', 'SenaoOpcional')],
+    'BlocoSenaoSe': [('SENAOSE', 'Expressao', ':', 'Bloco', 'BlocoSenaoSe'), ()],
+    'SenaoOpcional': [('SENAO', ':', 'Bloco'), ()],
+    'Enquanto': [('ENQUANTO', 'Expressao', ':', 'Bloco')],
+    'Para': [('PARA', 'ID', 'DENTRODE', 'Expressao', ':', 'Bloco')],
+    
+    'Funcao': [('FUNCAO', 'ID', '(', 'ListaParametros', ')', 'TipoRetorno', ':', 'Bloco')],
+    'TipoRetorno': [('-', '>', 'ID'), ()],
+    'ListaParametros': [('Parametro', 'ParametrosResto'), ()],
+    'ParametrosResto': [(',', 'Parametro', 'ParametrosResto'), ()],
+    'Parametro': [('ID', 'AnotacaoTipo', 'ValorPadrao')],
+    'AnotacaoTipo': [(':', 'ID'), ()],
+    'ValorPadrao': [('=', 'Expressao'), ()],
+    
+    'Classe': [('CLASSE', 'ID', ':', 'Bloco')],
+    'Bloco': [('NEWLINE', 'INDENTA', 'Declaracoes', 'DEDENTA')],
+    
+    'Retornar': [('RETORNAR', 'ExpressaoOpcional')],
+    'ExpressaoOpcional': [('Expressao',), ()],
+    'Quebra': [('QUEBRA',)],
+    'Continua': [('CONTINUA',)],
+    'Passar': [('PASSAR',)],
+    
+    'ExpressaoOuAtribuicao': [('Expressao', 'AtribuicaoOpcional')],
+    'AtribuicaoOpcional': [(operador, 'Expressao') for operador in _ATRIBUICAO] + [()],
+    
+    'Expressao': [('Termo', 'ExprResto')],
+    'ExprResto': [('E', 'Termo', 'ExprResto'), ('OU', 'Termo', 'ExprResto'), ()],
+    'Termo': [('Soma', 'TermoResto')],
+    'TermoResto': [(operador, 'Soma', 'TermoResto') for operador in _RELACIONAIS] + [()],
+    'Soma': [('Fator', 'SomaResto')],
+    'SomaResto': [('+', 'Fator', 'SomaResto'), ('-', 'Fator', 'SomaResto'), ()],
+    'Fator': [('Exponenciacao', 'FatorResto')],
+    'FatorResto': [
+        ('*', 'Exponenciacao', 'FatorResto'),
+        ('/', 'Exponenciacao', 'FatorResto'),
+        ('%', 'Exponenciacao', 'FatorResto'),
+        (),
+    ],
+    'Exponenciacao': [
+        ('-', 'Exponenciacao'),
+        ('NAO', 'Exponenciacao'),
+        ('FatorPrimario', 'ExponenciacaoResto'),
+    ],
+    'ExponenciacaoResto': [('**', 'Exponenciacao'), ()],
+    
+    'FatorPrimario': [
+        ('INTEIRO',), ('DECIMAL',), ('BOOLEANO',), ('VAZIO',),
+        ('STRING',), ('STRING_MULTILINE',),
+        ('ID', 'Acessos'),
+        ('(', 'Expressao', ')'),
+        ('[', 'ListaArgumentos', ']'),
+        ('{', 'ListaArgumentos', '}'),
+    ],
+    'Acessos': [
+        ('.', 'ID', 'Acessos'),
+        ('[', 'Expressao', ']', 'Acessos'),
+        ('(', 'ListaArgumentos', ')', 'Acessos'),
+        (),
+    ],
+    'ListaArgumentos': [('Expressao', 'ArgumentosResto'), ()],
+    'ArgumentosResto': [(',', 'Expressao', 'ArgumentosResto'), ()],
+}
+
+SIMBOLO_INICIAL = 'Programa'
+
+
+def terminais(gramatica):
+    """Retorna os terminais da gramática, na ordem em que aparecem (mais FIM e OUTRO)."""
+    encontrados = {}
+    for producoes in gramatica.values():
+        for producao in producoes:
+            for simbolo in producao:
+                if simbolo not in gramatica:
+                    encontrados.setdefault(simbolo, None)
+    encontrados.setdefault(FIM, None)
+    encontrados.setdefault(OUTRO, None)
+    return tuple(encontrados)
+
+
+def first_sequencia(simbolos, first, gramatica):
+    """
+    Calcula FIRST de uma sequência de símbolos Y₁Y₂...Yₖ.
+    
+    Returns:
+        Set com os terminais; contém ε se toda a sequência pode ser vazia
+    """
+    resultado = set()
+    for simbolo in simbolos:
+        if simbolo not in gramatica:
+            resultado.add(simbolo)
+            return resultado
+        resultado |= first[simbolo] - {EPSILON}
+        if EPSILON not in first[simbolo]:
+            return resultado
+    resultado.add(EPSILON)
+    return resultado
+
+
+def calcular_first(gramatica):
+    """Calcula FIRST de todos os não-terminais (ponto fixo, Seção 3.4)."""
+    first = {nao_terminal: set() for nao_terminal in gramatica}
+    alterado = True
+    while alterado:
+        alterado = False
+        for nao_terminal, producoes in gramatica.items():
+            for producao in producoes:
+                novos = first_sequencia(producao, first, gramatica) - first[nao_terminal]
+                if novos:
+                    first[nao_terminal] |= novos
+                    alterado = True
+    return first
+
+
+def calcular_follow(gramatica, first, inicial=SIMBOLO_INICIAL):
+    """Calcula FOLLOW de todos os não-terminais (ponto fixo, Seção 3.5)."""
+    follow = {nao_terminal: set() for nao_terminal in gramatica}
+    follow[inicial].add(FIM)
+    alterado = True
+    while alterado:
+        alterado = False
+        for nao_terminal, producoes in gramatica.items():
+            for producao in producoes:
+                for i, simbolo in enumerate(producao):
+                    if simbolo not in gramatica:
+                        continue
+                    resto = first_sequencia(producao[i + 1:], first, gramatica)
+                    novos = resto - {EPSILON}
+                    if EPSILON in resto:
+                        novos |= follow[nao_terminal]
+                    novos -= follow[simbolo]
+                    if novos:
+                        follow[simbolo] |= novos
+                        alterado = True
+    return follow
+
+
+def construir_tabela(gramatica, first, follow, id_terminal):
+    """
+    Monta a tabela LL(1): M[A][terminal] = produção de A a aplicar.
+    
+    Os terminais são indexados pelo seu id (id_terminal). Uma entrada
+    disputada por duas produções é registrada em conflitos e mantém a
+    primeira produção.
+    
+    Returns:
+        (tabela, conflitos) - tabela: {não-terminal: {id do terminal: produção}};
+        conflitos: lista de (não-terminal, terminal, produção existente, produção nova)
+    """
+    tabela = {}
+    conflitos = []
+    for nao_terminal, producoes in gramatica.items():
+        linha = tabela[nao_terminal] = {}
+        for producao in producoes:
+            inicio = first_sequencia(producao, first, gramatica)
+            if EPSILON in inicio:
+                inicio = (inicio - {EPSILON}) | follow[nao_terminal]
+            for terminal in inicio:
+                indice = id_terminal[terminal]
+                if indice in linha:
+                    conflitos.append((nao_terminal, terminal, linha[indice], producao))
+                else:
+                    linha[indice] = producao
+    return tabela, conflitos
+
 
 class FirstFollowSets:
     """
-    Armazena os conjuntos FIRST e FOLLOW para todos os não-terminais
-    da gramática Coral.
+    Armazena os conjuntos FIRST e FOLLOW e a tabela LL(1) de uma gramática
+    (por padrão, a gramática Coral).
+    
+    Para a gramática padrão, o cálculo é feito na primeira instanciação e
+    compartilhado pelas seguintes. Por isso os conjuntos são frozensets e as
+    tabelas são somente leitura (MappingProxyType): nenhuma instância pode
+    alterar o estado das outras.
     """
     
-    def __init__(self):
+    _padrao = None
+    
+    def __init__(self, gramatica=None, inicial=SIMBOLO_INICIAL):
+        if gramatica is None and FirstFollowSets._padrao is not None:
+            self.__dict__.update(FirstFollowSets._padrao.__dict__)
+            return
+        
+        self.gramatica = GRAMATICA if gramatica is None else gramatica
+        
+        # Terminais indexados por id numérico (o parser resolve cada token para um id)
+        self.TERMINAIS = terminais(self.gramatica)
+        id_terminal = {terminal: indice for indice, terminal in enumerate(self.TERMINAIS)}
+        
         # ===== CONJUNTOS FIRST =====
         # FIRST(A) = conjunto de terminais que podem iniciar derivações de A
-        
-        self.FIRST = {
-            'Programa': {
-                'INTEIRO', 'DECIMAL', 'BOOLEANO', 'STRING', 'VAZIO', 'ID',
-                'SE', 'ENQUANTO', 'PARA', 'FUNCAO', 'CLASSE',
-                'RETORNAR', 'QUEBRA', 'CONTINUA', 'PASSAR',
-                '(', '[', '{', '-', 'NAO', 'ε'  # ε indica que pode ser vazio
-            },
-            
-            'Declaracao': {
-                'INTEIRO', 'DECIMAL', 'BOOLEANO', 'STRING', 'VAZIO', 'ID',
-                'SE', 'ENQUANTO', 'PARA', 'FUNCAO', 'CLASSE',
-                'RETORNAR', 'QUEBRA', 'CONTINUA', 'PASSAR',
-                '(', '[', '{', '-', 'NAO'
-            },
-            
-            'Expressao': {
-                'INTEIRO', 'DECIMAL', 'BOOLEANO', 'STRING', 'VAZIO', 'ID',
-                '(', '[', '{', '-', 'NAO'
-            },
-            
-            'ExprResto': {
-                'E', 'OU', 'ε'
-            },
-            
-            'Termo': {
-                'INTEIRO', 'DECIMAL', 'BOOLEANO', 'STRING', 'VAZIO', 'ID',
-                '(', '[', '{', '-', 'NAO'
-            },
-            
-            'TermoResto': {
-                '==', '!=', '<', '>', '<=', '>=', 'ε'
-            },
-            
-            'Fator': {
-                'INTEIRO', 'DECIMAL', 'BOOLEANO', 'STRING', 'VAZIO', 'ID',
-                '(', '[', '{', '-', 'NAO'
-            },
-            
-            'FatorResto': {
-                '+', '-', '*', '/', '%', 'ε'
-            },
-            
-            'FatorPrimario': {
-                'INTEIRO', 'DECIMAL', 'BOOLEANO', 'STRING', 'VAZIO', 'ID',
-                '(', '[', '{'
-            },
-            
-            'EstruturaControle': {
-                'SE', 'ENQUANTO', 'PARA'
-            },
-            
-            'BlocoSenaoSe': {
-                'SENAOSE', 'ε'
-            },
-            
-            'SenaoOpcional': {
-                'SENAO', 'ε'
-            },
-            
-            'Funcao': {
-                'FUNCAO'
-            },
-            
-            'ListaParametros': {
-                'ID', 'ε'
-            },
-            
-            'Parametro': {
-                'ID'
-            },
-            
-            'Classe': {
-                'CLASSE'
-            },
-            
-            'Bloco': {
-                'INDENT'
-            },
-            
-            'ChamadaFuncao': {
-                '('
-            },
-            
-            'ListaArgumentos': {
-                'INTEIRO', 'DECIMAL', 'BOOLEANO', 'STRING', 'ID',
-                '(', '[', '{', '-', 'NAO', 'ε'
-            }
-        }
+        first = calcular_first(self.gramatica)
         
         # ===== CONJUNTOS FOLLOW =====
         # FOLLOW(A) = conjunto de terminais que podem aparecer imediatamente após A
+        follow = calcular_follow(self.gramatica, first, inicial)
+        
+        # ===== TABELA LL(1) =====
+        tabela, conflitos = construir_tabela(self.gramatica, first, follow, id_terminal)
+        
+        self.ID_TERMINAL = MappingProxyType(id_terminal)
+        self.FIRST = MappingProxyType({nao_terminal: frozenset(c) for nao_terminal, c in first.items()})
+        self.FOLLOW = MappingProxyType({nao_terminal: frozenset(c) for nao_terminal, c in follow.items()})
+        self.TABELA = MappingProxyType({nao_terminal: MappingProxyType(linha) for nao_terminal, linha in tabela.items()})
+        self.conflitos = tuple(conflitos)
         
-        self.FOLLOW = {
-            'Programa': {
-                '$'  # Fim do arquivo
-            },
-            
-            'Declaracao': {
-                'INTEIRO', 'DECIMAL', 'BOOLEANO', 'STRING', 'ID',
-                'SE', 'ENQUANTO', 'PARA', 'FUNCAO', 'CLASSE',
-                'RETORNAR', 'QUEBRA', 'CONTINUA', 'PASSAR',
-                '(', '[', '{', '-', 'NAO',
-                'DEDENT', '$'
-            },
-            
-            'Expressao': {
-                'INTEIRO', 'DECIMAL', 'BOOLEANO', 'STRING', 'ID',
-                'SE', 'ENQUANTO', 'PARA', 'FUNCAO', 'CLASSE',
-                'RETORNAR', 'QUEBRA', 'CONTINUA', 'PASSAR',
-                '(', '[', '{', '-', 'NAO',
-                'DEDENT', '$', ')', ']', '}', ',', ':'
-            },
-            
-            'ExprResto': {
-                'INTEIRO', 'DECIMAL', 'BOOLEANO', 'STRING', 'ID',
-                'SE', 'ENQUANTO', 'PARA', 'FUNCAO', 'CLASSE',
-                'RETORNAR', 'QUEBRA', 'CONTINUA', 'PASSAR',
-                '(', '[', '{', '-', 'NAO',
-                'DEDENT', '$', ')', ']', '}', ',', ':'
-            },
-            
-            'Termo': {
-                'E', 'OU',
-                'INTEIRO', 'DECIMAL', 'BOOLEANO', 'STRING', 'ID',
-                'SE', 'ENQUANTO', 'PARA', 'FUNCAO', 'CLASSE',
-                'RETORNAR', 'QUEBRA', 'CONTINUA', 'PASSAR',
-                '(', '[', '{', '-', 'NAO',
-                'DEDENT', '$', ')', ']', '}', ',', ':'
-            },
-            
-            'TermoResto': {
-                'E', 'OU',
-                'INTEIRO', 'DECIMAL', 'BOOLEANO', 'STRING', 'ID',
-                'SE', 'ENQUANTO', 'PARA', 'FUNCAO', 'CLASSE',
-                'RETORNAR', 'QUEBRA', 'CONTINUA', 'PASSAR',
-                '(', '[', '{', '-', 'NAO',
-                'DEDENT', '$', ')', ']', '}', ',', ':'
-            },
-            
-            'Fator': {
-                '==', '!=', '<', '>', '<=', '>=',
-                'E', 'OU',
-                'INTEIRO', 'DECIMAL', 'BOOLEANO', 'STRING', 'ID',
-                'SE', 'ENQUANTO', 'PARA', 'FUNCAO', 'CLASSE',
-                'RETORNAR', 'QUEBRA', 'CONTINUA', 'PASSAR',
-                '(', '[', '{', '-', 'NAO',
-                'DEDENT', '$', ')', ']', '}', ',', ':'
-            },
-            
-            'FatorResto': {
-                '==', '!=', '<', '>', '<=', '>=',
-                'E', 'OU',
-                'INTEIRO', 'DECIMAL', 'BOOLEANO', 'STRING', 'ID',
-                'SE', 'ENQUANTO', 'PARA', 'FUNCAO', 'CLASSE',
-                'RETORNAR', 'QUEBRA', 'CONTINUA', 'PASSAR',
-                '(', '[', '{', '-', 'NAO',
-                'DEDENT', '$', ')', ']', '}', ',', ':'
-            },
-            
-            'FatorPrimario': {
-                '+', '-', '*', '/', '%',
-                '==', '!=', '<', '>', '<=', '>=',
-                'E', 'OU',
-                'INTEIRO', 'DECIMAL', 'BOOLEANO', 'STRING', 'ID',
-                'SE', 'ENQUANTO', 'PARA', 'FUNCAO', 'CLASSE',
-                'RETORNAR', 'QUEBRA', 'CONTINUA', 'PASSAR',
-                '(', '[', '{', '-', 'NAO',
-                'DEDENT', '$', ')', ']', '}', ',', ':'
-            },
-            
-            'EstruturaControle': {
-                'INTEIRO', 'DECIMAL', 'BOOLEANO', 'STRING', 'ID',
-                'SE', 'ENQUANTO', 'PARA', 'FUNCAO', 'CLASSE',
-                'RETORNAR', 'QUEBRA', 'CONTINUA', 'PASSAR',
-                '(', '[', '{', '-', 'NAO',
-                'DEDENT', '$'
-            },
-            
-            'BlocoSenaoSe': {
-                'SENAO',
-                'INTEIRO', 'DECIMAL', 'BOOLEANO', 'STRING', 'ID',
-                'SE', 'ENQUANTO', 'PARA', 'FUNCAO', 'CLASSE',
-                'RETORNAR', 'QUEBRA', 'CONTINUA', 'PASSAR',
-                '(', '[', '{', '-', 'NAO',
-                'DEDENT', '$'
-            },
-            
-            'SenaoOpcional': {
-                'INTEIRO', 'DECIMAL', 'BOOLEANO', 'STRING', 'ID',
-                'SE', 'ENQUANTO', 'PARA', 'FUNCAO', 'CLASSE',
-                'RETORNAR', 'QUEBRA', 'CONTINUA', 'PASSAR',
-                '(', '[', '{', '-', 'NAO',
-                'DEDENT', '$'
-            },
-            
-            'Funcao': {
-                'INTEIRO', 'DECIMAL', 'BOOLEANO', 'STRING', 'ID',
-                'SE', 'ENQUANTO', 'PARA', 'FUNCAO', 'CLASSE',
-                'RETORNAR', 'QUEBRA', 'CONTINUA', 'PASSAR',
-                '(', '[', '{', '-', 'NAO',
-                'DEDENT', '$'
-            },
-            
-            'ListaParametros': {
-                ')'
-            },
-            
-            'Parametro': {
-                ',', ')'
-            },
-            
-            'Classe': {
-                'INTEIRO', 'DECIMAL', 'BOOLEANO', 'STRING', 'ID',
-                'SE', 'ENQUANTO', 'PARA', 'FUNCAO', 'CLASSE',
-                'RETORNAR', 'QUEBRA', 'CONTINUA', 'PASSAR',
-                '(', '[', '{', '-', 'NAO',
-                'DEDENT', '$'
-            },
-            
-            'Bloco': {
-                'DEDENT',
-                'SENAOSE', 'SENAO'
-            },
-            
-            'ChamadaFuncao': {
-                '+', '-', '*', '/', '%',
-                '==', '!=', '<', '>', '<=', '>=',
-                'E', 'OU',
-                'INTEIRO', 'DECIMAL', 'BOOLEANO', 'STRING', 'ID',
-                'SE', 'ENQUANTO', 'PARA', 'FUNCAO', 'CLASSE',
-                'RETORNAR', 'QUEBRA', 'CONTINUA', 'PASSAR',
-                '(', '[', '{', '-', 'NAO',
-                'DEDENT', '$', ')', ']', '}', ',', ':'
-            },
-            
-            'ListaArgumentos': {
-                ')'
-            }
-        }
+        if gramatica is None:
+            FirstFollowSets._padrao = self
     
     def get_first(self, non_terminal):
         """
@@ -265,11 +266,11 @@ class FirstFollowSets:
         
         Args:
             non_terminal: Nome do não-terminal
-            
+        
         Returns:
-            Set de strings com os terminais do FIRST
+            Frozenset de strings com os terminais do FIRST
         """
-        return self.FIRST.get(non_terminal, set())
+        return self.FIRST.get(non_terminal, frozenset())
     
     def get_follow(self, non_terminal):
         """
@@ -277,11 +278,29 @@ class FirstFollowSets:
         
         Args:
             non_terminal: Nome do não-terminal
-            
+        
         Returns:
-            Set de strings com os terminais do FOLLOW
+            Frozenset de strings com os terminais do FOLLOW
         """
-        return self.FOLLOW.get(non_terminal, set())
+        return self.FOLLOW.get(non_terminal, frozenset())
+    
+    def get_producao(self, non_terminal, terminal):
+        """
+        Consulta a tabela LL(1).
+        
+        Args:
+            non_terminal: Nome do não-terminal
+            terminal: Nome do terminal sob o cursor
+        
+        Returns:
+            Tupla com os símbolos da produção a aplicar, ou None (erro sintático)
+        """
+        indice = self.ID_TERMINAL.get(terminal)
+        return self.TABELA.get(non_terminal, {}).get(indice)
+    
+    def ids_first(self, non_terminal):
+        """Retorna os ids dos terminais de FIRST(non_terminal), sem ε."""
+        return frozenset(self.ID_TERMINAL[t] for t in self.get_first(non_terminal) if t != EPSILON)
     
     def can_derive_epsilon(self, non_terminal):
         """
@@ -289,11 +308,11 @@ class FirstFollowSets:
         
         Args:
             non_terminal: Nome do não-terminal
-            
+        
         Returns:
             True se 'ε' está em FIRST(non_terminal)
         """
-        return 'ε' in self.FIRST.get(non_terminal, set())
+        return EPSILON in self.FIRST.get(non_terminal, frozenset())
     
     def is_ll1_compatible(self):
         """
@@ -303,12 +322,12 @@ class FirstFollowSets:
         1. Para toda produção A → α | β, FIRST(α) ∩ FIRST(β) = ∅
         2. Se A → α e α pode derivar ε, então FIRST(α) ∩ FOLLOW(A) = ∅
         
+        Ou seja, se nenhuma entrada da tabela LL(1) tem duas produções.
+        
         Returns:
             True se a gramática é LL(1)
         """
-        # A verificação completa está documentada em gramatica_formal.md Seção 3.6
-        # A gramática Coral já foi verificada e é LL(1)
-        return True
+        return not self.conflitos
     
     def __repr__(self):
         return f"FirstFollowSets({len(self.FIRST)} não-terminais)"
@@ -7,20 +7,136 @@ uma Árvore Sintática Abstrata (AST) a partir do fluxo de tokens.
 
 import sys
 import os
+from collections import deque
+from functools import partial
 
 if __name__ == "__main__":
     sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 try:
     from src.parser.ast_nodes import *
-    from src.parser.first_follow import FirstFollowSets
+    from src.parser.first_follow import FirstFollowSets, OUTRO
+    from src.parser.percurso import Visitante
+    from src.lexer.Token import Token
     from src.utils.utils import (PALAVRAS_RESERVADAS, OPERADORES_LOGICOS, 
-                           OPERADORES_BOOLEANOS, TIPO_MAP)
+                           OPERADORES_BOOLEANOS, OPERADORES_ARITMETICOS,
+                           OPERADORES_RELACIONAIS, OPERADORES_ATRIBUICAO,
+                           DELIMITADORES, TIPO_MAP)
 except ModuleNotFoundError:
     from .ast_nodes import *
-    from .first_follow import FirstFollowSets
+    from .first_follow import FirstFollowSets, OUTRO
+    from .percurso import Visitante
+    from lexer.Token import Token
     from utils.utils import (PALAVRAS_RESERVADAS, OPERADORES_LOGICOS,
-                       OPERADORES_BOOLEANOS, TIPO_MAP)
+                       OPERADORES_BOOLEANOS, OPERADORES_ARITMETICOS,
+                       OPERADORES_RELACIONAIS, OPERADORES_ATRIBUICAO,
+                       DELIMITADORES, TIPO_MAP)
+
+
+# Conjuntos FIRST/FOLLOW e tabela LL(1), calculados uma vez por processo
+FIRST_FOLLOW = FirstFollowSets()
+ID_TERMINAL = FIRST_FOLLOW.ID_TERMINAL
+_OUTRO = ID_TERMINAL[OUTRO]
+
+# Tipos de token cujo terminal na gramática é o próprio lexema
+_TIPOS_POR_LEXEMA = frozenset((
+    'PALAVRA_RESERVADA', 'OPERADOR_LOGICO', 'OPERADOR_ARITMETICO',
+    'OPERADOR_RELACIONAL', 'OPERADOR_ATRIBUICAO', 'DELIMITADOR',
+))
+_TERMINAL_POR_LEXEMA = {
+    lexema: ID_TERMINAL[lexema]
+    for lexema in (PALAVRAS_RESERVADAS | OPERADORES_LOGICOS | OPERADORES_ARITMETICOS
+                   | OPERADORES_RELACIONAIS | OPERADORES_ATRIBUICAO | DELIMITADORES | {'.'})
+    if lexema in ID_TERMINAL
+}
+_TERMINAL_POR_LEXEMA.update(dict.fromkeys(OPERADORES_BOOLEANOS, ID_TERMINAL['BOOLEANO']))
+_TERMINAL_POR_TIPO = {
+    TIPO_MAP.get(nome, nome): ID_TERMINAL[nome]
+    for nome in ('ID', 'INTEIRO', 'DECIMAL', 'STRING', 'STRING_MULTILINE', 'BOOLEANO',
+                 'NEWLINE', 'INDENTA', 'DEDENTA', 'EOF')
+}
+
+
+def terminal_do_token(token):
+    """
+    Resolve um token para o id do seu terminal na gramática.
+    
+    Palavras reservadas, operadores e delimitadores são identificados pelo
+    lexema; os demais tokens, pelo tipo. Tokens sem terminal correspondente
+    resultam em OUTRO.
+    
+    Returns:
+        int (índice em FIRST_FOLLOW.TERMINAIS), ou None se token for None
+    """
+    if token is None:
+        return None
+    tipo = token.tipo
+    if tipo in _TIPOS_POR_LEXEMA:
+        return _TERMINAL_POR_LEXEMA.get(token.lexema, _OUTRO)
+    return _TERMINAL_POR_TIPO.get(tipo, _OUTRO)
+
+
+def _tabela_despacho(nao_terminais, metodos, padrao=None):
+    """
+    Monta o despacho de um ponto de decisão a partir da tabela LL(1).
+    
+    Args:
+        nao_terminais: Não-terminais cujas linhas da tabela são consultadas
+        metodos: Primeiro símbolo da produção -> método (ou ação) que a analisa
+        padrao: Valor para terminais sem produção ou cuja produção não está
+            em metodos (None: erro sintático)
+    
+    Returns:
+        Lista indexada pelo id do terminal
+    """
+    despacho = [padrao] * len(FIRST_FOLLOW.TERMINAIS)
+    for nao_terminal in nao_terminais:
+        for terminal, producao in FIRST_FOLLOW.TABELA[nao_terminal].items():
+            if producao[0] in metodos:
+                despacho[terminal] = metodos[producao[0]]
+    return despacho
+
+
+# Terminais que iniciam o resto de cada nível de expressão
+_OPERADORES_EXPR = FIRST_FOLLOW.ids_first('ExprResto')
+_OPERADORES_TERMO = FIRST_FOLLOW.ids_first('TermoResto')
+_OPERADORES_SOMA = FIRST_FOLLOW.ids_first('SomaResto')
+_OPERADORES_FATOR = FIRST_FOLLOW.ids_first('FatorResto')
+_OPERADORES_EXPONENCIACAO = FIRST_FOLLOW.ids_first('ExponenciacaoResto')
+_OPERADORES_UNARIOS = FIRST_FOLLOW.ids_first('Exponenciacao') - FIRST_FOLLOW.ids_first('FatorPrimario')
+_FIM_ARGUMENTOS = frozenset(ID_TERMINAL[t] for t in FIRST_FOLLOW.get_follow('ListaArgumentos'))
+_IDENTIFICADOR = ID_TERMINAL['ID']
+_PONTO = ID_TERMINAL['.']
+_VIRGULA = ID_TERMINAL[',']
+_ABRE_PARENTESES = ID_TERMINAL['(']
+_ABRE_COLCHETE = ID_TERMINAL['[']
+_ACESSOS = frozenset((_PONTO, _ABRE_COLCHETE))
+
+
+def _tabela_precedencia():
+    """
+    Precedência dos operadores binários por id do terminal (0: não é operador).
+    
+    Segue os níveis da gramática, do que liga menos ao que liga mais:
+    E/OU < relacionais < + - < * / % < ** (associativo à direita).
+    """
+    precedencia = [0] * len(FIRST_FOLLOW.TERMINAIS)
+    niveis = (_OPERADORES_EXPR, _OPERADORES_TERMO, _OPERADORES_SOMA, _OPERADORES_FATOR)
+    for nivel, operadores in enumerate(niveis, 1):
+        for terminal in operadores:
+            precedencia[terminal] = nivel
+    for terminal in _OPERADORES_EXPONENCIACAO:
+        precedencia[terminal] = _PRECEDENCIA_EXPONENCIACAO
+    return precedencia
+
+
+# Unários (- e NAO) se aplicam a uma exponenciação: ligam mais que * / % e menos que **
+_PRECEDENCIA_UNARIA = 5
+_PRECEDENCIA_EXPONENCIACAO = 6
+_PRECEDENCIA = _tabela_precedencia()
+
+# Agrupamentos abertos durante a análise de uma expressão
+_PARENTESES, _LISTA, _DICIONARIO, _INDICE, _CHAMADA, _CHAMADA_METODO = range(1, 7)
 
 
 class ErroSintatico(Exception):
@@ -42,49 +158,43 @@ class ParserCoral:
     Parser preditivo LL(1) para a linguagem Coral.
     
     Utiliza os conjuntos FIRST e FOLLOW para decidir qual produção aplicar
-    durante a análise sintática descendente.
+    durante a análise sintática descendente. Cada token é resolvido uma vez
+    para o id do seu terminal (terminal_atual); os pontos de decisão
+    consultam arrays montados a partir da tabela LL(1).
     """
     
     def __init__(self, tokens):
-        self.tokens = tokens
+        """
+        Args:
+            tokens: Fonte de tokens terminando em EOF: uma sequência (lista,
+                TokenStream) ou qualquer iterável, como o próprio
+                AnalisadorLexico. Os tokens são puxados sob demanda e só os
+                ainda não consumidos ficam guardados (janela de lookahead).
+        """
+        self.fonte_tokens = iter(tokens)
+        self.tokens_adiante = deque()  # Token atual seguido dos já espiados
         self.posicao = 0
-        self.token_atual = tokens[0] if tokens else None
-        self.first_follow = FirstFollowSets()
+        self.token_atual = self.olhar_adiante(0)
+        self.terminal_atual = terminal_do_token(self.token_atual)
+        self.first_follow = FIRST_FOLLOW
         self.dentro_de_laco = 0  # Contador de profundidade de laços
     
     def avancar(self):
-        if self.posicao < len(self.tokens) - 1:
-            self.posicao += 1
-            self.token_atual = self.tokens[self.posicao]
-        return self.token_atual
+        tokens_adiante = self.tokens_adiante
+        if len(tokens_adiante) < 2:
+            token = next(self.fonte_tokens, None)
+            if token is None:
+                return self.token_atual  # No último token (EOF) o parser permanece nele
+            tokens_adiante.append(token)
+        tokens_adiante.popleft()
+        self.posicao += 1
+        token = self.token_atual = tokens_adiante[0]
+        self.terminal_atual = terminal_do_token(token)
+        return token
     
     def verificar(self, tipo_esperado):
-        if not self.token_atual:
-            return False
-        
-        if tipo_esperado in PALAVRAS_RESERVADAS:
-            return (self.token_atual.tipo == 'PALAVRA_RESERVADA' and 
-                    self.token_atual.lexema == tipo_esperado)
-        
-        if tipo_esperado in OPERADORES_LOGICOS:
-            return (self.token_atual.tipo == 'OPERADOR_LOGICO' and 
-                    self.token_atual.lexema == tipo_esperado)
-        
-        if tipo_esperado == 'BOOLEANO':
-            if self.token_atual.tipo == 'BOOLEANO':
-                return True
-            if self.token_atual.lexema in OPERADORES_BOOLEANOS:
-                return True
-            return False
-        
-        if tipo_esperado in ['(', ')', '[', ']', '{', '}', ':', ',', 
-                             '+', '-', '*', '/', '%', '**',
-                             '==', '!=', '<', '>', '<=', '>=',
-                             '=', '+=', '-=', '*=', '/=', '%=']:
-            return self.token_atual.lexema == tipo_esperado
-        
-        tipo_verificar = TIPO_MAP.get(tipo_esperado, tipo_esperado)
-        return self.token_atual.tipo == tipo_verificar
+        """Verifica se o token atual é o terminal tipo_esperado (nome da gramática)."""
+        return self.terminal_atual == ID_TERMINAL.get(tipo_esperado, -1)
     
     def consumir(self, tipo_esperado, mensagem_erro=None):
         """
@@ -120,10 +230,13 @@ class ParserCoral:
         Returns:
             Token na posição atual + offset, ou None se não existir
         """
-        posicao_futura = self.posicao + offset
-        if posicao_futura < len(self.tokens):
-            return self.tokens[posicao_futura]
-        return None
+        tokens_adiante = self.tokens_adiante
+        while len(tokens_adiante) <= offset:
+            token = next(self.fonte_tokens, None)
+            if token is None:
+                return None
+            tokens_adiante.append(token)
+        return tokens_adiante[offset]
     
     def fim_arquivo(self):
         """Verifica se chegou ao fim do arquivo."""
@@ -167,27 +280,9 @@ class ParserCoral:
         Returns:
             ASTNode: Nó da declaração processada.
         """
-        if self.verificar('SE'):
-            return self.estrutura_se()
-        elif self.verificar('ENQUANTO'):
-            return self.estrutura_enquanto()
-        elif self.verificar('PARA'):
-            return self.estrutura_para()
-        elif self.verificar('FUNCAO'):
-            return self.funcao()
-        elif self.verificar('CLASSE'):
-            return self.classe()
-        elif self.verificar('RETORNAR'):
-            return self.retornar()
-        elif self.verificar('QUEBRA'):
-            return self.quebra()
-        elif self.verificar('CONTINUA'):
-            return self.continua()
-        elif self.verificar('PASSAR'):
-            return self.passar()
-        else:
-            # Tenta parsing de expressão/atribuição
-            return self.expressao_ou_atribuicao()
+        # Terminais fora de FIRST(Declaracao) também seguem para expressão/atribuição,
+        # que reporta o erro
+        return self._DESPACHO_DECLARACAO[self.terminal_atual](self)
     
     def expressao_ou_atribuicao(self):
         """
@@ -199,7 +294,7 @@ class ParserCoral:
         if self.verificar('ID'):
             # Olha à frente para verificar se é atribuição
             offset = 1
-            while offset < len(self.tokens) - self.posicao:
+            while True:
                 token_seguinte = self.olhar_adiante(offset)
                 if token_seguinte is None:
                     break
@@ -218,11 +313,13 @@ class ParserCoral:
                     offset += 1
                     # Pula até encontrar ']'
                     profundidade = 1
-                    while offset < len(self.tokens) - self.posicao and profundidade > 0:
+                    while profundidade > 0:
                         t = self.olhar_adiante(offset)
-                        if t and t.lexema == '[':
+                        if t is None:
+                            break
+                        if t.lexema == '[':
                             profundidade += 1
-                        elif t and t.lexema == ']':
+                        elif t.lexema == ']':
                             profundidade -= 1
                         offset += 1
                     continue
@@ -250,12 +347,12 @@ class ParserCoral:
         from .ast_nodes import AcessoAtributoNode, IndexacaoNode
         alvo = identificador
         
-        while self.token_atual and self.token_atual.lexema in ['.', '[']:
-            if self.token_atual.lexema == '.':
+        while self.terminal_atual in _ACESSOS:
+            if self.terminal_atual == _PONTO:
                 self.avancar()  # Consome '.'
                 atributo_token = self.consumir('ID', "Esperado nome do atributo após '.'")
                 alvo = AcessoAtributoNode(alvo, atributo_token.lexema, atributo_token.linha, atributo_token.coluna)
-            elif self.token_atual.lexema == '[':
+            else:
                 token_colchete = self.token_atual
                 self.avancar()  # Consome '['
                 indice = self.expressao()
@@ -306,276 +403,236 @@ class ParserCoral:
     
     def expressao(self):
         """
-        Processa uma expressão.
-        
-        Returns:
-            ExpressaoNode: Nó de expressão.
-        """
-        termo = self.termo()
-        return self.expr_resto(termo)
-    
-    def expr_resto(self, esquerda):
-        """
-        Processa o resto de uma expressão (operadores E, OU).
+        Processa uma expressão por precedence climbing, com pilhas explícitas.
         
-        Args:
-            esquerda: Nó da expressão à esquerda.
-            
-        Returns:
-            ExpressaoNode: Nó de expressão completa ou o nó esquerda se não houver continuação.
-        """
-        if self.verificar('E') or self.verificar('OU'):
-            operador = self.token_atual
-            self.avancar()
-            direita = self.termo()
-            binaria = ExpressaoBinariaNode(
-                esquerda,
-                operador,
-                direita,
-                operador.linha,
-                operador.coluna
-            )
-            return self.expr_resto(binaria)
-        
-        return esquerda
-    
-    def termo(self):
-        """
-        Processa um termo (soma seguido de operadores relacionais).
+        Operandos e operadores pendentes ficam em pilhas: ao chegar um
+        operador, os pendentes de precedência maior ou igual são reduzidos
+        (** é associativo à direita). Parênteses, listas, dicionários, índices
+        e argumentos de chamadas abrem um agrupamento, que guarda as pilhas
+        do contexto externo, em vez de uma chamada recursiva. Assim a análise
+        usa um número constante de frames, qualquer que seja o aninhamento.
         
         Returns:
-            ExpressaoNode: Nó de termo.
+            ExpressaoNode: Nó de expressão.
         """
-        soma = self.soma()
-        return self.termo_resto(soma)
-    
-    def termo_resto(self, esquerda):
-        """Processa o resto de um termo (operadores relacionais)."""
-        if self.token_atual and self.token_atual.lexema in ['==', '!=', '<', '>', '<=', '>=']:
-            operador = self.token_atual
-            self.avancar()
-            direita = self.soma()
-            binaria = ExpressaoBinariaNode(
-                esquerda,
-                operador,
-                direita,
-                operador.linha,
-                operador.coluna
-            )
-            return self.termo_resto(binaria)
-        
-        return esquerda
-    
-    def soma(self):
-        """Processa uma soma (fator seguido de operadores de adição e subtração)."""
-        fator = self.fator()
-        return self.soma_resto(fator)
-    
-    def soma_resto(self, esquerda):
-        """Processa o resto de uma soma (operadores de adição e subtração)."""
-        if self.token_atual and self.token_atual.lexema in ['+', '-']:
-            operador = self.token_atual
-            self.avancar()
-            direita = self.fator()
-            binaria = ExpressaoBinariaNode(
-                esquerda,
-                operador,
-                direita,
-                operador.linha,
-                operador.coluna
-            )
-            return self.soma_resto(binaria)
-        
-        return esquerda
-    
-    def fator(self):
-        """Processa um fator (exponenciação seguido de operadores de multiplicação). """
-        exponencial = self.exponenciacao()
-        return self.fator_resto(exponencial)
-    
-    def fator_resto(self, esquerda):
-        """Processa o resto de um fator (operadores de multiplicação, divisão e módulo)."""
-        if self.token_atual and self.token_atual.lexema in ['*', '/', '%']:
-            operador = self.token_atual
-            self.avancar()
-            direita = self.exponenciacao()
-            binaria = ExpressaoBinariaNode(
-                esquerda,
-                operador,
-                direita,
-                operador.linha,
-                operador.coluna
-            )
-            return self.fator_resto(binaria)
-        
-        return esquerda
-    
-    def exponenciacao(self):
-        """Processa exponenciação com associatividade à direita."""
-        base = self.fator_primario()
-        
-        if self.token_atual and self.token_atual.lexema == '**':
-            operador = self.token_atual
-            self.avancar()
-            expoente = self.exponenciacao()
-            return ExpressaoBinariaNode(
-                base,
-                operador,
-                expoente,
-                operador.linha,
-                operador.coluna
-            )
-        
-        return base
-    
-    def fator_primario(self):
-        """Processa um fator primário (literais, identificadores, operadores unários, etc.)."""
-        if self.verificar('INTEIRO'):
-            token = self.token_atual
-            self.avancar()
-            return LiteralNode(int(token.lexema), 'INTEIRO', token.linha, token.coluna)
-        
-        if self.verificar('DECIMAL'):
-            token = self.token_atual
-            self.avancar()
-            return LiteralNode(float(token.lexema), 'DECIMAL', token.linha, token.coluna)
-        
-        if self.verificar('BOOLEANO'):
-            token = self.token_atual
-            self.avancar()
-            valor = token.lexema == 'VERDADE'
-            return LiteralNode(valor, 'BOOLEANO', token.linha, token.coluna)
-        
-        if self.verificar('VAZIO'):
-            token = self.token_atual
-            self.avancar()
-            return LiteralNode(None, 'VAZIO', token.linha, token.coluna)
+        agrupamentos = []  # (tipo, token, itens, base, operandos e operadores externos)
+        operandos = []
+        operadores = []  # (precedência, token do operador)
+        expressao = None  # Operando completo mais recente (None: espera-se um operando)
+        cadeia = False  # Se o operando ainda aceita acessos encadeados (.attr, [i], chamadas)
         
-        if self.verificar('STRING') or self.verificar('STRING_MULTILINE'):
-            token = self.token_atual
-            formatada = False
-            
-            # Verifica se tem 'f' antes da string
-            if token.lexema.startswith('f"') or token.lexema.startswith("f'") or \
-               token.lexema.startswith('f"""') or token.lexema.startswith("f'''"):
-                formatada = True
-                # Remove o 'f' do início
-                if token.lexema.startswith('f"""') or token.lexema.startswith("f'''"):
-                    valor = token.lexema[4:-3] if len(token.lexema) >= 7 else token.lexema[1:]
-                else:
-                    valor = token.lexema[2:-1] if len(token.lexema) >= 3 else token.lexema[1:]
-            else:
-                # Remove aspas: " ou ' (1 char) ou """ ou ''' (3 chars)
-                if token.lexema.startswith('"""') or token.lexema.startswith("'''"):
-                    valor = token.lexema[3:-3] if len(token.lexema) >= 6 else token.lexema
+        while True:
+            # ----- Operando: operadores unários, agrupamentos, identificadores e literais -----
+            if expressao is None:
+                terminal = self.terminal_atual
+                if terminal in _OPERADORES_UNARIOS:
+                    operadores.append((_PRECEDENCIA_UNARIA, self.token_atual))
+                    self.avancar()
+                    continue
+                
+                token = self.token_atual
+                if token is None:
+                    raise self._expressao_esperada()
+                
+                if terminal == _IDENTIFICADOR:
+                    self.avancar()
+                    expressao = IdentificadorNode(token.lexema, token.linha, token.coluna)
+                    cadeia = True
+                elif self._DESPACHO_AGRUPAMENTO[terminal]:
+                    tipo = self._DESPACHO_AGRUPAMENTO[terminal]
+                    self.avancar()
+                    if tipo != _PARENTESES and self.terminal_atual in _FIM_ARGUMENTOS:
+                        expressao = self._fechar_agrupamento(tipo, token, [], None)
+                    else:
+                        itens = None if tipo == _PARENTESES else []
+                        agrupamentos.append((tipo, token, itens, None, operandos, operadores))
+                        operandos = []
+                        operadores = []
+                        continue
                 else:
-                    valor = token.lexema[1:-1] if len(token.lexema) >= 2 else token.lexema
+                    literal = self._DESPACHO_LITERAL[terminal]
+                    if literal is None:
+                        raise self._expressao_esperada()
+                    expressao = literal(self)
             
-            self.avancar()
-            return LiteralNode(valor, 'STRING', token.linha, token.coluna, formatada=formatada)
-        
-        if self.verificar('ID'):
-            token = self.token_atual
-            self.avancar()
-            
-            # Cria o identificador base
-            expressao = IdentificadorNode(token.lexema, token.linha, token.coluna)
-            
-            # Processa acessos encadeados: obj.attr1.attr2.metodo() ou lista[0] ou obj.lista[0]
-            while self.token_atual and self.token_atual.lexema in ['.', '[']:
-                if self.token_atual.lexema == '.':
+            # ----- Acessos encadeados: obj.attr1.metodo() ou lista[0] ou func() -----
+            if cadeia:
+                terminal = self.terminal_atual
+                if terminal == _PONTO:
                     self.avancar()  # Consome '.'
-                    
                     atributo_token = self.consumir('ID', "Esperado nome do atributo após '.'")
-                    atributo_nome = atributo_token.lexema
+                    expressao = AcessoAtributoNode(expressao, atributo_token.lexema, atributo_token.linha, atributo_token.coluna)
                     
-                    # Verifica se é chamada de método: obj.metodo()
-                    if self.verificar('('):
+                    # Chamada de método: obj.metodo()
+                    if self.terminal_atual == _ABRE_PARENTESES:
                         self.avancar()
-                        argumentos = self.lista_argumentos()
-                        self.consumir(')', "Esperado ')' após argumentos do método")
-                        # Cria acesso ao atributo (método) e depois chamada
-                        from .ast_nodes import AcessoAtributoNode
-                        acesso = AcessoAtributoNode(expressao, atributo_nome, atributo_token.linha, atributo_token.coluna)
-                        expressao = ChamadaFuncaoNode(acesso, argumentos, atributo_token.linha, atributo_token.coluna)
-                    else:
-                        # Apenas acesso ao atributo: obj.attr
-                        from .ast_nodes import AcessoAtributoNode
-                        expressao = AcessoAtributoNode(expressao, atributo_nome, atributo_token.linha, atributo_token.coluna)
+                        if self.terminal_atual in _FIM_ARGUMENTOS:
+                            expressao = self._fechar_agrupamento(_CHAMADA_METODO, atributo_token, [], expressao)
+                        else:
+                            agrupamentos.append((_CHAMADA_METODO, atributo_token, [], expressao, operandos, operadores))
+                            operandos = []
+                            operadores = []
+                            expressao = None
+                            cadeia = False
+                    continue
                 
-                elif self.token_atual.lexema == '[':
+                if terminal == _ABRE_COLCHETE:
                     # Indexação: lista[0] ou dict["chave"]
                     token_colchete = self.token_atual
                     self.avancar()  # Consome '['
-                    indice = self.expressao()
-                    self.consumir(']', "Esperado ']' após índice")
-                    from .ast_nodes import IndexacaoNode
-                    expressao = IndexacaoNode(expressao, indice, token_colchete.linha, token_colchete.coluna)
+                    agrupamentos.append((_INDICE, token_colchete, None, expressao, operandos, operadores))
+                    operandos = []
+                    operadores = []
+                    expressao = None
+                    cadeia = False
+                    continue
+                
+                cadeia = False
+                
+                # Chamada de função só sobre identificador simples: func()
+                if terminal == _ABRE_PARENTESES and isinstance(expressao, IdentificadorNode):
+                    self.avancar()
+                    if self.terminal_atual in _FIM_ARGUMENTOS:
+                        expressao = self._fechar_agrupamento(_CHAMADA, expressao, [], expressao.nome)
+                    else:
+                        agrupamentos.append((_CHAMADA, expressao, [], expressao.nome, operandos, operadores))
+                        operandos = []
+                        operadores = []
+                        expressao = None
+                        continue
             
-            # Se não tinha '.', verifica se é chamada de função normal: func()
-            if isinstance(expressao, IdentificadorNode) and self.verificar('('):
+            # ----- Operador binário -----
+            operandos.append(expressao)
+            expressao = None
+            terminal = self.terminal_atual
+            precedencia = _PRECEDENCIA[terminal] if terminal is not None else 0
+            if precedencia:
+                # Associatividade à direita: um ** não reduz o ** pendente
+                limite = precedencia + 1 if precedencia == _PRECEDENCIA_EXPONENCIACAO else precedencia
+                while operadores and operadores[-1][0] >= limite:
+                    self._reduzir(operandos, operadores)
+                operadores.append((precedencia, self.token_atual))
                 self.avancar()
-                argumentos = self.lista_argumentos()
-                self.consumir(')', "Esperado ')' após argumentos da função")
-                return ChamadaFuncaoNode(expressao.nome, argumentos, token.linha, token.coluna)
+                continue
+            
+            # ----- Fim da (sub)expressão -----
+            while operadores:
+                self._reduzir(operandos, operadores)
+            resultado = operandos.pop()
+            if not agrupamentos:
+                return resultado
             
-            return expressao
+            tipo, token, itens, base, operandos, operadores = agrupamentos[-1]
+            if itens is not None:
+                # Elemento de lista/dicionário ou argumento de chamada
+                itens.append(resultado)
+                if self.terminal_atual == _VIRGULA:
+                    self.avancar()
+                    operandos = []
+                    operadores = []
+                    continue
+                resultado = itens
+            agrupamentos.pop()
+            expressao = self._fechar_agrupamento(tipo, token, resultado, base)
+            cadeia = tipo == _INDICE or tipo == _CHAMADA_METODO
+    
+    @staticmethod
+    def _reduzir(operandos, operadores):
+        """
+        Aplica o operador do topo da pilha aos operandos do topo.
         
-        if self.verificar('('):
-            self.avancar()
-            expressao = self.expressao()
-            self.consumir(')', "Esperado ')' após expressão")
-            return expressao
+        O nó guarda uma cópia só com os dados do token: um TokenView (ou um
+        Token com índice de linhas) manteria vivos o TokenStream e o código
+        fonte inteiros enquanto a AST existir.
+        """
+        precedencia, operador = operadores.pop()
+        operador = Token(operador.lexema, operador.tipo, operador.linha, operador.coluna, operador.posicao)
+        direita = operandos.pop()
+        if precedencia == _PRECEDENCIA_UNARIA:
+            operandos.append(ExpressaoUnariaNode(operador, direita, operador.linha, operador.coluna))
+        else:
+            operandos[-1] = ExpressaoBinariaNode(operandos[-1], operador, direita, operador.linha, operador.coluna)
+    
+    def _fechar_agrupamento(self, tipo, token, conteudo, base):
+        """
+        Consome o fechamento de um agrupamento e retorna o nó correspondente.
         
-        if self.verificar('['):
-            token = self.token_atual
-            self.avancar()
-            elementos = self.lista_argumentos()
+        Args:
+            tipo: _PARENTESES, _INDICE, _LISTA, _DICIONARIO, _CHAMADA ou _CHAMADA_METODO
+            token: Token (ou nó) que dá linha e coluna ao nó criado
+            conteudo: Expressão interna (parênteses, índice) ou lista de itens
+            base: Expressão indexada, nome da função ou acesso ao método
+        """
+        if tipo == _PARENTESES:
+            self.consumir(')', "Esperado ')' após expressão")
+            return conteudo
+        if tipo == _INDICE:
+            self.consumir(']', "Esperado ']' após índice")
+            return IndexacaoNode(base, conteudo, token.linha, token.coluna)
+        if tipo == _LISTA:
             self.consumir(']', "Esperado ']' após elementos da lista")
-            return ListaNode(elementos, token.linha, token.coluna)
-        
-        if self.verificar('{'):
-            token = self.token_atual
-            self.avancar()
-            
+            return ListaNode(conteudo, token.linha, token.coluna)
+        if tipo == _DICIONARIO:
             # TODO: Implementar parsing de dicionários vs conjuntos
-            elementos = self.lista_argumentos()
             self.consumir('}', "Esperado '}' após elementos")
             return DicionarioNode([], token.linha, token.coluna)
-        
-        if self.verificar('-'):
-            operador = self.token_atual
-            self.avancar()
-            expressao = self.exponenciacao()
-            return ExpressaoUnariaNode(operador, expressao, operador.linha, operador.coluna)
-        
-        if self.verificar('NAO'):
-            operador = self.token_atual
-            self.avancar()
-            expressao = self.exponenciacao()
-            return ExpressaoUnariaNode(operador, expressao, operador.linha, operador.coluna)
-        
-        raise ErroSintatico(
+        if tipo == _CHAMADA:
+            self.consumir(')', "Esperado ')' após argumentos da função")
+        else:
+            self.consumir(')', "Esperado ')' após argumentos do método")
+        return ChamadaFuncaoNode(base, conteudo, token.linha, token.coluna)
+    
+    def _expressao_esperada(self):
+        return ErroSintatico(
             f"Expressão esperada, encontrado '{self.token_atual.tipo if self.token_atual else 'EOF'}'",
             self.token_atual.linha if self.token_atual else None,
             self.token_atual.coluna if self.token_atual else None
         )
     
-    def lista_argumentos(self):
-        """Processa uma lista de argumentos separados por vírgula."""
-        argumentos = []
-        
-        if self.token_atual and self.token_atual.lexema in [')', ']', '}']:
-            return argumentos
-        
-        argumentos.append(self.expressao())
-        
-        # Argumentos adicionais
-        while self.verificar(','):
-            self.avancar()
-            argumentos.append(self.expressao())
+    def literal_inteiro(self):
+        token = self.token_atual
+        self.avancar()
+        return LiteralNode(int(token.lexema), 'INTEIRO', token.linha, token.coluna)
+    
+    def literal_decimal(self):
+        token = self.token_atual
+        self.avancar()
+        return LiteralNode(float(token.lexema), 'DECIMAL', token.linha, token.coluna)
+    
+    def literal_booleano(self):
+        token = self.token_atual
+        self.avancar()
+        valor = token.lexema == 'VERDADE'
+        return LiteralNode(valor, 'BOOLEANO', token.linha, token.coluna)
+    
+    def literal_vazio(self):
+        token = self.token_atual
+        self.avancar()
+        return LiteralNode(None, 'VAZIO', token.linha, token.coluna)
+    
+    def literal_string(self):
+        """Processa uma string (simples, multilinha ou formatada com f)."""
+        token = self.token_atual
+        formatada = False
+        
+        # Verifica se tem 'f' antes da string
+        if token.lexema.startswith('f"') or token.lexema.startswith("f'") or \
+           token.lexema.startswith('f"""') or token.lexema.startswith("f'''"):
+            formatada = True
+            # Remove o 'f' do início
+            if token.lexema.startswith('f"""') or token.lexema.startswith("f'''"):
+                valor = token.lexema[4:-3] if len(token.lexema) >= 7 else token.lexema[1:]
+            else:
+                valor = token.lexema[2:-1] if len(token.lexema) >= 3 else token.lexema[1:]
+        else:
+            # Remove aspas: " ou ' (1 char) ou """ ou ''' (3 chars)
+            if token.lexema.startswith('"""') or token.lexema.startswith("'''"):
+                valor = token.lexema[3:-3] if len(token.lexema) >= 6 else token.lexema
+            else:
+                valor = token.lexema[1:-1] if len(token.lexema) >= 2 else token.lexema
         
-        return argumentos
+        self.avancar()
+        return LiteralNode(valor, 'STRING', token.linha, token.coluna, formatada=formatada)
     
     def estrutura_se(self):
         """Processa uma estrutura condicional SE/SENAOSE/SENAO."""
@@ -648,7 +705,7 @@ class ParserCoral:
         # Suporte para anotação de tipo de retorno: -> TIPO
         tipo_retorno = None
         if self.token_atual and self.token_atual.lexema == '-':
-            proximo = self.tokens[self.posicao + 1] if self.posicao + 1 < len(self.tokens) else None
+            proximo = self.olhar_adiante(1)
             if proximo and proximo.lexema == '>':
                 # Consome '-' e '>'
                 self.avancar()  # '-'
@@ -754,49 +811,133 @@ class ParserCoral:
         """Processa uma instrução PASSAR."""
         token = self.consumir('PASSAR')
         return PassarNode(token.linha, token.coluna)
+    
+    # ===== TABELAS DE DESPACHO (montadas a partir da tabela LL(1)) =====
+    
+    _DESPACHO_DECLARACAO = _tabela_despacho(
+        ('DeclaracaoComposta', 'DeclaracaoSimples'),
+        {
+            'Se': estrutura_se,
+            'Enquanto': estrutura_enquanto,
+            'Para': estrutura_para,
+            'Funcao': funcao,
+            'Classe': classe,
+            'Retornar': retornar,
+            'Quebra': quebra,
+            'Continua': continua,
+            'Passar': passar,
+            'ExpressaoOuAtribuicao': expressao_ou_atribuicao,
+        },
+        padrao=expressao_ou_atribuicao
+    )
+    
+    _DESPACHO_LITERAL = _tabela_despacho(
+        ('FatorPrimario',),
+        {
+            'INTEIRO': literal_inteiro,
+            'DECIMAL': literal_decimal,
+            'BOOLEANO': literal_booleano,
+            'VAZIO': literal_vazio,
+            'STRING': literal_string,
+            'STRING_MULTILINE': literal_string,
+        }
+    )
+    
+    _DESPACHO_AGRUPAMENTO = _tabela_despacho(
+        ('FatorPrimario',),
+        {'(': _PARENTESES, '[': _LISTA, '{': _DICIONARIO},
+        padrao=0
+    )
 
-def exibir_ast(no, indentacao=0, profundidade_maxima=10):
-    """Exibe a AST de forma hierárquica e legível."""
-    if indentacao > profundidade_maxima:
-        print("  " * indentacao + "...")
-        return
-    
-    prefixo = "  " * indentacao
-    print(f"{prefixo}{no}")
-    
-    # Exibe filhos dependendo do tipo de nó
-    if hasattr(no, 'declaracoes') and no.declaracoes:
-        for i, decl in enumerate(no.declaracoes):
-            if i < 20:  # Limita exibição
-                exibir_ast(decl, indentacao + 1, profundidade_maxima)
+class _ExibidorAST(Visitante):
+    """Visitante usado por exibir_ast."""
+    
+    def __init__(self, profundidade_maxima):
+        self.profundidade_maxima = profundidade_maxima
+    
+    def _exibir(self, no, rotulo=None):
+        """
+        Exibe o nó em uma linha (rotulo ou repr(no)); retorna False (e exibe
+        '...') além da profundidade máxima.
+        
+        Nós cujo repr inclui os filhos (ex.: ExpBinaria) passam um rótulo só
+        com o operador ou nome: o repr é recursivo e os filhos são exibidos
+        nas linhas seguintes.
+        """
+        if self.profundidade > self.profundidade_maxima:
+            print("  " * self.profundidade + "...")
+            return False
+        print(f"{'  ' * self.profundidade}{no if rotulo is None else rotulo}")
+        return True
+    
+    def _linha(self, texto):
+        return partial(print, f"{'  ' * self.profundidade}  {texto}")
+    
+    def visitar_padrao(self, no):
+        self._exibir(no)
+    
+    def visitar_ProgramaNode(self, no):
+        if not self._exibir(no) or not no.declaracoes:
+            return None
+        itens = no.declaracoes[:20]  # Limita exibição
         if len(no.declaracoes) > 20:
-            print("  " * (indentacao + 1) + f"... e mais {len(no.declaracoes) - 20} declarações")
-    
-    elif hasattr(no, 'esquerda') and hasattr(no, 'direita'):
-        if no.esquerda:
-            exibir_ast(no.esquerda, indentacao + 1, profundidade_maxima)
-        if no.direita:
-            exibir_ast(no.direita, indentacao + 1, profundidade_maxima)
-    
-    elif hasattr(no, 'expressao') and no.expressao:
-        exibir_ast(no.expressao, indentacao + 1, profundidade_maxima)
-    
-    elif hasattr(no, 'condicao') and hasattr(no, 'bloco_se'):
-        print(f"{prefixo}  Condição:")
-        exibir_ast(no.condicao, indentacao + 2, profundidade_maxima)
-        print(f"{prefixo}  Bloco SE:")
-        exibir_ast(no.bloco_se, indentacao + 2, profundidade_maxima)
-        if hasattr(no, 'blocos_senaose') and no.blocos_senaose:
-            for i, (cond, bloco) in enumerate(no.blocos_senaose):
-                print(f"{prefixo}  SENAOSE {i+1}:")
-                exibir_ast(cond, indentacao + 2, profundidade_maxima)
-                exibir_ast(bloco, indentacao + 2, profundidade_maxima)
-        if hasattr(no, 'bloco_senao') and no.bloco_senao:
-            print(f"{prefixo}  Bloco SENAO:")
-            exibir_ast(no.bloco_senao, indentacao + 2, profundidade_maxima)
-    
-    elif hasattr(no, 'bloco') and no.bloco:
-        exibir_ast(no.bloco, indentacao + 1, profundidade_maxima)
+            itens.append(partial(print, "  " * (self.profundidade + 1) + f"... e mais {len(no.declaracoes) - 20} declarações"))
+        return itens
+    
+    visitar_BlocoNode = visitar_ProgramaNode
+    
+    def visitar_ExpressaoBinariaNode(self, no):
+        if self._exibir(no, f"ExpBinaria({no.operador.lexema})"):
+            return [no.esquerda, no.direita]
+    
+    def visitar_ExpressaoUnariaNode(self, no):
+        if self._exibir(no, f"ExpUnaria({no.operador.lexema})"):
+            return [no.expressao]
+    
+    def visitar_AtribuicaoNode(self, no):
+        if self._exibir(no, f"Atribuicao({no.operador})"):
+            return [no.identificador, no.expressao]
+    
+    def visitar_AcessoAtributoNode(self, no):
+        if self._exibir(no, f"Acesso(.{no.atributo})"):
+            return [no.objeto]
+    
+    def visitar_IndexacaoNode(self, no):
+        if self._exibir(no, "Indexacao()"):
+            return [no.objeto, no.indice]
+    
+    def visitar_RetornarNode(self, no):
+        if self._exibir(no, "Retornar()"):
+            return [no.expressao]
+    
+    def visitar_SeNode(self, no):
+        if not self._exibir(no):
+            return None
+        itens = [self._linha("Condição:"), (no.condicao, 2), self._linha("Bloco SE:"), (no.bloco_se, 2)]
+        for i, (cond, bloco) in enumerate(no.blocos_senaose or ()):
+            itens += [self._linha(f"SENAOSE {i+1}:"), (cond, 2), (bloco, 2)]
+        if no.bloco_senao:
+            itens += [self._linha("Bloco SENAO:"), (no.bloco_senao, 2)]
+        return itens
+    
+    def visitar_EnquantoNode(self, no):
+        if self._exibir(no, "Enquanto()"):
+            return [no.condicao, no.bloco]
+    
+    def visitar_ParaNode(self, no):
+        if self._exibir(no, f"Para({no.variavel})"):
+            return [no.iteravel, no.bloco]
+    
+    def visitar_FuncaoNode(self, no):
+        if self._exibir(no):
+            return [no.bloco]
+    
+    visitar_ClasseNode = visitar_FuncaoNode
+
+
+def exibir_ast(no, indentacao=0, profundidade_maxima=10):
+    """Exibe a AST de forma hierárquica e legível (sem recursão)."""
+    _ExibidorAST(profundidade_maxima).visitar(no, indentacao)
 
 
 def main():
@@ -830,18 +971,9 @@ def main():
         print(f"Arquivo: {arquivo}")
         print(f"{'='*70}")
         
-        # Análise léxica
-        lexer = LexerCoral.analisar_arquivo(arquivo)
-        tokens = []
-        while True:
-            token = lexer.getNextToken()
-            tokens.append(token)
-            if token.tipo == "EOF":
-                break
-        
-        # Análise sintática
-        parser = ParserCoral(tokens)
-        ast = parser.parse()
+        # Análises léxica e sintática: o parser puxa os tokens do lexer sob demanda
+        with LexerCoral.analisar_arquivo(arquivo, streaming=True) as lexer:
+            ast = ParserCoral(lexer).parse()
         
         # Exibe a AST
         print(f"\n{'='*70}")
@@ -0,0 +1,146 @@
+"""
+Percurso da AST sem recursão.
+
+Funções e classes compartilhadas por quem precisa percorrer a árvore
+(exibição, coleta de strings do compilador LLVM, análises): as pilhas são
+explícitas, então a profundidade da árvore não é limitada pelo limite de
+recursão do Python.
+    
+    filhos(no)               nós filhos diretos, na ordem de CAMPOS
+    percorrer(raiz)          gerador em pré-ordem
+    percorrer_pos_ordem(raiz)
+                             gerador em pós-ordem (filhos antes do pai)
+    TabelaDespacho           método visitante por classe de nó, em cache
+    Visitante                base de visitantes com pilha explícita
+
+Os nós são reconhecidos pelo atributo de classe CAMPOS (ver ast_nodes), sem
+isinstance, então nós de src.parser.ast_nodes e de parser.ast_nodes são
+tratados igualmente.
+"""
+
+
+def filhos(no):
+    """
+    Retorna os nós filhos diretos, na ordem de CAMPOS.
+    
+    Listas e tuplas nos campos (ex.: declaracoes, blocos_senaose) são
+    expandidas; valores que não são nós (nomes, literais, tokens) são
+    ignorados.
+    """
+    resultado = []
+    pendentes = [getattr(no, campo) for campo in type(no).CAMPOS]
+    pendentes.reverse()
+    while pendentes:
+        valor = pendentes.pop()
+        classe = type(valor)
+        if classe is list or classe is tuple:
+            pendentes.extend(reversed(valor))
+        elif hasattr(classe, 'CAMPOS'):
+            resultado.append(valor)
+    return resultado
+
+
+def percorrer(raiz):
+    """Itera sobre os nós da árvore em pré-ordem (o pai antes dos filhos)."""
+    pilha = [raiz]
+    while pilha:
+        no = pilha.pop()
+        yield no
+        proximos = filhos(no)
+        proximos.reverse()
+        pilha.extend(proximos)
+
+
+def percorrer_pos_ordem(raiz):
+    """Itera sobre os nós da árvore em pós-ordem (os filhos antes do pai)."""
+    pilha = [(raiz, False)]
+    while pilha:
+        no, expandido = pilha.pop()
+        if expandido:
+            yield no
+        else:
+            pilha.append((no, True))
+            pilha.extend((filho, False) for filho in reversed(filhos(no)))
+
+
+class TabelaDespacho(dict):
+    """
+    Cache, por classe de nó, da função que a trata em uma classe visitante.
+    
+    Para uma classe de nó, a função é o primeiro atributo
+    <prefixo><Classe> da classe visitante seguindo a MRO da classe do nó
+    (ex.: visitar_LiteralNode, depois visitar_ExpressaoNode...), ou o
+    atributo padrao. A busca é feita uma vez por classe; as chamadas seguintes
+    são uma consulta ao dicionário: tabela[type(no)](visitante, no).
+    """
+    
+    def __init__(self, classe_visitante, prefixo, padrao):
+        super().__init__()
+        self.classe_visitante = classe_visitante
+        self.prefixo = prefixo
+        self.padrao = padrao
+    
+    def __missing__(self, classe_no):
+        for base in classe_no.__mro__:
+            funcao = getattr(self.classe_visitante, self.prefixo + base.__name__, None)
+            if funcao is not None:
+                break
+        else:
+            funcao = getattr(self.classe_visitante, self.padrao)
+        self[classe_no] = funcao
+        return funcao
+
+
+class Visitante:
+    """
+    Base de visitantes da AST percorrida com pilha explícita.
+    
+    visitar(raiz) chama, para cada nó alcançado, visitar_<Classe>(no) ou
+    visitar_padrao(no) (ver TabelaDespacho), com self.profundidade igual à
+    profundidade do nó. O método retorna os próximos itens, processados na
+    ordem em que aparecem:
+        
+        nó          visitado com profundidade + 1
+        (nó, n)     visitado com profundidade + n
+        função      chamada sem argumentos ao ser alcançada (ex.: imprimir um
+                    rótulo entre dois filhos, ou agir depois deles)
+        None        ignorado
+    
+    Se o método retornar None, nada abaixo do nó é visitado; visitar_padrao
+    visita todos os filhos (filhos(no)).
+    """
+    
+    _despacho = None
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._despacho = TabelaDespacho(cls, 'visitar_', 'visitar_padrao')
+    
+    def visitar_padrao(self, no):
+        return filhos(no)
+    
+    def visitar(self, raiz, profundidade=0):
+        """Visita a árvore a partir de raiz (ignorada se for None)."""
+        despacho = self._despacho
+        if despacho is None:
+            despacho = type(self)._despacho = TabelaDespacho(type(self), 'visitar_', 'visitar_padrao')
+        pilha = [(raiz, profundidade)]
+        while pilha:
+            item, profundidade = pilha.pop()
+            if item is None:
+                continue
+            if callable(item):
+                item()
+                continue
+            self.profundidade = profundidade
+            proximos = despacho[type(item)](self, item)
+            if not proximos:
+                continue
+            itens = []
+            for proximo in proximos:
+                if type(proximo) is tuple:
+                    itens.append((proximo[0], profundidade + proximo[1]))
+                else:
+                    itens.append((proximo, profundidade + 1))
+            itens.reverse()
+            pilha.extend(itens)
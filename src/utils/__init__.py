@@ -9,6 +9,7 @@ from .utils import (
     OPERADORES_ATRIBUICAO,
     DELIMITADORES,
     TIPO_MAP,
+    diretorio_cache,
     exibir_tabelas,
     eh_palavra_reservada,
     eh_operador_logico,
@@ -24,6 +25,7 @@ __all__ = [
     'OPERADORES_ATRIBUICAO',
     'DELIMITADORES',
     'TIPO_MAP',
+    'diretorio_cache',
     'exibir_tabelas',
     'eh_palavra_reservada',
     'eh_operador_logico',
@@ -16,6 +16,8 @@ Uso:
     exibir_tabelas()
 """
 
+import os
+
 # ===== PALAVRAS RESERVADAS =====
 
 PALAVRAS_RESERVADAS = {
@@ -47,6 +49,29 @@ OPERADORES_ATRIBUICAO = {'=', '+=', '-=', '*=', '/=', '%='}
 
 DELIMITADORES = {'(', ')', '[', ']', '{', '}', ':', ','}
 
+# ===== CACHE EM DISCO =====
+
+def diretorio_cache(subdiretorio=None):
+    """
+    Retorna o diretório de cache da linguagem Coral.
+    
+    Usa a variável de ambiente CORAL_CACHE_DIR se definida; caso contrário,
+    XDG_CACHE_HOME/coral (ou ~/.cache/coral).
+    
+    Args:
+        subdiretorio: Nome opcional de um subdiretório dentro do cache
+        
+    Returns:
+        str: Caminho do diretório (não é criado por esta função)
+    """
+    base = os.environ.get('CORAL_CACHE_DIR')
+    if not base:
+        raiz = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        base = os.path.join(raiz, 'coral')
+    if subdiretorio:
+        return os.path.join(base, subdiretorio)
+    return base
+
 # ===== MAPEAMENTOS DE TIPOS =====
 
 TIPO_MAP = {
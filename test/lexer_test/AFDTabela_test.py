@@ -0,0 +1,69 @@
+import unittest
+
+from src.lexer.AFN.AFNCoralUnificado import AFNCoralUnificado
+from src.lexer.afn_to_afd import ConversorAFNparaAFD
+from src.lexer.AFD.AFDUnificado import AFDUnificado
+from src.lexer.AFD.AFDTabela import AFDTabela
+from src.lexer.AFD import get_afd
+
+class TestAFDTabela(unittest.TestCase):
+    """Testes do motor de tabela de inteiros do AFD unificado."""
+    
+    ENTRADAS = [
+        "x = 10",
+        "SE idade >= 18:\n    imprima(\"maior\")",
+        "resultado = (a + b) * c ** 2 % 3",
+        "aprovado = nota >= 7.5 E presenca >= 75 OU NAO reprovado",
+        "ativo = VERDADE\ninativo = FALSO",
+        "# comentário\nvalor = 'texto' # fim",
+        'msg = f"Olá {nome}"\nbloco = """linha\noutra"""',
+        "lista = [1, 2, 3]; dic = {a: 1}",
+        "nome_com_acento = 'ação'\nçaí = 1",
+        "x += 1\ny -= 2\nz != w",
+        "valor = 12abc\n.5 @ $ ~",
+        "\t \x0b\x0c  ",
+    ]
+    
+    def setUp(self):
+        conversor = ConversorAFNparaAFD(AFNCoralUnificado())
+        conversor.construir_subconjuntos()
+        self.afd_dicionario = AFDUnificado(conversor)
+        self.afd_tabela = AFDTabela(conversor)
+    
+    def test_casar_tabela_equivalente(self):
+        """Testa que o percurso da tabela coincide com o motor de dicionários em toda posição."""
+        for entrada in self.ENTRADAS:
+            for inicio in range(len(entrada)):
+                with self.subTest(entrada=entrada, inicio=inicio):
+                    self.assertEqual(
+                        self.afd_tabela._casar_tabela(entrada, inicio),
+                        self.afd_dicionario._casar_tabela(entrada, inicio)
+                    )
+    
+    def test_match_equivalente(self):
+        """Testa que match() produz os mesmos tokens nos dois motores."""
+        for entrada in self.ENTRADAS:
+            for inicio in range(len(entrada)):
+                with self.subTest(entrada=entrada, inicio=inicio):
+                    self.assertEqual(
+                        self.afd_tabela.match(entrada, inicio),
+                        self.afd_dicionario.match(entrada, inicio)
+                    )
+    
+    def test_tabelas_compactas(self):
+        """Testa a forma da matriz de transições e da tabela de classes ASCII."""
+        estados = len(self.afd_tabela.aceitacao)
+        self.assertEqual(len(self.afd_tabela.transicoes), estados * self.afd_tabela.total_colunas)
+        self.assertEqual(len(self.afd_tabela.classes_ascii), AFDTabela.LIMITE_ASCII)
+        self.assertEqual(self.afd_tabela.transicoes.typecode, 'i')
+    
+    def test_get_afd_motor(self):
+        """Testa a seleção do motor em get_afd()."""
+        self.assertIsInstance(get_afd('tabela'), AFDTabela)
+        self.assertIs(get_afd('tabela'), get_afd('tabela'))
+        self.assertNotIsInstance(get_afd('dicionario'), AFDTabela)
+        with self.assertRaises(ValueError):
+            get_afd('inexistente')
+
+if __name__ == '__main__':
+    unittest.main()
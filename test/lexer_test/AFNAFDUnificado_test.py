@@ -170,5 +170,24 @@ class TestAFNAFDUnificado(unittest.TestCase):
                 resultado = self.afd.match(entrada)
                 self.assertEqual(resultado, esperado)
 
+    def test_match_com_deslocamento(self):
+        """Testa reconhecimento a partir de uma posição sem copiar a entrada."""
+        codigo = 'x = f"oi {y}" + 3.14 # fim\n"""bloco\n""" VERDADE'
+        casos = [
+            (0, ("x", 1, "IDENTIFICADOR")),
+            (2, ("=", 1, "OPERADOR_ATRIBUICAO")),
+            (4, ('f"oi {y}"', 9, "STRING")),
+            (14, ("+", 1, "OPERADOR_ARITMETICO")),
+            (16, ("3.14", 4, "DECIMAL")),
+            (21, ("# fim\n", 6, "COMENTARIO_LINHA")),
+            (27, ('"""bloco\n"""', 12, "STRING_MULTILINE")),
+            (40, ("VERDADE", 7, "BOOLEANO")),
+            (len(codigo), None)
+        ]
+        for inicio, esperado in casos:
+            with self.subTest(inicio=inicio):
+                self.assertEqual(self.afd.match(codigo, inicio), esperado)
+                self.assertEqual(self.afd.match(codigo[inicio:]), esperado)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
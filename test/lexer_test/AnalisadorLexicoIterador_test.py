@@ -0,0 +1,83 @@
+import unittest
+from collections import deque
+
+from src.lexer.lexer import LexerCoral
+
+CODIGO = '''# programa de teste
+FUNCAO soma(a, b):
+    SE a > b:
+        RETORNAR a + b  # comentário
+    RETORNAR (a -
+              b)
+x = soma(1, 2.5)
+'''
+
+def tokens_manual(codigo):
+    """Tokeniza chamando getNextToken até o EOF."""
+    analisador = LexerCoral.analisar_string(codigo)
+    tokens = []
+    while True:
+        token = analisador.getNextToken()
+        tokens.append((token.lexema, token.tipo, token.linha, token.coluna, token.posicao))
+        if token.tipo == "EOF":
+            return tokens
+
+def resumo(tokens):
+    return [(t.lexema, t.tipo, t.linha, t.coluna, t.posicao) for t in tokens]
+
+class TestAnalisadorLexicoIterador(unittest.TestCase):
+    """Testes do protocolo de iteração e da tokenização em lote."""
+    
+    def test_iteracao_equivale_a_getNextToken(self):
+        """Testa que iterar produz os mesmos tokens que getNextToken, terminando em EOF."""
+        tokens = list(LexerCoral.analisar_string(CODIGO))
+        self.assertEqual(resumo(tokens), tokens_manual(CODIGO))
+        self.assertEqual(tokens[-1].tipo, "EOF")
+        self.assertEqual(sum(1 for t in tokens if t.tipo == "EOF"), 1)
+    
+    def test_tokenizar_tudo(self):
+        """Testa que tokenizar_tudo equivale à iteração."""
+        self.assertEqual(resumo(LexerCoral.analisar_string(CODIGO).tokenizar_tudo()), tokens_manual(CODIGO))
+    
+    def test_sem_comentarios(self):
+        """Testa que comentários não chegam aos consumidores."""
+        tipos = {t.tipo for t in LexerCoral.analisar_string(CODIGO)}
+        self.assertNotIn("COMENTARIO_LINHA", tipos)
+    
+    def test_emitir_comentarios(self):
+        """Testa que, a pedido, comentários são emitidos sem alterar os demais tokens."""
+        tokens = list(LexerCoral.analisar_string(CODIGO, emitir_comentarios=True))
+        comentarios = [(t.lexema, t.linha, t.coluna) for t in tokens if t.tipo == "COMENTARIO_LINHA"]
+        self.assertEqual(comentarios, [("# programa de teste\n", 1, 1), ("# comentário\n", 4, 25)])
+        self.assertEqual(resumo(t for t in tokens if t.tipo != "COMENTARIO_LINHA"), tokens_manual(CODIGO))
+    
+    def test_espacos_e_comentarios_pulados(self):
+        """Testa sequências longas de espaços, tabs e linhas de comentário."""
+        codigo = "x =" + " \t" * 500 + "1\n" + "# c\n    # d\n" * 200 + "\tSE a:\n\t    b = 2\n"
+        tokens = list(LexerCoral.analisar_string(codigo))
+        self.assertEqual(
+            [(t.lexema, t.tipo) for t in tokens][:4],
+            [("x", "IDENTIFICADOR"), ("=", "OPERADOR_ATRIBUICAO"), ("1", "INTEIRO"), ("\\n", "NEWLINE")]
+        )
+        indenta = [t for t in tokens if t.tipo == "INDENTA"]
+        self.assertEqual([t.coluna for t in indenta], [4, 8])
+        self.assertEqual(indenta[0].linha, 402)
+    
+    def test_indentacao_pendente(self):
+        """Testa os DEDENTAs pendentes, guardados em deque."""
+        analisador = LexerCoral.analisar_string("SE a:\n    SE b:\n        x = 1\ny = 2\n")
+        self.assertIsInstance(analisador.tokens_pendentes, deque)
+        tipos = [t.tipo for t in analisador]
+        self.assertEqual(tipos.count("INDENTA"), 2)
+        self.assertEqual(tipos.count("DEDENTA"), 2)
+    
+    def test_iteracao_apos_getNextToken(self):
+        """Testa que a iteração continua de onde getNextToken parou."""
+        analisador = LexerCoral.analisar_string("x = 1")
+        primeiro = analisador.getNextToken()
+        restantes = [t.lexema for t in analisador]
+        self.assertEqual(primeiro.lexema, "x")
+        self.assertEqual(restantes, ["=", "1", ""])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+import glob
+import io
+import os
+import tempfile
+import unittest
+
+from src.lexer.lexer import LexerCoral
+from src.lexer.Buffer import BufferLeituraArquivo
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+TAMANHOS_BLOCO = [1, 2, 3, 7, 16, 4096]
+
+def tokens_ou_erro(analisador):
+    """Tokeniza até EOF; retorna a lista de tokens ou (tokens, mensagem de erro)."""
+    tokens = []
+    try:
+        while True:
+            token = analisador.getNextToken()
+            tokens.append((token.lexema, token.tipo, token.linha, token.coluna, token.posicao))
+            if token.tipo == "EOF":
+                return tokens
+    except ValueError as e:
+        return tokens, str(e)
+
+class ArquivoGerado(io.TextIOBase):
+    """Arquivo de texto somente leitura que gera o conteúdo sob demanda."""
+    
+    def __init__(self, linhas):
+        self.restantes = linhas
+        self.pendente = ''
+    
+    def readable(self):
+        return True
+    
+    def read(self, tamanho=-1):
+        while self.restantes and len(self.pendente) < tamanho:
+            n = self.restantes
+            self.pendente += f'SE x_{n} >= {n}:\n    texto = "linha {n}"\n'
+            self.restantes -= 1
+        bloco, self.pendente = self.pendente[:tamanho], self.pendente[tamanho:]
+        return bloco
+
+class TestBufferLeituraArquivo(unittest.TestCase):
+    """Testes do lexer com leitura do código fonte em blocos."""
+    
+    TRECHOS = [
+        'bloco = """linha 1\n\nlinha 3"""\ndepois = 1\n',
+        'msg = f"""Olá\n{nome}\n"""\nx = f"a {b}"\n',
+        'continua = "abc\\\ndef"\ny = 2\n',
+        'fstr = f"abc\\\n{d}"\n',
+        'aberta = """sem fechamento\nx = 1\n',
+        'f = f"""ab',
+        'SE x:\n    # comentário\n    y = (1 +\n         2)\n# fim\n\nz = 3',
+        'erro = "sem fechar\nx = 1\n',
+    ]
+    
+    def assertTokensIguais(self, codigo, **opcoes):
+        esperado = tokens_ou_erro(LexerCoral.analisar_string(io.StringIO(codigo, **opcoes).read()))
+        for tamanho in TAMANHOS_BLOCO:
+            with self.subTest(codigo=codigo[:40], tamanho_bloco=tamanho):
+                fluxo = io.StringIO(codigo, **opcoes)
+                obtido = tokens_ou_erro(LexerCoral.analisar_fluxo(fluxo, tamanho_bloco=tamanho))
+                self.assertEqual(obtido, esperado)
+    
+    def test_exemplos(self):
+        """Testa que os exemplos geram os mesmos tokens lidos em blocos."""
+        for arquivo in sorted(glob.glob(os.path.join(RAIZ, "exemplos", "**", "*.crl"), recursive=True)):
+            with open(arquivo, 'r', encoding='utf-8') as f:
+                self.assertTokensIguais(f.read())
+    
+    def test_tokens_entre_blocos(self):
+        """Testa strings multilinhas, f-strings e escapes atravessando blocos."""
+        for codigo in self.TRECHOS:
+            self.assertTokensIguais(codigo)
+    
+    def test_crlf(self):
+        """Testa quebras de linha CRLF preservadas (newline='') atravessando blocos."""
+        self.assertTokensIguais('x = 1\r\nSE x:\r\n    y = """a\r\nb"""\r\n', newline='')
+    
+    def test_lookahead(self):
+        """Testa que peekNextToken não perde o trecho descartado da janela."""
+        codigo = '# a\n# b\n\nx = 1\ny = 2\n'
+        analisador = LexerCoral.analisar_fluxo(io.StringIO(codigo), tamanho_bloco=1)
+        while True:
+            espiado = analisador.peekNextToken()
+            token = analisador.getNextToken()
+            self.assertEqual((espiado.lexema, espiado.tipo, espiado.posicao),
+                             (token.lexema, token.tipo, token.posicao))
+            if token.tipo == "EOF":
+                break
+    
+    def test_memoria_limitada(self):
+        """Testa que a janela não cresce com o tamanho do arquivo."""
+        analisador = LexerCoral.analisar_fluxo(ArquivoGerado(20000), tamanho_bloco=256)
+        buffer_leitura = analisador.buffer_leitura
+        maior_janela = 0
+        total = 0
+        while analisador.getNextToken().tipo != "EOF":
+            maior_janela = max(maior_janela, len(buffer_leitura.codigo_fonte))
+            total += 1
+        self.assertGreater(total, 100000)
+        self.assertLess(maior_janela, 1024)
+    
+    def test_janela_com_linhas_completas(self):
+        """Testa que a janela termina em fim de linha e usa posições absolutas."""
+        buffer_leitura = BufferLeituraArquivo(io.StringIO("abc\ndefgh\nij"), tamanho_bloco=5)
+        self.assertEqual(buffer_leitura.codigo_fonte, "abc\n")
+        buffer_leitura.avancar(4)
+        self.assertEqual(buffer_leitura.caractere_atual(), "d")
+        self.assertEqual(buffer_leitura.codigo_fonte, "defgh\n")
+        self.assertEqual(buffer_leitura.get_posicao_info(), {'posicao': 4, 'linha': 2, 'coluna': 1})
+    
+    def test_analisar_arquivo_streaming(self):
+        """Testa analisar_arquivo(streaming=True) e o fechamento do arquivo."""
+        with tempfile.NamedTemporaryFile('w', suffix='.crl', delete=False, encoding='utf-8') as f:
+            f.write('x = """a\nb"""\nSE x:\n    y = 1\n')
+        try:
+            esperado = tokens_ou_erro(LexerCoral.analisar_arquivo(f.name))
+            analisador = LexerCoral.analisar_arquivo(f.name, streaming=True)
+            self.assertEqual(tokens_ou_erro(analisador), esperado)
+            self.assertTrue(analisador.buffer_leitura.arquivo.closed)
+        finally:
+            os.remove(f.name)
+    
+    def test_fechar_apos_erro(self):
+        """Testa que o analisador em streaming fecha o arquivo quando a análise para em um erro."""
+        with tempfile.NamedTemporaryFile('w', suffix='.crl', delete=False, encoding='utf-8') as f:
+            f.write('x = @\n' + 'y = 1\n' * 10000)
+        try:
+            with self.assertRaises(ValueError):
+                with LexerCoral.analisar_arquivo(f.name, streaming=True) as analisador:
+                    analisador.tokenizar_tudo()
+            self.assertTrue(analisador.buffer_leitura.arquivo.closed)
+            
+            arquivo = io.StringIO('x = @\n')
+            with self.assertRaises(ValueError):
+                with LexerCoral.analisar_fluxo(arquivo) as analisador:
+                    analisador.tokenizar_tudo()
+            self.assertFalse(arquivo.closed)  # Arquivo do chamador não é fechado
+        finally:
+            os.remove(f.name)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+import glob
+import os
+import random
+import tempfile
+import unittest
+
+from src.lexer.lexer import LexerCoral
+from src.lexer.Buffer import BufferLeituraMmap
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+def tokens_ou_erro(analisador):
+    """Tokeniza até EOF; retorna a lista de tokens ou (tokens, mensagem de erro)."""
+    tokens = []
+    try:
+        while True:
+            token = analisador.getNextToken()
+            tokens.append((token.lexema, token.tipo, token.linha, token.coluna, token.posicao))
+            if token.tipo == "EOF":
+                return tokens
+    except ValueError as e:
+        return tokens, str(e)
+
+def posicoes_em_bytes(resultado, codigo):
+    """Converte as posições (em caracteres) dos tokens para deslocamentos em bytes."""
+    tokens, erro = (resultado, None) if isinstance(resultado, list) else resultado
+    tokens = [t[:4] + (len(codigo[:t[4]].encode('utf-8')),) for t in tokens]
+    return tokens if erro is None else (tokens, erro)
+
+class TestBufferLeituraMmap(unittest.TestCase):
+    """Testes do lexer sobre os bytes de um arquivo mapeado em memória."""
+    
+    TRECHOS = [
+        'ação = "olá, mundo"\nx² = 1\n',
+        'nome = f"Olá {usuário}"\n# comentário com acentuação\n',
+        'texto = """linha ç\n\nlinha ã"""\ndepois = 1\n',
+        'SE café >= 1.5é:\n    valor_ñ = ação.índice\n',
+        'x = 1\n    y = 2\n',
+        'emoji = "🐍"\nz = 🐍\n',
+        'aberta = """sem fechamento ção\nx = 1\n',
+        'x = 1\r\nSE x:\r\n    y = "é"\r\n',
+        '',
+    ]
+    
+    def analisar_mmap(self, codigo):
+        with tempfile.NamedTemporaryFile('wb', suffix='.crl', delete=False) as f:
+            f.write(codigo.encode('utf-8'))
+        try:
+            with LexerCoral.analisar_arquivo(f.name, mmap=True) as analisador:
+                return tokens_ou_erro(analisador)
+        finally:
+            os.remove(f.name)
+    
+    def assertTokensIguais(self, codigo):
+        esperado = posicoes_em_bytes(tokens_ou_erro(LexerCoral.analisar_string(codigo)), codigo)
+        with self.subTest(codigo=codigo[:40]):
+            self.assertEqual(self.analisar_mmap(codigo), esperado)
+    
+    def test_exemplos(self):
+        """Testa que os exemplos geram os mesmos tokens lidos como bytes."""
+        for arquivo in sorted(glob.glob(os.path.join(RAIZ, "exemplos", "**", "*.crl"), recursive=True)):
+            with open(arquivo, 'r', encoding='utf-8', newline='') as f:
+                self.assertTokensIguais(f.read())
+    
+    def test_caracteres_nao_ascii(self):
+        """Testa identificadores, strings, comentários e erros com caracteres não ASCII."""
+        for codigo in self.TRECHOS:
+            self.assertTokensIguais(codigo)
+    
+    def test_aleatorio(self):
+        """Testa trechos aleatórios misturando ASCII e caracteres multibyte."""
+        rnd = random.Random(0)
+        pedacos = ['x', 'é', '1', '.', '2', ' ', '\n', '"', 'ção', '²', '_', '#', '(', ')', '+', '=', 'SE ', ':']
+        for _ in range(300):
+            self.assertTokensIguais(''.join(rnd.choice(pedacos) for _ in range(rnd.randint(1, 30))))
+    
+    def test_buffer_bytes(self):
+        """Testa caractere atual, posições em bytes e coluna em caracteres."""
+        buffer_leitura = BufferLeituraMmap('aé\nção'.encode('utf-8'))
+        self.assertEqual(buffer_leitura.tamanho, 9)
+        buffer_leitura.avancar(1)
+        self.assertEqual(buffer_leitura.caractere_atual(), 'é')
+        buffer_leitura.avancar(3)
+        self.assertEqual(buffer_leitura.caractere_atual(), 'ç')
+        self.assertEqual(buffer_leitura.resto_codigo(), 'ção')
+        self.assertEqual(buffer_leitura.linha_coluna(8), (2, 3))
+    
+    def test_linha_coluna_incremental(self):
+        """Testa linha e coluna de marcas em ordem e de marcas anteriores à última resolvida."""
+        codigo = "x = 1\nação = 'é'\n\ny\r\n🐍 z\n"
+        posicoes = [len(codigo[:posicao].encode('utf-8')) for posicao in range(len(codigo) + 1)]
+        esperado = [BufferLeituraMmap(codigo.encode('utf-8')).indice_linhas.linha_coluna(posicao)
+                    for posicao in posicoes]
+        buffer_leitura = BufferLeituraMmap(codigo.encode('utf-8'))
+        self.assertEqual([buffer_leitura.linha_coluna(posicao) for posicao in posicoes], esperado)
+        self.assertIsNone(buffer_leitura.indice_linhas.inicios)
+        self.assertEqual(buffer_leitura.linha_coluna(posicoes[8]), esperado[8])
+    
+    def test_fechar(self):
+        """Testa que fechar libera o mmap e que os tokens guardam linha e coluna."""
+        with tempfile.NamedTemporaryFile('wb', suffix='.crl', delete=False) as f:
+            f.write('x = 1\nação = "é"\n'.encode('utf-8'))
+        try:
+            with LexerCoral.analisar_arquivo(f.name, mmap=True) as analisador:
+                tokens = analisador.tokenizar_tudo()
+            self.assertTrue(analisador.buffer_leitura.codigo_fonte.closed)
+            self.assertTrue(all(t.indice_linhas is None for t in tokens))
+            self.assertEqual([(t.lexema, t.linha, t.coluna) for t in tokens[4:7]],
+                             [('ação', 2, 1), ('=', 2, 6), ('"é"', 2, 8)])
+            analisador.fechar()
+        finally:
+            os.remove(f.name)
+    
+    def test_tokenizar_em_colunas_indisponivel(self):
+        """Testa que tokenizar_em_colunas exige o código fonte em texto."""
+        with tempfile.NamedTemporaryFile('wb', suffix='.crl', delete=False) as f:
+            f.write(b'x = 1\n')
+        try:
+            with self.assertRaises(ValueError):
+                with LexerCoral.analisar_arquivo(f.name, mmap=True) as analisador:
+                    analisador.tokenizar_em_colunas()
+        finally:
+            os.remove(f.name)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from src.lexer.AFN.AFNCoralUnificado import AFNCoralUnificado
+from src.lexer.afn_to_afd import ConversorAFNparaAFD
+from src.lexer.AFD.AFDUnificado import AFDUnificado
+from src.lexer.AFD import get_afd
+from src.lexer import cache_afd
+
+class TestCacheAFD(unittest.TestCase):
+    """Testes do cache do AFD unificado (por processo e em disco)."""
+    
+    def setUp(self):
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.ambiente = mock.patch.dict(os.environ, {"CORAL_CACHE_DIR": self.diretorio.name})
+        self.ambiente.start()
+    
+    def tearDown(self):
+        self.ambiente.stop()
+        self.diretorio.cleanup()
+    
+    def test_get_afd_compartilhado(self):
+        """Testa que get_afd retorna a mesma instância, inclusive entre threads."""
+        resultados = []
+        threads = [threading.Thread(target=lambda: resultados.append(get_afd())) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertTrue(all(afd is get_afd() for afd in resultados))
+    
+    def test_assinatura_estavel(self):
+        """Testa que a assinatura do AFN é determinística."""
+        self.assertEqual(AFNCoralUnificado().assinatura(), AFNCoralUnificado().assinatura())
+    
+    def test_salvar_e_carregar_tabelas(self):
+        """Testa a persistência da tabela do AFD em disco."""
+        afn = AFNCoralUnificado()
+        conversor = ConversorAFNparaAFD(afn)
+        conversor.construir_subconjuntos()
+        chave = cache_afd.chave_cache(afn)
+        
+        self.assertIsNone(cache_afd.carregar_tabelas(chave))
+        cache_afd.salvar_tabelas(
+            chave,
+            conversor.get_tabela_transicoes_afd(),
+            conversor.get_estados_aceitacao_afd()
+        )
+        tabelas = cache_afd.carregar_tabelas(chave)
+        
+        self.assertIsNotNone(tabelas)
+        self.assertEqual(tabelas[0], conversor.get_tabela_transicoes_afd())
+        self.assertEqual(tabelas[1], conversor.get_estados_aceitacao_afd())
+    
+    def test_afd_carregado_equivalente(self):
+        """Testa que o AFD criado a partir das tabelas reconhece os mesmos tokens."""
+        conversor = ConversorAFNparaAFD(AFNCoralUnificado())
+        conversor.construir_subconjuntos()
+        original = AFDUnificado(conversor)
+        carregado = AFDUnificado.de_tabelas(
+            conversor.get_tabela_transicoes_afd(),
+            conversor.get_estados_aceitacao_afd()
+        )
+        for entrada in ["variavel", "3.14", '"texto"', "==", "@", "# nota\n", "VERDADE"]:
+            with self.subTest(entrada=entrada):
+                self.assertEqual(carregado.match(entrada), original.match(entrada))
+    
+    def test_cache_corrompido_ignorado(self):
+        """Testa que um arquivo de cache inválido é ignorado."""
+        chave = cache_afd.chave_cache(AFNCoralUnificado())
+        os.makedirs(os.path.dirname(cache_afd._caminho(chave)), exist_ok=True)
+        with open(cache_afd._caminho(chave), 'w', encoding='utf-8') as f:
+            f.write("{corrompido")
+        self.assertIsNone(cache_afd.carregar_tabelas(chave))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.lexer.lexer import LexerCoral, AnalisadorLexico
+from src.lexer import cache_tokens
+
+def colunas(fluxo):
+    return (list(fluxo.tipos), list(fluxo.inicios), list(fluxo.fins), list(fluxo.linhas_colunas))
+
+class TestCacheTokens(unittest.TestCase):
+    """Testes do cache em disco dos tokens de arquivos fonte."""
+    
+    def setUp(self):
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.arquivo = os.path.join(self.diretorio.name, "programa.crl")
+        self.cache = os.path.join(self.diretorio.name, "cache")
+        self.escrever('SE x:\n    y = "olá"\n')
+    
+    def tearDown(self):
+        self.diretorio.cleanup()
+    
+    def escrever(self, codigo):
+        with open(self.arquivo, 'w', encoding='utf-8', newline='') as f:
+            f.write(codigo)
+    
+    def tokenizar(self):
+        return LexerCoral.tokenizar_arquivo(self.arquivo, cache=True, diretorio_cache=self.cache)
+    
+    def test_reutiliza_tokens_sem_analisar(self):
+        """Testa que a segunda análise do mesmo conteúdo vem do cache."""
+        esperado = LexerCoral.tokenizar_arquivo(self.arquivo)
+        self.assertEqual(colunas(self.tokenizar()), colunas(esperado))
+        
+        with mock.patch.object(AnalisadorLexico, 'tokenizar_em_colunas') as analisar:
+            fluxo = self.tokenizar()
+        analisar.assert_not_called()
+        self.assertEqual(colunas(fluxo), colunas(esperado))
+        self.assertEqual([t.lexema for t in fluxo], [t.lexema for t in esperado])
+    
+    def test_conteudo_alterado(self):
+        """Testa que alterar o arquivo invalida a entrada do cache."""
+        self.tokenizar()
+        self.escrever('x = 1\r\ny = 2\r\n')
+        self.assertEqual(colunas(self.tokenizar()), colunas(LexerCoral.tokenizar_arquivo(self.arquivo)))
+    
+    def test_versao_do_lexer_na_chave(self):
+        """Testa que a chave depende da versão do lexer e do conteúdo."""
+        chave = cache_tokens.chave_tokens(b'x = 1\n')
+        self.assertEqual(chave, cache_tokens.chave_tokens(b'x = 1\n'))
+        self.assertNotEqual(chave, cache_tokens.chave_tokens(b'x = 2\n'))
+        with mock.patch.object(cache_tokens, '_versao_lexer', 'outra'):
+            self.assertNotEqual(chave, cache_tokens.chave_tokens(b'x = 1\n'))
+    
+    def test_entrada_corrompida(self):
+        """Testa que uma entrada truncada é ignorada."""
+        fluxo = LexerCoral.tokenizar_arquivo(self.arquivo)
+        cache_tokens.salvar_tokens('chave', fluxo, self.cache)
+        caminho = os.path.join(self.cache, 'chave' + cache_tokens.EXTENSAO)
+        with open(caminho, 'r+b') as f:
+            f.truncate(os.path.getsize(caminho) - 1)
+        self.assertIsNone(cache_tokens.carregar_tokens('chave', fluxo.codigo_fonte, self.cache))
+    
+    def test_erro_lexico_nao_e_salvo(self):
+        """Testa que arquivos com erro léxico não geram entradas."""
+        self.escrever('x = $\n')
+        with self.assertRaises(ValueError):
+            self.tokenizar()
+        self.assertFalse(os.path.isdir(self.cache) and os.listdir(self.cache))
+    
+    def test_erros_no_modo_de_recuperacao(self):
+        """Testa que, com erros informado, todos os erros são listados em uma única análise."""
+        self.escrever('x = $\ny = 1 @\n')
+        erros = []
+        with mock.patch.object(AnalisadorLexico, 'tokenizar_em_colunas',
+                               autospec=True, side_effect=AnalisadorLexico.tokenizar_em_colunas) as analisar:
+            fluxo = LexerCoral.tokenizar_arquivo(self.arquivo, cache=True, diretorio_cache=self.cache, erros=erros)
+        self.assertEqual(analisar.call_count, 1)
+        self.assertEqual(len(erros), 2)
+        self.assertEqual([t.tipo for t in fluxo][:3], ['IDENTIFICADOR', 'OPERADOR_ATRIBUICAO', 'NEWLINE'])
+        self.assertFalse(os.path.isdir(self.cache) and os.listdir(self.cache))
+        
+        self.escrever('x = 1\n')
+        erros = []
+        LexerCoral.tokenizar_arquivo(self.arquivo, cache=True, diretorio_cache=self.cache, erros=erros)
+        self.assertEqual(erros, [])
+        self.assertEqual(len(os.listdir(self.cache)), 1)
+    
+    def test_remocao_lru(self):
+        """Testa que o limite de tamanho remove as entradas usadas há mais tempo."""
+        fluxo = LexerCoral.tokenizar_arquivo(self.arquivo)
+        for n, chave in enumerate(('a', 'b', 'c')):
+            cache_tokens.salvar_tokens(chave, fluxo, self.cache)
+            os.utime(os.path.join(self.cache, chave + cache_tokens.EXTENSAO), (n, n))
+        
+        # Ler 'a' a torna a mais recente; 'b' passa a ser a menos usada
+        self.assertIsNotNone(cache_tokens.carregar_tokens('a', fluxo.codigo_fonte, self.cache))
+        tamanho = os.path.getsize(os.path.join(self.cache, 'a' + cache_tokens.EXTENSAO))
+        cache_tokens.limitar_cache(self.cache, 2 * tamanho)
+        self.assertEqual(sorted(os.listdir(self.cache)), ['a.tokens', 'c.tokens'])
+
+if __name__ == '__main__':
+    unittest.main()
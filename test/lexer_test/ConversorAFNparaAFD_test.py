@@ -0,0 +1,89 @@
+import unittest
+from src.lexer.AFN.AFNCoralUnificado import AFNCoralUnificado
+from src.lexer.afn_to_afd import ConversorAFNparaAFD
+
+class TestConversorAFNparaAFD(unittest.TestCase):
+    """Testes da construção de subconjuntos e da minimização de Hopcroft."""
+    
+    def construir(self, minimizar=True):
+        conversor = ConversorAFNparaAFD(AFNCoralUnificado())
+        conversor.construir_subconjuntos(minimizar=minimizar)
+        return conversor
+    
+    def executar(self, conversor, simbolos):
+        """Percorre o AFD e retorna o tipo do último estado de aceitação atingido."""
+        estado = ConversorAFNparaAFD.ESTADO_INICIAL
+        ultimo = None
+        for simbolo in simbolos:
+            estado = conversor.afd_transicoes.get(estado, {}).get(simbolo)
+            if estado is None:
+                break
+            ultimo = conversor.afd_estados_aceitacao.get(estado, ultimo)
+        return ultimo
+    
+    def test_estados_inteiros(self):
+        """Testa que os estados do AFD são inteiros e o inicial é 0."""
+        conversor = self.construir()
+        self.assertIn(0, conversor.afd_transicoes)
+        for estado, transicoes in conversor.afd_transicoes.items():
+            self.assertIsInstance(estado, int)
+            for destino in transicoes.values():
+                self.assertIsInstance(destino, int)
+    
+    def test_minimizacao_reduz_estados(self):
+        """Testa que a minimização produz um AFD menor."""
+        completo = self.construir(minimizar=False)
+        minimo = self.construir()
+        self.assertLess(len(minimo.afd_estados), len(completo.afd_estados))
+        self.assertLess(
+            sum(len(t) for t in minimo.afd_transicoes.values()),
+            sum(len(t) for t in completo.afd_transicoes.values())
+        )
+    
+    def test_minimizacao_preserva_linguagem(self):
+        """Testa que AFD mínimo e completo aceitam as mesmas sequências."""
+        completo = self.construir(minimizar=False)
+        minimo = self.construir()
+        casos = [
+            ['digito', '.', 'digito'],
+            ['digito', 'digito'],
+            ['letra', 'letra_digito'],
+            ['"', 'outro', '"'],
+            ['"""', 'qualquer', '"""'],
+            ['#', 'outro'],
+            ['*', '*'],
+            ['=', '='],
+            ['V', 'E', 'R', 'D', 'A', 'D', 'E'],
+            ['N', 'A', 'O'],
+            ['O', 'U'],
+            ['outro'],
+        ]
+        for simbolos in casos:
+            with self.subTest(simbolos=simbolos):
+                self.assertEqual(self.executar(minimo, simbolos), self.executar(completo, simbolos))
+    
+    def test_sem_estados_mortos(self):
+        """Testa que todo estado do AFD mínimo alcança um estado de aceitação."""
+        conversor = self.construir()
+        alcancam = set(conversor.afd_estados_aceitacao)
+        mudou = True
+        while mudou:
+            mudou = False
+            for estado, transicoes in conversor.afd_transicoes.items():
+                if estado not in alcancam and alcancam & set(transicoes.values()):
+                    alcancam.add(estado)
+                    mudou = True
+        self.assertEqual(alcancam, set(conversor.afd_estados))
+    
+    def test_prioridade_palavras_sobre_identificador(self):
+        """Testa que operadores lógicos prevalecem sobre identificadores no AFD."""
+        conversor = self.construir()
+        self.assertEqual(self.executar(conversor, ['E']), 'OPERADOR_LOGICO')
+        self.assertEqual(self.executar(conversor, ['letra']), 'IDENTIFICADOR')
+    
+    def test_construcao_deterministica(self):
+        """Testa que duas construções produzem a mesma tabela."""
+        self.assertEqual(self.construir().afd_transicoes, self.construir().afd_transicoes)
+
+if __name__ == '__main__':
+    unittest.main()
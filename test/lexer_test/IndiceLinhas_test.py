@@ -0,0 +1,78 @@
+import random
+import unittest
+
+from src.lexer.lexer import LexerCoral
+from src.lexer.IndiceLinhas import IndiceLinhas, IndiceLinhasBytes
+
+def linha_coluna_manual(codigo, posicao):
+    """Linha e coluna contando caractere a caractere (como o antigo BufferLeitura.avancar)."""
+    linha, coluna = 1, 1
+    for caractere in codigo[:posicao]:
+        if caractere == '\n':
+            linha, coluna = linha + 1, 1
+        else:
+            coluna += 1
+    return linha, coluna
+
+class TestIndiceLinhas(unittest.TestCase):
+    """Testes do índice de inícios de linha (posição -> linha/coluna)."""
+    
+    def test_linha_coluna(self):
+        """Testa todas as posições, incluindo o fim e quebras '\\r\\n' e '\\r'."""
+        for codigo in ["", "abc", "a\nbc\n", "\n\n", "x\r\ny\rz\n\nw"]:
+            indice = IndiceLinhas(codigo)
+            for posicao in range(len(codigo) + 1):
+                self.assertEqual(indice.linha_coluna(posicao), linha_coluna_manual(codigo, posicao))
+                self.assertEqual(indice.linha(posicao), linha_coluna_manual(codigo, posicao)[0])
+                self.assertEqual(indice.coluna(posicao), linha_coluna_manual(codigo, posicao)[1])
+    
+    def test_construcao_sob_demanda(self):
+        """Testa que o índice só é construído quando uma posição é consultada."""
+        analisador = LexerCoral.analisar_string("SE a:\n    b = 1\n")
+        tokens = analisador.tokenizar_tudo()
+        indice = analisador.buffer_leitura.indice_linhas
+        self.assertIsNone(indice.inicios)
+        self.assertEqual((tokens[-3].tipo, tokens[-3].linha, tokens[-3].coluna), ("NEWLINE", 2, 10))
+        self.assertIsNotNone(indice.inicios)
+    
+    def test_editar(self):
+        """Testa que editar equivale a reconstruir o índice do código editado."""
+        rnd = random.Random(3)
+        codigo = "a = 1\nSE a:\n\n    b\n" * 5
+        indice = IndiceLinhas(codigo)
+        indice.linha(0)
+        for _ in range(300):
+            inicio = rnd.randint(0, len(codigo))
+            fim = min(len(codigo), inicio + rnd.randint(0, 8))
+            texto = rnd.choice(["", "x", "\n", "ab\ncd\n", "\n\n"])
+            codigo = codigo[:inicio] + texto + codigo[fim:]
+            indice.editar(inicio, fim, texto, codigo)
+            esperado = IndiceLinhas(codigo)
+            esperado.linha(0)
+            self.assertEqual(indice.inicios, esperado.inicios)
+    
+    def test_editar_bytes(self):
+        """Testa editar sobre bytes UTF-8, com posições em bytes."""
+        rnd = random.Random(5)
+        codigo = "ação = 1\nSE é:\n\n    b\n".encode('utf-8') * 5
+        indice = IndiceLinhasBytes(codigo)
+        indice.linha(0)
+        for _ in range(300):
+            inicio = rnd.randint(0, len(codigo))
+            fim = min(len(codigo), inicio + rnd.randint(0, 8))
+            texto = rnd.choice(["", "x", "\n", "ç\nã\n", "\n\n"]).encode('utf-8')
+            codigo = codigo[:inicio] + texto + codigo[fim:]
+            indice.editar(inicio, fim, texto, codigo)
+            esperado = IndiceLinhasBytes(codigo)
+            esperado.linha(0)
+            self.assertEqual(indice.inicios, esperado.inicios)
+    
+    def test_posicao_em_mensagem_de_erro(self):
+        """Testa linha e coluna de um erro após uma string longa de várias linhas."""
+        codigo = 'x = """' + "a" * 10000 + '\n' * 3 + '"""\ny = @\n'
+        with self.assertRaises(ValueError) as contexto:
+            LexerCoral.analisar_string(codigo).tokenizar_tudo()
+        self.assertIn("linha 5, coluna 5", str(contexto.exception))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import random
+import unittest
+
+from src.lexer.lexer import LexerCoral
+from src.lexer.LexerIncremental import LexerIncremental
+
+BLOCO = '''FUNCAO soma(a, b):
+    SE a > b:  # comentário
+        RETORNAR (a +
+                  b)
+    RETORNAR a - b
+texto = """linha 1
+linha 2"""
+x = soma(1, 2.5)
+
+'''
+
+def resumo(tokens):
+    return [(t.lexema, t.tipo, t.linha, t.coluna, t.posicao) for t in tokens]
+
+def tokens_completos(codigo):
+    return resumo(LexerCoral.analisar_string(codigo).tokenizar_tudo())
+
+class TestLexerIncremental(unittest.TestCase):
+    """Testes da análise léxica incremental (LexerIncremental.editar)."""
+    
+    def assertEdicao(self, incremental, inicio, fim, texto):
+        esperado = incremental.codigo_fonte[:inicio] + texto + incremental.codigo_fonte[fim:]
+        tokens = incremental.editar(inicio, fim, texto)
+        self.assertEqual(incremental.codigo_fonte, esperado)
+        self.assertEqual(resumo(tokens), tokens_completos(esperado))
+    
+    def test_analise_inicial(self):
+        """Testa que os tokens iniciais equivalem à análise completa."""
+        self.assertEqual(resumo(LexerIncremental(BLOCO).tokens), tokens_completos(BLOCO))
+    
+    def test_edicoes_aleatorias(self):
+        """Testa edições aleatórias contra a re-análise completa."""
+        rnd = random.Random(7)
+        pedacos = ['\n', '    ', '(', ')', 'y', ' = 1\n', '"""', '#c\n', 'SE a:\n    b\n', '\t', '\r\n', '']
+        for _ in range(150):
+            incremental = LexerIncremental(BLOCO * 3)
+            for _ in range(4):
+                tamanho = len(incremental.codigo_fonte)
+                inicio = rnd.randint(0, tamanho)
+                fim = min(tamanho, inicio + rnd.choice([0, 1, 5]))
+                texto = ''.join(rnd.choice(pedacos) for _ in range(rnd.randint(0, 2)))
+                try:
+                    tokens_completos(incremental.codigo_fonte[:inicio] + texto + incremental.codigo_fonte[fim:])
+                except ValueError:
+                    continue
+                self.assertEdicao(incremental, inicio, fim, texto)
+    
+    def test_edicao_local_reanalisa_pouco(self):
+        """Testa que uma edição em uma linha re-analisa só a vizinhança dela."""
+        codigo = BLOCO * 500
+        incremental = LexerIncremental(codigo)
+        total = incremental.tokens_relexados
+        
+        meio = codigo.index("x = soma", len(codigo) // 2)
+        self.assertEdicao(incremental, meio, meio + 1, "contador")
+        self.assertLess(incremental.tokens_relexados, 20)
+        
+        # Mudança de indentação converge no fim do bloco
+        inicio_bloco = codigo.index("FUNCAO", len(codigo) // 2)
+        self.assertEdicao(incremental, inicio_bloco, inicio_bloco, "SE a:\n    ")
+        self.assertLess(incremental.tokens_relexados, 60)
+        self.assertGreater(total, 100 * incremental.tokens_relexados)
+    
+    def test_estado_propagado_ate_o_fim(self):
+        """Testa que um parêntese aberto muda o estado de todas as linhas seguintes."""
+        incremental = LexerIncremental(BLOCO * 3)
+        total = incremental.tokens_relexados
+        self.assertEdicao(incremental, 0, 0, "y = (\n")
+        # Dentro dos parênteses as quebras de linha não geram NEWLINE
+        self.assertGreater(incremental.tokens_relexados, total // 2)
+        self.assertEdicao(incremental, 0, 6, "")
+        self.assertEqual(resumo(incremental.tokens), tokens_completos(BLOCO * 3))
+    
+    def test_erro_mantem_estado(self):
+        """Testa que um erro léxico na edição não altera o estado anterior."""
+        incremental = LexerIncremental(BLOCO)
+        tokens = incremental.tokens
+        with self.assertRaises(ValueError):
+            incremental.editar(0, 0, "@")
+        self.assertIs(incremental.tokens, tokens)
+        self.assertEqual(incremental.codigo_fonte, BLOCO)
+        self.assertEqual(resumo(tokens), tokens_completos(BLOCO))
+        self.assertEdicao(incremental, 0, 0, "y = 2\n")
+    
+    def test_intervalo_invalido(self):
+        """Testa que intervalos fora do código fonte são rejeitados."""
+        incremental = LexerIncremental("x = 1\n")
+        with self.assertRaises(ValueError):
+            incremental.editar(3, 2, "")
+        with self.assertRaises(ValueError):
+            incremental.editar(0, 100, "")
+    
+    def test_codigo_vazio(self):
+        """Testa edições a partir de um código vazio e até esvaziá-lo."""
+        incremental = LexerIncremental("")
+        self.assertEdicao(incremental, 0, 0, "")
+        self.assertEdicao(incremental, 0, 0, "SE a:\n    b\n")
+        self.assertEdicao(incremental, 0, len(incremental.codigo_fonte), "")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+from src.lexer.lexer import LexerCoral
+from src.lexer.LexerParalelo import analisar_paralelo, dividir_em_trechos
+
+BLOCO = '''# bloco
+FUNCAO soma(a, b):
+    SE a > b:
+        RETORNAR (a +
+b)
+    RETORNAR a - b
+x = soma(1, 2.5)
+
+'''
+
+def resumo(tokens):
+    return [(t.lexema, t.tipo, t.linha, t.coluna, t.posicao) for t in tokens]
+
+class TestLexerParalelo(unittest.TestCase):
+    """Testes da análise léxica paralela (trechos em um pool de processos)."""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.executor = ProcessPoolExecutor(max_workers=2)
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.shutdown()
+    
+    def paralelo(self, codigo):
+        # Muitos trechos pequenos: quase toda linha elegível vira fronteira
+        return analisar_paralelo(codigo, processos=64, executor=self.executor, tamanho_minimo_trecho=16)
+    
+    def assertIdentico(self, codigo):
+        sequencial = LexerCoral.analisar_string(codigo).tokenizar_em_colunas()
+        self.assertEqual(resumo(self.paralelo(codigo)), resumo(sequencial))
+    
+    def test_fronteiras_em_indentacao_zero(self):
+        """Testa que as fronteiras caem em linhas de código com indentação 0."""
+        codigo = BLOCO * 20
+        inicios = dividir_em_trechos(codigo, 8)
+        self.assertGreater(len(inicios), 1)
+        for inicio in inicios[1:]:
+            self.assertEqual(codigo[inicio - 1], '\n')
+            self.assertNotIn(codigo[inicio], ' \t\r\n#')
+    
+    def test_identico_ao_sequencial(self):
+        """Testa tokens, posições e INDENTA/DEDENTA idênticos à análise sequencial."""
+        self.assertIdentico(BLOCO * 20)
+        self.assertIdentico("SE a:\n    SE b:\n        c\nd\n" * 30)
+    
+    def test_fronteiras_invalidas(self):
+        """Testa trechos que terminam dentro de parênteses, strings ou após comentário."""
+        self.assertIdentico(BLOCO * 5 + 's = """\nlinha em coluna 0\n"""\n' + BLOCO * 5)
+        self.assertIdentico(BLOCO * 5 + 'x = [\n1,\n2\n]\n' + BLOCO * 5)
+        self.assertIdentico(BLOCO * 5 + 'y = 1  # comentário\nz = 2\n' + BLOCO * 5)
+        self.assertIdentico(BLOCO * 5 + 'w = "a\\\nb"\n' + BLOCO * 5)
+    
+    def test_erro_lexico(self):
+        """Testa que erros léxicos têm a mesma mensagem da análise sequencial."""
+        codigo = BLOCO * 10 + "x = @\n" + BLOCO * 10
+        with self.assertRaises(ValueError) as esperado:
+            LexerCoral.analisar_string(codigo).tokenizar_tudo()
+        with self.assertRaises(ValueError) as obtido:
+            self.paralelo(codigo)
+        self.assertEqual(str(obtido.exception), str(esperado.exception))
+    
+    def test_codigo_pequeno_sequencial(self):
+        """Testa que códigos menores que um trecho são analisados sem o pool."""
+        self.assertEqual(resumo(LexerCoral.analisar_paralelo(BLOCO, processos=2)),
+                         resumo(LexerCoral.analisar_string(BLOCO).tokenizar_tudo()))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+
+from src.lexer.lexer import LexerCoral
+
+CODIGO = '''FUNCAO soma(a, b):
+    SE a > b:
+        RETORNAR (a +
+                  b)  # comentário
+    RETORNAR a - b
+x = soma(1, 2.5)
+'''
+
+def resumo(tokens):
+    return [(t.lexema, t.tipo, t.linha, t.coluna, t.posicao) for t in tokens]
+
+class AFDContador:
+    """Envolve um AFD contando as chamadas a match."""
+    
+    def __init__(self, afd):
+        self.afd = afd
+        self.chamadas = 0
+    
+    def match(self, entrada, inicio=0):
+        self.chamadas += 1
+        return self.afd.match(entrada, inicio)
+
+class TestLookahead(unittest.TestCase):
+    """Testes do buffer de lookahead de peekNextToken."""
+    
+    def setUp(self):
+        self.esperado = resumo(LexerCoral.analisar_string(CODIGO).tokenizar_tudo())
+    
+    def test_peek_k_nao_altera_sequencia(self):
+        """Testa que espiar k tokens antes de cada consumo não altera os tokens emitidos."""
+        for k in (1, 2, 3, 8):
+            analisador = LexerCoral.analisar_string(CODIGO)
+            tokens = []
+            while True:
+                espiados = [analisador.peekNextToken(i) for i in range(1, k + 1)]
+                token = analisador.getNextToken()
+                self.assertIs(token, espiados[0])
+                tokens.append(token)
+                if token.tipo == "EOF":
+                    break
+            self.assertEqual(resumo(tokens), self.esperado, f"k={k}")
+    
+    def test_peek_parentese_preserva_estado(self):
+        """Testa que espiar através de '(' não altera parênteses nem indentação."""
+        analisador = LexerCoral.analisar_string(CODIGO)
+        consumidos = []
+        while analisador.peekNextToken().lexema != "(":
+            consumidos.append(analisador.getNextToken())
+        # Espia até depois do ')' da linha continuada
+        self.assertEqual(analisador.peekNextToken(5).lexema, ")")
+        self.assertEqual(analisador.nivel_parenteses, 0)
+        consumidos += analisador.tokenizar_tudo()
+        self.assertEqual(resumo(consumidos), self.esperado)
+    
+    def test_peek_nao_reprocessa_tokens(self):
+        """Testa que peek seguido de get reconhece cada token uma única vez."""
+        analisador = LexerCoral.analisar_string(CODIGO)
+        contador = AFDContador(analisador.afd)
+        analisador.afd = contador
+        analisador.tokenizar_tudo()
+        sem_peek = contador.chamadas
+        
+        analisador = LexerCoral.analisar_string(CODIGO)
+        contador = AFDContador(analisador.afd)
+        analisador.afd = contador
+        while True:
+            analisador.peekNextToken(2)
+            analisador.peekNextToken()
+            if analisador.getNextToken().tipo == "EOF":
+                break
+        self.assertEqual(contador.chamadas, sem_peek)
+    
+    def test_peek_alem_do_eof(self):
+        """Testa que espiar além do fim retorna EOF."""
+        analisador = LexerCoral.analisar_string("x = 1\n")
+        total = len(LexerCoral.analisar_string("x = 1\n").tokenizar_tudo())
+        self.assertEqual(analisador.peekNextToken(total + 3).tipo, "EOF")
+        tokens = list(analisador)
+        self.assertEqual(resumo(tokens), resumo(LexerCoral.analisar_string("x = 1\n").tokenizar_tudo()))
+    
+    def test_iteracao_apos_peek(self):
+        """Testa que a iteração devolve primeiro os tokens já espiados."""
+        analisador = LexerCoral.analisar_string(CODIGO)
+        analisador.getNextToken()
+        analisador.peekNextToken(4)
+        self.assertEqual(resumo(list(analisador)), self.esperado[1:])
+
+if __name__ == '__main__':
+    unittest.main()
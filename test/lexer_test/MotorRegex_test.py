@@ -0,0 +1,83 @@
+import glob
+import os
+import unittest
+
+from src.lexer.lexer import LexerCoral
+from src.lexer.AFD import get_afd, AFDRegex
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+# Corpus diferencial: programas de exemplo + trechos com casos de borda
+ARQUIVOS = sorted(glob.glob(os.path.join(RAIZ, "exemplos", "**", "*.crl"), recursive=True))
+
+TRECHOS = [
+    'msg = f"Olá {nome}, \\"citação\\""\noutra = f\'x {y}\'',
+    'bloco = """linha 1\nlinha 2"""\nfb = f"""a {b}\nc"""',
+    'aberta = """sem fechamento',
+    "s = 'quebra\nno meio'",
+    "valores = [1, 2.5, 0.75, 10]\nx = 3.\n",
+    "erro = 12abc",
+    "decimal_invalido = 1.5x",
+    "ponto = obj.atributo.metodo()\nmeio = .5",
+    "VERDADEIRO = VERDADE E FALSO OU NAO Eu",
+    "x += 1\ny -= 2\nz *= 3\nw /= 4\nv %= 5\nk = a ** b // c\nd = a != b <= c >= e == f",
+    "çaí = 1\nação_2 = çaí * 2",
+    "x² = 1",
+    "# só comentário",
+    "SE x:\n    y = 1\n\tz = 2\n",
+    "lista = [\n    1,\n    2\n]\n",
+    "x = 1\r\ny = 2\r\n",
+    "x = 1 @ 2",
+]
+
+def tokens_ou_erro(codigo, motor):
+    """Tokeniza o código inteiro; retorna a lista de tokens ou a mensagem de erro."""
+    analisador = LexerCoral.analisar_string(codigo, motor=motor)
+    tokens = []
+    try:
+        while True:
+            token = analisador.getNextToken()
+            tokens.append((token.lexema, token.tipo, token.linha, token.coluna, token.posicao))
+            if token.tipo == "EOF":
+                return tokens
+    except ValueError as e:
+        return tokens, str(e)
+
+class TestMotorRegex(unittest.TestCase):
+    """Teste diferencial: o motor regex deve emitir os mesmos tokens que o AFDUnificado."""
+    
+    def test_get_afd_regex(self):
+        """Testa a seleção do motor regex."""
+        self.assertIsInstance(get_afd('regex'), AFDRegex)
+    
+    def test_exemplos_identicos(self):
+        """Testa os programas de exemplos/ nos dois motores."""
+        self.assertTrue(ARQUIVOS)
+        for arquivo in ARQUIVOS:
+            with open(arquivo, 'r', encoding='utf-8') as f:
+                codigo = f.read()
+            with self.subTest(arquivo=os.path.relpath(arquivo, RAIZ)):
+                self.assertEqual(tokens_ou_erro(codigo, 'regex'), tokens_ou_erro(codigo, 'dicionario'))
+    
+    def test_trechos_identicos(self):
+        """Testa trechos com casos de borda nos dois motores."""
+        for codigo in TRECHOS:
+            with self.subTest(codigo=codigo):
+                self.assertEqual(tokens_ou_erro(codigo, 'regex'), tokens_ou_erro(codigo, 'dicionario'))
+    
+    def test_match_em_toda_posicao(self):
+        """Testa match() em todas as posições dos trechos."""
+        regex = get_afd('regex')
+        dicionario = get_afd('dicionario')
+        for codigo in TRECHOS:
+            for inicio in range(len(codigo) + 1):
+                with self.subTest(codigo=codigo, inicio=inicio):
+                    self.assertEqual(regex.match(codigo, inicio), dicionario.match(codigo, inicio))
+    
+    def test_analisar_arquivo_com_motor(self):
+        """Testa a seleção do motor em LexerCoral.analisar_arquivo."""
+        analisador = LexerCoral.analisar_arquivo(ARQUIVOS[0], motor='regex')
+        self.assertEqual(type(analisador.afd).__name__, 'AFDRegex')
+
+if __name__ == '__main__':
+    unittest.main()
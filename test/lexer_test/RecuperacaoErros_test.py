@@ -0,0 +1,81 @@
+import io
+import os
+import tempfile
+import unittest
+
+from src.lexer.lexer import LexerCoral
+
+def tipos_e_erros(analisador):
+    """Tokeniza até EOF; retorna ([(lexema, tipo)], [(mensagem, linha, coluna)])."""
+    tokens = [(t.lexema, t.tipo) for t in analisador.tokenizar_tudo()]
+    return tokens, [(e.mensagem, e.linha, e.coluna) for e in analisador.erros]
+
+class TestRecuperacaoErros(unittest.TestCase):
+    """Testes do modo de recuperação de erros léxicos."""
+    
+    def test_sem_recuperacao_lanca_erro_lexico(self):
+        """Testa que, por padrão, o primeiro erro interrompe a análise com ErroLexico."""
+        with self.assertRaises(ValueError) as contexto:
+            LexerCoral.analisar_string("x = 1\ny = $ 2\n").tokenizar_tudo()
+        erro = contexto.exception
+        self.assertEqual(type(erro).__name__, "ErroLexico")
+        self.assertEqual(str(erro), "Token inválido na linha 2, coluna 5: '$'")
+        self.assertEqual((erro.linha, erro.coluna, erro.posicao, erro.lexema), (2, 5, 10, "$"))
+    
+    def test_todos_os_erros_em_uma_passada(self):
+        """Testa que todos os erros são registrados e os tokens válidos mantidos."""
+        analisador = LexerCoral.analisar_string("x = $ 1\ny = 2 ` 3\nz = 4\n", recuperar_erros=True)
+        tokens, erros = tipos_e_erros(analisador)
+        self.assertEqual(erros, [("Token inválido", 1, 5), ("Token inválido", 2, 7)])
+        self.assertEqual(
+            [lexema for lexema, _ in tokens],
+            ["x", "=", "1", "\\n", "y", "=", "2", "3", "\\n", "z", "=", "4", "\\n", ""]
+        )
+    
+    def test_trecho_invalido_gera_um_erro(self):
+        """Testa que caracteres inválidos consecutivos geram um único erro."""
+        analisador = LexerCoral.analisar_string("a = @@$ + b\n", recuperar_erros=True)
+        tokens, erros = tipos_e_erros(analisador)
+        self.assertEqual(erros, [("Token inválido", 1, 5)])
+        self.assertEqual([lexema for lexema, _ in tokens], ["a", "=", "+", "b", "\\n", ""])
+    
+    def test_string_sem_fechamento(self):
+        """Testa que uma string sem fechamento descarta apenas o resto da linha."""
+        analisador = LexerCoral.analisar_string('a = "abc $ def\nb = 1\n', recuperar_erros=True)
+        tokens, erros = tipos_e_erros(analisador)
+        self.assertEqual(len(erros), 1)
+        self.assertEqual([lexema for lexema, _ in tokens], ["a", "=", "\\n", "b", "=", "1", "\\n", ""])
+    
+    def test_indentacao_inconsistente(self):
+        """Testa que a indentação inconsistente é registrada e a análise continua."""
+        codigo = "SE x:\n        y = 1\n    z = 2\nw = $\n"
+        analisador = LexerCoral.analisar_string(codigo, recuperar_erros=True)
+        _, erros = tipos_e_erros(analisador)
+        self.assertEqual(erros, [("Indentação inconsistente", 3, 1), ("Token inválido", 4, 5)])
+    
+    def test_leituras_em_blocos_e_mmap(self):
+        """Testa que a leitura em blocos e a mapeada em memória registram os mesmos erros."""
+        codigo = "ação = € 1\nx = $\ny = 'ok' ` 2\n"
+        esperado = tipos_e_erros(LexerCoral.analisar_string(codigo, recuperar_erros=True))
+        self.assertEqual(len(esperado[1]), 3)
+        
+        fluxo = LexerCoral.analisar_fluxo(io.StringIO(codigo), tamanho_bloco=3, recuperar_erros=True)
+        self.assertEqual(tipos_e_erros(fluxo), esperado)
+        
+        with tempfile.NamedTemporaryFile('wb', suffix='.crl', delete=False) as f:
+            f.write(codigo.encode('utf-8'))
+        try:
+            with LexerCoral.analisar_arquivo(f.name, mmap=True, recuperar_erros=True) as analisador:
+                self.assertEqual(tipos_e_erros(analisador), esperado)
+        finally:
+            os.remove(f.name)
+    
+    def test_muitos_erros(self):
+        """Testa um arquivo com muitos erros consecutivos (sem recursão)."""
+        analisador = LexerCoral.analisar_string("$ " * 5000 + "\nx = 1\n", recuperar_erros=True)
+        tokens, erros = tipos_e_erros(analisador)
+        self.assertEqual(len(erros), 5000)
+        self.assertEqual([lexema for lexema, _ in tokens], ["\\n", "x", "=", "1", "\\n", ""])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import inspect
+import os
+import tempfile
+import types
+import unittest
+from unittest import mock
+
+from src.lexer.AFN.AFNCoralUnificado import AFNCoralUnificado
+from src.lexer.AFD.AFDUnificado import AFDUnificado
+from src.lexer.AFD.AFDGerado import AFDGerado
+from src.lexer.afn_to_afd import ConversorAFNparaAFD
+from src.lexer import AFD
+from src.lexer import cache_afd, gerador_scanner
+from src.lexer.cache_afd import chave_scanner
+
+class TestScannerGerado(unittest.TestCase):
+    """Testes do scanner especializado gerado a partir do AFN."""
+    
+    ENTRADAS = [
+        "x = 10\ny = 3.14\nz = 12abc",
+        "SE idade >= 18:\n    imprima(\"maior\")\nSENAO:\n    PASSAR",
+        "resultado = (a + b) * c ** 2 % 3 // 4",
+        "aprovado = nota >= 7.5 E presenca >= 75 OU NAO reprovado",
+        "ativo = VERDADE\ninativo = FALSO\nVERDADEIRO = 1",
+        "# comentário\nvalor = 'texto' # fim",
+        'msg = f"Olá {nome}"\nbloco = """linha\noutra"""\nfb = f"""a\nb"""',
+        "s = 'aberta\nt = \"esc\\\"ape\"",
+        "lista = [1, 2, 3]; dic = {a: 1}\nx += 1\ny -= 2\nz != w",
+        "çaí = 1\n.5 @ $ ~ \t\x0b",
+    ]
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.modulo = types.ModuleType("scanner_teste")
+        exec(gerador_scanner.gerar_codigo(), cls.modulo.__dict__)
+        conversor_afd = ConversorAFNparaAFD(AFNCoralUnificado())
+        conversor_afd.construir_subconjuntos()
+        cls.afd = AFDUnificado(conversor_afd)
+    
+    def test_scan_equivalente(self):
+        """Testa que scan() reconhece os mesmos tokens que AFDUnificado.match em toda posição."""
+        for entrada in self.ENTRADAS:
+            for inicio in range(len(entrada) + 1):
+                with self.subTest(entrada=entrada, inicio=inicio):
+                    self.assertEqual(self.modulo.scan(entrada, inicio), self.afd.match(entrada, inicio))
+    
+    def test_afd_compilado_equivalente(self):
+        """Testa que o AFD compilado em código equivale ao percurso da tabela."""
+        for entrada in self.ENTRADAS:
+            for inicio in range(len(entrada)):
+                with self.subTest(entrada=entrada, inicio=inicio):
+                    self.assertEqual(
+                        self.modulo._casar_afd(entrada, inicio),
+                        self.afd._casar_tabela(entrada, inicio)
+                    )
+    
+    def test_chave_atual(self):
+        """Testa que o código gerado carrega a chave do AFN atual."""
+        self.assertEqual(self.modulo.CHAVE, chave_scanner(AFNCoralUnificado(), AFDUnificado))
+    
+    def test_classes_do_afn(self):
+        """Testa que as classes de caractere do scanner vêm do alfabeto do AFN."""
+        alfabeto = AFNCoralUnificado().simbolos()
+        for c in [chr(codigo) for codigo in range(128)] + list("çÉ٣\u2003€"):
+            with self.subTest(c=c):
+                tipo = AFDUnificado._get_tipo_caractere(c)
+                self.assertEqual(self.modulo._classe(c), tipo if tipo in alfabeto else None)
+    
+    def test_chave_cobre_classes(self):
+        """Testa que a chave muda quando a classificação dos caracteres muda."""
+        chave = chave_scanner(AFNCoralUnificado(), AFDUnificado)
+        with mock.patch.object(AFDUnificado, '_get_tipo_caractere', staticmethod(lambda char: 'outro')):
+            self.assertNotEqual(chave_scanner(AFNCoralUnificado(), AFDUnificado), chave)
+    
+    def test_chave_cobre_codigo_fonte(self):
+        """Testa que a chave muda quando o modelo do gerador ou os caminhos rápidos mudam."""
+        chave = chave_scanner(AFNCoralUnificado(), AFDUnificado)
+        with tempfile.NamedTemporaryFile('w', suffix='.py', delete=False, encoding='utf-8') as f:
+            f.write(inspect.getsource(gerador_scanner).replace("if pos >= fim:", "if pos > fim:"))
+        try:
+            with mock.patch.object(cache_afd, '_GERADOR_SCANNER', f.name):
+                self.assertNotEqual(chave_scanner(AFNCoralUnificado(), AFDUnificado), chave)
+        finally:
+            os.remove(f.name)
+        
+        fonte = inspect.getsource(inspect.getmodule(AFDUnificado))
+        with mock.patch.object(inspect, 'getsource', lambda objeto: fonte + "\n# alterado\n"):
+            self.assertNotEqual(chave_scanner(AFNCoralUnificado(), AFDUnificado), chave)
+    
+    def test_scanner_atualizado_usado(self):
+        """Testa que o scanner gerado é usado quando a chave coincide."""
+        with mock.patch.object(AFD, 'scanner_gerado', self.modulo, create=True):
+            afd = AFD._carregar_scanner_gerado()
+        self.assertIsInstance(afd, AFDGerado)
+        self.assertIs(afd.match, self.modulo.scan)
+    
+    def test_scanner_desatualizado_ignorado(self):
+        """Testa que um scanner gerado com chave antiga não é usado."""
+        desatualizado = types.ModuleType("scanner_teste")
+        desatualizado.CHAVE = "v0-antiga"
+        desatualizado.scan = self.modulo.scan
+        with mock.patch.object(AFD, 'scanner_gerado', desatualizado, create=True):
+            self.assertIsNone(AFD._carregar_scanner_gerado())
+
+if __name__ == '__main__':
+    unittest.main()
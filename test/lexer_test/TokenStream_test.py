@@ -0,0 +1,87 @@
+import contextlib
+import glob
+import io
+import os
+import unittest
+
+from src.lexer.lexer import LexerCoral
+from src.lexer.TokenStream import TokenStream
+from src.parser.parser import ParserCoral, ErroSintatico, exibir_ast
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+def resumo(tokens):
+    return [(t.lexema, t.tipo, t.linha, t.coluna, t.posicao) for t in tokens]
+
+def exemplos_validos():
+    """Exemplos de exemplos/parser que o lexer aceita."""
+    for arquivo in sorted(glob.glob(os.path.join(RAIZ, "exemplos", "parser", "*.crl"))):
+        with open(arquivo, 'r', encoding='utf-8') as f:
+            yield arquivo, f.read()
+
+class TestTokenStream(unittest.TestCase):
+    """Testes do armazenamento colunar de tokens."""
+    
+    def test_equivale_a_lista_de_tokens(self):
+        """Testa que o TokenStream expõe os mesmos tokens que tokenizar_tudo."""
+        for arquivo, codigo in exemplos_validos():
+            with self.subTest(arquivo=os.path.basename(arquivo)):
+                esperado = resumo(LexerCoral.analisar_string(codigo).tokenizar_tudo())
+                fluxo = LexerCoral.analisar_string(codigo).tokenizar_em_colunas()
+                self.assertEqual(len(fluxo), len(esperado))
+                self.assertEqual(resumo(fluxo), esperado)
+    
+    def test_parser_compativel(self):
+        """Testa que o ParserCoral gera a mesma AST a partir do TokenStream."""
+        for arquivo, codigo in exemplos_validos():
+            with self.subTest(arquivo=os.path.basename(arquivo)):
+                saidas = []
+                for tokens in (LexerCoral.analisar_string(codigo).tokenizar_tudo(),
+                               LexerCoral.analisar_string(codigo).tokenizar_em_colunas()):
+                    saida = io.StringIO()
+                    try:
+                        with contextlib.redirect_stdout(saida):
+                            exibir_ast(ParserCoral(tokens).parse())
+                    except ErroSintatico as e:
+                        saida.write(e.formatar_mensagem())
+                    saidas.append(saida.getvalue())
+                self.assertEqual(saidas[0], saidas[1])
+    
+    def test_lexema_sob_demanda(self):
+        """Testa que os lexemas são fatiados do código fonte e os fixos não dependem dele."""
+        codigo = 'x = "texto"\r\nSE x:\r\n    y = 1\r\n'
+        fluxo = LexerCoral.analisar_string(codigo).tokenizar_em_colunas()
+        self.assertIs(fluxo.codigo_fonte, codigo)
+        self.assertEqual(fluxo[2].lexema, '"texto"')
+        self.assertEqual([t.lexema for t in fluxo if t.tipo == "NEWLINE"], ["\\n"] * 3)
+        self.assertEqual(fluxo[-1].tipo, "EOF")
+        self.assertEqual(type(fluxo[0]).__name__, "TokenView")
+        with self.assertRaises(IndexError):
+            fluxo[len(fluxo)]
+    
+    def test_indentacao_na_coluna(self):
+        """Testa que INDENTA/DEDENTA preservam o nível de indentação na coluna."""
+        codigo = "SE x:\n        y = 1\nz = 2\n"
+        esperado = resumo(LexerCoral.analisar_string(codigo).tokenizar_tudo())
+        self.assertEqual(resumo(LexerCoral.analisar_string(codigo).tokenizar_em_colunas()), esperado)
+    
+    def test_memoria_compacta(self):
+        """Testa que cada token ocupa poucos bytes nas colunas."""
+        codigo = "x = 1\n" * 1000
+        fluxo = LexerCoral.analisar_string(codigo).tokenizar_em_colunas()
+        self.assertLessEqual(fluxo.memoria() / len(fluxo), 32)
+    
+    def test_streaming_nao_suportado(self):
+        """Testa que o modo em blocos não gera TokenStream (não há código fonte completo)."""
+        with self.assertRaises(ValueError):
+            LexerCoral.analisar_fluxo(io.StringIO("x = 1")).tokenizar_em_colunas()
+    
+    def test_adicionar(self):
+        """Testa a construção manual do TokenStream."""
+        fluxo = TokenStream("abc = 10")
+        fluxo.adicionar("IDENTIFICADOR", 0, 3, 1, 1)
+        fluxo.adicionar("INTEIRO", 6, 8, 1, 7)
+        self.assertEqual(resumo(fluxo), [("abc", "IDENTIFICADOR", 1, 1, 0), ("10", "INTEIRO", 1, 7, 6)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+"""
+Utilitários compartilhados pelos testes do parser (importados como
+parser_test.conftest).
+"""
+import glob
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from src.lexer.lexer import LexerCoral
+from src.parser.parser import ParserCoral
+from src.parser.ast_nodes import ASTNode
+
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+
+# Programa que usa todos os tipos de valor guardados na AST (nós, listas,
+# tuplas de blocos_senaose, tokens de operadores e constantes)
+CODIGO = """
+FUNCAO soma(a: inteiro, b = 2.5) -> inteiro:
+    RETORNAR -a + b ** 2
+SE x >= 1 E NAO y:
+    lista = [1, -0.0, 0.0, "olá", f"{x}", VAZIO, VERDADE]
+SENAOSE x:
+    obj.campo[0] += f(1, g())
+SENAO:
+    PASSAR
+"""
+
+# Exemplos (relativos a exemplos/) que não são programas válidos, com o erro
+# esperado: os exemplos do lexer cobrem apenas tokens e ola_mundo.crl
+# demonstra uma mensagem de erro
+EXEMPLOS_INVALIDOS = {
+    'lexer/delimitadores.crl': 'ErroSintatico',
+    'lexer/numeros_operacoes.crl': 'ErroSintatico',
+    'lexer/ola_mundo_errado.crl': 'ErroLexico',
+    'lexer/operadores_logicos.crl': 'ErroSintatico',
+    'lexer/operadores_relacionais.crl': 'ErroSintatico',
+    'lexer/tokens_invalidos.crl': 'ErroLexico',
+    'parser/ola_mundo.crl': 'ErroSintatico',
+}
+
+EXEMPLOS = sorted(
+    os.path.relpath(caminho, os.path.join(RAIZ, "exemplos")).replace(os.sep, '/')
+    for caminho in glob.glob(os.path.join(RAIZ, "exemplos", "*", "*.crl"))
+)
+EXEMPLOS_VALIDOS = [exemplo for exemplo in EXEMPLOS if exemplo not in EXEMPLOS_INVALIDOS]
+
+
+def analisar(codigo):
+    """Helper para fazer lex + parse."""
+    return ParserCoral(LexerCoral.analisar_string(codigo).tokenizar_tudo()).parse()
+
+
+def analisar_exemplo(exemplo):
+    """Helper para fazer lex + parse de um arquivo de exemplos/."""
+    return ParserCoral(LexerCoral.analisar_arquivo(os.path.join(RAIZ, "exemplos", exemplo))).parse()
+
+
+def estrutura(valor):
+    """Converte a AST em tuplas comparáveis, incluindo posições e tokens."""
+    if isinstance(valor, list):
+        return [estrutura(item) for item in valor]
+    if isinstance(valor, tuple):
+        return ('tupla',) + tuple(estrutura(item) for item in valor)
+    if isinstance(valor, ASTNode):
+        campos = tuple(estrutura(getattr(valor, campo)) for campo in type(valor).CAMPOS)
+        return (type(valor).__name__, valor.loc) + campos
+    if hasattr(valor, 'lexema'):
+        return ('token', valor.lexema, valor.tipo, valor.linha, valor.coluna, valor.posicao)
+    return (type(valor).__name__, repr(valor))
@@ -0,0 +1,81 @@
+"""
+Testes da representação da AST em arena (arrays paralelos).
+"""
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from src.parser.arena import ArenaAST, CLASSES
+from src.parser.ast_nodes import *
+from parser_test.conftest import CODIGO, analisar
+
+
+class TestConversao:
+    """Testes do layout da arena construída a partir da AST de objetos."""
+    
+    def test_pre_ordem(self):
+        """Testa que os nós ficam em pré-ordem, com a raiz no índice 0."""
+        arena = ArenaAST.de_ast(analisar("x = a + 1\ny = b\n"))
+        nomes = [arena.classe(i).__name__ for i in range(len(arena))]
+        assert nomes == [
+            'ProgramaNode', 'AtribuicaoNode', 'IdentificadorNode', 'ExpressaoBinariaNode',
+            'IdentificadorNode', 'LiteralNode', 'AtribuicaoNode', 'IdentificadorNode', 'IdentificadorNode',
+        ]
+    
+    def test_constantes_compartilhadas(self):
+        """Testa que constantes repetidas são guardadas uma vez, sem confundir 0, 0.0 e FALSO."""
+        arena = ArenaAST.de_ast(analisar("x = x + x\ny = [0.0, 0, FALSO, 0]\n"))
+        assert arena.constantes.count('x') == 1
+        assert sorted(repr(c) for c in arena.constantes if c == 0) == ['0', '0.0', 'False']
+
+
+class TestIteracao:
+    """Testes do acesso aos nós sem reconstruir a AST de objetos."""
+    
+    def test_nos_por_classe(self):
+        """Testa a iteração filtrada por classe, em pré-ordem."""
+        arena = ArenaAST.de_ast(analisar(CODIGO))
+        literais = [no.valor for no in arena.nos(LiteralNode) if no.tipo == 'STRING']
+        assert literais == ["olá", "{x}"]
+        assert [no.nome for no in arena.nos(FuncaoNode, ClasseNode)] == ['soma']
+        assert len(list(arena.nos())) == len(arena) == sum(arena.contar().values())
+    
+    def test_campos_da_visao(self):
+        """Testa que a visão expõe os campos, a posição e os filhos do nó."""
+        arena = ArenaAST.de_ast(analisar(CODIGO))
+        funcao = next(arena.nos(FuncaoNode))
+        assert funcao.classe is FuncaoNode
+        assert (funcao.linha, funcao.coluna) == (2, 1)
+        assert [p.nome for p in funcao.parametros] == ['a', 'b']
+        assert funcao.parametros[1].valor_padrao.valor == 2.5
+        assert funcao.tipo_retorno == 'inteiro'
+        binaria = funcao.bloco.declaracoes[0].expressao
+        assert binaria.operador.lexema == '+'
+        assert [f.classe for f in binaria.filhos()] == [ExpressaoUnariaNode, ExpressaoBinariaNode]
+        with pytest.raises(AttributeError):
+            funcao.inexistente
+    
+    def test_filhos_de_listas_e_tuplas(self):
+        """Testa que filhos em listas e tuplas (blocos_senaose) são incluídos na ordem."""
+        arena = ArenaAST.de_ast(analisar(CODIGO))
+        se = next(arena.nos(SeNode))
+        assert [f.classe.__name__ for f in se.filhos()] == [
+            'ExpressaoBinariaNode', 'BlocoNode', 'IdentificadorNode', 'BlocoNode', 'BlocoNode'
+        ]
+        assert se.filhos()[1] == arena.no(se.filhos()[1].indice)
+    
+    def test_classes(self):
+        """Testa que todas as classes de nós de ast_nodes são representáveis."""
+        assert ProgramaNode in CLASSES and IndexacaoNode in CLASSES
+        assert len(CLASSES) < 256
+
+
+class TestSerializacao:
+    """Testes da serialização da arena (a ida e volta é coberta por test_cache_ast)."""
+    
+    def test_arena_vazia(self):
+        """Testa a serialização de uma arena sem nós."""
+        arena = ArenaAST.de_bytes(ArenaAST().para_bytes())
+        assert len(arena) == 0 and arena.para_ast() is None
@@ -0,0 +1,72 @@
+"""
+Testes dos nós compactos da AST (__slots__ e posição empacotada).
+"""
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from src.lexer.lexer import LexerCoral
+from src.parser.parser import ParserCoral
+from src.parser import ast_nodes
+from src.parser.ast_nodes import *
+
+
+def tokenizar_codigo(codigo):
+    """Helper global para tokenizar código."""
+    return LexerCoral.analisar_string(codigo).tokenizar_tudo()
+
+
+def classes_de_nos():
+    """Retorna todas as classes de nós definidas em ast_nodes."""
+    return [c for c in vars(ast_nodes).values() if isinstance(c, type) and issubclass(c, ASTNode)]
+
+
+class TestNosCompactos:
+    """Testes da representação dos nós da AST."""
+    
+    def test_sem_dict(self):
+        """Testa que nenhum nó tem __dict__ por instância."""
+        for classe in classes_de_nos():
+            assert '__slots__' in classe.__dict__, classe.__name__
+        ast = ParserCoral(tokenizar_codigo("x = f(a.b[0], -1)\n")).parse()
+        no = ast.declaracoes[0].expressao
+        assert not hasattr(no, '__dict__')
+        with pytest.raises(AttributeError):
+            no.atributo_inexistente = 1
+    
+    def test_posicao_empacotada(self):
+        """Testa que linha e coluna são lidas e alteradas pela posição empacotada."""
+        no = IdentificadorNode("x", 70000, 123456)
+        assert (no.linha, no.coluna) == (70000, 123456)
+        assert no.loc == empacotar_posicao(70000, 123456)
+        assert desempacotar_posicao(no.loc) == (70000, 123456)
+        no.coluna = 5
+        assert (no.linha, no.coluna) == (70000, 5)
+        no.linha = None
+        assert (no.linha, no.coluna) == (None, 5)
+        assert (ProgramaNode([]).linha, ProgramaNode([]).coluna) == (None, None)
+    
+    def test_posicao_do_parser(self):
+        """Testa as posições dos nós criados pelo parser."""
+        ast = ParserCoral(tokenizar_codigo("x = 1\nSE x:\n    y = x + 2\n")).parse()
+        soma = ast.declaracoes[1].bloco_se.declaracoes[0].expressao
+        assert (ast.declaracoes[1].linha, ast.declaracoes[1].coluna) == (2, 1)
+        assert (soma.linha, soma.coluna) == (3, 11)
+        assert (soma.direita.linha, soma.direita.coluna) == (3, 13)
+    
+    def test_campos(self):
+        """Testa que CAMPOS segue a ordem dos parâmetros do construtor."""
+        assert ExpressaoBinariaNode.CAMPOS == ('esquerda', 'operador', 'direita')
+        assert LiteralNode.CAMPOS == ('valor', 'tipo', 'formatada')
+        assert QuebraNode.CAMPOS == ()
+        literal = LiteralNode("a", "STRING", 1, 2, formatada=True)
+        assert [getattr(literal, campo) for campo in LiteralNode.CAMPOS] == ["a", "STRING", True]
+    
+    def test_acesso_atributo_unico(self):
+        """Testa que AcessoAtributoNode é definido uma única vez."""
+        nomes = [c.__name__ for c in classes_de_nos()]
+        assert len(nomes) == len(set(nomes))
+        with open(ast_nodes.__file__, encoding='utf-8') as arquivo:
+            assert arquivo.read().count("class AcessoAtributoNode(") == 1
@@ -0,0 +1,125 @@
+"""
+Testes do cache em disco da AST (arquivos .crlc).
+"""
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from src.lexer.lexer import LexerCoral
+from src.parser.parser import ParserCoral
+from src.parser import cache_ast
+from src.parser.ast_nodes import *
+from parser_test.conftest import (CODIGO, EXEMPLOS_INVALIDOS, EXEMPLOS_VALIDOS,
+                                  analisar, analisar_exemplo, estrutura)
+
+
+class TestSerializacao:
+    """Testes da serialização binária da AST."""
+    
+    def test_ida_e_volta(self):
+        """Testa que a AST desserializada é idêntica à original."""
+        ast = analisar(CODIGO)
+        copia = cache_ast.desserializar_ast(cache_ast.serializar_ast(ast))
+        assert isinstance(copia, ProgramaNode)
+        assert estrutura(copia) == estrutura(ast)
+        se = copia.declaracoes[1]
+        assert isinstance(se.blocos_senaose[0], tuple)
+    
+    @pytest.mark.parametrize('exemplo', EXEMPLOS_VALIDOS)
+    def test_exemplos(self, exemplo):
+        """Testa a ida e volta em todos os exemplos válidos."""
+        ast = analisar_exemplo(exemplo)
+        copia = cache_ast.desserializar_ast(cache_ast.serializar_ast(ast))
+        assert estrutura(copia) == estrutura(ast)
+    
+    @pytest.mark.parametrize('exemplo', sorted(EXEMPLOS_INVALIDOS))
+    def test_exemplos_invalidos(self, exemplo):
+        """Testa que os exemplos inválidos falham na análise com o erro esperado."""
+        with pytest.raises(Exception) as erro:
+            analisar_exemplo(exemplo)
+        assert type(erro.value).__name__ == EXEMPLOS_INVALIDOS[exemplo]
+    
+    def test_tokens_sem_fonte(self):
+        """Testa que os tokens da AST não carregam o TokenStream de origem."""
+        fluxo = LexerCoral.analisar_string("x = a * b\n").tokenizar_em_colunas()
+        ast = ParserCoral(fluxo).parse()
+        copia = cache_ast.desserializar_ast(cache_ast.serializar_ast(ast))
+        operador = copia.declaracoes[0].expressao.operador
+        assert type(operador).__name__ == 'Token'
+        assert (operador.lexema, operador.linha, operador.coluna, operador.posicao) == ('*', 1, 7, 6)
+    
+    def test_aninhamento_profundo(self):
+        """Testa que árvores mais profundas que o limite de recursão são serializadas."""
+        n = 5000
+        ast = analisar("x = " + "(" * n + "1" + ")" * n + "\ny = " + "[" * n + "]" * n + "\n")
+        copia = cache_ast.desserializar_ast(cache_ast.serializar_ast(ast))
+        lista = copia.declaracoes[1].expressao
+        for _ in range(n - 1):
+            lista = lista.elementos[0]
+        assert isinstance(lista, ListaNode) and lista.elementos == []
+    
+    def test_dados_corrompidos(self):
+        """Testa que dados truncados ou alterados geram ValueError."""
+        dados = cache_ast.serializar_ast(analisar(CODIGO))
+        for corrompido in (b"", b"{}\n", dados[:-1], dados[:len(dados) // 2], b"x" + dados):
+            with pytest.raises(ValueError):
+                cache_ast.desserializar_ast(corrompido)
+    
+    def test_valor_nao_serializavel(self):
+        """Testa que valores desconhecidos na árvore são rejeitados."""
+        with pytest.raises(TypeError):
+            cache_ast.serializar_ast(ProgramaNode([object()]))
+
+
+class TestCacheAST:
+    """Testes do cache em disco."""
+    
+    def test_salvar_e_carregar(self, tmp_path):
+        """Testa que a AST salva é carregada para a mesma chave."""
+        ast = analisar(CODIGO)
+        chave = cache_ast.chave_ast(CODIGO.encode('utf-8'), '1.0')
+        assert cache_ast.carregar_ast(chave, str(tmp_path)) is None
+        cache_ast.salvar_ast(chave, ast, str(tmp_path))
+        assert estrutura(cache_ast.carregar_ast(chave, str(tmp_path))) == estrutura(ast)
+        assert os.listdir(tmp_path) == [chave + cache_ast.EXTENSAO]
+    
+    def test_chave(self, monkeypatch):
+        """Testa que a chave depende do conteúdo, da versão do Coral e do front-end."""
+        chave = cache_ast.chave_ast(b'x = 1\n', '1.0')
+        assert chave == cache_ast.chave_ast(b'x = 1\n', '1.0')
+        assert chave != cache_ast.chave_ast(b'x = 2\n', '1.0')
+        assert chave != cache_ast.chave_ast(b'x = 1\n', '1.1')
+        monkeypatch.setattr(cache_ast, '_versao_parser', 'outra')
+        assert chave != cache_ast.chave_ast(b'x = 1\n', '1.0')
+    
+    def test_chave_arquivo(self, tmp_path):
+        """Testa que a chave do arquivo, lido em blocos, é a chave do seu conteúdo."""
+        caminho = tmp_path / 'programa.crl'
+        caminho.write_bytes(CODIGO.encode('utf-8'))
+        chave = cache_ast.chave_ast(CODIGO.encode('utf-8'), '1.0')
+        assert cache_ast.chave_ast_arquivo(str(caminho), '1.0', tamanho_bloco=7) == chave
+        assert cache_ast.chave_ast_arquivo(str(caminho), '1.0') == chave
+    
+    def test_entrada_invalida(self, tmp_path):
+        """Testa que entradas corrompidas ou de outra chave são ignoradas."""
+        cache_ast.salvar_ast('chave', analisar(CODIGO), str(tmp_path))
+        caminho = tmp_path / ('chave' + cache_ast.EXTENSAO)
+        os.replace(caminho, tmp_path / ('outra' + cache_ast.EXTENSAO))
+        assert cache_ast.carregar_ast('outra', str(tmp_path)) is None
+        
+        cache_ast.salvar_ast('chave', analisar(CODIGO), str(tmp_path))
+        caminho.write_bytes(caminho.read_bytes()[:-10])
+        assert cache_ast.carregar_ast('chave', str(tmp_path)) is None
+    
+    def test_limite_de_tamanho(self, tmp_path):
+        """Testa que as entradas usadas há mais tempo são removidas."""
+        ast = analisar(CODIGO)
+        cache_ast.salvar_ast('a', ast, str(tmp_path))
+        tamanho = os.path.getsize(tmp_path / ('a' + cache_ast.EXTENSAO))
+        (tmp_path / 'outro.tokens').write_bytes(b'x' * 10 * tamanho)
+        for n, chave in enumerate(['a', 'b', 'c']):
+            cache_ast.salvar_ast(chave, ast, str(tmp_path), tamanho_maximo=2 * tamanho)
+            os.utime(tmp_path / (chave + cache_ast.EXTENSAO), (n, n))
+        assert sorted(os.listdir(tmp_path)) == ['b.crlc', 'c.crlc', 'outro.tokens']
@@ -14,14 +14,7 @@ from src.parser.ast_nodes import *
 
 def tokenizar_codigo(codigo):
     """Helper global para tokenizar código."""
-    analisador = LexerCoral.analisar_string(codigo)
-    tokens = []
-    while True:
-        token = analisador.getNextToken()
-        tokens.append(token)
-        if token.tipo == "EOF":
-            break
-    return tokens
+    return LexerCoral.analisar_string(codigo).tokenizar_tudo()
 
 
 class TestEstruturaCondicional:
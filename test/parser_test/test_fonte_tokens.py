@@ -0,0 +1,104 @@
+"""
+Testes do consumo de tokens sob demanda (lexer -> parser sem lista intermediária).
+"""
+import gc
+import pytest
+import sys
+import os
+import weakref
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from src.lexer.lexer import LexerCoral
+from src.parser.parser import ParserCoral, ErroSintatico
+from src.parser.ast_nodes import *
+from src.parser.percurso import percorrer
+
+
+CODIGO = """
+CLASSE Ponto:
+    FUNCAO __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+FUNCAO soma(a: inteiro, b: inteiro) -> inteiro:
+    RETORNAR a + b * 2
+
+lista = [1, 2, 3]
+lista[0] = soma(lista[1], -lista[2])
+p = Ponto(1, 2)
+p.x += 1
+PARA i DENTRODE intervalo(3):
+    SE i == 1:
+        CONTINUA
+    ESCREVA(f"{i}")
+"""
+
+
+def estrutura(valor):
+    """Converte a AST em tuplas/listas comparáveis (tokens viram (lexema, tipo))."""
+    if isinstance(valor, list):
+        return [estrutura(item) for item in valor]
+    if hasattr(valor, 'lexema') and hasattr(valor, 'tipo'):
+        return (valor.lexema, valor.tipo)
+    if isinstance(valor, ASTNode):
+        campos = {campo: estrutura(getattr(valor, campo)) for campo in type(valor).CAMPOS}
+        return (type(valor).__name__, valor.loc, campos)
+    return valor
+
+
+class TestFonteTokens:
+    """Testes do ParserCoral com fontes de tokens preguiçosas."""
+    
+    def test_lexer_como_fonte(self):
+        """Testa que o parser aceita o próprio lexer e gera a mesma AST da lista."""
+        ast = ParserCoral(LexerCoral.analisar_string(CODIGO).tokenizar_tudo()).parse()
+        assert any(isinstance(no, ContinuaNode) for no in percorrer(ast))
+        esperado = estrutura(ast)
+        assert estrutura(ParserCoral(LexerCoral.analisar_string(CODIGO)).parse()) == esperado
+        assert estrutura(ParserCoral(iter(LexerCoral.analisar_string(CODIGO).tokenizar_tudo())).parse()) == esperado
+        assert estrutura(ParserCoral(LexerCoral.analisar_string(CODIGO).tokenizar_em_colunas()).parse()) == esperado
+    
+    def test_janela_limitada(self):
+        """Testa que só a janela de lookahead fica em memória, não o programa inteiro."""
+        linhas = 2000
+        codigo = "".join(f"v{n}[{n} + 1] = v{n} + {n}\n" for n in range(linhas))
+        maior_janela = 0
+        
+        def fonte():
+            nonlocal maior_janela
+            for token in LexerCoral.analisar_string(codigo):
+                if parser is not None:
+                    maior_janela = max(maior_janela, len(parser.tokens_adiante))
+                yield token
+        
+        parser = None
+        parser = ParserCoral(fonte())
+        ast = parser.parse()
+        assert len(ast.declaracoes) == linhas
+        assert maior_janela <= 8
+    
+    def test_erro_lexico_durante_analise(self):
+        """Testa que erros léxicos de uma fonte preguiçosa chegam ao chamador do parser."""
+        with pytest.raises(ValueError) as erro:
+            ParserCoral(LexerCoral.analisar_string("x = 1\ny = $\n")).parse()
+        assert type(erro.value).__name__ == "ErroLexico"
+    
+    def test_erro_sintatico_no_fim(self):
+        """Testa que o parser permanece no EOF quando a fonte se esgota."""
+        with pytest.raises(ErroSintatico):
+            ParserCoral(LexerCoral.analisar_string("x = (1 +")).parse()
+    
+    def test_ast_nao_referencia_o_fluxo(self):
+        """Testa que a AST não mantém o TokenStream (e o código fonte) vivo após a análise."""
+        fluxo = LexerCoral.analisar_string(CODIGO).tokenizar_em_colunas()
+        referencia = weakref.ref(fluxo)
+        ast = ParserCoral(fluxo).parse()
+        del fluxo
+        gc.collect()
+        assert referencia() is None
+        
+        operadores = [no.operador for no in percorrer(ast) if isinstance(no, (ExpressaoBinariaNode, ExpressaoUnariaNode))]
+        assert [op.lexema for op in operadores] == ['+', '*', '-', '==']
+        assert all(type(op).__name__ == 'Token' and op.indice_linhas is None for op in operadores)
+        assert (operadores[0].linha, operadores[0].coluna) == (8, 16)
@@ -0,0 +1,182 @@
+"""
+Testes do percurso da AST sem recursão (percurso.py) e dos seus usos.
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from src.lexer.lexer import LexerCoral
+from src.parser.parser import ParserCoral, exibir_ast
+from src.parser.percurso import filhos, percorrer, percorrer_pos_ordem, Visitante, TabelaDespacho
+from src.parser.ast_nodes import *
+from src.llvm.llvm_compiler import LLVMCompiler
+from src.interpreter.interpreter import InterpretadorCoral
+
+
+PROFUNDIDADE = 5 * sys.getrecursionlimit()
+
+
+def analisar(codigo):
+    """Helper para fazer lex + parse."""
+    return ParserCoral(LexerCoral.analisar_string(codigo).tokenizar_tudo()).parse()
+
+
+def nomes(nos):
+    return [type(no).__name__ for no in nos]
+
+
+def se_aninhados(profundidade, folha):
+    """Constrói SEs aninhados (blocos dentro de blocos) com folha no mais interno."""
+    no = BlocoNode([folha])
+    for _ in range(profundidade):
+        no = BlocoNode([SeNode(LiteralNode(True, 'BOOLEANO'), no, [], None)])
+    return ProgramaNode(no.declaracoes)
+
+
+class TestPercorrer:
+    """Testes de filhos, percorrer e percorrer_pos_ordem."""
+    
+    def test_filhos_na_ordem_dos_campos(self):
+        """Testa que listas e tuplas (blocos_senaose) são expandidas na ordem."""
+        se = analisar("SE a:\n    x = 1\nSENAOSE b:\n    PASSAR\nSENAO:\n    PASSAR\n").declaracoes[0]
+        assert nomes(filhos(se)) == [
+            'IdentificadorNode', 'BlocoNode', 'IdentificadorNode', 'BlocoNode', 'BlocoNode'
+        ]
+        assert filhos(LiteralNode(1, 'INTEIRO')) == []
+    
+    def test_pre_e_pos_ordem(self):
+        """Testa a ordem dos nós nos dois geradores."""
+        ast = analisar("x = a + 1\n")
+        assert nomes(percorrer(ast)) == [
+            'ProgramaNode', 'AtribuicaoNode', 'IdentificadorNode',
+            'ExpressaoBinariaNode', 'IdentificadorNode', 'LiteralNode'
+        ]
+        assert nomes(percorrer_pos_ordem(ast)) == [
+            'IdentificadorNode', 'IdentificadorNode', 'LiteralNode',
+            'ExpressaoBinariaNode', 'AtribuicaoNode', 'ProgramaNode'
+        ]
+    
+    def test_aninhamento_profundo(self):
+        """Testa árvores mais profundas que o limite de recursão."""
+        ast = analisar("x = " + "(" * PROFUNDIDADE + "1 + 2" + ")" * PROFUNDIDADE + "\n")
+        assert len(list(percorrer(ast))) == 6
+        ast = se_aninhados(PROFUNDIDADE, PassarNode())
+        assert sum(1 for _ in percorrer(ast)) == sum(1 for _ in percorrer_pos_ordem(ast)) == 3 * PROFUNDIDADE + 2
+
+
+class TestVisitante:
+    """Testes da classe base Visitante e do despacho por classe."""
+    
+    def test_despacho_em_cache_e_pela_mro(self):
+        """Testa que o método é resolvido uma vez por classe, seguindo a MRO."""
+        class Contador(Visitante):
+            def __init__(self):
+                self.visitados = []
+            
+            def visitar_ExpressaoNode(self, no):
+                self.visitados.append(('expressao', type(no).__name__))
+                return self.visitar_padrao(no)
+            
+            def visitar_LiteralNode(self, no):
+                self.visitados.append(('literal', no.valor))
+        
+        contador = Contador()
+        contador.visitar(analisar("x = a + 1\n"))
+        assert contador.visitados == [
+            ('expressao', 'IdentificadorNode'), ('expressao', 'ExpressaoBinariaNode'),
+            ('expressao', 'IdentificadorNode'), ('literal', 1)
+        ]
+        assert Contador._despacho[IdentificadorNode] is Contador.visitar_ExpressaoNode
+        assert Contador._despacho[AtribuicaoNode] is Visitante.visitar_padrao
+        assert Contador._despacho is not Visitante._despacho
+    
+    def test_itens_e_profundidade(self):
+        """Testa os itens retornados: nós, pares (nó, n), funções e None."""
+        class Registro(Visitante):
+            def __init__(self):
+                self.linhas = []
+            
+            def visitar_padrao(self, no):
+                self.linhas.append((self.profundidade, type(no).__name__))
+                return super().visitar_padrao(no)
+            
+            def visitar_ExpressaoBinariaNode(self, no):
+                self.linhas.append((self.profundidade, 'binaria'))
+                return [None, (no.esquerda, 3), lambda: self.linhas.append('meio'), no.direita]
+        
+        registro = Registro()
+        registro.visitar(analisar("x = a + 1\n"), 1)
+        assert registro.linhas == [
+            (1, 'ProgramaNode'), (2, 'AtribuicaoNode'), (3, 'IdentificadorNode'),
+            (3, 'binaria'), (6, 'IdentificadorNode'), 'meio', (4, 'LiteralNode')
+        ]
+    
+    def test_tabela_despacho(self):
+        """Testa a tabela com prefixo e método padrão próprios."""
+        class Avaliador:
+            def avaliar_LiteralNode(self, no):
+                return no.valor
+            
+            def avaliar_outro(self, no):
+                return None
+        
+        tabela = TabelaDespacho(Avaliador, 'avaliar_', 'avaliar_outro')
+        assert tabela[LiteralNode](Avaliador(), LiteralNode(7, 'INTEIRO')) == 7
+        assert tabela[PassarNode] is Avaliador.avaliar_outro
+        assert set(tabela) == {LiteralNode, PassarNode}
+
+
+class TestUsos:
+    """Testes dos percursos que antes eram recursivos."""
+    
+    def test_exibir_ast(self, capsys):
+        """Testa a saída de exibir_ast, incluindo o limite de declarações."""
+        ast = analisar("SE a:\n    x = -1\nSENAO:\n    PASSAR\n" + "y = 2\n" * 21)
+        exibir_ast(ast)
+        linhas = capsys.readouterr().out.splitlines()
+        assert linhas[:4] == [repr(ast), "  " + repr(ast.declaracoes[0]), "    Condição:", "      " + repr(ast.declaracoes[0].condicao)]
+        assert "    Bloco SENAO:" in linhas
+        assert linhas[-1] == "  ... e mais 2 declarações"
+    
+    def test_exibir_ast_profundo(self, capsys):
+        """Testa exibir_ast com aninhamento além do limite de recursão."""
+        exibir_ast(se_aninhados(PROFUNDIDADE, PassarNode()), profundidade_maxima=PROFUNDIDADE * 4)
+        linhas = capsys.readouterr().out.splitlines()
+        assert linhas[-1].strip() == repr(PassarNode())
+        exibir_ast(se_aninhados(PROFUNDIDADE, PassarNode()), profundidade_maxima=3)
+        assert capsys.readouterr().out.splitlines()[-1] == "        ..."
+        
+        ast = analisar("x = " + "2 ** " * PROFUNDIDADE + "2\n")
+        exibir_ast(ast, profundidade_maxima=PROFUNDIDADE + 3)
+        linhas = capsys.readouterr().out.splitlines()
+        assert linhas[:4] == [repr(ast), "  Atribuicao(=)", "    Id(x)", "    ExpBinaria(**)"]
+        assert linhas[-1] == "  " * (PROFUNDIDADE + 2) + repr(LiteralNode(2, 'INTEIRO'))
+    
+    def test_coleta_de_strings_llvm(self):
+        """Testa a coleta de strings do compilador em blocos muito aninhados."""
+        folha = ChamadaFuncaoNode('ESCREVA', [LiteralNode("fundo", 'STRING')])
+        compilador = LLVMCompiler()
+        compilador._collect_strings(se_aninhados(PROFUNDIDADE, folha))
+        assert list(compilador.strings.values()) == ["fundo"]
+        
+        compilador = LLVMCompiler()
+        compilador._collect_strings(analisar('FUNCAO f():\n    ESCREVA("fora")\nESCREVA("a", "b", "a")\n'))
+        assert compilador.strings == {0: "a", 1: "b"}
+    
+    def test_despacho_do_interpretador(self, capsys):
+        """Testa que o interpretador resolve os métodos pela tabela em cache."""
+        InterpretadorCoral().interpretar(analisar("x = 1 + 2\nESCREVA(x)\n"))
+        assert capsys.readouterr().out.strip() == "3"
+        despacho = InterpretadorCoral._despacho
+        assert despacho[ExpressaoBinariaNode] is InterpretadorCoral.visitar_ExpressaoBinariaNode
+        assert despacho[TuplaNode] is InterpretadorCoral.visitar_generico
+        
+        class Interpretador(InterpretadorCoral):
+            def visitar_LiteralNode(self, no):
+                return 0
+        
+        Interpretador().interpretar(analisar("ESCREVA(1 + 2)\n"))
+        assert capsys.readouterr().out.strip() == "0"
+        assert Interpretador._despacho is not despacho
+        assert despacho[LiteralNode] is InterpretadorCoral.visitar_LiteralNode
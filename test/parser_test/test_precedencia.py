@@ -0,0 +1,128 @@
+"""
+Testes da análise de expressões por precedência (pilhas explícitas, sem recursão).
+"""
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from src.lexer.lexer import LexerCoral
+from src.parser.parser import ParserCoral, ErroSintatico
+from src.parser.ast_nodes import *
+
+
+PROFUNDIDADE = 10000
+
+
+def tokenizar_codigo(codigo):
+    """Helper global para tokenizar código."""
+    return LexerCoral.analisar_string(codigo).tokenizar_tudo()
+
+
+def expressao(codigo):
+    """Retorna a expressão da primeira atribuição de 'x = <codigo>'."""
+    return ParserCoral(tokenizar_codigo(f"x = {codigo}")).parse().declaracoes[0].expressao
+
+
+def forma(no):
+    """Converte a expressão em uma string totalmente parentizada."""
+    if isinstance(no, ExpressaoBinariaNode):
+        return f"({forma(no.esquerda)} {no.operador.lexema} {forma(no.direita)})"
+    if isinstance(no, ExpressaoUnariaNode):
+        return f"({no.operador.lexema} {forma(no.expressao)})"
+    if isinstance(no, IdentificadorNode):
+        return no.nome
+    return str(no.valor)
+
+
+class TestPrecedencia:
+    """Testes de precedência e associatividade dos operadores."""
+    
+    @pytest.mark.parametrize("codigo, esperado", [
+        ("a - b - c", "((a - b) - c)"),
+        ("a + b * c % d", "(a + ((b * c) % d))"),
+        ("a ** b ** c", "(a ** (b ** c))"),
+        ("-a ** b", "(- (a ** b))"),
+        ("2 ** -3 * 4", "((2 ** (- 3)) * 4)"),
+        ("NAO a E b", "((NAO a) E b)"),
+        ("a < b + 1 OU c", "((a < (b + 1)) OU c)"),
+        ("(a + b) * c", "((a + b) * c)"),
+    ])
+    def test_arvore(self, codigo, esperado):
+        """Testa o agrupamento produzido para cada combinação de operadores."""
+        assert forma(expressao(codigo)) == esperado
+    
+    def test_acessos_encadeados(self):
+        """Testa chamadas, métodos, atributos e índices como operandos."""
+        soma = expressao("obj.m(f(1, g(2)))[0].y + -lista[i]")
+        assert isinstance(soma.esquerda, AcessoAtributoNode)
+        assert isinstance(soma.esquerda.objeto, IndexacaoNode)
+        metodo = soma.esquerda.objeto.objeto
+        assert isinstance(metodo, ChamadaFuncaoNode)
+        assert isinstance(metodo.nome, AcessoAtributoNode)
+        chamada = metodo.argumentos[0]
+        assert isinstance(chamada, ChamadaFuncaoNode)
+        assert isinstance(chamada.argumentos[1], ChamadaFuncaoNode)
+        assert isinstance(soma.direita, ExpressaoUnariaNode)
+        assert isinstance(soma.direita.expressao, IndexacaoNode)
+    
+    @pytest.mark.parametrize("codigo, mensagem", [
+        ("(1 + 2", "Esperado ')' após expressão"),
+        ("[1, 2", "Esperado ']' após elementos da lista"),
+        ("f(1", "Esperado ')' após argumentos da função"),
+        ("1 + ", "Expressão esperada, encontrado 'EOF'"),
+    ])
+    def test_erros(self, codigo, mensagem):
+        """Testa as mensagens de erro de agrupamentos e operandos ausentes."""
+        with pytest.raises(ErroSintatico) as erro:
+            expressao(codigo)
+        assert erro.value.mensagem == mensagem
+    
+    @pytest.mark.parametrize("codigo", [
+        "x = y[1[2]]\n",
+        "a.m(1[0])\n",
+        "x = y[\"a\".b]\n",
+        "x[VAZIO[1]]\n",
+        "x[-1[0]]\n",
+    ])
+    def test_acessos_sobre_literal_no_agrupamento(self, codigo):
+        """Testa que o primeiro operando de um índice ou chamada de método não aceita acessos se for literal."""
+        with pytest.raises(ErroSintatico):
+            ParserCoral(tokenizar_codigo(codigo)).parse()
+
+
+class TestAninhamentoProfundo:
+    """Testes de expressões aninhadas além do limite de recursão do Python."""
+    
+    def test_parenteses(self):
+        """Testa 10 mil níveis de parênteses sem RecursionError."""
+        no = expressao("(" * PROFUNDIDADE + "1 + 2" + ")" * PROFUNDIDADE)
+        assert forma(no) == "(1 + 2)"
+    
+    def test_listas_e_chamadas(self):
+        """Testa 10 mil níveis de listas e de chamadas de função."""
+        no = expressao("[" * PROFUNDIDADE + "1" + "]" * PROFUNDIDADE)
+        for _ in range(PROFUNDIDADE):
+            assert isinstance(no, ListaNode)
+            no = no.elementos[0]
+        assert isinstance(no, LiteralNode)
+        
+        no = expressao("f(" * PROFUNDIDADE + ")" * PROFUNDIDADE)
+        for _ in range(PROFUNDIDADE - 1):
+            no = no.argumentos[0]
+        assert isinstance(no, ChamadaFuncaoNode) and no.argumentos == []
+    
+    def test_operadores(self):
+        """Testa 10 mil operadores unários e uma cadeia de '**' do mesmo tamanho."""
+        no = expressao("- " * PROFUNDIDADE + "a")
+        profundidade = 0
+        while isinstance(no, ExpressaoUnariaNode):
+            no, profundidade = no.expressao, profundidade + 1
+        assert profundidade == PROFUNDIDADE
+        
+        no = expressao(" ** ".join(["a"] * PROFUNDIDADE))
+        profundidade = 0
+        while isinstance(no, ExpressaoBinariaNode):
+            no, profundidade = no.direita, profundidade + 1
+        assert profundidade == PROFUNDIDADE - 1
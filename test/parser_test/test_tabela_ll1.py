@@ -0,0 +1,126 @@
+"""
+Testes dos conjuntos FIRST/FOLLOW calculados e da tabela LL(1) usada pelo parser.
+"""
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from src.lexer.lexer import LexerCoral
+from src.parser.parser import ParserCoral, ErroSintatico, FIRST_FOLLOW, terminal_do_token
+from src.parser.first_follow import FirstFollowSets, EPSILON, OUTRO
+from src.parser.ast_nodes import *
+
+
+def tokenizar_codigo(codigo):
+    """Helper global para tokenizar código."""
+    return LexerCoral.analisar_string(codigo).tokenizar_tudo()
+
+
+class TestFirstFollow:
+    """Testes do cálculo dos conjuntos FIRST e FOLLOW."""
+    
+    def test_gramatica_de_exemplo(self):
+        """Testa o cálculo em uma gramática clássica de expressões."""
+        gramatica = {
+            'E': [('T', 'E2')],
+            'E2': [('+', 'T', 'E2'), ()],
+            'T': [('F', 'T2')],
+            'T2': [('*', 'F', 'T2'), ()],
+            'F': [('(', 'E', ')'), ('id',)],
+        }
+        conjuntos = FirstFollowSets(gramatica, inicial='E')
+        assert conjuntos.get_first('E') == {'(', 'id'}
+        assert conjuntos.get_first('E2') == {'+', EPSILON}
+        assert conjuntos.get_follow('E') == {')', 'EOF'}
+        assert conjuntos.get_follow('F') == {'+', '*', ')', 'EOF'}
+        assert conjuntos.get_producao('T2', '+') == ()
+        assert conjuntos.get_producao('F', 'id') == ('id',)
+        assert conjuntos.get_producao('F', '+') is None
+        assert conjuntos.is_ll1_compatible()
+    
+    def test_conflito_detectado(self):
+        """Testa que uma gramática ambígua é reportada como não LL(1)."""
+        conjuntos = FirstFollowSets({'S': [('a', 'b'), ('a', 'c')]}, inicial='S')
+        assert not conjuntos.is_ll1_compatible()
+        assert conjuntos.conflitos[0][:2] == ('S', 'a')
+    
+    def test_gramatica_coral_ll1(self):
+        """Testa que a gramática Coral não tem conflitos na tabela LL(1)."""
+        assert FIRST_FOLLOW.is_ll1_compatible(), FIRST_FOLLOW.conflitos
+        assert FIRST_FOLLOW.get_first('FatorPrimario') == {
+            'INTEIRO', 'DECIMAL', 'BOOLEANO', 'VAZIO', 'STRING', 'STRING_MULTILINE', 'ID', '(', '[', '{'
+        }
+        assert {'SE', 'FUNCAO', 'RETORNAR', 'ID', '-', 'NAO'} <= FIRST_FOLLOW.get_first('Programa')
+    
+    def test_calculado_uma_vez(self):
+        """Testa que os parsers compartilham os conjuntos, calculados uma única vez."""
+        assert ParserCoral([]).first_follow is FIRST_FOLLOW
+        assert FirstFollowSets().TABELA is FIRST_FOLLOW.TABELA
+    
+    def test_estado_compartilhado_somente_leitura(self):
+        """Testa que uma instância não consegue alterar os conjuntos e tabelas das outras."""
+        conjuntos = FirstFollowSets()
+        with pytest.raises(AttributeError):
+            conjuntos.get_first('Expressao').add('QUEBRA')
+        with pytest.raises(AttributeError):
+            conjuntos.get_follow('Expressao').discard(')')
+        with pytest.raises(TypeError):
+            conjuntos.FIRST['Expressao'] = frozenset()
+        with pytest.raises(TypeError):
+            conjuntos.TABELA['Expressao'][0] = ()
+        with pytest.raises(TypeError):
+            conjuntos.ID_TERMINAL['QUEBRA'] = 0
+        assert ')' in FIRST_FOLLOW.get_follow('Expressao')
+
+
+class TestDespacho:
+    """Testes da resolução de tokens em terminais e do despacho pela tabela."""
+    
+    def terminais(self, codigo):
+        nomes = FIRST_FOLLOW.TERMINAIS
+        return [nomes[terminal_do_token(t)] for t in tokenizar_codigo(codigo)]
+    
+    def test_terminais_dos_tokens(self):
+        """Testa que cada token é resolvido para o terminal da gramática."""
+        assert self.terminais("SE x.y >= VERDADE E NAO VAZIO:") == [
+            'SE', 'ID', '.', 'ID', '>=', 'BOOLEANO', 'E', 'NAO', 'VAZIO', ':', 'EOF'
+        ]
+        assert self.terminais('x ++ 2.5 ; "a"') == ['ID', OUTRO, 'DECIMAL', OUTRO, 'STRING', 'EOF']
+    
+    def test_verificar(self):
+        """Testa verificar com nomes de terminais."""
+        parser = ParserCoral(tokenizar_codigo("FALSO"))
+        assert parser.verificar('BOOLEANO')
+        assert not parser.verificar('ID')
+        assert not parser.verificar('INEXISTENTE')
+    
+    def test_despacho_declaracoes_e_fatores(self):
+        """Testa que todas as alternativas são alcançadas pela tabela de despacho."""
+        codigo = """
+CLASSE A:
+    PASSAR
+FUNCAO f(a):
+    ENQUANTO a:
+        QUEBRA
+    PARA i DENTRODE [1, 2.5, VERDADE, VAZIO, "s", {}]:
+        CONTINUA
+    SE (a):
+        RETORNAR -a ** 2
+x = NAO f(1)
+"""
+        ast = ParserCoral(tokenizar_codigo(codigo)).parse()
+        assert [type(d).__name__ for d in ast.declaracoes] == ['ClasseNode', 'FuncaoNode', 'AtribuicaoNode']
+        funcao = ast.declaracoes[1]
+        tipos = [type(d).__name__ for d in funcao.bloco.declaracoes]
+        assert tipos == ['EnquantoNode', 'ParaNode', 'SeNode']
+        retorno = funcao.bloco.declaracoes[2].bloco_se.declaracoes[0]
+        assert isinstance(retorno.expressao, ExpressaoUnariaNode)
+        assert isinstance(retorno.expressao.expressao, ExpressaoBinariaNode)
+    
+    def test_erro_fora_da_tabela(self):
+        """Testa a mensagem de erro para um terminal sem produção em FatorPrimario."""
+        with pytest.raises(ErroSintatico) as erro:
+            ParserCoral(tokenizar_codigo("x = )")).parse()
+        assert erro.value.mensagem == "Expressão esperada, encontrado 'DELIMITADOR'"